@@ -4,7 +4,8 @@ Replaces the ``@HasPerm(global)`` + ``get_user_permitted_org()`` pattern
 with a single ``@HasOrgPerm`` decorator that reads the active
 organization from ``request.organization_id`` (set by
 ``OrganizationMiddleware`` from the ``X-Organization-ID`` header) and
-validates the user's permission in that org via a single DB query.
+validates the user's permission in that org against the request-scoped
+permission cache (one DB query per user and org per request).
 
 Usage::
 
@@ -23,8 +24,7 @@ Or with django-codename strings::
 from collections.abc import Callable
 from typing import Any
 
-from accounts.models import Organization
-from common.permissions.utils import permissioned_queryset
+from common.permissions.cache import has_org_perms
 from strawberry.types import Info
 from strawberry_django.permissions import (
     DjangoNoPermission,
@@ -39,10 +39,12 @@ class HasOrgPerm(HasPerm):
     Reads ``info.context.request.organization_id`` (set by
     ``OrganizationMiddleware`` from the ``X-Organization-ID`` header)
     and checks that the authenticated user holds the requested
-    permission(s) within that organization via a single query.
+    permission(s) within that organization.
 
-    Delegates to ``permissioned_queryset`` so the permission-checking
-    SQL is shared with ``get_queryset`` hooks and selectors.
+    Reads the permissions from ``common.permissions.cache``, the same
+    request-scoped cache ``permissioned_queryset`` and
+    ``PermissionedQuerySet`` consult, so guarding many fields costs one
+    query per request.
 
     Defaults ``fail_silently=False`` so that permission denials raise
     rather than silently returning empty results.
@@ -84,14 +86,12 @@ class HasOrgPerm(HasPerm):
         if not self.perms:
             raise DjangoNoPermission("No permissions specified for this operation.")
 
-        has_perm = permissioned_queryset(
-            Organization.objects.all(),
-            user=user,
-            organization_id=org_id,
-            perms=[f"{p.app}.{p.permission}" if p.app else str(p.permission) for p in self.perms],
+        has_perm = has_org_perms(
+            user,
+            org_id,
+            [f"{p.app}.{p.permission}" if p.app else str(p.permission) for p in self.perms],
             any_perm=self.any_perm,
-            organization_field="pk",
-        ).exists()
+        )
 
         if not has_perm:
             raise DjangoNoPermission("You do not have permission to perform this action in this organization.")
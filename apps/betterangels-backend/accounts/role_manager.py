@@ -6,6 +6,7 @@ Placed in its own module to avoid circular imports between
 
 from typing import TYPE_CHECKING
 
+from common.permissions.cache import invalidate_org_permissions
 from django.contrib.auth.models import Group
 from django.db import transaction
 from organizations.models import Organization
@@ -45,6 +46,7 @@ class OrgRoleManager:
                 template__name=template_config.name,
             )
             user.groups.add(permission_group.group)
+        invalidate_org_permissions(user_id=user.pk, organization_id=self.organization.pk)
 
     @transaction.atomic
     def remove_roles(self, user: User, *templates: TemplateConfig) -> None:
@@ -59,12 +61,14 @@ class OrgRoleManager:
                 template__name=template_config.name,
             )
             user.groups.remove(permission_group.group)
+        invalidate_org_permissions(user_id=user.pk, organization_id=self.organization.pk)
 
     @transaction.atomic
     def clear_roles(self, user: User) -> None:
         """Remove **all** org-scoped permission groups from *user*."""
         groups = Group.objects.filter(permissiongroup__organization=self.organization)
         user.groups.remove(*groups)
+        invalidate_org_permissions(user_id=user.pk, organization_id=self.organization.pk)
 
     @transaction.atomic
     def replace_roles(self, user: User, *templates: TemplateConfig) -> None:
@@ -10,6 +10,7 @@ import uuid
 from typing import TYPE_CHECKING, Any
 
 from common.org_types import REGISTRY
+from common.permissions.cache import invalidate_org_permissions
 from common.permissions.config import TemplateConfig
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError, transaction
@@ -254,6 +255,9 @@ def reconcile_org_groups(org: Organization) -> None:
         Q(template__isnull=True) | ~Q(template__name__in=expected),
     ).delete()
 
+    # Members of deleted groups lost those permissions.
+    invalidate_org_permissions(organization_id=org.pk)
+
 
 # ── Member removal ───────────────────────────────────────────────────
 
@@ -0,0 +1,94 @@
+from datetime import datetime, time, timedelta
+from io import SEEK_END
+from typing import Any, Callable
+
+import pytest
+from common.scale_data import ScaleDataset
+from django.utils import timezone
+from reports.export_options import MetricsExportOptions
+from reports.export_to_csv import stream_metrics_zip
+from reports.export_to_xlsx import metrics_to_xlsx, shelters_metrics_to_xlsx
+from reports.selectors import note_list_for_org
+from reports.services import stream_interaction_data_csv
+from shelters.models import Shelter
+from shelters.selectors import shelter_occupancy_metrics, shelters_occupancy_metrics
+from shelters.types.filters import SHELTER_SCHEDULE_TIME_ZONE
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize("days", [30, 365])
+def test_stream_interaction_data_csv(measure: Callable[..., Any], scale_dataset: ScaleDataset, days: int) -> None:
+    end_date = timezone.now().date()
+    notes = note_list_for_org(
+        org=scale_dataset.orgs[0], start_date=end_date - timedelta(days=days - 1), end_date=end_date
+    ).order_by("interacted_at")
+
+    def export() -> int:
+        return sum(len(chunk) for chunk in stream_interaction_data_csv(notes=notes))
+
+    size = measure(export, rounds=3)
+
+    assert size > 0
+
+
+def _history_window(scale_dataset: ScaleDataset) -> tuple[datetime, datetime]:
+    tz = SHELTER_SCHEDULE_TIME_ZONE
+    end_date = timezone.now().astimezone(tz).date()
+    start = datetime.combine(end_date - timedelta(days=scale_dataset.config.history_days - 1), time.min, tzinfo=tz)
+    return start, datetime.combine(end_date, time.min, tzinfo=tz) + timedelta(days=1)
+
+
+# Peak memory is the number to compare: one shelter's full history through the
+# in-memory workbook versus the write-only exporter.
+@pytest.mark.parametrize("write_only", [False, True], ids=["workbook", "write_only"])
+def test_shelter_metrics_to_xlsx(measure: Callable[..., Any], scale_dataset: ScaleDataset, write_only: bool) -> None:
+    shelter = scale_dataset.shelters(scale_dataset.orgs[0])[0]
+    start, end = _history_window(scale_dataset)
+    metrics = shelter_occupancy_metrics(shelter=shelter, start=start, end=end)
+    options = list(MetricsExportOptions)
+
+    def export() -> int:
+        if not write_only:
+            return len(metrics_to_xlsx(metrics, options)[1])
+        _, xlsx_file = shelters_metrics_to_xlsx(
+            [metrics], options, start_date=metrics.start_date, end_date=metrics.end_date
+        )
+        with xlsx_file:
+            return xlsx_file.seek(0, SEEK_END)
+
+    size = measure(export, rounds=3)
+
+    assert size > 0
+
+
+def test_all_shelters_metrics_to_xlsx(measure: Callable[..., Any], scale_dataset: ScaleDataset) -> None:
+    start, end = _history_window(scale_dataset)
+    shelters = Shelter.objects.filter(organization__in=scale_dataset.orgs).order_by("pk")
+
+    def export() -> int:
+        _, xlsx_file = shelters_metrics_to_xlsx(
+            shelters_occupancy_metrics(shelters=shelters.iterator(), start=start, end=end),
+            list(MetricsExportOptions),
+            start_date=start.date(),
+            end_date=(end - timedelta(days=1)).date(),
+        )
+        with xlsx_file:
+            return xlsx_file.seek(0, SEEK_END)
+
+    size = measure(export, rounds=1)
+
+    assert size > 0
+
+
+def test_all_shelters_metrics_zip(measure: Callable[..., Any], scale_dataset: ScaleDataset) -> None:
+    start, end = _history_window(scale_dataset)
+    shelters = Shelter.objects.filter(organization__in=scale_dataset.orgs).order_by("pk")
+
+    def export() -> int:
+        metrics = shelters_occupancy_metrics(shelters=shelters.iterator(), start=start, end=end)
+        return sum(len(chunk) for chunk in stream_metrics_zip(metrics, list(MetricsExportOptions)))
+
+    size = measure(export, rounds=1)
+
+    assert size > 0
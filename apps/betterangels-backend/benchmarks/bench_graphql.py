@@ -0,0 +1,162 @@
+"""End-to-end GraphQL requests (middleware, permissions, resolvers) against the scale dataset."""
+
+import json
+from typing import Any, Callable
+
+import pytest
+from common.scale_data import ScaleDataset
+from common.graphql.pagination import encode_cursor
+from django.test import Client
+from notes.models import Note
+
+pytestmark = pytest.mark.django_db
+
+SHELTERS_QUERY = """
+    query Shelters($offset: Int!, $limit: Int!) {
+        shelters(pagination: {offset: $offset, limit: $limit}) {
+            totalCount
+            results { id name location { latitude longitude } }
+        }
+    }
+"""
+
+NEAREST_SHELTERS_QUERY = """
+    query NearestShelters($geolocation: GeolocationInput!, $limit: Int!) {
+        shelters(filters: {geolocation: $geolocation}, pagination: {offset: 0, limit: $limit}) {
+            results { id name distanceInMiles }
+        }
+    }
+"""
+# Downtown Los Angeles.
+REFERENCE_POINT = {"latitude": 34.0522, "longitude": -118.2437}
+
+CLIENT_PROFILES_QUERY = """
+    query ClientProfiles($search: String!) {
+        clientProfiles(filters: {search: $search}, pagination: {offset: 0, limit: 25}) {
+            totalCount
+            results { id firstName lastName email }
+        }
+    }
+"""
+
+NOTES_QUERY = """
+    query Notes($limit: Int!) {
+        notes(pagination: {offset: 0, limit: $limit}) {
+            totalCount
+            results { id purpose interactedAt clientProfile { id firstName } providedServices { id service { label } } }
+        }
+    }
+"""
+
+NOTES_OFFSET_PAGE_QUERY = """
+    query NotesOffsetPage($offset: Int!) {
+        notes(pagination: {offset: $offset, limit: 25}) {
+            results { id purpose interactedAt }
+        }
+    }
+"""
+
+NOTES_KEYSET_PAGE_QUERY = """
+    query NotesKeysetPage($after: String!) {
+        notesKeyset(pagination: {after: $after, limit: 25}) {
+            pageInfo { hasNextPage }
+            results { id purpose interactedAt }
+        }
+    }
+"""
+NOTES_KEYSET = ("-interacted_at", "-id")
+
+REPORT_SUMMARY_QUERY = """
+    query ReportSummary($startDate: Date, $endDate: Date) {
+        reportSummary(startDate: $startDate, endDate: $endDate) {
+            totalNotes
+            uniqueClients
+            notesByDate { date count }
+            notesByTeam { name count }
+            topProvidedServices { name count }
+        }
+    }
+"""
+
+SHELTER_OCCUPANCY_METRICS_QUERY = """
+    query ShelterOccupancyMetrics($shelterId: ID!, $startDate: Date, $endDate: Date) {
+        shelterOccupancyMetrics(shelterId: $shelterId, startDate: $startDate, endDate: $endDate) {
+            dailyOccupancy { date occupiedCount totalBeds occupancyPct }
+            dailyBedStatus { date available occupied reserved outOfService inTurnaround }
+            reservationMetrics { checkInOverdue cancelled checkedIn checkInOverdueToCheckedIn }
+            avgDaysToOccupancy
+        }
+    }
+"""
+
+
+@pytest.fixture
+def execute(scale_dataset: ScaleDataset) -> Callable[[str, dict[str, Any]], dict[str, Any]]:
+    client = Client()
+    client.force_login(scale_dataset.user)
+    org_header = {"HTTP_X_ORGANIZATION_ID": str(scale_dataset.orgs[0].pk)}
+
+    def run(query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        response = client.post(
+            "/graphql",
+            json.dumps({"query": query, "variables": variables}),
+            content_type="application/json",
+            **org_header,
+        )
+        payload: dict[str, Any] = response.json()
+        assert "errors" not in payload, payload["errors"]
+        return payload["data"]
+
+    return run
+
+
+def test_shelters(measure: Callable[..., Any], execute: Callable[..., Any]) -> None:
+    data = measure(execute, SHELTERS_QUERY, {"offset": 0, "limit": 50})
+    assert data["shelters"]["totalCount"] > 0
+
+
+@pytest.mark.parametrize("nearest_first", [False, True], ids=["sorted", "knn"])
+def test_nearest_shelters(measure: Callable[..., Any], execute: Callable[..., Any], nearest_first: bool) -> None:
+    geolocation = {**REFERENCE_POINT, "nearestFirst": nearest_first}
+    data = measure(execute, NEAREST_SHELTERS_QUERY, {"geolocation": geolocation, "limit": 25})
+    distances = [s["distanceInMiles"] for s in data["shelters"]["results"]]
+    assert len(distances) == 25
+    assert distances == sorted(distances)
+
+
+def test_client_profiles_search(measure: Callable[..., Any], execute: Callable[..., Any]) -> None:
+    data = measure(execute, CLIENT_PROFILES_QUERY, {"search": "john"})
+    assert data["clientProfiles"]["totalCount"] > 0
+
+
+def test_notes(measure: Callable[..., Any], execute: Callable[..., Any]) -> None:
+    data = measure(execute, NOTES_QUERY, {"limit": 50})
+    assert data["notes"]["totalCount"] > 0
+
+
+@pytest.mark.parametrize("mode", ["offset", "keyset"])
+def test_notes_deep_page(
+    measure: Callable[..., Any], execute: Callable[..., Any], scale_dataset: ScaleDataset, mode: str
+) -> None:
+    notes = Note.objects.filter(organization=scale_dataset.orgs[0]).order_by(*NOTES_KEYSET)
+    depth = notes.count() // 2
+    if mode == "offset":
+        data = measure(execute, NOTES_OFFSET_PAGE_QUERY, {"offset": depth})
+        assert data["notes"]["results"]
+    else:
+        after = encode_cursor(notes[depth - 1], NOTES_KEYSET)
+        data = measure(execute, NOTES_KEYSET_PAGE_QUERY, {"after": after})
+        assert data["notesKeyset"]["results"]
+
+
+def test_report_summary(measure: Callable[..., Any], execute: Callable[..., Any]) -> None:
+    data = measure(execute, REPORT_SUMMARY_QUERY, {"startDate": None, "endDate": None})
+    assert data["reportSummary"]["totalNotes"] >= 0
+
+
+def test_shelter_occupancy_metrics(
+    measure: Callable[..., Any], execute: Callable[..., Any], scale_dataset: ScaleDataset
+) -> None:
+    shelter = scale_dataset.shelters(scale_dataset.orgs[0])[0]
+    data = measure(execute, SHELTER_OCCUPANCY_METRICS_QUERY, {"shelterId": str(shelter.pk)})
+    assert len(data["shelterOccupancyMetrics"]["dailyOccupancy"]) == 30
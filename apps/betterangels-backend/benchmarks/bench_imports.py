@@ -0,0 +1,50 @@
+"""Import throughput against the scale dataset; each benchmark also records ``rows_per_second``."""
+
+import itertools
+from typing import Any, Callable
+
+import pytest
+from accounts.selectors import resolve_permission_group
+from common.scale_data import ScaleDataset
+from clients.models import ClientProfile
+from notes.groups import CASEWORKER
+from notes.models import NoteDataImport, OrganizationService
+from notes.services import NoteImportRow, bulk_import_notes
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize("rows", [100, 1_000])
+def test_bulk_import_notes(measure: Callable[..., Any], benchmark: Any, scale_dataset: ScaleDataset, rows: int) -> None:
+    org = scale_dataset.orgs[0]
+    user = scale_dataset.user
+    permission_group = resolve_permission_group(user, template=CASEWORKER, organization_id=str(org.pk))
+    import_job = NoteDataImport.objects.create(source_file="bench.csv", imported_by=user)
+    client_profile_ids = list(ClientProfile.objects.values_list("pk", flat=True)[:100])
+    service_ids = list(OrganizationService.objects.filter(organization=org).values_list("pk", flat=True)[:10])
+    # Every call imports new source ids; repeats would only record "already imported" failures.
+    source_ids = itertools.count()
+
+    def run_import() -> int:
+        batch = [
+            NoteImportRow(
+                source_id=str(source_id),
+                source_name="bench",
+                raw_data={"id": source_id},
+                note={
+                    "purpose": f"Imported note {source_id}",
+                    "public_details": "Imported from the benchmark.",
+                    "client_profile": client_profile_ids[source_id % len(client_profile_ids)],
+                    "provided_services": [{"service_id": service_ids[source_id % len(service_ids)]}],
+                    "requested_services": [{"service_other": "Benchmark request"}],
+                },
+            )
+            for source_id in itertools.islice(source_ids, rows)
+        ]
+        records = bulk_import_notes(import_job=import_job, user=user, permission_group=permission_group, rows=batch)
+        return sum(record.success for record in records)
+
+    imported = measure(run_import, rounds=3)
+
+    benchmark.extra_info["rows_per_second"] = round(rows / benchmark.stats.stats.median)
+    assert imported == rows
@@ -0,0 +1,58 @@
+from datetime import datetime, time, timedelta
+from typing import Any, Callable
+
+import pytest
+from common.scale_data import ScaleDataset
+from django.utils import timezone
+from reports.selectors import report_summary
+from shelters.enums import BedStatusChoices, RoomStatusChoices
+from shelters.models import Bed, Room, Shelter
+from shelters.selectors import shelter_occupancy_metrics
+from shelters.selectors.computed_status import shelter_count_subquery, shelter_status_counts
+from shelters.types.filters import SHELTER_SCHEDULE_TIME_ZONE
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize("days", [30, 365])
+def test_report_summary(measure: Callable[..., Any], scale_dataset: ScaleDataset, days: int) -> None:
+    end_date = timezone.now().date()
+    start_date = end_date - timedelta(days=days - 1)
+
+    summary = measure(report_summary, org=scale_dataset.orgs[0], start_date=start_date, end_date=end_date)
+
+    assert summary["total_notes"] > 0
+
+
+@pytest.mark.parametrize("days", [30, 365])
+def test_shelter_occupancy_metrics(measure: Callable[..., Any], scale_dataset: ScaleDataset, days: int) -> None:
+    shelter = scale_dataset.shelters(scale_dataset.orgs[0])[0]
+    tz = SHELTER_SCHEDULE_TIME_ZONE
+    end_date = timezone.now().astimezone(tz).date()
+    start = datetime.combine(end_date - timedelta(days=days - 1), time.min, tzinfo=tz)
+    end = datetime.combine(end_date, time.min, tzinfo=tz) + timedelta(days=1)
+
+    metrics = measure(shelter_occupancy_metrics, shelter=shelter, start=start, end=end)
+
+    assert len(metrics.daily_occupancy) == days
+
+
+@pytest.mark.parametrize("annotation", ["per_status", "grouped"])
+def test_shelter_status_counts(measure: Callable[..., Any], scale_dataset: ScaleDataset, annotation: str) -> None:
+    shelter_ids = [shelter.pk for shelter in scale_dataset.shelters(scale_dataset.orgs[0])]
+
+    def per_status() -> list[dict[str, Any]]:
+        annotations: dict[str, Any] = {}
+        for kind, model_class, status_enum in (("beds", Bed, BedStatusChoices), ("rooms", Room, RoomStatusChoices)):
+            annotations[f"{kind}_total"] = shelter_count_subquery(model_class)
+            for status in status_enum:
+                annotations[f"{kind}_{status.value}"] = shelter_count_subquery(model_class, status)
+        return list(Shelter.objects.filter(pk__in=shelter_ids).annotate(**annotations).values("pk", *annotations))
+
+    def grouped() -> list[tuple[Any, Any]]:
+        beds, rooms = shelter_status_counts(Bed, shelter_ids), shelter_status_counts(Room, shelter_ids)
+        return [(beds[pk], rooms[pk]) for pk in shelter_ids]
+
+    rows = measure({"per_status": per_status, "grouped": grouped}[annotation])
+
+    assert len(rows) == len(shelter_ids)
@@ -0,0 +1,65 @@
+"""Periodic task throughput against the scale dataset; each benchmark also records ``rows_per_second``."""
+
+from datetime import timedelta
+from typing import Any, Callable
+from unittest.mock import patch
+
+import pytest
+from common.scale_data import ScaleDataset
+from django.utils import timezone
+from reports.models import ScheduledReport
+from reports.tasks import process_scheduled_reports, send_scheduled_reports
+from shelters.enums import ReservationStatusChoices
+from shelters.models import Bed, Reservation
+from shelters.services.reservation import reservation_mark_overdue
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize("rows", [1_000, 10_000])
+def test_reservation_mark_overdue(
+    measure: Callable[..., Any], benchmark: Any, scale_dataset: ScaleDataset, rows: int
+) -> None:
+    shelter = scale_dataset.shelters(scale_dataset.orgs[0])[0]
+    # Fresh beds, so the confirmed reservations don't collide with the seeded active stays.
+    beds = Bed.objects.bulk_create(Bed(shelter=shelter) for _ in range(rows))
+    start_date = timezone.now().date() - timedelta(days=1)
+    reservations = Reservation.objects.bulk_create(
+        Reservation(bed=bed, start_date=start_date, status=ReservationStatusChoices.CONFIRMED) for bed in beds
+    )
+    reservation_ids = [reservation.pk for reservation in reservations]
+
+    def confirm() -> None:
+        Reservation.objects.filter(pk__in=reservation_ids).update(status=ReservationStatusChoices.CONFIRMED)
+
+    marked = measure(reservation_mark_overdue, setup=confirm, rounds=3)
+
+    benchmark.extra_info["rows_per_second"] = round(rows / benchmark.stats.stats.median)
+    assert marked == rows
+
+
+@pytest.mark.parametrize("reports_per_org", [60])
+def test_scheduled_reports_dispatch(
+    measure: Callable[..., Any], benchmark: Any, scale_dataset: ScaleDataset, reports_per_org: int
+) -> None:
+    reports = ScheduledReport.objects.bulk_create(
+        ScheduledReport(name=f"bench-{i}", organization=org, recipients="bench@example.com")
+        for org in scale_dataset.orgs
+        for i in range(reports_per_org)
+    )
+    report_ids = [report.pk for report in reports]
+
+    def make_due() -> None:
+        ScheduledReport.objects.filter(pk__in=report_ids).update(
+            next_run_at=timezone.now() - timedelta(minutes=1), claimed_until=None
+        )
+
+    def dispatch_and_send() -> int:
+        with patch("reports.tasks.send_scheduled_reports.delay") as mock_delay:
+            process_scheduled_reports.apply().get()
+        return sum(len(send_scheduled_reports.apply(args=batch.args).get()) for batch in mock_delay.call_args_list)
+
+    sent = measure(dispatch_and_send, setup=make_due, rounds=3)
+
+    benchmark.extra_info["rows_per_second"] = round(len(report_ids) / benchmark.stats.stats.median)
+    assert sent == len(report_ids)
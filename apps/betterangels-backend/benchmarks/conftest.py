@@ -0,0 +1,144 @@
+"""
+Fixtures for the benchmark suite.
+
+Benchmarks run against their own test database (``BENCH_DB_NAME``) so the
+large seeded dataset survives between runs (``--reuse-db``) without leaking
+into the regular test database.  Pick the scale with ``--bench-scale``.
+
+Every benchmark records, next to pytest-benchmark's timings, the SQL query
+count and the peak Python memory of one extra (untimed) call in
+``extra_info``.  Those land in the saved run under ``--benchmark-storage``;
+the terminal summary compares them with the previous saved run.
+"""
+
+import json
+import tracemalloc
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from common.scale_data import PRESETS, ScaleDataset, describe, load_or_seed
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+BENCH_DB_NAME = "test_betterangels_bench"
+# Metric -> ratio over the previous run that is flagged as a regression.
+TRACKED_METRICS = {"sql_queries": 1.0, "peak_memory_bytes": 1.1}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--bench-scale",
+        choices=sorted(PRESETS),
+        default="small",
+        help="Size of the synthetic dataset to benchmark against (default: small).",
+    )
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings() -> None:
+    from django.conf import settings
+
+    settings.DATABASES["default"].setdefault("TEST", {})["NAME"] = BENCH_DB_NAME
+
+
+@pytest.fixture(scope="session")
+def scale_dataset(
+    request: pytest.FixtureRequest, django_db_setup: None, django_db_blocker: Any
+) -> Iterator[ScaleDataset]:
+    config = PRESETS[request.config.getoption("--bench-scale")]
+    reporter = request.config.pluginmanager.get_plugin("terminalreporter")
+
+    def log(message: str) -> None:
+        if reporter is not None:
+            reporter.write_line(f"[seed] {message}")
+
+    with django_db_blocker.unblock():
+        dataset = load_or_seed(config, log=log)
+    yield dataset
+
+
+@pytest.fixture
+def measure(benchmark: Any, scale_dataset: ScaleDataset) -> Callable[..., Any]:
+    """Time ``fn(*args, **kwargs)`` and record its query count and peak memory.
+
+    Queries and memory come from one extra call outside the timed rounds, so
+    neither ``tracemalloc`` nor query capture skews the timings.  ``setup``,
+    if given, runs untimed before every call.
+    """
+
+    def run(
+        fn: Callable[..., Any],
+        *args: Any,
+        rounds: int = 5,
+        setup: Callable[[], None] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        if setup is not None:
+            setup()
+        tracemalloc.start()
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                fn(*args, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        benchmark.extra_info["sql_queries"] = len(queries.captured_queries)
+        benchmark.extra_info["peak_memory_bytes"] = peak
+        benchmark.extra_info["scale"] = describe(scale_dataset.config)
+        if setup is None:
+            return benchmark.pedantic(fn, args=args, kwargs=kwargs, rounds=rounds, iterations=1, warmup_rounds=1)
+
+        def setup_round() -> tuple[tuple[Any, ...], dict[str, Any]]:
+            setup()
+            return args, kwargs
+
+        return benchmark.pedantic(fn, setup=setup_round, rounds=rounds, iterations=1, warmup_rounds=1)
+
+    return run
+
+
+def _previous_run(config: pytest.Config) -> dict[str, dict[str, Any]]:
+    storage: str = config.getoption("benchmark_storage")
+    if not storage.startswith("file://"):
+        return {}
+    root = Path(storage.removeprefix("file://"))
+    saved = sorted(root.glob("*/*.json"), key=lambda p: p.name)
+    if not saved:
+        return {}
+    data = json.loads(saved[-1].read_text())
+    return {b["fullname"]: b.get("extra_info", {}) for b in data.get("benchmarks", [])}
+
+
+def pytest_sessionstart(session: pytest.Session) -> None:
+    # Read before this run is autosaved, so the summary compares against the previous one.
+    session.config._bench_previous = _previous_run(session.config)  # type: ignore[attr-defined]
+
+
+def pytest_terminal_summary(terminalreporter: Any, config: pytest.Config) -> None:
+    bs = getattr(config, "_benchmarksession", None)
+    if bs is None or not bs.benchmarks:
+        return
+    previous: dict[str, dict[str, Any]] = getattr(config, "_bench_previous", {})
+
+    terminalreporter.section("queries / peak memory (vs. previous saved run)")
+    for bench in bs.benchmarks:
+        current = bench.extra_info
+        before = previous.get(bench.fullname, {})
+        cells = []
+        for metric in TRACKED_METRICS:
+            value = current.get(metric)
+            if value is None:
+                continue
+            old = before.get(metric)
+            delta = "" if old is None or old == value else f" ({value - old:+,})"
+            cells.append(f"{metric}={value:,}{delta}")
+        if (throughput := current.get("rows_per_second")) is not None:
+            cells.append(f"rows_per_second={throughput:,}")
+        regressed = any(
+            before.get(metric) is not None and current.get(metric, 0) > before[metric] * tolerance
+            for metric, tolerance in TRACKED_METRICS.items()
+        )
+        terminalreporter.write_line(f"{bench.name}: " + ", ".join(cells), red=regressed)
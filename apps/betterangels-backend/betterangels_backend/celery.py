@@ -34,4 +34,19 @@ app.conf.beat_schedule = {
         "task": "reports.tasks.process_scheduled_reports",
         "schedule": crontab(minute=0),
     },
+    # Roll new bed/reservation events into the occupancy report rollup
+    "refresh_occupancy_rollups": {
+        "task": "shelters.tasks.refresh_occupancy_rollups",
+        "schedule": crontab(minute="*/15"),
+    },
+    # Flag confirmed reservations that were never checked in
+    "mark_overdue_reservations": {
+        "task": "shelters.tasks.mark_overdue_reservations",
+        "schedule": crontab(minute=5),
+    },
+    # Fail export jobs whose worker died mid-export
+    "fail_stale_export_jobs": {
+        "task": "reports.tasks.fail_stale_export_jobs",
+        "schedule": crontab(minute="*/10"),
+    },
 }
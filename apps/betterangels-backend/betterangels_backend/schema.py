@@ -10,6 +10,7 @@ from notes.schema import Mutation as NotesMutation
 from notes.schema import Query as NotesQuery
 from referrals.schema import Mutation as ReferralsMutation
 from referrals.schema import Query as ReferralsQuery
+from reports.schema import Mutation as ReportsMutation
 from reports.schema import Query as ReportsQuery
 from shelters.schema import Mutation as SheltersMutation
 from shelters.schema import Query as SheltersQuery
@@ -43,6 +44,7 @@ mutations = (
     ClientsMutation,
     HmisMutation,
     NotesMutation,
+    ReportsMutation,
     TasksMutation,
     TeamsMutation,
     SheltersMutation,
@@ -52,7 +52,13 @@ env = environ.Env(
     DJANGO_CACHE_MAX_CONNECTIONS=(int, 100),
     GOOGLE_MAPS_API_KEY=(str, ""),
     HMIS_API_KEY=(str, ""),
+    HMIS_CONNECT_TIMEOUT=(float, 3.05),
     HMIS_HOST=(str, ""),
+    HMIS_MAX_RETRIES=(int, 2),
+    HMIS_OPERATION_TIMEOUTS=(dict, {}),
+    HMIS_POOL_MAXSIZE=(int, 10),
+    HMIS_READ_TIMEOUT=(float, 15.0),
+    HMIS_RESPONSE_CACHE_TTL=(int, 0),
     HMIS_REST_URL=(str, ""),
     HMIS_TOKEN_KEY=(str, ""),
     IS_LOCAL_DEV=(bool, False),
@@ -63,6 +69,7 @@ env = environ.Env(
     POSTGRES_USER=(str, "postgres"),
     POSTGRES_PASSWORD=(str, "postgres"),
     POSTGRES_HOST=(str, "db"),
+    REPORT_SUMMARY_CACHE_TTL=(int, 0),
     SECRET_KEY=(str, "secret_key"),
     SESSION_COOKIE_AGE=(int, 172800),  # Defaults to two days in seconds
     SESSION_COOKIE_SECURE=(bool, True),
@@ -78,6 +85,7 @@ env = environ.Env(
     IMGPROXY_PATH_PREFIX=(str, ""),
     IMGPROXY_LOCAL_URL=(str, "http://localhost:8080"),
     IMGPROXY_LOCAL_MEDIA_URL=(str, "http://better-angels:8000/media/"),
+    SHELTER_MAP_CLUSTER_CACHE_TTL=(int, 0),
     SHELTER_PHOTO_MAX_FILE_SIZE=(int, 50 * 1024 * 1024),  # 50 MiB
     NOTE_ATTACHMENT_MAX_FILE_SIZE=(int, 50 * 1024 * 1024),
     CLIENT_DOCUMENT_MAX_FILE_SIZE=(int, 50 * 1024 * 1024),
@@ -460,6 +468,22 @@ HMIS_API_KEY = env("HMIS_API_KEY")
 HMIS_TOKEN_KEY = env("HMIS_TOKEN_KEY")
 HMIS_HOST = env("HMIS_HOST")
 HMIS_REST_URL = env("HMIS_REST_URL")
+# Shared transport (hmis/transport.py): pooled keep-alive connections, retries on
+# connect errors and on 5xx for idempotent methods, per-operation read timeouts
+# (e.g. HMIS_OPERATION_TIMEOUTS="login=30,create_client=30").
+HMIS_CONNECT_TIMEOUT = env("HMIS_CONNECT_TIMEOUT")
+HMIS_READ_TIMEOUT = env("HMIS_READ_TIMEOUT")
+HMIS_OPERATION_TIMEOUTS = {k: float(v) for k, v in env("HMIS_OPERATION_TIMEOUTS").items()}
+HMIS_MAX_RETRIES = env("HMIS_MAX_RETRIES")
+HMIS_POOL_MAXSIZE = env("HMIS_POOL_MAXSIZE")
+# Seconds to cache read responses per HMIS user and query; 0 disables the cache.
+HMIS_RESPONSE_CACHE_TTL = env("HMIS_RESPONSE_CACHE_TTL")
+
+# Seconds to cache the report summary per organization and date range; 0 disables the cache.
+REPORT_SUMMARY_CACHE_TTL = env("REPORT_SUMMARY_CACHE_TTL")
+
+# Seconds to cache shelter map clusters per tile and filter set; 0 disables the cache.
+SHELTER_MAP_CLUSTER_CACHE_TTL = env("SHELTER_MAP_CLUSTER_CACHE_TTL")
 
 # Logging Configuration
 # https://django-structlog.readthedocs.io/en/latest/getting_started.html
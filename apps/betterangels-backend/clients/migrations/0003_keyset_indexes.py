@@ -0,0 +1,17 @@
+# Generated by Django 6.0.6 on 2026-10-18 22:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='clientprofile',
+            index=models.Index(fields=['created_at', 'id'], name='clientprofile_created_id_idx'),
+        ),
+    ]
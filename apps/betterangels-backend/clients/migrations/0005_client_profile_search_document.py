@@ -0,0 +1,72 @@
+# Generated by Django 6.0.6 on 2026-10-18 22:11
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import pgtrigger.compiler
+import pgtrigger.migrations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0004_search_trgm_indexes'),
+        ('common', '0002_phonenumber_number_digits'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClientPhoneNumber',
+            fields=[
+            ],
+            options={
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('common.phonenumber',),
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='clientprofile',
+            name='client_profile_update_update',
+        ),
+        migrations.AddField(
+            model_name='clientprofile',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False, help_text='Maintained by database triggers; see clients/triggers.py.'),
+        ),
+        migrations.AddField(
+            model_name='clientprofile',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, help_text='Maintained by database triggers; see clients/triggers.py.', null=True),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='clientprofile',
+            trigger=pgtrigger.compiler.Trigger(name='client_profile_search_document', sql=pgtrigger.compiler.UpsertTriggerSql(func='NEW."search_vector" :=\n    setweight(to_tsvector(\'simple\', regexp_replace(concat_ws(\' \', NEW."first_name", NEW."last_name"), \'[^[:alnum:]]+\', \' \', \'g\')), \'A\')\n    || setweight(to_tsvector(\'simple\', regexp_replace(concat_ws(\' \', NEW."middle_name", NEW."nickname"), \'[^[:alnum:]]+\', \' \', \'g\')), \'B\')\n    || setweight(to_tsvector(\'simple\', regexp_replace(concat_ws(\' \', NEW."california_id", (SELECT string_agg(h."hmis_id", \' \') FROM "clients_hmisprofile" h\n            WHERE h."client_profile_id" = NEW."id")), \'[^[:alnum:]]+\', \' \', \'g\')), \'C\')\n    || setweight(to_tsvector(\'simple\', regexp_replace(concat_ws(\' \', (SELECT string_agg(concat_ws(\' \', d, substring(d FROM \'^1(\\d{10})$\')), \' \')\n            FROM (SELECT p."number_digits" FROM "common_phonenumber" p\n            JOIN "django_content_type" ct ON ct."id" = p."content_type_id"\n            WHERE ct."app_label" = \'clients\' AND ct."model" = \'clientprofile\'\n              AND p."object_id" = NEW."id" AND p."number_digits" <> \'\') phones (d))), \'[^[:alnum:]]+\', \' \', \'g\')), \'D\');\nNEW."search_text" := concat_ws(\' \',\n    NEW."first_name", NEW."middle_name", NEW."last_name", NEW."nickname", NEW."california_id", (SELECT string_agg(h."hmis_id", \' \') FROM "clients_hmisprofile" h\n            WHERE h."client_profile_id" = NEW."id")\n);\nRETURN NEW;', hash='c62288c29e779e24a1fea5f364ccb10585720600', operation='INSERT OR UPDATE OF "first_name", "middle_name", "last_name", "nickname", "california_id", "search_vector", "search_text"', pgid='pgtrigger_client_profile_search_document_35cc9', table='clients_clientprofile', when='BEFORE')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='clientprofile',
+            trigger=pgtrigger.compiler.Trigger(name='client_profile_update_update', sql=pgtrigger.compiler.UpsertTriggerSql(condition='WHEN (OLD."ada_accommodation" IS DISTINCT FROM (NEW."ada_accommodation") OR OLD."address" IS DISTINCT FROM (NEW."address") OR OLD."california_id" IS DISTINCT FROM (NEW."california_id") OR OLD."created_at" IS DISTINCT FROM (NEW."created_at") OR OLD."date_of_birth" IS DISTINCT FROM (NEW."date_of_birth") OR OLD."email" IS DISTINCT FROM (NEW."email") OR OLD."eye_color" IS DISTINCT FROM (NEW."eye_color") OR OLD."first_name" IS DISTINCT FROM (NEW."first_name") OR OLD."gender" IS DISTINCT FROM (NEW."gender") OR OLD."gender_other" IS DISTINCT FROM (NEW."gender_other") OR OLD."hair_color" IS DISTINCT FROM (NEW."hair_color") OR OLD."height_in_inches" IS DISTINCT FROM (NEW."height_in_inches") OR OLD."id" IS DISTINCT FROM (NEW."id") OR OLD."important_notes" IS DISTINCT FROM (NEW."important_notes") OR OLD."last_name" IS DISTINCT FROM (NEW."last_name") OR OLD."living_situation" IS DISTINCT FROM (NEW."living_situation") OR OLD."mailing_address" IS DISTINCT FROM (NEW."mailing_address") OR OLD."marital_status" IS DISTINCT FROM (NEW."marital_status") OR OLD."merged_at" IS DISTINCT FROM (NEW."merged_at") OR OLD."merged_data" IS DISTINCT FROM (NEW."merged_data") OR OLD."merged_into_id" IS DISTINCT FROM (NEW."merged_into_id") OR OLD."middle_name" IS DISTINCT FROM (NEW."middle_name") OR OLD."nickname" IS DISTINCT FROM (NEW."nickname") OR OLD."phone_number" IS DISTINCT FROM (NEW."phone_number") OR OLD."physical_description" IS DISTINCT FROM (NEW."physical_description") OR OLD."place_of_birth" IS DISTINCT FROM (NEW."place_of_birth") OR OLD."preferred_communication" IS DISTINCT FROM (NEW."preferred_communication") OR OLD."preferred_language" IS DISTINCT FROM (NEW."preferred_language") OR OLD."profile_photo" IS DISTINCT FROM (NEW."profile_photo") OR OLD."pronouns" IS DISTINCT FROM (NEW."pronouns") OR OLD."pronouns_other" IS DISTINCT FROM (NEW."pronouns_other") OR OLD."race" IS DISTINCT FROM (NEW."race") OR OLD."residence_address" IS DISTINCT FROM (NEW."residence_address") OR OLD."residence_geolocation" IS DISTINCT FROM (NEW."residence_geolocation") OR OLD."spoken_languages" IS DISTINCT FROM (NEW."spoken_languages") OR OLD."unhoused_start_date" IS DISTINCT FROM (NEW."unhoused_start_date") OR OLD."updated_at" IS DISTINCT FROM (NEW."updated_at") OR OLD."veteran_status" IS DISTINCT FROM (NEW."veteran_status"))', func='INSERT INTO "clients_clientprofileevent" ("ada_accommodation", "address", "california_id", "created_at", "date_of_birth", "email", "eye_color", "first_name", "gender", "gender_other", "hair_color", "height_in_inches", "id", "important_notes", "last_name", "living_situation", "mailing_address", "marital_status", "merged_at", "merged_data", "merged_into_id", "middle_name", "nickname", "pgh_context_id", "pgh_created_at", "pgh_label", "pgh_obj_id", "phone_number", "physical_description", "place_of_birth", "preferred_communication", "preferred_language", "profile_photo", "pronouns", "pronouns_other", "race", "residence_address", "residence_geolocation", "spoken_languages", "unhoused_start_date", "updated_at", "veteran_status") VALUES (NEW."ada_accommodation", NEW."address", NEW."california_id", NEW."created_at", NEW."date_of_birth", NEW."email", NEW."eye_color", NEW."first_name", NEW."gender", NEW."gender_other", NEW."hair_color", NEW."height_in_inches", NEW."id", NEW."important_notes", NEW."last_name", NEW."living_situation", NEW."mailing_address", NEW."marital_status", NEW."merged_at", NEW."merged_data", NEW."merged_into_id", NEW."middle_name", NEW."nickname", _pgh_attach_context(), NOW(), \'client_profile.update\', NEW."id", NEW."phone_number", NEW."physical_description", NEW."place_of_birth", NEW."preferred_communication", NEW."preferred_language", NEW."profile_photo", NEW."pronouns", NEW."pronouns_other", NEW."race", NEW."residence_address", NEW."residence_geolocation", NEW."spoken_languages", NEW."unhoused_start_date", NEW."updated_at", NEW."veteran_status"); RETURN NULL;', hash='fbc0c644a5ea4342d4072e15976dd552b304090e', operation='UPDATE', pgid='pgtrigger_client_profile_update_update_858fb', table='clients_clientprofile', when='AFTER')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='hmisprofile',
+            trigger=pgtrigger.compiler.Trigger(name='hmis_profile_search_document', sql=pgtrigger.compiler.UpsertTriggerSql(func='IF TG_OP = \'UPDATE\'\n    AND OLD."client_profile_id" IS NOT DISTINCT FROM NEW."client_profile_id"\n    AND OLD."hmis_id" IS NOT DISTINCT FROM NEW."hmis_id"\nTHEN\n    RETURN NULL;\nEND IF;\nUPDATE "clients_clientprofile" SET "search_vector" = "search_vector"\n    WHERE "id" IN (OLD."client_profile_id", NEW."client_profile_id");\nRETURN NULL;', hash='4a9771f5af8eaf19447185d06e2f2cb0f9f075cf', operation='INSERT OR UPDATE OR DELETE', pgid='pgtrigger_hmis_profile_search_document_bc4a8', table='clients_hmisprofile', when='AFTER')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='clientphonenumber',
+            trigger=pgtrigger.compiler.Trigger(name='phone_number_search_document', sql=pgtrigger.compiler.UpsertTriggerSql(func='IF TG_OP = \'UPDATE\'\n    AND OLD."content_type_id" IS NOT DISTINCT FROM NEW."content_type_id"\n    AND OLD."object_id" IS NOT DISTINCT FROM NEW."object_id"\n    AND OLD."number_digits" IS NOT DISTINCT FROM NEW."number_digits"\nTHEN\n    RETURN NULL;\nEND IF;\nUPDATE "clients_clientprofile" SET "search_vector" = "search_vector"\n    WHERE "id" IN (SELECT p."object_id" FROM (VALUES (OLD."content_type_id", OLD."object_id"),\n        (NEW."content_type_id", NEW."object_id")) p ("content_type_id", "object_id")\n        JOIN "django_content_type" ct ON ct."id" = p."content_type_id"\n        WHERE ct."app_label" = \'clients\' AND ct."model" = \'clientprofile\');\nRETURN NULL;', hash='ee09ab7a283bd65019d4b6834da1064b93ea7f8f', operation='INSERT OR UPDATE OR DELETE', pgid='pgtrigger_phone_number_search_document_fced2', table='common_phonenumber', when='AFTER')),
+        ),
+        # Assigning the column to itself fires the search trigger for every existing profile.
+        migrations.RunSQL(
+            'UPDATE "clients_clientprofile" SET "search_vector" = "search_vector";',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='clientprofile',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='clientprofile_search_vector'),
+        ),
+        migrations.AddIndex(
+            model_name='clientprofile',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_text'], name='clientprofile_search_text_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
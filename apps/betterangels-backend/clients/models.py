@@ -21,6 +21,11 @@ from clients.enums import (
     SocialMediaEnum,
     VeteranStatusEnum,
 )
+from clients.triggers import (
+    client_profile_search_trigger,
+    hmis_profile_search_sync_trigger,
+    phone_number_search_sync_trigger,
+)
 from common.constants import CALIFORNIA_ID_REGEX
 from common.models import Attachment, BaseModel, PhoneNumber
 from common.permissions.utils import PermissionSet
@@ -28,10 +33,12 @@ from dateutil.relativedelta import relativedelta
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.gis.db.models import PointField
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import RegexValidator
 from django.db import models
 from django.db.models import Model, QuerySet
-from django.db.models.functions import Lower
+from django.db.models.functions import Lower, Upper
 from django.utils import timezone
 from django.utils.encoding import force_str
 from django_choices_field import TextChoicesField
@@ -91,6 +98,7 @@ class HmisProfile(BaseModel):
 
     class Meta:
         constraints = [models.UniqueConstraint(Lower("hmis_id"), "agency", name="unique_hmis_id_agency")]
+        triggers = [hmis_profile_search_sync_trigger(name="hmis_profile_search_document")]
 
 
 class AbstractClientProfile(BaseModel):
@@ -165,6 +173,8 @@ class ClientProfileManager(models.Manager.from_queryset(ClientProfileQuerySet)["
     pghistory.InsertEvent("client_profile.add"),
     pghistory.UpdateEvent("client_profile.update"),
     pghistory.DeleteEvent("client_profile.remove"),
+    # Derived from the profile, its HMIS profiles and phone numbers by trigger.
+    exclude=["search_text", "search_vector"],
 )
 class ClientProfile(AbstractClientProfile):
     objects = ClientProfileManager()  # hides merged profiles by default
@@ -183,6 +193,18 @@ class ClientProfile(AbstractClientProfile):
     nickname = models.CharField(max_length=50, blank=True, null=True)
     profile_photo = models.ImageField(upload_to=get_client_profile_photo_file_path, blank=True, null=True)
     race = TextChoicesField(choices_enum=RaceEnum, blank=True, null=True)
+    search_text = models.TextField(
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Maintained by database triggers; see clients/triggers.py.",
+    )
+    search_vector = SearchVectorField(
+        blank=True,
+        null=True,
+        editable=False,
+        help_text="Maintained by database triggers; see clients/triggers.py.",
+    )
     veteran_status = TextChoicesField(choices_enum=VeteranStatusEnum, blank=True, null=True)
 
     @model_property
@@ -227,7 +249,8 @@ class ClientProfile(AbstractClientProfile):
 
         return force_str(self.gender.label)
 
-    def save(self, *args: Any, **kwargs: Any) -> None:
+    def normalize_identifiers(self) -> None:
+        """Upper-case the California ID and lower-case the email; blank values become ``None``."""
         if self.california_id:
             self.california_id = self.california_id.upper()
         else:
@@ -238,6 +261,8 @@ class ClientProfile(AbstractClientProfile):
         else:
             self.email = None
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        self.normalize_identifiers()
         super().save(*args, **kwargs)
 
     @model_property
@@ -250,6 +275,23 @@ class ClientProfile(AbstractClientProfile):
 
     class Meta:
         ordering = ["first_name"]
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="clientprofile_created_id_idx"),
+            # Match ``icontains``/``istartswith``, which compile to ``UPPER(<field>::text) LIKE ...``.
+            GinIndex(OpClass(Upper("first_name"), name="gin_trgm_ops"), name="clientprofile_first_name_trgm"),
+            GinIndex(OpClass(Upper("last_name"), name="gin_trgm_ops"), name="clientprofile_last_name_trgm"),
+            GinIndex(fields=["search_vector"], name="clientprofile_search_vector"),
+            GinIndex(fields=["search_text"], opclasses=["gin_trgm_ops"], name="clientprofile_search_text_trgm"),
+        ]
+        triggers = [client_profile_search_trigger(name="client_profile_search_document")]
+
+
+class ClientPhoneNumber(PhoneNumber):
+    """Carries the trigger that keeps client search documents in sync with ``common_phonenumber``."""
+
+    class Meta:
+        proxy = True
+        triggers = [phone_number_search_sync_trigger(name="phone_number_search_document")]
 
 
 class ClientDocument(Attachment):
@@ -16,15 +16,18 @@ from clients.models import (
     SocialMediaProfile,
 )
 
-from clients.services import client_document, client_profile_photo
+from clients.selectors.search import CLIENT_PROFILE_SEARCH_DEFAULT_LIMIT, search_client_profiles
+from clients.services import client_document, client_profile_import, client_profile_photo
 from common.services.types import UploadRequest, UploadConfirmation
 from common.constants import CALIFORNIA_ID_REGEX, EMAIL_REGEX
+from common.graphql.pagination import KeysetPaginated, keyset_paginated
 from common.graphql.types import (
     AuthorizedPresignedS3UploadsType,
     AuthorizedPresignedS3UploadType,
     DeleteDjangoObjectInput,
     DeletedObjectType,
 )
+from common.graphql.utils import without_unset
 from common.models import Attachment, PhoneNumber
 from common.permissions.utils import IsAuthenticated, assign_object_permissions
 from django.contrib.contenttypes.fields import GenericRel
@@ -46,6 +49,7 @@ from strawberry_django.utils.query import filter_for_user
 
 from .enums import RelationshipTypeEnum
 from .types import (
+    BulkImportClientProfilesInput,
     ClientContactInput,
     ClientContactType,
     ClientDocumentType,
@@ -54,6 +58,7 @@ from .types import (
     ClientHouseholdMemberType,
     ClientProfileDataImportType,
     ClientProfileImportRecordsBulkInput,
+    ClientProfileImportRecordsType,
     ClientProfileImportRecordType,
     ClientProfilePhotoInput,
     ClientProfileType,
@@ -346,6 +351,22 @@ class Query:
         permission_classes=[IsAuthenticated],
         extensions=[HasRetvalPerm(perms=[ClientProfile.perms.VIEW])],
     )
+    client_profiles_keyset: KeysetPaginated[ClientProfileType] = keyset_paginated(
+        key=("-created_at", "-id"),
+        permission_classes=[IsAuthenticated],
+        extensions=[HasRetvalPerm(perms=[ClientProfile.perms.VIEW])],
+    )
+
+    @strawberry_django.field(permission_classes=[IsAuthenticated])
+    def client_profile_search(
+        self, info: Info, text: str, limit: int = CLIENT_PROFILE_SEARCH_DEFAULT_LIMIT
+    ) -> List[ClientProfileType]:
+        """The best matches for *text*, ranked, in one scan of the client search index."""
+        user = get_current_user(info)
+        # Permissions are applied before ranking: the top matches are taken from the visible profiles.
+        queryset = filter_for_user(ClientProfile.objects.all(), user, [ClientProfile.perms.VIEW])
+
+        return cast(List[ClientProfileType], search_client_profiles(queryset, text, limit=limit))
 
     client_document: ClientDocumentType = strawberry_django.field(
         permission_classes=[IsAuthenticated],
@@ -846,6 +867,31 @@ class Mutation:
             )
         return cast(ClientProfileImportRecordType, record)
 
+    @strawberry_django.mutation(
+        permission_classes=[IsAuthenticated], extensions=[HasPerm(ClientProfileImportRecord.perms.ADD)]
+    )
+    def bulk_import_client_profiles(
+        self, info: Info, data: BulkImportClientProfilesInput
+    ) -> ClientProfileImportRecordsType:
+        """Import many rows into one import job; like ``import_client_profile``, failures are recorded per row."""
+        import_job = ClientProfileDataImport.objects.get(id=data.import_job_id)
+        rows = [
+            client_profile_import.ClientProfileImportRow(
+                source_id=record.source_id,
+                source_name=record.source_name,
+                raw_data=record.raw_data,
+                client_profile=without_unset(strawberry.asdict(record.client_profile)),
+            )
+            for record in data.records
+        ]
+        records = client_profile_import.bulk_import_client_profiles(import_job=import_job, rows=rows)
+
+        # Failed rows are written after the batch's successes, so pk order isn't input order.
+        by_pk = ClientProfileImportRecord.objects.select_related("client_profile").in_bulk([r.pk for r in records])
+        return ClientProfileImportRecordsType(
+            records=cast(List[ClientProfileImportRecordType], [by_pk[record.pk] for record in records])
+        )
+
     update_client_document: ClientDocumentType = mutations.update(
         UpdateClientDocumentInput,
         permission_classes=[IsAuthenticated],
@@ -92,6 +92,8 @@ def get_scalar_fields(model: type[models.Model]) -> list[models.Field]:
             "merged_at",
             "merged_data",
             "profile_photo",  # ImageField — handled separately
+            "search_text",  # maintained by database triggers
+            "search_vector",
             "pgh_obj",
             "pgh_created_at",
             "pgh_label",
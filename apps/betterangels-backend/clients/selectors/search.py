@@ -0,0 +1,76 @@
+"""
+Selectors for client profile search.
+
+Every query here runs against the search document that database triggers
+keep on each ``ClientProfile`` (see clients/triggers.py):
+
+* ``search_vector``: names (weight A), middle name and nickname (B),
+  California ID and HMIS IDs (C) and phone digits (D), GIN-indexed.
+* ``search_text``: the same words as plain text, trigram-indexed.
+
+Both live on the profile row, so a search is one index scan of one table
+instead of an OR across five columns, the HMIS table and the phone table.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Optional, Sequence
+
+from clients.models import ClientProfile
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.db.models import F, Q, QuerySet
+
+CLIENT_PROFILE_SEARCH_DEFAULT_LIMIT = 20
+CLIENT_PROFILE_SEARCH_MAX_LIMIT = 100
+
+# Alphanumeric runs: the same split the search trigger applies to the document.
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def search_words(value: str) -> list[str]:
+    """Lower-cased words of *value*, as they appear in ``search_vector``."""
+    return _WORD_RE.findall(value.lower())
+
+
+def prefix_search_query(words: Sequence[str]) -> Optional[SearchQuery]:
+    """Match profiles with a word starting with each of *words* (``istartswith`` per word)."""
+    if not words:
+        return None
+    # Words are alphanumeric only, so they can't carry tsquery operators.
+    return SearchQuery(" & ".join(f"{word}:*" for word in words), config="simple", search_type="raw")
+
+
+def exact_search_query(words: Sequence[str]) -> Optional[SearchQuery]:
+    """Match profiles with every one of *words* as a whole word."""
+    if not words:
+        return None
+    return SearchQuery(" & ".join(words), config="simple", search_type="raw")
+
+
+def search_client_profiles(
+    queryset: QuerySet[ClientProfile],
+    text: str,
+    *,
+    limit: int = CLIENT_PROFILE_SEARCH_DEFAULT_LIMIT,
+) -> QuerySet[ClientProfile]:
+    """Return the *limit* profiles of *queryset* that best match *text*, best first.
+
+    A profile matches when it has a word starting with every word of *text*,
+    or, to forgive typos, when *text* is trigram-similar to a run of its
+    words.  Matches are ranked by the weighted prefix match plus the trigram
+    similarity, so a hit on a name outranks one on a phone number.
+    """
+    words = search_words(text)
+    if not words:
+        return queryset.none()
+
+    query = prefix_search_query(words)
+    phrase = " ".join(words)
+    limit = max(0, min(limit, CLIENT_PROFILE_SEARCH_MAX_LIMIT))
+
+    return (
+        queryset.filter(Q(search_vector=query) | Q(search_text__trigram_word_similar=phrase))
+        .annotate(search_rank=SearchRank(F("search_vector"), query) + TrigramWordSimilarity(phrase, "search_text"))
+        .order_by(F("search_rank").desc(nulls_last=True), "pk")[:limit]
+    )
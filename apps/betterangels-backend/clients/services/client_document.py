@@ -5,7 +5,7 @@ from accounts.selectors import resolve_permission_group
 from clients.models import ClientProfile
 from common.constants import DEFAULT_DOCUMENT_CONTENT_TYPES, DEFAULT_IMAGE_CONTENT_TYPES
 from common.models import Attachment
-from common.permissions.utils import assign_object_permissions
+from common.permissions.utils import bulk_assign_object_permissions
 from common.services import file_upload
 from common.services.file_upload import (
     AttachmentUploadConfig,
@@ -67,11 +67,10 @@ def resolve_upload(
             config=CLIENT_DOCUMENT_CONFIG,
         )
 
-        for att in attached:
-            assign_object_permissions(
-                permission_group.group,
-                att,
-                [Attachment.perms.DELETE, Attachment.perms.CHANGE],
-            )
+        bulk_assign_object_permissions(
+            permission_group.group,
+            attached,
+            [Attachment.perms.DELETE, Attachment.perms.CHANGE],
+        )
 
     return attached
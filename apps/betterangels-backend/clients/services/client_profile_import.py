@@ -0,0 +1,377 @@
+"""
+Bulk client profile import service.
+
+``importClientProfile`` creates one profile per call, and each call runs its
+own uniqueness queries and one insert per related object.  This service
+imports a whole batch of rows for a ``ClientProfileDataImport`` job instead:
+
+* uniqueness (already-imported source ids, emails, California IDs and HMIS
+  ids) is checked with one query per kind for the whole batch;
+* profiles, phone numbers, contacts, household members, HMIS and social
+  media profiles and the import records are written with ``bulk_create``,
+  ``IMPORT_BATCH_SIZE`` rows per transaction.
+
+Every row gets an import record; rows that fail validation are recorded with
+``success=False`` and the same error codes the single-row mutation reports.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Iterable, Sequence, cast
+
+from clients.enums import ErrorCodeEnum
+from clients.models import (
+    ClientContact,
+    ClientHouseholdMember,
+    ClientProfile,
+    ClientProfileDataImport,
+    ClientProfileImportRecord,
+    HmisProfile,
+    SocialMediaProfile,
+)
+from common.constants import CALIFORNIA_ID_REGEX, EMAIL_REGEX
+from common.models import PhoneNumber
+from common.services.bulk_import import bulk_insert_with_row_retry
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.db.models.functions import Lower, Upper
+from phonenumber_field.validators import validate_international_phonenumber
+
+IMPORT_BATCH_SIZE = 500
+
+# Reverse FK relations of ClientProfile accepted in a row, by input key.
+RELATED_MODELS: dict[str, type[models.Model]] = {
+    "contacts": ClientContact,
+    "hmis_profiles": HmisProfile,
+    "household_members": ClientHouseholdMember,
+    "social_media_profiles": SocialMediaProfile,
+}
+
+
+# ---------------------------------------------------------------------------
+# Dataclasses
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ClientProfileImportRow:
+    """One source row: the ``CreateClientProfileInput`` payload (snake_case) and where it came from."""
+
+    source_id: str
+    source_name: str
+    raw_data: Any
+    client_profile: dict[str, Any]
+
+
+@dataclass
+class _PreparedRow:
+    index: int
+    row: ClientProfileImportRow
+    profile: ClientProfile
+    related: list[models.Model] = field(default_factory=list)
+    phone_numbers: list[PhoneNumber] = field(default_factory=list)
+
+    def unsaved_instances(self) -> Iterable[models.Model]:
+        return [self.profile, *self.related, *self.phone_numbers]
+
+
+@dataclass
+class _TakenValues:
+    """Unique values already used in the database or by an earlier row of the batch."""
+
+    imported: set[tuple[str, str]]
+    emails: set[str]
+    california_ids: set[str]
+    hmis_ids: set[tuple[str, str]]
+
+
+# ---------------------------------------------------------------------------
+# Validation (set-based: one query per unique value kind)
+# ---------------------------------------------------------------------------
+
+
+def _error(field_name: str, code: ErrorCodeEnum, location: str | None = None) -> dict[str, Any]:
+    return {"field": field_name, "location": location, "errorCode": code.name}
+
+
+def format_errors(errors: Iterable[dict[str, Any]]) -> str:
+    """Render *errors* the way ``importClientProfile`` records a validation failure."""
+    details = "; ".join(
+        f"{err['field']}: {err['errorCode']}" + (f" at {err['location']}" if err.get("location") else "")
+        for err in errors
+    )
+    return f"Validation Errors: {details}"
+
+
+# Unique constraints a validated row can still violate when a concurrent write
+# lands first, with the error validation reports for the same conflict.
+# ``unique=True`` columns get Postgres's default ``<table>_<column>_key`` name.
+_CONSTRAINT_ERRORS = {
+    f"{ClientProfile._meta.db_table}_email_key": format_errors([_error("email", ErrorCodeEnum.EMAIL_IN_USE)]),
+    f"{ClientProfile._meta.db_table}_california_id_key": format_errors(
+        [_error("californiaId", ErrorCodeEnum.CA_ID_IN_USE)]
+    ),
+    "unique_hmis_id_agency": format_errors([_error("hmisProfiles", ErrorCodeEnum.HMIS_ID_IN_USE)]),
+}
+
+
+def _taken_values(rows: Sequence[ClientProfileImportRow]) -> _TakenValues:
+    source_ids = {row.source_id for row in rows}
+    source_names = {row.source_name for row in rows}
+    emails = {email.lower() for row in rows if (email := row.client_profile.get("email"))}
+    california_ids = {ca_id.upper() for row in rows if (ca_id := row.client_profile.get("california_id"))}
+    hmis_ids = {
+        hmis_id.lower()
+        for row in rows
+        for hmis_profile in row.client_profile.get("hmis_profiles") or []
+        if (hmis_id := (hmis_profile.get("hmis_id") or "").strip())
+    }
+
+    # Merged profiles are hidden by the default manager but still hold their unique values.
+    profiles = ClientProfile.objects.including_merged()
+    return _TakenValues(
+        imported=set(
+            ClientProfileImportRecord.objects.filter(
+                success=True, source_id__in=source_ids, source_name__in=source_names
+            ).values_list("source_name", "source_id")
+        ),
+        emails=set(profiles.annotate(value=Lower("email")).filter(value__in=emails).values_list("value", flat=True))
+        if emails
+        else set(),
+        california_ids=set(
+            profiles.annotate(value=Upper("california_id"))
+            .filter(value__in=california_ids)
+            .values_list("value", flat=True)
+        )
+        if california_ids
+        else set(),
+        hmis_ids=set(
+            HmisProfile.objects.annotate(value=Lower("hmis_id"))
+            .filter(value__in=hmis_ids)
+            .values_list("agency", "value")
+        )
+        if hmis_ids
+        else set(),
+    )
+
+
+def _has_name(data: dict[str, Any]) -> bool:
+    return any((data.get(name) or "").strip() for name in ("first_name", "last_name", "middle_name", "nickname"))
+
+
+def _phone_number_errors(items: Sequence[dict[str, Any]], field_name: str, key: str, location: str) -> list[dict]:
+    errors = []
+    for idx, item in enumerate(items):
+        if not item.get(key):
+            continue
+        try:
+            validate_international_phonenumber(item[key])
+        except ValidationError:
+            errors.append(_error(field_name, ErrorCodeEnum.PHONE_NUMBER_INVALID, f"{idx}__{location}"))
+    return errors
+
+
+def _validate_row(row: ClientProfileImportRow, taken: _TakenValues) -> list[dict[str, Any]]:
+    """The same checks as ``validate_client_profile_data``, against the batch's prefetched unique values."""
+    data = row.client_profile
+    errors: list[dict[str, Any]] = []
+
+    if not _has_name(data):
+        errors.append(_error("client_name", ErrorCodeEnum.NAME_NOT_PROVIDED))
+
+    if email := data.get("email"):
+        if not re.search(EMAIL_REGEX, email):
+            errors.append(_error("email", ErrorCodeEnum.EMAIL_INVALID))
+        elif email.lower() in taken.emails:
+            errors.append(_error("email", ErrorCodeEnum.EMAIL_IN_USE))
+
+    if california_id := data.get("california_id"):
+        if not re.search(CALIFORNIA_ID_REGEX, california_id):
+            errors.append(_error("californiaId", ErrorCodeEnum.CA_ID_INVALID))
+        elif california_id.upper() in taken.california_ids:
+            errors.append(_error("californiaId", ErrorCodeEnum.CA_ID_IN_USE))
+
+    errors += _phone_number_errors(data.get("contacts") or [], "contacts", "phone_number", "phoneNumber")
+
+    for idx, hmis_profile in enumerate(data.get("hmis_profiles") or []):
+        hmis_id = (hmis_profile.get("hmis_id") or "").strip()
+        if not hmis_id:
+            errors.append(_error("hmisProfiles", ErrorCodeEnum.HMIS_ID_NOT_PROVIDED, f"{idx}__hmisId"))
+        elif (str(hmis_profile.get("agency")), hmis_id.lower()) in taken.hmis_ids:
+            errors.append(_error("hmisProfiles", ErrorCodeEnum.HMIS_ID_IN_USE, f"{idx}__hmisId"))
+
+    errors += _phone_number_errors(data.get("phone_numbers") or [], "phoneNumbers", "number", "number")
+
+    return errors
+
+
+def _claim(row: ClientProfileImportRow, taken: _TakenValues) -> None:
+    """Mark *row*'s unique values as used, so a later row of the batch can't reuse them."""
+    data = row.client_profile
+    taken.imported.add((row.source_name, row.source_id))
+    if email := data.get("email"):
+        taken.emails.add(email.lower())
+    if california_id := data.get("california_id"):
+        taken.california_ids.add(california_id.upper())
+    for hmis_profile in data.get("hmis_profiles") or []:
+        taken.hmis_ids.add((str(hmis_profile.get("agency")), hmis_profile["hmis_id"].strip().lower()))
+
+
+# ---------------------------------------------------------------------------
+# Building unsaved instances
+# ---------------------------------------------------------------------------
+
+
+def _build(model: type[models.Model], data: dict[str, Any], **extra: Any) -> Any:
+    """An unsaved *model* from the concrete, editable fields of *data* (ids and relations are ignored)."""
+    names = {f.name for f in model._meta.concrete_fields if f.editable and not f.is_relation and not f.primary_key}
+    return model(**{name: value for name, value in data.items() if name in names}, **extra)
+
+
+def _full_clean(instance: models.Model, exclude: Sequence[str] = ()) -> None:
+    # Uniqueness was checked for the whole batch up front; skip the per-row queries.
+    instance.full_clean(exclude=list(exclude), validate_unique=False, validate_constraints=False)
+
+
+def _prepare(index: int, row: ClientProfileImportRow) -> _PreparedRow:
+    """Unsaved, validated instances for *row*; raises ``ValidationError``."""
+    data = row.client_profile
+    profile = _build(ClientProfile, data)
+    profile.normalize_identifiers()
+    _full_clean(profile)
+    prepared = _PreparedRow(index=index, row=row, profile=profile)
+
+    for key, model in RELATED_MODELS.items():
+        for item in data.get(key) or []:
+            related = _build(model, item)
+            _full_clean(related, exclude=["client_profile"])
+            prepared.related.append(related)
+
+    phone_numbers = data.get("phone_numbers") or []
+    # Saving a primary number demotes the others, so with several the last one wins.
+    primary = max((idx for idx, item in enumerate(phone_numbers) if item.get("is_primary")), default=None)
+    for idx, item in enumerate(phone_numbers):
+        phone_number = PhoneNumber(number=item.get("number"), is_primary=idx == primary)
+        # ``bulk_create`` skips ``save()``, which normally derives the digits.
+        phone_number.number_digits = phone_number.compute_number_digits()
+        prepared.phone_numbers.append(phone_number)
+
+    return prepared
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    if hasattr(error, "error_dict"):
+        return "; ".join(f"{name}: {message}" for name, messages in error.message_dict.items() for message in messages)
+    return "; ".join(error.messages)
+
+
+# ---------------------------------------------------------------------------
+# Writes
+# ---------------------------------------------------------------------------
+
+
+def _insert(import_job: ClientProfileDataImport, prepared: Sequence[_PreparedRow]) -> list[ClientProfileImportRecord]:
+    """Write *prepared* rows with one ``bulk_create`` per table."""
+    profiles = ClientProfile.objects.bulk_create([p.profile for p in prepared])
+
+    related_by_model: dict[type[models.Model], list[models.Model]] = {}
+    phone_numbers: list[PhoneNumber] = []
+    content_type = ContentType.objects.get_for_model(ClientProfile)
+    for p, profile in zip(prepared, profiles):
+        for related in p.related:
+            related.client_profile = profile  # type: ignore[attr-defined]
+            related_by_model.setdefault(type(related), []).append(related)
+        for phone_number in p.phone_numbers:
+            phone_number.content_type = content_type
+            phone_number.object_id = profile.pk
+            phone_numbers.append(phone_number)
+
+    for model, objs in related_by_model.items():
+        model._default_manager.bulk_create(objs)
+    PhoneNumber.objects.bulk_create(phone_numbers)
+
+    return ClientProfileImportRecord.objects.bulk_create(
+        ClientProfileImportRecord(
+            import_job=import_job,
+            source_id=p.row.source_id,
+            source_name=p.row.source_name,
+            client_profile=profile,
+            raw_data=p.row.raw_data,
+            success=True,
+        )
+        for p, profile in zip(prepared, profiles)
+    )
+
+
+def bulk_import_client_profiles(
+    *,
+    import_job: ClientProfileDataImport,
+    rows: Sequence[ClientProfileImportRow],
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> list[ClientProfileImportRecord]:
+    """Import *rows* into *import_job*; returns one import record per row, in order.
+
+    Rows already imported successfully (same source name and id) fail with
+    an error instead of creating a second profile, as do later rows of the
+    batch that reuse an email, California ID or HMIS id.
+    """
+    records: list[ClientProfileImportRecord] = []
+
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start : start + batch_size]
+        taken = _taken_values(batch)
+        failures: dict[int, str] = {}
+        prepared: list[_PreparedRow] = []
+
+        for index, row in enumerate(batch):
+            if (row.source_name, row.source_id) in taken.imported:
+                failures[index] = (
+                    f"Source ID {row.source_id} with source name '{row.source_name}' has already been imported successfully."
+                )
+                continue
+
+            if errors := _validate_row(row, taken):
+                failures[index] = format_errors(errors)
+                continue
+
+            try:
+                prepared.append(_prepare(index, row))
+            except ValidationError as e:
+                failures[index] = _format_validation_error(e)
+                continue
+
+            _claim(row, taken)
+
+        results = (
+            bulk_insert_with_row_retry(
+                prepared,
+                partial(_insert, import_job),
+                label="Client profile import",
+                constraint_errors=_CONSTRAINT_ERRORS,
+            )
+            if prepared
+            else {}
+        )
+        failures.update({key: result for key, result in results.items() if isinstance(result, str)})
+
+        failed = sorted(failures)
+        failed_records = ClientProfileImportRecord.objects.bulk_create(
+            ClientProfileImportRecord(
+                import_job=import_job,
+                source_id=batch[index].source_id,
+                source_name=batch[index].source_name,
+                raw_data=batch[index].raw_data,
+                success=False,
+                error_message=failures[index],
+            )
+            for index in failed
+        )
+        results.update(zip(failed, failed_records))
+
+        records.extend(cast(ClientProfileImportRecord, results[index]) for index in range(len(batch)))
+
+    return records
@@ -100,7 +100,7 @@ class ResolveUploadTest(TestCase):
         self.permission_group = MagicMock()
         self.permission_group.group = MagicMock()
 
-    @patch("clients.services.client_document.assign_object_permissions")
+    @patch("clients.services.client_document.bulk_assign_object_permissions")
     @patch("clients.services.client_document.resolve_permission_group")
     @patch("common.services.file_upload.create_attachment_records")
     def test_delegates_to_generic_with_correct_params(
@@ -136,10 +136,10 @@ class ResolveUploadTest(TestCase):
             config=CLIENT_DOCUMENT_CONFIG,
         )
 
-    @patch("clients.services.client_document.assign_object_permissions")
+    @patch("clients.services.client_document.bulk_assign_object_permissions")
     @patch("clients.services.client_document.resolve_permission_group")
     @patch("common.services.file_upload.create_attachment_records")
-    def test_assigns_permissions_per_attachment(
+    def test_assigns_permissions_to_all_attachments(
         self,
         mock_generic: MagicMock,
         mock_perm_group: MagicMock,
@@ -171,20 +171,14 @@ class ResolveUploadTest(TestCase):
             ],
         )
 
-        self.assertEqual(mock_assign.call_count, 2)
-        mock_assign.assert_any_call(
+        mock_assign.assert_called_once_with(
             self.permission_group.group,
-            att1,
-            [Attachment.perms.DELETE, Attachment.perms.CHANGE],
-        )
-        mock_assign.assert_any_call(
-            self.permission_group.group,
-            att2,
+            [att1, att2],
             [Attachment.perms.DELETE, Attachment.perms.CHANGE],
         )
         self.assertEqual(result, [att1, att2])
 
-    @patch("clients.services.client_document.assign_object_permissions")
+    @patch("clients.services.client_document.bulk_assign_object_permissions")
     @patch("clients.services.client_document.resolve_permission_group")
     @patch("common.services.file_upload.create_attachment_records")
     def test_returns_attachments_from_generic(
@@ -213,7 +207,7 @@ class ResolveUploadTest(TestCase):
 
         self.assertEqual(result, [attachment])
 
-    @patch("clients.services.client_document.assign_object_permissions")
+    @patch("clients.services.client_document.bulk_assign_object_permissions")
     @patch("clients.services.client_document.resolve_permission_group")
     @patch("common.services.file_upload.create_attachment_records")
     def test_raises_on_generic_failure(
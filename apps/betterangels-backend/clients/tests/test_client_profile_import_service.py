@@ -0,0 +1,240 @@
+from typing import Any
+from unittest.mock import patch
+
+from clients.enums import GenderEnum, HmisAgencyEnum, RelationshipTypeEnum
+from clients.models import (
+    ClientContact,
+    ClientHouseholdMember,
+    ClientProfile,
+    ClientProfileDataImport,
+    ClientProfileImportRecord,
+    HmisProfile,
+)
+from clients.services.client_profile_import import ClientProfileImportRow, _TakenValues, bulk_import_client_profiles
+from common.models import PhoneNumber
+from common.tests.utils import GraphQLBaseTestCase
+from django.contrib.auth.models import Permission
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+
+
+def _row(source_id: str, **client_profile: Any) -> ClientProfileImportRow:
+    return ClientProfileImportRow(
+        source_id=source_id,
+        source_name="SELAH",
+        raw_data={"id": source_id},
+        client_profile={"first_name": f"Client {source_id}", **client_profile},
+    )
+
+
+class BulkImportClientProfilesTest(TestCase):
+    def setUp(self) -> None:
+        self.import_job = ClientProfileDataImport.objects.create(
+            source_file="selah.csv", imported_by=baker.make("accounts.User")
+        )
+
+    def _import(self, rows: list[ClientProfileImportRow], **kwargs: Any) -> list[ClientProfileImportRecord]:
+        return bulk_import_client_profiles(import_job=self.import_job, rows=rows, **kwargs)
+
+    def test_imports_profiles_and_related_objects(self) -> None:
+        records = self._import(
+            [
+                _row(
+                    "1",
+                    last_name="Cooper",
+                    california_id="b7654321",
+                    email="Dale@Example.com",
+                    phone_numbers=[
+                        {"number": "2125551212", "is_primary": True},
+                        {"number": "7185551212", "is_primary": True},
+                    ],
+                    contacts=[{"name": "Harry", "relationship_to_client": RelationshipTypeEnum.FRIEND}],
+                    household_members=[{"name": "Audrey", "gender": GenderEnum.FEMALE}],
+                    hmis_profiles=[{"hmis_id": "HMIS1", "agency": HmisAgencyEnum.LAHSA}],
+                ),
+                _row("2"),
+            ]
+        )
+
+        self.assertEqual([r.source_id for r in records], ["1", "2"])
+        self.assertTrue(all(r.success for r in records))
+        self.assertEqual(ClientProfileImportRecord.objects.filter(import_job=self.import_job).count(), 2)
+
+        profile = records[0].client_profile
+        assert profile is not None
+        profile.refresh_from_db()
+        self.assertEqual((profile.california_id, profile.email), ("B7654321", "dale@example.com"))
+        self.assertEqual(ClientContact.objects.get(client_profile=profile).name, "Harry")
+        self.assertEqual(ClientHouseholdMember.objects.get(client_profile=profile).name, "Audrey")
+        self.assertEqual(HmisProfile.objects.get(client_profile=profile).hmis_id, "HMIS1")
+
+        phone_numbers = PhoneNumber.objects.filter(object_id=profile.pk).order_by("pk")
+        self.assertEqual([p.number_digits for p in phone_numbers], ["12125551212", "17185551212"])
+        self.assertEqual([p.is_primary for p in phone_numbers], [False, True])
+
+        # The search document sees the bulk-inserted HMIS profile and phone numbers.
+        self.assertIn("HMIS1", ClientProfile.objects.values_list("search_text", flat=True).get(pk=profile.pk))
+
+    def test_reports_failures_per_row(self) -> None:
+        baker.make(ClientProfile, email="taken@example.com", california_id="A1111111")
+        self._import([_row("imported")])
+
+        records = self._import(
+            [
+                _row("imported"),
+                _row("ok"),
+                ClientProfileImportRow(source_id="nameless", source_name="SELAH", raw_data={}, client_profile={}),
+                _row("email-in-use", email="TAKEN@example.com"),
+                _row("ca-id-in-use", california_id="a1111111"),
+                _row("first-email", email="new@example.com"),
+                _row("second-email", email="new@example.com"),
+                _row("bad-phone", phone_numbers=[{"number": "123", "is_primary": False}]),
+                _row("bad-gender", household_members=[{"name": "Audrey", "gender": "not-a-gender"}]),
+            ]
+        )
+
+        self.assertEqual(
+            {r.source_id: r.success for r in records},
+            {
+                "imported": False,
+                "ok": True,
+                "nameless": False,
+                "email-in-use": False,
+                "ca-id-in-use": False,
+                "first-email": True,
+                "second-email": False,
+                "bad-phone": False,
+                "bad-gender": False,
+            },
+        )
+        errors = {r.source_id: r.error_message for r in records}
+        self.assertIn("has already been imported successfully", errors["imported"])
+        self.assertEqual(errors["nameless"], "Validation Errors: client_name: NAME_NOT_PROVIDED")
+        self.assertEqual(errors["email-in-use"], "Validation Errors: email: EMAIL_IN_USE")
+        self.assertEqual(errors["ca-id-in-use"], "Validation Errors: californiaId: CA_ID_IN_USE")
+        self.assertEqual(errors["second-email"], "Validation Errors: email: EMAIL_IN_USE")
+        self.assertEqual(errors["bad-phone"], "Validation Errors: phoneNumbers: PHONE_NUMBER_INVALID at 0__number")
+        self.assertIn("gender", errors["bad-gender"])
+        self.assertFalse(ClientHouseholdMember.objects.filter(name="Audrey").exists())
+
+    def test_query_count_does_not_grow_with_rows(self) -> None:
+        def import_queries(prefix: str, count: int) -> int:
+            rows = [
+                _row(f"{prefix}{i}", phone_numbers=[{"number": "2125551212", "is_primary": True}]) for i in range(count)
+            ]
+            with CaptureQueriesContext(connection) as ctx:
+                self._import(rows)
+            return len(ctx.captured_queries)
+
+        import_queries("warmup", 1)
+
+        self.assertEqual(import_queries("few", 5), import_queries("many", 50))
+
+    def test_database_error_fails_only_its_row(self) -> None:
+        baker.make(ClientProfile, email="taken@example.com")
+        untaken = _TakenValues(imported=set(), emails=set(), california_ids=set(), hmis_ids=set())
+
+        # A profile that passes validation but collides in the database, e.g. a concurrent import.
+        with patch("clients.services.client_profile_import._taken_values", return_value=untaken):
+            records = self._import([_row("1"), _row("2", email="taken@example.com"), _row("3")])
+
+        self.assertEqual([r.success for r in records], [True, False, True])
+        self.assertEqual(records[1].error_message, "Validation Errors: email: EMAIL_IN_USE")
+        self.assertEqual(ClientProfile.objects.filter(first_name__in=["Client 1", "Client 3"]).count(), 2)
+
+    def test_batches(self) -> None:
+        records = self._import([_row(str(i)) for i in range(5)], batch_size=2)
+
+        self.assertEqual([r.source_id for r in records], ["0", "1", "2", "3", "4"])
+        self.assertTrue(all(r.success for r in records))
+
+
+BULK_IMPORT_CLIENT_PROFILES_MUTATION = """
+    mutation ($data: BulkImportClientProfilesInput!) {
+        bulkImportClientProfiles(data: $data) {
+            ... on ClientProfileImportRecordsType {
+                records {
+                    id
+                    sourceId
+                    sourceName
+                    success
+                    errorMessage
+                    rawData
+                    clientProfile {
+                        id
+                        firstName
+                    }
+                }
+            }
+            ... on OperationInfo {
+                messages {
+                    kind
+                    message
+                }
+            }
+        }
+    }
+"""
+
+
+class BulkImportClientProfilesMutationTest(GraphQLBaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.import_job = ClientProfileDataImport.objects.create(
+            source_file="selah.csv", imported_by=self.org_1_case_manager_1
+        )
+
+    def _bulk_import(self, *records: dict[str, Any]) -> dict[str, Any]:
+        variables = {
+            "data": {
+                "importJobId": str(self.import_job.pk),
+                "records": [
+                    {
+                        "sourceId": record["sourceId"],
+                        "sourceName": "SELAH",
+                        "rawData": {"id": record["sourceId"]},
+                        "clientProfile": record["clientProfile"],
+                    }
+                    for record in records
+                ],
+            }
+        }
+        return self.execute_graphql(BULK_IMPORT_CLIENT_PROFILES_MUTATION, variables)
+
+    def test_requires_import_permission(self) -> None:
+        self.graphql_client.force_login(self.org_1_case_manager_1)
+
+        response = self._bulk_import({"sourceId": "1", "clientProfile": {"firstName": "Dale"}})
+
+        messages = response["data"]["bulkImportClientProfiles"]["messages"]
+        self.assertEqual(messages[0]["kind"], "PERMISSION")
+        self.assertFalse(ClientProfileImportRecord.objects.exists())
+
+    def test_requires_authentication(self) -> None:
+        self.graphql_client.logout()
+
+        response = self._bulk_import({"sourceId": "1", "clientProfile": {"firstName": "Dale"}})
+
+        self.assertGraphQLUnauthenticated(response)
+
+    def test_returns_records_in_input_order(self) -> None:
+        self.org_1_case_manager_1.user_permissions.add(Permission.objects.get(codename="add_clientprofileimportrecord"))
+        self.graphql_client.force_login(self.org_1_case_manager_1)
+
+        # Failed rows are written after the batch's successes, so pk order is not input order.
+        response = self._bulk_import(
+            {"sourceId": "bad", "clientProfile": {"firstName": "Laura", "californiaId": "nope"}},
+            {"sourceId": "ok", "clientProfile": {"firstName": "Dale"}},
+        )
+
+        records = response["data"]["bulkImportClientProfiles"]["records"]
+        self.assertEqual([r["sourceId"] for r in records], ["bad", "ok"])
+        self.assertEqual([r["success"] for r in records], [False, True])
+        self.assertGreater(int(records[0]["id"]), int(records[1]["id"]))
+        self.assertIn("californiaId", records[0]["errorMessage"])
+        self.assertIsNone(records[0]["clientProfile"])
+        self.assertEqual(records[1]["clientProfile"]["firstName"], "Dale")
+        self.assertEqual(records[1]["rawData"], {"id": "ok"})
+        self.assertEqual(records[1]["sourceName"], "SELAH")
@@ -1,8 +1,12 @@
 from clients.enums import HmisAgencyEnum, PronounEnum
 from clients.models import ClientProfile, HmisProfile
+from clients.selectors.search import prefix_search_query, search_client_profiles
+from common.models import PhoneNumber
+from django.contrib.contenttypes.models import ContentType
 from django.db import IntegrityError
 from django.test import TestCase
 from model_bakery import baker
+from pghistory.models import Events
 
 
 class ClientProfileModelTestCase(TestCase):
@@ -50,3 +54,75 @@ class HmisProfileModelTestCase(TestCase):
 
         with self.assertRaises(IntegrityError):
             baker.make(HmisProfile, hmis_id="HMISid1", agency=HmisAgencyEnum.LAHSA)
+
+
+class ClientProfileSearchDocumentTestCase(TestCase):
+    """The trigger-maintained ``ClientProfile.search_vector`` / ``search_text``."""
+
+    def _matches(self, *words: str) -> list[ClientProfile]:
+        return list(ClientProfile.objects.filter(search_vector=prefix_search_query(words)))
+
+    def _phone_number(self, client_profile: ClientProfile, number: str) -> PhoneNumber:
+        return PhoneNumber.objects.create(
+            content_type=ContentType.objects.get_for_model(ClientProfile),
+            object_id=client_profile.pk,
+            number=number,
+        )
+
+    def test_document_follows_profile_changes(self) -> None:
+        client_profile = baker.make(ClientProfile, first_name="Dale", last_name="Cooper", california_id="B7654321")
+        self.assertEqual(self._matches("coop", "b765"), [client_profile])
+
+        ClientProfile.objects.filter(pk=client_profile.pk).update(nickname="Coop-Dog")
+        self.assertEqual(self._matches("dog"), [client_profile])
+
+        hmis_profile = baker.make(HmisProfile, client_profile=client_profile, hmis_id="HMIS-4242")
+        self.assertEqual(self._matches("dale", "4242"), [client_profile])
+
+        hmis_profile.delete()
+        self.assertEqual(self._matches("4242"), [])
+
+        phone_number = self._phone_number(client_profile, "2125551212")
+        self.assertEqual(self._matches("2125551212"), [client_profile])
+
+        phone_number.delete()
+        self.assertEqual(self._matches("212"), [])
+
+    def test_other_phone_numbers_are_not_indexed(self) -> None:
+        client_profile = baker.make(ClientProfile, first_name="Dale")
+        PhoneNumber.objects.create(
+            content_type=ContentType.objects.get_for_model(HmisProfile),
+            object_id=client_profile.pk,
+            number="2125551212",
+        )
+
+        self.assertEqual(self._matches("212"), [])
+
+    def test_stale_save_keeps_document(self) -> None:
+        client_profile = baker.make(ClientProfile, first_name="Dale")
+        stale = ClientProfile.objects.get(pk=client_profile.pk)
+        baker.make(HmisProfile, client_profile=client_profile, hmis_id="HMIS4242")
+
+        stale.last_name = "Cooper"
+        stale.save()
+
+        self.assertEqual(self._matches("hmis4242", "cooper"), [client_profile])
+
+    def test_document_changes_do_not_record_profile_updates(self) -> None:
+        client_profile = baker.make(ClientProfile, first_name="Dale")
+
+        baker.make(HmisProfile, client_profile=client_profile, hmis_id="HMIS4242")
+        self._phone_number(client_profile, "2125551212")
+
+        self.assertFalse(Events.objects.filter(pgh_label="client_profile.update").exists())
+
+    def test_ranked_search(self) -> None:
+        by_name = baker.make(ClientProfile, first_name="Dale", last_name="Cooper")
+        by_nickname = baker.make(ClientProfile, first_name="Audrey", nickname="Cooper")
+        baker.make(ClientProfile, first_name="Harry", last_name="Truman")
+
+        self.assertEqual(list(search_client_profiles(ClientProfile.objects.all(), "coop")), [by_name, by_nickname])
+        self.assertEqual(list(search_client_profiles(ClientProfile.objects.all(), "coop", limit=1)), [by_name])
+        # Trigram similarity forgives typos the prefix match can't.
+        self.assertEqual(list(search_client_profiles(ClientProfile.objects.all(), "Cooperr")), [by_name, by_nickname])
+        self.assertEqual(list(search_client_profiles(ClientProfile.objects.all(), "!")), [])
@@ -197,6 +197,27 @@ class ClientProfilePermissionTestCase(ClientProfileGraphQLBaseTestCase):
             if user_label is None:
                 self.assertGraphQLUnauthenticated(response)
 
+    @parametrize(
+        "user_label, expected_client_count",
+        [
+            ("org_1_case_manager_1", 2),  # Owner should succeed
+            ("org_2_case_manager_1", 2),  # CM in different org should succeed
+            ("non_case_manager_user", 0),  # Non CM should not succeed
+            (None, None),  # Anonymous user should return error
+        ],
+    )
+    def test_view_client_profiles_keyset_permission(
+        self, user_label: Optional[str], expected_client_count: Optional[int]
+    ) -> None:
+        self._handle_user_login(user_label)
+
+        response = self.execute_graphql("query { clientProfilesKeyset { results { id } } }")
+
+        if expected_client_count is not None:
+            self.assertEqual(len(response["data"]["clientProfilesKeyset"]["results"]), expected_client_count)
+        else:
+            self.assertGraphQLUnauthenticated(response)
+
 
 class ClientDocumentPermissionTestCase(ClientProfileGraphQLBaseTestCase):
     def setUp(self) -> None:
@@ -425,7 +446,7 @@ class ClientDocumentPermissionTestCase(ClientProfileGraphQLBaseTestCase):
         self._handle_user_login(user_label)
         with (
             patch("common.services.file_upload.validate_upload_token", return_value=True),
-            patch("clients.services.client_document.assign_object_permissions"),
+            patch("clients.services.client_document.bulk_assign_object_permissions"),
             patch("common.services.file_upload.s3_key_exists", return_value=True),
             patch(
                 "common.services.file_upload.strip_storage_location",
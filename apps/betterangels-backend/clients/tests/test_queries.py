@@ -154,6 +154,14 @@ class ClientProfileQueryTestCase(ClientProfileGraphQLBaseTestCase):
         self.assertEqual(client_profiles_data["totalCount"], client_profile_count)
         self.assertEqual(client_profiles_data["pageInfo"], {"limit": 10, "offset": 0})
 
+    def test_client_profiles_keyset_query(self) -> None:
+        newest = baker.make(ClientProfile)
+
+        self.assertEqual(
+            self._keyset_pages("clientProfilesKeyset", "ClientProfileFilter"),
+            [[str(newest.pk), self.client_profile_2["id"]], [self.client_profile_1["id"]]],
+        )
+
     @override_settings(
         IMGPROXY_KEY="736563726574",
         IMGPROXY_SALT="68656C6C6F",
@@ -352,6 +360,32 @@ class ClientProfileQueryTestCase(ClientProfileGraphQLBaseTestCase):
 
         self.assertEqual(response["data"]["clientProfiles"]["totalCount"], 0)
 
+    @parametrize(
+        ("text, expected_client_profiles"),
+        [
+            ("toad", ["client_profile_1"]),  # nickname prefix
+            ("hmisidp", ["client_profile_1", "client_profile_2"]),  # hmis_id prefix
+            ("Peanutbuter", ["client_profile_2"]),  # last name, misspelled
+            ("zzz", []),
+        ],
+    )
+    def test_client_profile_search_query(self, text: str, expected_client_profiles: list[str]) -> None:
+        self.graphql_client.force_login(self.org_1_case_manager_1)
+
+        query = """
+            query ($text: String!) {
+                clientProfileSearch(text: $text) {
+                    id
+                }
+            }
+        """
+        response = self.execute_graphql(query, variables={"text": text})
+
+        self.assertEqual(
+            {result["id"] for result in response["data"]["clientProfileSearch"]},
+            {getattr(self, name)["id"] for name in expected_client_profiles},
+        )
+
     @parametrize(
         ("search_value, is_active, expected_client_profile_count"),
         [
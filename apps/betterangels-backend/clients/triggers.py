@@ -0,0 +1,127 @@
+"""Database triggers that keep derived client profile data in sync.
+
+``ClientProfile.search_vector`` / ``ClientProfile.search_text``
+----------------------------------------------------------------
+The per-profile search document: names, nickname, California ID, HMIS IDs
+and phone digits (see ``clients/selectors/search.py`` for how it is queried).
+
+* A ``BEFORE INSERT OR UPDATE OF <searched columns>, search_vector, search_text``
+  trigger on ``clients_clientprofile`` rebuilds both columns, so they can only
+  ever hold the derived value; see :func:`client_profile_search_trigger`.
+* An ``AFTER`` trigger on ``clients_hmisprofile`` and on ``common_phonenumber``
+  (client profile rows only) touches the profile, which re-fires it.
+"""
+
+import pgtrigger
+
+CLIENT_PROFILE_TABLE = "clients_clientprofile"
+HMIS_PROFILE_TABLE = "clients_hmisprofile"
+PHONE_NUMBER_TABLE = "common_phonenumber"
+
+# Every run of non-alphanumerics becomes a word break, on both sides of the
+# match (see ``clients.selectors.search.search_words``), so the Postgres parser
+# and the query builder always agree on the tokens.
+_WORD_BREAKS = "'[^[:alnum:]]+'"
+
+_CLIENT_PROFILE_PHONE_NUMBERS = f"""SELECT p."number_digits" FROM "{PHONE_NUMBER_TABLE}" p
+            JOIN "django_content_type" ct ON ct."id" = p."content_type_id"
+            WHERE ct."app_label" = 'clients' AND ct."model" = 'clientprofile'
+              AND p."object_id" = NEW."id" AND p."number_digits" <> ''"""
+
+
+def _tokens(*values: str) -> str:
+    return f"regexp_replace(concat_ws(' ', {', '.join(values)}), {_WORD_BREAKS}, ' ', 'g')"
+
+
+def _weighted(weight: str, *values: str) -> str:
+    return f"setweight(to_tsvector('simple', {_tokens(*values)}), '{weight}')"
+
+
+def _client_profile_search_sql() -> str:
+    """Statements assigning ``search_vector`` and ``search_text`` of the ``NEW`` client profile."""
+    hmis_ids = f"""(SELECT string_agg(h."hmis_id", ' ') FROM "{HMIS_PROFILE_TABLE}" h
+            WHERE h."client_profile_id" = NEW."id")"""
+    # Stored with the country code; the national number is added so a full
+    # ten-digit search matches as a word, not just as a substring.
+    phone_digits = f"""(SELECT string_agg(concat_ws(' ', d, substring(d FROM '^1(\\d{{10}})$')), ' ')
+            FROM ({_CLIENT_PROFILE_PHONE_NUMBERS}) phones (d))"""
+    return f"""NEW."search_vector" :=
+    {_weighted("A", 'NEW."first_name"', 'NEW."last_name"')}
+    || {_weighted("B", 'NEW."middle_name"', 'NEW."nickname"')}
+    || {_weighted("C", 'NEW."california_id"', hmis_ids)}
+    || {_weighted("D", phone_digits)};
+NEW."search_text" := concat_ws(' ',
+    NEW."first_name", NEW."middle_name", NEW."last_name", NEW."nickname", NEW."california_id", {hmis_ids}
+);"""
+
+
+def client_profile_search_trigger(*, name: str) -> pgtrigger.Trigger:
+    """Row trigger rebuilding ``search_vector`` and ``search_text`` of a client profile.
+
+    Fires on ``UPDATE OF`` the derived columns too, so a ``save()`` of a stale
+    instance cannot write an old document back.
+    """
+    return pgtrigger.Trigger(
+        name=name,
+        when=pgtrigger.Before,
+        operation=pgtrigger.Insert
+        | pgtrigger.UpdateOf(
+            "first_name",
+            "middle_name",
+            "last_name",
+            "nickname",
+            "california_id",
+            "search_vector",
+            "search_text",
+        ),
+        func=f"{_client_profile_search_sql()}\nRETURN NEW;",
+    )
+
+
+def _touch(ids: str) -> str:
+    # Assigning the column to itself fires ``client_profile_search_trigger`` for the row.
+    return f"""UPDATE "{CLIENT_PROFILE_TABLE}" SET "search_vector" = "search_vector"
+    WHERE "id" IN ({ids});"""
+
+
+def hmis_profile_search_sync_trigger(*, name: str) -> pgtrigger.Trigger:
+    """Row trigger on HMIS profiles that refreshes the client profile's search document."""
+    return pgtrigger.Trigger(
+        name=name,
+        when=pgtrigger.After,
+        operation=pgtrigger.Insert | pgtrigger.Update | pgtrigger.Delete,
+        func=f"""IF TG_OP = 'UPDATE'
+    AND OLD."client_profile_id" IS NOT DISTINCT FROM NEW."client_profile_id"
+    AND OLD."hmis_id" IS NOT DISTINCT FROM NEW."hmis_id"
+THEN
+    RETURN NULL;
+END IF;
+{_touch('OLD."client_profile_id", NEW."client_profile_id"')}
+RETURN NULL;""",
+    )
+
+
+def phone_number_search_sync_trigger(*, name: str) -> pgtrigger.Trigger:
+    """Row trigger on phone numbers that refreshes the owning client profile's search document.
+
+    Phone numbers belong to several models through a generic relation; rows of
+    other content types touch nothing.
+    """
+    client_profile_ids = """SELECT p."object_id" FROM (VALUES (OLD."content_type_id", OLD."object_id"),
+        (NEW."content_type_id", NEW."object_id")) p ("content_type_id", "object_id")
+        JOIN "django_content_type" ct ON ct."id" = p."content_type_id"
+        WHERE ct."app_label" = 'clients' AND ct."model" = 'clientprofile'"""
+    return pgtrigger.Trigger(
+        name=name,
+        when=pgtrigger.After,
+        operation=pgtrigger.Insert | pgtrigger.Update | pgtrigger.Delete,
+        func=f"""IF TG_OP = 'UPDATE'
+    AND OLD."content_type_id" IS NOT DISTINCT FROM NEW."content_type_id"
+    AND OLD."object_id" IS NOT DISTINCT FROM NEW."object_id"
+    AND OLD."number_digits" IS NOT DISTINCT FROM NEW."number_digits"
+THEN
+    RETURN NULL;
+END IF;
+{_touch(client_profile_ids)}
+RETURN NULL;""",
+    )
@@ -1,7 +1,7 @@
 import re
 from datetime import date, datetime, timedelta
 from functools import reduce
-from operator import and_, or_
+from operator import and_
 from typing import List, Optional, Tuple
 
 import strawberry
@@ -15,7 +15,7 @@ from common.graphql.types import (
 )
 from common.models import Attachment, PhoneNumber
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import CharField, Exists, F, Func, Max, OuterRef, Q, QuerySet, Value
+from django.db.models import Max, Q, QuerySet
 from django.utils import timezone
 from strawberry import ID, Info, auto
 from strawberry.file_uploads import Upload
@@ -28,6 +28,7 @@ from clients.enums import (
     LivingSituationEnum,
     PreferredCommunicationEnum,
 )
+from clients.selectors.search import exact_search_query, prefix_search_query, search_words
 
 from .models import (
     ClientContact,
@@ -54,23 +55,13 @@ def _parse_dob_search_value(value: str) -> Optional[date]:
 
 
 def _phone_number_matching_query(digits_only: str) -> Q:
-    related_phone_digits = Func(
-        F("number"),
-        Value(r"[^0-9]"),
-        Value(""),
-        Value("g"),
-        function="regexp_replace",
-        output_field=CharField(),
-    )
+    """Clients with a phone number containing *digits_only* (served by the ``number_digits`` trigram index)."""
     client_profile_ct = ContentType.objects.get_for_model(ClientProfile)
     return Q(
-        Exists(
-            PhoneNumber.objects.annotate(digits=related_phone_digits).filter(
-                content_type=client_profile_ct,
-                object_id=OuterRef("pk"),
-                digits__contains=digits_only,
-            )
-        )
+        pk__in=PhoneNumber.objects.filter(
+            content_type=client_profile_ct,
+            number_digits__contains=digits_only,
+        ).values("object_id")
     )
 
 
@@ -176,8 +167,6 @@ class ClientProfileFilter:
 
         search_terms = value.split()
 
-        searchable_fields = ["california_id", "first_name", "last_name", "middle_name", "nickname"]
-
         # Pure numeric/date searches (e.g. a formatted phone number) are matched
         # against the whole value so that formatted numbers like "(212) 555-1212"
         # are not fragmented into sub-terms that cause false positives.
@@ -194,34 +183,43 @@ class ClientProfileFilter:
                 return queryset.filter(combined_query), Q()
             return queryset.none(), Q()
 
-        # Each search term must match at least one searched field (direct fields,
-        # HMIS id, date of birth, or phone number). Terms are combined with AND so
-        # a single term matching a phone number or date of birth cannot bypass the
-        # other terms' requirements.
+        # Each search term must match at least one searched field (names, nickname,
+        # California ID, HMIS id, date of birth, or phone number). Terms are combined
+        # with AND so a single term matching a phone number or date of birth cannot
+        # bypass the other terms' requirements.
+        #
+        # Names, nickname, California ID and HMIS ids are matched by word prefix on
+        # the profile's search document; terms with no other way to match fold into
+        # a single tsquery, answered by one scan of the ``search_vector`` index.
+        words: List[str] = []
         term_queries: List[Q] = []
         for term in search_terms:
-            # Direct field partial matches
-            term_query = reduce(
-                or_,
-                [Q(**{f"{field}__istartswith": term}) for field in searchable_fields],
-            )
-
-            # HMIS id partial match
-            term_query |= Q(
-                Exists(HmisProfile.objects.filter(client_profile_id=OuterRef("pk"), hmis_id__istartswith=term))
-            )
+            term_words = search_words(term)
+            alternatives = Q()
 
             # Date of birth exact match (MM/DD/YYYY or MM-DD-YYYY)
             dob = _parse_dob_search_value(term)
             if dob is not None:
-                term_query |= Q(date_of_birth=dob)
+                alternatives |= Q(date_of_birth=dob)
 
             # Phone number partial match on digits only (like HMIS ID partial search)
             digits_only = re.sub(r"\D", "", term)
             if len(digits_only) >= MIN_PHONE_SEARCH_DIGITS:
-                term_query |= _phone_number_matching_query(digits_only)
+                alternatives |= _phone_number_matching_query(digits_only)
+
+            if not alternatives:
+                words.extend(term_words)
+                continue
+
+            if term_words:
+                alternatives |= Q(search_vector=prefix_search_query(term_words))
+            term_queries.append(alternatives)
 
-            term_queries.append(term_query)
+        if words:
+            term_queries.append(Q(search_vector=prefix_search_query(words)))
+
+        if not term_queries:
+            return queryset.none(), Q()
 
         combined_query = reduce(and_, term_queries)
 
@@ -244,16 +242,23 @@ class ClientProfileFilter:
         from being flagged as a duplicate entry.
         """
         filters = {}
+        words: List[str] = []
 
         search_fields = ["california_id", "first_name", "middle_name", "last_name"]
 
         for field in search_fields:
             if field_value := (getattr(value, field) or "").strip():
                 filters[f"{field}__iexact"] = field_value
+                words.extend(search_words(field_value))
 
         if not filters:
             return (queryset.none(), Q())
 
+        # Every word of an exact match is a word of the search document, so the
+        # ``search_vector`` index narrows the candidates before the exact checks.
+        if words:
+            filters["search_vector"] = exact_search_query(words)
+
         queryset = queryset.filter(**filters)
 
         if excluded_id := value.excluded_client_profile_id:
@@ -472,6 +477,25 @@ class ImportClientProfileInput:
     client_profile: CreateClientProfileInput
 
 
+@strawberry_django.input(ClientProfileImportRecord)
+class ImportClientProfileRecordInput:
+    source_id: auto
+    source_name: auto
+    raw_data: auto
+    client_profile: CreateClientProfileInput
+
+
+@strawberry_django.input(ClientProfileImportRecord)
+class BulkImportClientProfilesInput:
+    import_job_id: auto
+    records: List[ImportClientProfileRecordInput]
+
+
+@strawberry.type
+class ClientProfileImportRecordsType:
+    records: List[ClientProfileImportRecordType]
+
+
 # Input for updating a client document
 @strawberry_django.input(Attachment)
 class UpdateClientDocumentInput:
@@ -1,6 +1,7 @@
 import inspect
 from typing import Any, Callable, Optional, Type, Union
 
+from common.permissions.cache import has_org_perms, org_permission_scope_active
 from django.db.models import Model, QuerySet
 from strawberry.types.info import Info
 from strawberry_django.auth.utils import get_current_user
@@ -27,6 +28,12 @@ class PermissionedQuerySet(HasRetvalPerm):
     ``ServiceRequestType``).  Mutations that need cross-org protection
     must catch ``DoesNotExist`` from ``qs.get()`` and raise a
     ``PermissionDenied`` explicitly.
+
+    When the request carries an organization and the user holds the
+    permission there (per the request-scoped org permission cache), the
+    user necessarily holds it through one of their groups, so
+    ``filter_for_user`` would return every row; the unfiltered queryset is
+    used directly instead of building its permission subqueries.
     """
 
     def __init__(
@@ -59,6 +66,15 @@ class PermissionedQuerySet(HasRetvalPerm):
 
     def _prepare_qs(self, info: Info) -> QuerySet[Model]:
         user = get_current_user(info)
+        organization_id = getattr(info.context.request, "organization_id", None)
+        perms = [self.permissions] if isinstance(self.permissions, str) else list(self.permissions)
+        if (
+            organization_id is not None
+            and org_permission_scope_active()
+            and has_org_perms(user, organization_id, perms, any_perm=self.any_perm)
+        ):
+            return self.model.objects.all()
+
         qs: QuerySet[Model] = filter_for_user(self.model.objects.all(), user, self.permissions)  # type: ignore
         return qs
 
@@ -0,0 +1,221 @@
+"""Keyset (cursor) pagination for GraphQL list queries.
+
+``OffsetPaginated`` slices with ``OFFSET``, so page *n* makes Postgres read
+and discard every row of the pages before it.  A keyset page instead
+continues from the last row it returned: the cursor carries that row's sort
+key and the next page is ``WHERE (key) < (cursor) ORDER BY key LIMIT n``,
+which an index on the key answers in constant time however deep the page.
+
+Fields are declared with :func:`keyset_paginated` and a fixed, unique sort
+key (always ending in ``id``)::
+
+    notes_keyset: KeysetPaginated[NoteType] = keyset_paginated(key=("-interacted_at", "-id"))
+
+The key replaces the query's order.  Filters that order the results
+themselves (e.g. the shelters' ``geolocation`` distance/nearest-first sort)
+are rejected rather than silently overridden; use the offset query for
+those.
+
+``totalCount`` is still available but, like every GraphQL field, only
+computed when selected; infinite-scroll clients should rely on
+``pageInfo.hasNextPage`` instead and skip the ``COUNT(*)``.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Generic, Optional, Sequence, TypeVar, cast
+
+import strawberry
+import strawberry_django
+from django.core.exceptions import ValidationError
+from django.db.models import F, Model, QuerySet
+from django.db.models.fields.tuple_lookups import TupleGreaterThan, TupleLessThan
+from strawberry import UNSET
+from strawberry.extensions.field_extension import SyncExtensionResolver
+from strawberry.types import Info
+from strawberry.types.arguments import StrawberryArgument
+from strawberry_django.arguments import argument
+from strawberry_django.fields.field import StrawberryDjangoField, StrawberryOffsetPaginatedExtension
+from strawberry_django.pagination import PAGINATION_ARG, OffsetPaginated
+from strawberry_django.resolvers import django_resolver
+from strawberry_django.settings import strawberry_django_settings
+
+NodeType = TypeVar("NodeType")
+
+
+@strawberry.type
+class KeysetPaginationInfo:
+    limit: Optional[int] = None
+    end_cursor: Optional[str] = None
+    has_next_page: bool = False
+
+
+@strawberry.input
+class KeysetPaginationInput:
+    after: Optional[str] = None
+    limit: Optional[int] = UNSET
+
+
+def _resolve_limit(limit: Optional[int]) -> int:
+    settings = strawberry_django_settings()
+    default_limit = settings["PAGINATION_DEFAULT_LIMIT"] or 100
+    max_limit = settings["PAGINATION_MAX_LIMIT"]
+
+    resolved = default_limit if limit in (None, UNSET) or cast(int, limit) < 0 else cast(int, limit)
+    return min(resolved, max_limit) if max_limit is not None else resolved
+
+
+def _key_fields(key: Sequence[str]) -> tuple[list[str], bool]:
+    """Field names of *key* and whether it sorts descending; mixed directions can't use a row comparison."""
+    descending = {name.startswith("-") for name in key}
+    if len(descending) != 1:
+        raise ValueError(f"keyset {tuple(key)} must sort every field in the same direction")
+
+    return [name.lstrip("-") for name in key], descending.pop()
+
+
+def _cursor_value(value: Any) -> str:
+    # Not DjangoJSONEncoder: it truncates datetimes to milliseconds, and a
+    # truncated cursor would skip rows.
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def encode_cursor(obj: Model, key: Sequence[str]) -> str:
+    fields, _ = _key_fields(key)
+    values = [getattr(obj, obj._meta.get_field(name).attname) for name in fields]
+    return base64.urlsafe_b64encode(json.dumps(values, default=_cursor_value).encode()).decode()
+
+
+def decode_cursor(model: type[Model], cursor: str, key: Sequence[str]) -> list[Any]:
+    fields, _ = _key_fields(key)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(fields):
+            raise ValueError
+        return [model._meta.get_field(name).to_python(value) for name, value in zip(fields, values)]
+    except binascii.Error, ValueError, ValidationError:
+        raise ValueError("Invalid pagination cursor.")
+
+
+def apply_keyset(queryset: QuerySet[Any], key: Sequence[str], after: Optional[str] = None) -> QuerySet[Any]:
+    """Order *queryset* by *key* and, given a cursor, keep only the rows after it."""
+    fields, descending = _key_fields(key)
+    queryset = queryset.order_by(*key)
+    if after:
+        lookup = TupleLessThan if descending else TupleGreaterThan
+        queryset = queryset.filter(
+            lookup(tuple(F(name) for name in fields), tuple(decode_cursor(queryset.model, after, key)))
+        )
+
+    return queryset
+
+
+@strawberry.type
+class KeysetPaginated(OffsetPaginated[NodeType], Generic[NodeType]):
+    key: strawberry.Private[tuple[str, ...]] = ()
+    _page: strawberry.Private[Optional[list[Any]]] = None
+
+    @strawberry.field
+    @django_resolver
+    def page_info(self) -> KeysetPaginationInfo:  # type: ignore[override]
+        page, has_next_page = self._get_page()
+        return KeysetPaginationInfo(
+            limit=_resolve_limit(self.pagination.limit),
+            end_cursor=encode_cursor(page[-1], self.key) if page else None,
+            has_next_page=has_next_page,
+        )
+
+    @strawberry.field(description="List of paginated results.")
+    @django_resolver
+    def results(self) -> list[NodeType]:
+        return cast(list[NodeType], self._get_page()[0])
+
+    @classmethod
+    def resolve_paginated(  # type: ignore[override]
+        cls,
+        queryset: QuerySet[Any],
+        *,
+        info: Info,
+        pagination: Optional[KeysetPaginationInput] = None,
+        key: Sequence[str] = ("-id",),
+        **kwargs: Any,
+    ) -> "KeysetPaginated[NodeType]":
+        return cls(
+            queryset=queryset,
+            pagination=pagination or KeysetPaginationInput(),  # type: ignore[arg-type]
+            key=tuple(key),
+        )
+
+    def _get_page(self) -> tuple[list[Any], bool]:
+        """The page's rows and whether more follow; one query fetches both (``LIMIT n + 1``)."""
+        if self.queryset is None:
+            return [], False
+
+        pagination = cast(KeysetPaginationInput, self.pagination)
+        limit = _resolve_limit(pagination.limit)
+        if self._page is None:
+            self._page = list(apply_keyset(self.queryset, self.key, pagination.after)[: limit + 1])
+
+        return self._page[:limit], len(self._page) > limit
+
+
+class KeysetPaginatedField(StrawberryDjangoField):
+    """Takes a :class:`KeysetPaginationInput` instead of an offset one."""
+
+    @property
+    def arguments(self) -> list[StrawberryArgument]:
+        return [
+            argument(PAGINATION_ARG, KeysetPaginationInput, is_optional=True)
+            if arg.python_name == PAGINATION_ARG
+            else arg
+            for arg in super().arguments
+        ]
+
+    @arguments.setter
+    def arguments(self, value: list[StrawberryArgument]) -> None:
+        cast(property, StrawberryDjangoField.arguments).fset(self, value)  # type: ignore[misc]
+
+    def get_pagination(self) -> Optional[type]:
+        return KeysetPaginationInput if self._has_pagination() else None
+
+
+class KeysetPaginatedExtension(StrawberryOffsetPaginatedExtension):
+    """Resolve a :class:`KeysetPaginated` field, paging on *key*."""
+
+    def __init__(self, key: Sequence[str]) -> None:
+        _key_fields(key)
+        self.key = tuple(key)
+
+    def resolve(
+        self,
+        next_: SyncExtensionResolver,
+        source: Any,
+        info: Info,
+        *,
+        pagination: Optional[KeysetPaginationInput] = None,
+        **kwargs: Any,
+    ) -> Any:
+        queryset = next_(source, info, pagination=pagination, **kwargs)
+        if isinstance(queryset, QuerySet) and queryset.query.order_by:
+            raise ValueError(
+                "Keyset pagination can't be combined with filters that order the results; use the offset query."
+            )
+
+        return self.paginated_type.resolve_paginated(queryset, info=info, pagination=pagination, key=self.key)
+
+
+def keyset_paginated(*, key: Sequence[str], extensions: Sequence[Any] = (), **kwargs: Any) -> Any:
+    """Like ``strawberry_django.offset_paginated``, but paged by *key* instead of by offset.
+
+    The key replaces any ``order``/``ordering`` argument, and filters that
+    order the queryset themselves are rejected: a cursor is only meaningful
+    against the order it was taken from.
+    """
+    return strawberry_django.field(
+        field_cls=KeysetPaginatedField,
+        extensions=[*extensions, KeysetPaginatedExtension(key)],
+        order=None,
+        ordering=None,
+        **kwargs,
+    )
@@ -1,6 +1,6 @@
 from typing import Any, TypeVar
 
-from strawberry import ID, Maybe
+from strawberry import ID, UNSET, Maybe
 
 from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
 from django.db.models import Model, QuerySet
@@ -37,3 +37,12 @@ def maybe_int_value(maybe: Maybe[ID | None]) -> int | None:
         return None
 
     return int(maybe.value)
+
+
+def without_unset(data: Any) -> Any:
+    """*data* (from ``strawberry.asdict``) without the fields the client left unset."""
+    if isinstance(data, dict):
+        return {key: without_unset(value) for key, value in data.items() if value is not UNSET}
+    if isinstance(data, list):
+        return [without_unset(value) for value in data]
+    return data
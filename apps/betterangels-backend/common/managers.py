@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, Iterable, Sequence
+
+from django.db.models import CharField, Func, QuerySet, Value
+
+if TYPE_CHECKING:
+    from common.models import PhoneNumber
+
+
+class DigitsOnly(Func):
+    """``regexp_replace(expression, '[^0-9]', '', 'g')``."""
+
+    function = "regexp_replace"
+    output_field = CharField()
+
+    def __init__(self, expression: Any, **extra: Any) -> None:
+        super().__init__(expression, Value(r"[^0-9]"), Value(""), Value("g"), **extra)
+
+
+def digits_only(value: str | None) -> str:
+    """Python twin of ``DigitsOnly``: *value* with every non-ASCII-digit removed."""
+    return re.sub(r"[^0-9]", "", value or "")
+
+
+class PhoneNumberQuerySet(QuerySet["PhoneNumber"]):
+    """Keeps ``PhoneNumber.number_digits`` current on the write paths that bypass ``save()``."""
+
+    def bulk_create(self, objs: Iterable[PhoneNumber], *args: Any, **kwargs: Any) -> list[PhoneNumber]:
+        objs = list(objs)
+        for obj in objs:
+            obj.number_digits = obj.compute_number_digits()
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs: Iterable[PhoneNumber], fields: Sequence[str], *args: Any, **kwargs: Any) -> int:
+        objs = list(objs)
+        if "number" in fields:
+            fields = [*fields, "number_digits"] if "number_digits" not in fields else list(fields)
+            for obj in objs:
+                obj.number_digits = obj.compute_number_digits()
+        return super().bulk_update(objs, fields, *args, **kwargs)
+
+    def update(self, **kwargs: Any) -> int:
+        if "number" in kwargs:
+            number = kwargs["number"]
+            if hasattr(number, "resolve_expression"):
+                kwargs["number_digits"] = DigitsOnly(number)
+            else:
+                prepared = self.model._meta.get_field("number").get_prep_value(number)
+                kwargs["number_digits"] = digits_only(prepared)
+        return super().update(**kwargs)
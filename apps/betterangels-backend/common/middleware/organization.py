@@ -1,12 +1,14 @@
 """Attaches ``request.organization_id`` from the X-Organization-ID header.
 
 Zero-cost middleware — no DB queries.  Membership validation happens
-downstream in the ``HasOrgPerm`` extension and in selectors, folded
-into their existing queries so Django can optimize.
+downstream in the ``HasOrgPerm`` extension and in selectors.  The request
+runs inside an :func:`~common.permissions.cache.org_permission_scope`, so
+those checks load a user's org permissions at most once per request.
 """
 
 from collections.abc import Callable
 
+from common.permissions.cache import org_permission_scope
 from django.http import HttpRequest, HttpResponse
 
 HEADER = "HTTP_X_ORGANIZATION_ID"
@@ -20,4 +22,5 @@ class OrganizationMiddleware:
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
         request.organization_id = request.META.get(HEADER)  # type: ignore[attr-defined]
-        return self.get_response(request)
+        with org_permission_scope():
+            return self.get_response(request)
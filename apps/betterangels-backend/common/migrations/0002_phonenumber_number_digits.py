@@ -0,0 +1,45 @@
+# Generated by Django 6.0.6 on 2026-10-18 21:21
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, CreateExtension
+from django.db import migrations, models
+from django.db.models import CharField, F, Func, Max, Value
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def backfill_number_digits(apps, schema_editor):
+    """Fill ``number_digits`` in primary-key ranges; each batch commits on its own (non-atomic migration)."""
+    PhoneNumber = apps.get_model("common", "PhoneNumber")
+    digits = Func(F("number"), Value(r"[^0-9]"), Value(""), Value("g"), function="regexp_replace", output_field=CharField())
+
+    last_pk = PhoneNumber.objects.aggregate(m=Max("pk"))["m"] or 0
+    for start in range(0, last_pk, BACKFILL_BATCH_SIZE):
+        PhoneNumber.objects.filter(pk__gt=start, pk__lte=start + BACKFILL_BATCH_SIZE, number__isnull=False).update(
+            number_digits=digits
+        )
+
+
+class Migration(migrations.Migration):
+
+    # Lets the backfill commit batch by batch and the index build without blocking writes.
+    atomic = False
+
+    dependencies = [
+        ('common', '0001_initial'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        CreateExtension("pg_trgm"),
+        migrations.AddField(
+            model_name='phonenumber',
+            name='number_digits',
+            field=models.CharField(blank=True, default='', editable=False, max_length=128),
+        ),
+        migrations.RunPython(backfill_number_digits, migrations.RunPython.noop),
+        AddIndexConcurrently(
+            model_name='phonenumber',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['number_digits'], name='phonenumber_digits_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
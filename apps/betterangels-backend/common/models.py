@@ -5,11 +5,13 @@ from urllib.parse import unquote
 import magic
 from common.enums import AttachmentType
 from common.files.utils import canonicalise_filename, get_unique_file_path, infer_attachment_type
+from common.managers import PhoneNumberQuerySet, digits_only
 from common.permissions.utils import PermissionSet
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.gis.db.models import PointField
 from django.contrib.gis.geos import Point
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models import ForeignKey
 from django.db.models.functions import Lower
@@ -336,13 +338,15 @@ class Location(BaseModel):
 
 class PhoneNumber(models.Model):
     number = PhoneNumberField(region="US", blank=True, null=True)
+    # ``number`` as stored, digits only (``+12125551212`` -> ``12125551212``), for substring search.
+    number_digits = models.CharField(max_length=128, blank=True, default="", editable=False)
     is_primary = models.BooleanField(default=False)
 
     content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
     object_id = models.PositiveIntegerField()
     content_object: GenericForeignKey = GenericForeignKey("content_type", "object_id")
 
-    objects = models.Manager()
+    objects = PhoneNumberQuerySet.as_manager()
 
     class Meta:
         indexes = [
@@ -357,9 +361,22 @@ class PhoneNumber(models.Model):
                 fields=["content_type", "object_id"],
                 name="phonenumber_gfk_idx",
             ),
+            GinIndex(
+                name="phonenumber_digits_trgm",
+                fields=["number_digits"],
+                opclasses=["gin_trgm_ops"],
+            ),
         ]
 
+    def compute_number_digits(self) -> str:
+        return digits_only(self._meta.get_field("number").get_prep_value(self.number))
+
     def save(self, *args: Any, **kwargs: Any) -> None:
+        self.number_digits = self.compute_number_digits()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "number" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "number_digits"}
+
         if self.is_primary:
             PhoneNumber.objects.filter(
                 content_type=self.content_type, object_id=self.object_id, is_primary=True
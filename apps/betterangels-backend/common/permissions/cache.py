@@ -0,0 +1,94 @@
+"""Request-scoped cache of the permissions a user holds in an organization.
+
+A GraphQL document can hit dozens of ``HasOrgPerm``-guarded fields and
+org-scoped selectors, each of which used to re-join Organization →
+PermissionGroup → Group → Permission for the same (user, org).  Inside an
+:func:`org_permission_scope` (opened per request by
+``OrganizationMiddleware``) the full set of ``"app_label.codename"``
+strings is loaded once per (user, org) and reused by every check.
+
+Outside a scope (Celery tasks, management commands, shell) nothing is
+cached and every call hits the database.
+"""
+
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from django.contrib.auth.base_user import AbstractBaseUser
+from django.contrib.auth.models import AnonymousUser, Permission
+
+_OrgPermKey = tuple[Any, str]
+
+_org_permissions: ContextVar[dict[_OrgPermKey, frozenset[str]] | None] = ContextVar(
+    "org_permissions",
+    default=None,
+)
+
+
+@contextmanager
+def org_permission_scope() -> Iterator[None]:
+    """Cache org permissions for the duration of the ``with`` block."""
+    token = _org_permissions.set({})
+    try:
+        yield
+    finally:
+        _org_permissions.reset(token)
+
+
+def org_permission_scope_active() -> bool:
+    return _org_permissions.get() is not None
+
+
+def org_permissions(user: AbstractBaseUser | AnonymousUser, organization_id: Any) -> frozenset[str]:
+    """Return the ``"app_label.codename"`` permissions *user* holds in *organization_id*.
+
+    Only permissions granted through the organization's permission groups
+    count.  Cached for the active :func:`org_permission_scope`, if any.
+    """
+    if not user.is_authenticated:
+        return frozenset()
+
+    cache = _org_permissions.get()
+    key = (user.pk, str(organization_id))
+    if cache is not None and key in cache:
+        return cache[key]
+
+    # Both conditions in one ``.filter()`` so they must hold for the *same* group.
+    rows = (
+        Permission.objects.filter(group__permissiongroup__organization_id=organization_id, group__user=user)
+        .values_list("content_type__app_label", "codename")
+        .distinct()
+    )
+    perms = frozenset(f"{app_label}.{codename}" for app_label, codename in rows)
+
+    if cache is not None:
+        cache[key] = perms
+    return perms
+
+
+def has_org_perms(
+    user: AbstractBaseUser | AnonymousUser,
+    organization_id: Any,
+    perms: Sequence[str],
+    *,
+    any_perm: bool = True,
+) -> bool:
+    """Whether *user* holds any (or, with ``any_perm=False``, all) of *perms* in the organization."""
+    granted = org_permissions(user, organization_id)
+    check = any if any_perm else all
+    return check(perm in granted for perm in perms)
+
+
+def invalidate_org_permissions(*, user_id: Any = None, organization_id: Any = None) -> None:
+    """Drop cached entries matching *user_id* and/or *organization_id* (all entries when neither is given)."""
+    cache = _org_permissions.get()
+    if cache is None:
+        return
+
+    org_key = None if organization_id is None else str(organization_id)
+    for key in list(cache):
+        cached_user_id, cached_org_id = key
+        if (user_id is None or cached_user_id == user_id) and (org_key is None or cached_org_id == org_key):
+            del cache[key]
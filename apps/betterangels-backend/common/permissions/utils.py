@@ -2,19 +2,22 @@ from __future__ import annotations
 
 from functools import reduce
 from operator import or_
-from typing import Any, Sequence, Tuple, Type, TypeVar
+from typing import Any, Iterable, NamedTuple, Sequence, Tuple, Type, TypeVar, cast
 
 import strawberry
-from django.contrib.auth.models import AbstractBaseUser, Group
+from django.contrib.auth.models import AbstractBaseUser, Group, Permission
 from django.core.exceptions import PermissionDenied
+from django.db import connection
 from django.db.models import Exists, Model, OuterRef, Q, QuerySet, TextChoices
 from django.utils.encoding import force_str
-from guardian.shortcuts import assign_perm
+from guardian.ctypes import get_content_type
+from guardian.utils import get_group_obj_perms_model
 from organizations.models import Organization
 from strawberry.types import Info
 from strawberry_django.auth.utils import get_current_user
 
 from common.errors import UnauthenticatedGQLError
+from common.permissions.cache import has_org_perms, org_permission_scope_active
 
 
 # ── Permission enum registry (frontend codegen) ───────────────────────────────
@@ -286,7 +289,10 @@ def permissioned_queryset(
 
     When *perms* is provided, further restricts to records where the
     user holds the specified permission(s).  The org-membership check is
-    implicit — ``permission_groups__group__user`` proves both.
+    implicit — ``permission_groups__group__user`` proves both.  Inside an
+    ``org_permission_scope`` (every HTTP request) the permission check is
+    answered from the request-scoped cache instead of an ``EXISTS`` join:
+    the queryset is either only org-filtered or ``none()``.
 
     Parameters
     ----------
@@ -324,6 +330,11 @@ def permissioned_queryset(
 
     queryset = queryset.filter(reduce(or_, (Q(**{f: organization_id}) for f in fields)))
 
+    if perms is not None and org_permission_scope_active():
+        if has_org_perms(user, organization_id, perms, any_perm=any_perm):
+            return queryset
+        return queryset.none()
+
     if perms is None:
         queryset = queryset.filter(
             reduce(or_, (Q(Exists(Organization.objects.filter(pk=OuterRef(f), users=user))) for f in fields))
@@ -342,6 +353,98 @@ def permissioned_queryset(
     return queryset
 
 
+class ObjectPermissionGrant(NamedTuple):
+    """``group`` is granted ``permission`` (``"app_label.codename"``) on ``obj``."""
+
+    group: Group
+    obj: Model
+    permission: str
+
+
+# VALUES rows per statement; four parameters each stays well below Postgres' 65,535.
+_GRANT_CHUNK_SIZE = 10_000
+
+
+def _grant_statement(perms_model: type[Model], row_count: int) -> str:
+    """``INSERT … SELECT`` of ``row_count`` grants into ``perms_model``'s table.
+
+    Permissions are resolved by a join on ``auth_permission`` inside the
+    statement, existing rows are skipped by ``ON CONFLICT DO NOTHING``, and
+    the statement returns the codenames that matched no permission.
+    """
+    opts = perms_model._meta
+    group_column = opts.get_field("group").column
+    permission_column = opts.get_field("permission").column
+    if perms_model.objects.is_generic():  # type: ignore[attr-defined]
+        target_columns = f'"{opts.get_field("content_type").column}", "{opts.get_field("object_pk").column}"'
+        target_values = "content_type_id, object_pk"
+    else:
+        # Direct foreign key models (e.g. ``NoteGroupObjectPermission``) reference the object itself.
+        content_object = cast(Any, opts.get_field("content_object"))
+        target_columns = f'"{content_object.column}"'
+        target_values = f"object_pk::{content_object.target_field.rel_db_type(connection)}"
+
+    values = ", ".join(["(%s::integer, %s::integer, %s::text, %s::text)"] * row_count)
+    return f"""
+        WITH grants (group_id, content_type_id, object_pk, codename) AS (VALUES {values}),
+        resolved AS (
+            SELECT grants.*, p."id" AS permission_id
+            FROM grants
+            LEFT JOIN "{Permission._meta.db_table}" p
+                ON p."content_type_id" = grants.content_type_id AND p."codename" = grants.codename
+        ),
+        inserted AS (
+            INSERT INTO "{opts.db_table}" ("{group_column}", "{permission_column}", {target_columns})
+            SELECT group_id, permission_id, {target_values} FROM resolved WHERE permission_id IS NOT NULL
+            ON CONFLICT DO NOTHING
+        )
+        SELECT DISTINCT codename FROM resolved WHERE permission_id IS NULL
+    """
+
+
+def assign_object_permission_grants(grants: Iterable[ObjectPermissionGrant]) -> None:
+    """Write every grant of ``grants`` (objects × permissions × groups) in one statement per table.
+
+    The replacement for ``guardian.shortcuts.assign_perm`` in a loop, which
+    runs a permission lookup and a get-or-create per grant.  Grants that
+    already exist are skipped.  Objects must be saved; like guardian, a
+    permission that doesn't exist for the object's content type raises
+    ``Permission.DoesNotExist``.
+    """
+    rows_by_model: dict[type[Model], list[tuple[Any, ...]]] = {}
+    for group, obj, permission in grants:
+        if obj.pk is None:
+            raise ValueError(f"Cannot assign object permissions on unsaved {obj!r}")
+        rows_by_model.setdefault(get_group_obj_perms_model(obj), []).append(
+            (group.pk, get_content_type(obj).pk, str(obj.pk), str(permission).split(".", 1)[-1])
+        )
+
+    unknown: set[str] = set()
+    with connection.cursor() as cursor:
+        for perms_model, rows in rows_by_model.items():
+            for start in range(0, len(rows), _GRANT_CHUNK_SIZE):
+                chunk = rows[start : start + _GRANT_CHUNK_SIZE]
+                cursor.execute(_grant_statement(perms_model, len(chunk)), [value for row in chunk for value in row])
+                unknown.update(codename for (codename,) in cursor.fetchall())
+
+    if unknown:
+        raise Permission.DoesNotExist(f"Unknown object permissions: {', '.join(sorted(unknown))}")
+
+
+def bulk_assign_object_permissions(
+    group: Group,
+    objs: Sequence[Model],
+    permissions: Sequence[str],
+) -> None:
+    """Assign every one of ``permissions`` on every one of ``objs`` to ``group``.
+
+    One statement however many objects; see :func:`assign_object_permission_grants`.
+    """
+    assign_object_permission_grants(
+        ObjectPermissionGrant(group, obj, permission) for obj in objs for permission in permissions
+    )
+
+
 def assign_object_permissions(
     group: Group,
     obj: Model,
@@ -349,9 +452,7 @@ def assign_object_permissions(
 ) -> None:
     """Assign a list of object-level permissions on ``obj`` to ``group``.
 
-    This is a thin wrapper around ``guardian.shortcuts.assign_perm`` that
-    eliminates the repeated ``for perm in perms: assign_perm(…)`` loop
-    scattered across mutations and services.
+    Creating several objects?  Call :func:`bulk_assign_object_permissions`
+    once for all of them instead of this once per object.
     """
-    for perm in permissions:
-        assign_perm(perm, group, obj)
+    bulk_assign_object_permissions(group, [obj], permissions)
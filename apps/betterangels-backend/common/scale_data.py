@@ -0,0 +1,374 @@
+"""
+Synthetic, configurable-scale dataset for profiling and the benchmark suite
+(``manage.py seed_scale_data`` and ``benchmarks/``).
+
+Builds on the local seed commands: services, teams, purposes and names come
+from ``load_report_test_data`` and ``seed_merge_test_data`` so the data looks
+like what those commands produce, only bulk-inserted and much larger.
+
+Every dataset is keyed by a fingerprint of its ``ScaleConfig``; seeding the
+same config twice reuses the first run (see :func:`load_or_seed`).
+
+Reservation history is inserted round by round (the n-th stay of every bed)
+and walked through ``confirmed`` → ``checked_in`` → ``completed`` with real
+updates, so pghistory records the same events production does.  The events
+are then backdated to the stay times, which is what the occupancy selectors
+replay.
+"""
+
+import hashlib
+import json
+import random
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from accounts.groups import ORG_ADMIN
+from accounts.models import User
+from accounts.services import create_organization_with_presets
+from clients.management.commands.seed_merge_test_data import DUPLICATE_GROUPS
+from clients.models import ClientProfile
+from common.models import PhoneNumber
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.gis.geos import Point
+from django.db import transaction
+from django.db.models import F, OuterRef, Subquery
+from django.utils import timezone
+from notes.enums import ServiceRequestStatusEnum
+from notes.groups import CASEWORKER
+from notes.models import Note, OrganizationService, ServiceRequest
+from organizations.models import Organization
+from places import Places
+from reports.management.commands.load_report_test_data import (
+    FIRST_NAMES,
+    LAST_NAMES,
+    PURPOSES,
+    SEED_TEAMS,
+    create_org_services,
+)
+from shelters.enums import ReservationStatusChoices, StatusChoices
+from shelters.groups import SHELTER_OPERATOR
+from shelters.models import Bed, Reservation, Room, Shelter
+from shelters.services.occupancy_rollup import occupancy_rollup_refresh
+from teams.models import Team
+
+BATCH_SIZE = 5_000
+BEDS_PER_ROOM = 4
+
+# Rough Los Angeles bounding box, as used by the shelter model tests.
+LATITUDE_BOUNDS = (33.937143, 34.102757)
+LONGITUDE_BOUNDS = (-118.493372, -118.246635)
+# Los Angeles County, for the org-less shelters the map and distance queries search.
+COUNTY_LATITUDE_BOUNDS = (33.70, 34.82)
+COUNTY_LONGITUDE_BOUNDS = (-118.94, -117.65)
+
+
+@dataclass(frozen=True)
+class ScaleConfig:
+    orgs: int = 2
+    shelters_per_org: int = 3
+    beds_per_shelter: int = 10
+    history_days: int = 90
+    notes: int = 2_000
+    clients: int = 1_000
+    map_shelters: int = 10_000
+    seed: int = 1
+
+    @property
+    def fingerprint(self) -> str:
+        return hashlib.sha1(json.dumps(asdict(self), sort_keys=True).encode()).hexdigest()[:10]
+
+
+PRESETS: dict[str, ScaleConfig] = {
+    "small": ScaleConfig(),
+    "medium": ScaleConfig(
+        orgs=4,
+        shelters_per_org=10,
+        beds_per_shelter=25,
+        history_days=365,
+        notes=25_000,
+        clients=20_000,
+        map_shelters=25_000,
+    ),
+    "large": ScaleConfig(
+        orgs=10,
+        shelters_per_org=20,
+        beds_per_shelter=40,
+        history_days=3 * 365,
+        notes=150_000,
+        clients=100_000,
+        map_shelters=100_000,
+    ),
+}
+
+
+@dataclass
+class ScaleDataset:
+    config: ScaleConfig
+    user: User
+    orgs: list[Organization]
+
+    def shelters(self, org: Organization) -> list[Shelter]:
+        return list(Shelter.objects.filter(organization=org).order_by("pk"))
+
+
+def _org_name(config: ScaleConfig, index: int) -> str:
+    return f"bench-{config.fingerprint}-{index}"
+
+
+def load_or_seed(config: ScaleConfig, log: Callable[[str], None] = lambda _: None) -> ScaleDataset:
+    """Return the dataset for *config*, seeding it first unless a complete one already exists."""
+    names = [_org_name(config, i) for i in range(config.orgs)]
+    user = User.objects.filter(username=f"bench-{config.fingerprint}").first()
+    orgs = {o.name: o for o in Organization.objects.filter(name__in=names)}
+    if user is not None and len(orgs) == config.orgs:
+        return ScaleDataset(config=config, user=user, orgs=[orgs[n] for n in names])
+
+    return seed_scale_dataset(config, log=log)
+
+
+@transaction.atomic
+def seed_scale_dataset(config: ScaleConfig, log: Callable[[str], None] = lambda _: None) -> ScaleDataset:
+    rng = random.Random(config.seed)
+    now = timezone.now()
+    history_start = now - timedelta(days=config.history_days)
+
+    user, _ = User.objects.get_or_create(
+        username=f"bench-{config.fingerprint}",
+        defaults={"email": f"bench-{config.fingerprint}@example.com"},
+    )
+
+    log(f"Creating {config.clients} client profiles...")
+    clients = _seed_clients(config, rng)
+
+    log(f"Scattering {config.map_shelters} shelters across LA County...")
+    _seed_map_shelters(config, rng)
+
+    orgs: list[Organization] = []
+    notes_per_org, extra_notes = divmod(config.notes, config.orgs)
+    for index in range(config.orgs):
+        org = create_organization_with_presets(
+            name=_org_name(config, index),
+            preset_names=["outreach", "shelter"],
+            owner=user,
+            owner_roles=(CASEWORKER, ORG_ADMIN, SHELTER_OPERATOR),
+        )
+        orgs.append(org)
+
+        log(f"[{org.name}] shelters, beds and {config.history_days} days of reservations...")
+        for shelter in _seed_shelters(config, org, rng):
+            _seed_reservation_history(shelter, rng, start=history_start, now=now)
+            occupancy_rollup_refresh(shelter=shelter, rebuild=True)
+
+        org_notes = notes_per_org + (1 if index < extra_notes else 0)
+        log(f"[{org.name}] {org_notes} notes...")
+        _seed_notes(org, user, clients, org_notes, rng, start=history_start, now=now)
+
+    return ScaleDataset(config=config, user=user, orgs=orgs)
+
+
+def _seed_clients(config: ScaleConfig, rng: random.Random) -> list[int]:
+    # A sprinkling of the merge-tool duplicates so name search has realistic collisions.
+    duplicate_names = [(g["target"]["first_name"], g["target"]["last_name"]) for g in DUPLICATE_GROUPS]
+
+    ids: list[int] = []
+    for offset in range(0, config.clients, BATCH_SIZE):
+        batch = []
+        for i in range(offset, min(offset + BATCH_SIZE, config.clients)):
+            if rng.random() < 0.01:
+                first_name, last_name = rng.choice(duplicate_names)
+            else:
+                first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            batch.append(
+                ClientProfile(
+                    first_name=first_name,
+                    last_name=last_name,
+                    email=f"client-{config.fingerprint}-{i}@example.com",
+                )
+            )
+        ids.extend(c.pk for c in ClientProfile.objects.bulk_create(batch))
+
+    content_type = ContentType.objects.get_for_model(ClientProfile)
+    phone_numbers = []
+    for client_id in ids:
+        if rng.random() < 0.5:
+            phone = PhoneNumber(
+                number=f"+1213{rng.randrange(2_000_000, 9_999_999)}",
+                is_primary=True,
+                content_type=content_type,
+                object_id=client_id,
+            )
+            phone.number_digits = phone.compute_number_digits()
+            phone_numbers.append(phone)
+    PhoneNumber.objects.bulk_create(phone_numbers, batch_size=BATCH_SIZE)
+
+    return ids
+
+
+def _seed_shelters(config: ScaleConfig, org: Organization, rng: random.Random) -> list[Shelter]:
+    shelters = []
+    for i in range(config.shelters_per_org):
+        latitude = round(rng.uniform(*LATITUDE_BOUNDS), 5)
+        longitude = round(rng.uniform(*LONGITUDE_BOUNDS), 5)
+        shelters.append(
+            Shelter(
+                name=f"{org.name} shelter {i + 1}",
+                organization=org,
+                status=StatusChoices.APPROVED,
+                total_beds=config.beds_per_shelter,
+                # bulk_create skips ``Shelter.save``, which derives geolocation from location.
+                location=Places(f"{rng.randint(100, 20000)} Main St", str(latitude), str(longitude)),
+                geolocation=Point(longitude, latitude),
+            )
+        )
+    shelters = Shelter.objects.bulk_create(shelters)
+
+    for shelter in shelters:
+        rooms = Room.objects.bulk_create(
+            Room(shelter=shelter, name=f"Room {r + 1}") for r in range(-(-config.beds_per_shelter // BEDS_PER_ROOM))
+        )
+        Bed.objects.bulk_create(
+            Bed(shelter=shelter, room=rooms[b // BEDS_PER_ROOM], name=f"Bed {b + 1}")
+            for b in range(config.beds_per_shelter)
+        )
+
+    return shelters
+
+
+def _seed_map_shelters(config: ScaleConfig, rng: random.Random) -> None:
+    """Approved, bed-less shelters without an organization, for map and distance queries."""
+    shelters = []
+    for i in range(config.map_shelters):
+        latitude = round(rng.uniform(*COUNTY_LATITUDE_BOUNDS), 5)
+        longitude = round(rng.uniform(*COUNTY_LONGITUDE_BOUNDS), 5)
+        shelters.append(
+            Shelter(
+                name=f"bench-{config.fingerprint} map shelter {i + 1}",
+                status=StatusChoices.APPROVED,
+                location=Places(f"{rng.randint(100, 20000)} Main St", str(latitude), str(longitude)),
+                geolocation=Point(longitude, latitude),
+            )
+        )
+    Shelter.objects.bulk_create(shelters, batch_size=BATCH_SIZE)
+
+
+def _seed_reservation_history(shelter: Shelter, rng: random.Random, *, start: datetime, now: datetime) -> None:
+    bed_ids = list(Bed.objects.filter(shelter=shelter).values_list("pk", flat=True))
+    Bed.objects.filter(pk__in=bed_ids).update(created_at=start)
+    Bed.pgh_event_model.objects.filter(  # type: ignore[attr-defined]
+        pgh_obj_id__in=bed_ids, pgh_label="bed.add"
+    ).update(pgh_created_at=start)
+
+    # Per bed: stays of 1–30 nights separated by 0–5 idle days; a stay still running at *now* stays checked in.
+    rounds: list[list[tuple[int, datetime, datetime | None]]] = []
+    for bed_id in bed_ids:
+        at = start + timedelta(days=rng.randint(0, 5), hours=rng.randint(12, 20))
+        n = 0
+        while at < now:
+            leave = at + timedelta(days=rng.randint(1, 30), hours=rng.randint(-4, 2))
+            check_out = leave if leave < now else None
+            if n == len(rounds):
+                rounds.append([])
+            rounds[n].append((bed_id, at, check_out))
+            if check_out is None:
+                break
+            at = check_out + timedelta(days=rng.randint(0, 5), hours=rng.randint(1, 8))
+            n += 1
+
+    for stays in rounds:
+        reservations = Reservation.objects.bulk_create(
+            Reservation(bed_id=bed_id, start_date=at.date(), status=ReservationStatusChoices.CONFIRMED)
+            for bed_id, at, _ in stays
+        )
+        for reservation, (_, at, _) in zip(reservations, stays):
+            reservation.status = ReservationStatusChoices.CHECKED_IN
+            reservation.checked_in_at = at
+        Reservation.objects.bulk_update(reservations, ["status", "checked_in_at"], batch_size=BATCH_SIZE)
+
+        completed = []
+        for reservation, (_, _, check_out) in zip(reservations, stays):
+            if check_out is not None:
+                reservation.status = ReservationStatusChoices.COMPLETED
+                reservation.checked_out_at = check_out
+                completed.append(reservation)
+        Reservation.objects.bulk_update(completed, ["status", "checked_out_at"], batch_size=BATCH_SIZE)
+
+    _backdate_reservation_events(bed_ids)
+
+
+def _backdate_reservation_events(bed_ids: list[int]) -> None:
+    booked_ahead = timedelta(hours=2)
+    event_model = Reservation.pgh_event_model  # type: ignore[attr-defined]
+    events = event_model.objects.filter(bed_id__in=bed_ids)
+
+    checked_in_at = Reservation.objects.filter(pk=OuterRef("pgh_obj_id")).values("checked_in_at")[:1]
+    events.filter(pgh_label="reservation.add").update(pgh_created_at=Subquery(checked_in_at) - booked_ahead)
+    events.filter(pgh_label="reservation.status_change", status=ReservationStatusChoices.CHECKED_IN).update(
+        pgh_created_at=F("checked_in_at")
+    )
+    events.filter(pgh_label="reservation.status_change", status=ReservationStatusChoices.COMPLETED).update(
+        pgh_created_at=F("checked_out_at")
+    )
+    Reservation.objects.filter(bed_id__in=bed_ids).update(
+        created_at=F("checked_in_at") - booked_ahead,
+        updated_at=F("checked_in_at"),
+    )
+
+
+def _seed_notes(
+    org: Organization,
+    user: User,
+    clients: list[int],
+    count: int,
+    rng: random.Random,
+    *,
+    start: datetime,
+    now: datetime,
+) -> None:
+    teams = [Team.objects.get_or_create(name=name, organization=org)[0] for name in SEED_TEAMS]
+    services: list[OrganizationService] = create_org_services(org)
+    span_seconds = int((now - start).total_seconds())
+    provided_through = Note.provided_services.through
+    requested_through = Note.requested_services.through
+
+    for offset in range(0, count, BATCH_SIZE):
+        size = min(BATCH_SIZE, count - offset)
+        notes = Note.objects.bulk_create(
+            Note(
+                organization=org,
+                created_by=user,
+                client_profile_id=rng.choice(clients) if clients else None,
+                interacted_at=start + timedelta(seconds=rng.randrange(span_seconds)),
+                team=rng.choice(teams),
+                purpose=rng.choice(PURPOSES),
+                is_submitted=True,
+                public_details=f"Benchmark interaction #{offset + i + 1}",
+            )
+            for i in range(size)
+        )
+
+        # (note, service request, provided?) — 1–4 provided services each, requested ones on ~60% of notes.
+        links: list[tuple[Note, ServiceRequest, bool]] = []
+        for note in notes:
+            for service in rng.sample(services, rng.randint(1, 4)):
+                request = ServiceRequest(service=service, status=ServiceRequestStatusEnum.COMPLETED, created_by=user)
+                links.append((note, request, True))
+            if rng.random() < 0.6:
+                for service in rng.sample(services, rng.randint(1, 3)):
+                    status = rng.choice([ServiceRequestStatusEnum.TO_DO, ServiceRequestStatusEnum.COMPLETED])
+                    links.append((note, ServiceRequest(service=service, status=status, created_by=user), False))
+
+        ServiceRequest.objects.bulk_create([request for _, request, _ in links], batch_size=BATCH_SIZE)
+        provided_through.objects.bulk_create(
+            [provided_through(note_id=n.pk, servicerequest_id=r.pk) for n, r, provided in links if provided],
+            batch_size=BATCH_SIZE,
+        )
+        requested_through.objects.bulk_create(
+            [requested_through(note_id=n.pk, servicerequest_id=r.pk) for n, r, provided in links if not provided],
+            batch_size=BATCH_SIZE,
+        )
+
+
+def describe(config: ScaleConfig) -> dict[str, Any]:
+    return {**asdict(config), "fingerprint": config.fingerprint}
@@ -0,0 +1,91 @@
+"""Shared write path of the bulk importers (client profiles, notes).
+
+Importers validate a batch up front, then hand the prepared rows to
+:func:`bulk_insert_with_row_retry`, which writes them in one transaction and,
+when the database rejects the batch, falls back to one transaction per row
+so only the offending rows fail.  A failed row records a message, never the
+database's own error text, which is logged instead.
+"""
+
+import logging
+from typing import Callable, Iterable, Mapping, Protocol, Sequence, TypeVar
+
+from django.db import DatabaseError, IntegrityError, transaction
+from django.db.models import Model
+
+logger = logging.getLogger(__name__)
+
+
+class ImportSourceRow(Protocol):
+    @property
+    def source_id(self) -> str: ...
+
+    @property
+    def source_name(self) -> str: ...
+
+
+class PreparedImportRow(Protocol):
+    """A validated source row and the unsaved instances it will insert."""
+
+    @property
+    def index(self) -> int: ...
+
+    @property
+    def row(self) -> ImportSourceRow: ...
+
+    def unsaved_instances(self) -> Iterable[Model]: ...
+
+
+P = TypeVar("P", bound=PreparedImportRow)
+R = TypeVar("R")
+
+INTEGRITY_ERROR_MESSAGE = "Conflicts with existing data, possibly from a concurrent change."
+DATABASE_ERROR_MESSAGE = "Could not be saved."
+
+
+def violated_constraint(error: DatabaseError) -> str | None:
+    """Name of the constraint *error* violated, from the database driver's diagnostics."""
+    diag = getattr(error.__cause__, "diag", None)
+    return getattr(diag, "constraint_name", None)
+
+
+def _row_error_message(error: DatabaseError, constraint_errors: Mapping[str, str]) -> str:
+    if (constraint := violated_constraint(error)) in constraint_errors:
+        return constraint_errors[constraint]
+    return INTEGRITY_ERROR_MESSAGE if isinstance(error, IntegrityError) else DATABASE_ERROR_MESSAGE
+
+
+def bulk_insert_with_row_retry(
+    prepared: Sequence[P],
+    insert: Callable[[Sequence[P]], Sequence[R]],
+    *,
+    label: str,
+    constraint_errors: Mapping[str, str] | None = None,
+) -> dict[int, R | str]:
+    """Insert *prepared* with *insert*; if the batch hits a database error, retry row by row so only the bad rows fail.
+
+    *insert* returns one result per prepared row, in order.  Returns the
+    result, or the error message, of each row by its index.  *label* names
+    the importer in the log of failed rows.  *constraint_errors* maps the
+    names of constraints the importer knows about to the message a row
+    violating one records; other errors record a generic message.
+    """
+    try:
+        with transaction.atomic():
+            return {p.index: result for p, result in zip(prepared, insert(prepared))}
+    except DatabaseError:
+        if len(prepared) == 1:
+            raise
+
+    results: dict[int, R | str] = {}
+    for p in prepared:
+        # The failed attempt left primary keys from the rolled-back inserts on the instances.
+        for instance in p.unsaved_instances():
+            instance.pk = None
+            instance._state.adding = True
+        try:
+            results.update(bulk_insert_with_row_retry([p], insert, label=label))
+        except DatabaseError as e:
+            logger.warning("%s of %s/%s failed: %s", label, p.row.source_name, p.row.source_id, e)
+            results[p.index] = _row_error_message(e, constraint_errors or {})
+    return results
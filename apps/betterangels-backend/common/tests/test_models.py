@@ -418,6 +418,39 @@ class PhoneNumberTestCase(TestCase):
         self.assertFalse(phone_number_1.is_primary)
         self.assertTrue(phone_number_2.is_primary)
 
+    def _stored_digits(self) -> list[str]:
+        return list(PhoneNumber.objects.order_by("pk").values_list("number_digits", flat=True))
+
+    def test_number_digits_kept_current(self) -> None:
+        content_type = ContentType.objects.get_for_model(Address)
+        phone_number = PhoneNumber.objects.create(content_type=content_type, object_id=1, number="(212) 555-1212")
+        self.assertEqual(self._stored_digits(), ["12125551212"])
+
+        phone_number.number = "718-555-0000"
+        phone_number.save(update_fields=["number"])
+        self.assertEqual(self._stored_digits(), ["17185550000"])
+
+        phone_number.number = None
+        phone_number.save()
+        self.assertEqual(self._stored_digits(), [""])
+
+    def test_number_digits_kept_current_on_bulk_paths(self) -> None:
+        content_type = ContentType.objects.get_for_model(Address)
+        created = PhoneNumber.objects.bulk_create(
+            [
+                PhoneNumber(content_type=content_type, object_id=1, number="2125551212"),
+                PhoneNumber(content_type=content_type, object_id=2, number="3475550101"),
+            ]
+        )
+        self.assertEqual(self._stored_digits(), ["12125551212", "13475550101"])
+
+        created[0].number = "7185550000"
+        PhoneNumber.objects.bulk_update(created, ["number"])
+        self.assertEqual(self._stored_digits(), ["17185550000", "13475550101"])
+
+        PhoneNumber.objects.filter(object_id=2).update(number="+13105550199")
+        self.assertEqual(self._stored_digits(), ["17185550000", "13105550199"])
+
 
 @override_settings(STORAGES={"default": {"BACKEND": "django.core.files.storage.InMemoryStorage"}})
 class AttachmentTestCase(TestCase):
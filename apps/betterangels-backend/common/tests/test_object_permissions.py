@@ -0,0 +1,67 @@
+from accounts.models import BigGroupObjectPermission
+from clients.models import ClientProfile
+from common.permissions.utils import (
+    ObjectPermissionGrant,
+    assign_object_permission_grants,
+    assign_object_permissions,
+    bulk_assign_object_permissions,
+)
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+from guardian.shortcuts import get_groups_with_perms, get_perms
+from model_bakery import baker
+from notes.models import Note, NoteGroupObjectPermission
+
+
+class AssignObjectPermissionGrantsTest(TestCase):
+    def setUp(self) -> None:
+        self.group_1 = baker.make(Group)
+        self.group_2 = baker.make(Group)
+        self.notes = baker.make(Note, _quantity=3)
+        self.client_profile = baker.make(ClientProfile)
+        # Warm the content type cache, so the query counts below are the writes alone.
+        ContentType.objects.get_for_models(Note, ClientProfile)
+
+    def test_writes_direct_and_generic_tables_with_one_statement_each(self) -> None:
+        grants = [
+            *(
+                ObjectPermissionGrant(group, note, perm)
+                for group in (self.group_1, self.group_2)
+                for note in self.notes
+                for perm in ("notes.change_note", "notes.delete_note")
+            ),
+            ObjectPermissionGrant(self.group_1, self.client_profile, "clients.change_clientprofile"),
+        ]
+
+        with self.assertNumQueries(2):
+            assign_object_permission_grants(grants)
+
+        self.assertEqual(NoteGroupObjectPermission.objects.count(), 12)
+        for note in self.notes:
+            self.assertEqual(set(get_groups_with_perms(note)), {self.group_1, self.group_2})
+            self.assertEqual(set(get_perms(self.group_2, note)), {"change_note", "delete_note"})
+        self.assertEqual(get_perms(self.group_1, self.client_profile), ["change_clientprofile"])
+        self.assertEqual(
+            BigGroupObjectPermission.objects.filter(object_pk=str(self.client_profile.pk)).count(),
+            1,
+        )
+
+    def test_existing_grants_are_skipped(self) -> None:
+        assign_object_permissions(self.group_1, self.notes[0], ["notes.change_note"])
+
+        bulk_assign_object_permissions(self.group_1, self.notes, ["notes.change_note", "notes.change_note"])
+
+        self.assertEqual(NoteGroupObjectPermission.objects.count(), 3)
+
+    def test_unknown_permission_raises(self) -> None:
+        with self.assertRaisesMessage(Permission.DoesNotExist, "change_shelter"):
+            assign_object_permissions(self.group_1, self.notes[0], ["shelters.change_shelter"])
+
+    def test_unsaved_object_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            assign_object_permissions(self.group_1, Note(), ["notes.change_note"])
+
+    def test_no_grants_runs_no_queries(self) -> None:
+        with self.assertNumQueries(0):
+            bulk_assign_object_permissions(self.group_1, [], ["notes.change_note"])
@@ -13,12 +13,17 @@ from accounts.groups import ORG_ADMIN
 from accounts.models import PermissionGroup, User
 from accounts.role_manager import OrgRoleManager
 from accounts.tests.baker_recipes import organization_recipe
+from common.permissions.cache import has_org_perms, org_permission_scope
 from common.permissions.utils import permissioned_queryset
 from common.tests.utils import GraphQLBaseTestCase
 from django.contrib.auth.models import Permission
+from django.db import connection
 from django.test import TestCase, ignore_warnings
+from django.test.utils import CaptureQueriesContext
 from model_bakery import baker
+from notes.groups import CASEWORKER
 from organizations.models import Organization
+from shelters.tests.utils import ShelterTestCase
 from teams.models import Team
 
 CREATE_TEAM = """
@@ -108,3 +113,74 @@ class PermissionedQuerysetSameGroupTestCase(TestCase):
         self.holder_group.group.user_set.add(self.user)
 
         self.assertTrue(self._matches())
+
+    def test_cached_check_applies_the_same_group_rule(self) -> None:
+        with org_permission_scope():
+            self.assertFalse(self._matches())
+
+
+class OrgPermissionCacheTestCase(TestCase):
+    def setUp(self) -> None:
+        self.org = organization_recipe.make(name="perm_cache_org")
+        self.user = baker.make(User, username=f"member_{uuid.uuid4()}")
+        self.org.add_user(self.user)
+
+    def test_loaded_once_per_scope(self) -> None:
+        with org_permission_scope():
+            with self.assertNumQueries(1):
+                for _ in range(5):
+                    has_org_perms(self.user, self.org.pk, [Team.perms.ADD])
+                    has_org_perms(self.user, str(self.org.pk), [Team.perms.CHANGE])
+
+    def test_uncached_outside_a_scope(self) -> None:
+        with self.assertNumQueries(2):
+            has_org_perms(self.user, self.org.pk, [Team.perms.ADD])
+            has_org_perms(self.user, self.org.pk, [Team.perms.ADD])
+
+    def test_role_change_invalidates(self) -> None:
+        with org_permission_scope():
+            self.assertFalse(has_org_perms(self.user, self.org.pk, [Team.perms.ADD]))
+
+            OrgRoleManager(self.org).add_roles(self.user, ORG_ADMIN)
+            self.assertTrue(has_org_perms(self.user, self.org.pk, [Team.perms.ADD]))
+
+            OrgRoleManager(self.org).clear_roles(self.user)
+            self.assertFalse(has_org_perms(self.user, self.org.pk, [Team.perms.ADD]))
+
+    def test_scoped_queryset_answers_from_cache(self) -> None:
+        OrgRoleManager(self.org).add_roles(self.user, CASEWORKER)
+
+        with org_permission_scope():
+            has_org_perms(self.user, self.org.pk, [Team.perms.ADD])
+            with self.assertNumQueries(0):
+                denied = permissioned_queryset(
+                    Team.objects.all(), user=self.user, organization_id=str(self.org.pk), perms=[Team.perms.ADD]
+                )
+            with self.assertNumQueries(0):
+                self.assertEqual(list(denied), [])
+
+
+class HasOrgPermQueryCountTestCase(ShelterTestCase):
+    """Regression: one permission lookup per request, however many guarded fields resolve."""
+
+    QUERY = """
+        query {
+            shelters: operatorShelters { totalCount }
+            beds { totalCount }
+            rooms { totalCount }
+            reservations { totalCount }
+            bedsAgain: beds { totalCount }
+        }
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.graphql_client.force_login(self.operator)
+
+    def test_permissions_loaded_once_per_request(self) -> None:
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.execute_graphql(self.QUERY)
+
+        self.assertIsNone(response.get("errors"))
+        permission_queries = [q["sql"] for q in ctx.captured_queries if '"auth_permission"' in q["sql"]]
+        self.assertEqual(len(permission_queries), 1, permission_queries)
@@ -299,3 +299,31 @@ class GraphQLBaseTestCase(
             self.graphql_client.force_login(self.user_map[user_label])
         else:
             self.graphql_client.logout()
+
+    def _keyset_pages(
+        self, field: str, filter_type: str, filters: Optional[Dict[str, Any]] = None, limit: int = 2
+    ) -> List[List[str]]:
+        """Follow the cursors of keyset-paginated *field* to its last page; the result ids of each page."""
+        query = f"""
+            query ($after: String, $filters: {filter_type}) {{
+                {field} (filters: $filters, pagination: {{limit: {limit}, after: $after}}) {{
+                    pageInfo {{
+                        endCursor
+                        hasNextPage
+                    }}
+                    results {{
+                        id
+                    }}
+                }}
+            }}
+        """
+        pages = []
+        after = None
+        while True:
+            response = self.execute_graphql(query, variables={"after": after, "filters": filters})
+            self.assertIsNone(response.get("errors"))
+            page = response["data"][field]
+            pages.append([r["id"] for r in page["results"]])
+            if not page["pageInfo"]["hasNextPage"]:
+                return pages
+            after = page["pageInfo"]["endCursor"]
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Iterator
 
 import pytest
 from test_utils.vcr_config import scrubbed_vcr
@@ -9,3 +10,12 @@ def _set_relative_vcr_dir(request: pytest.FixtureRequest) -> None:
     """Always override cassette path to module-relative directory."""
     test_file = Path(request.path)
     scrubbed_vcr.cassette_library_dir = str(test_file.parent / "cassettes")
+
+
+@pytest.fixture(autouse=True)
+def _reset_hmis_transport() -> Iterator[None]:
+    """Drop pooled HMIS connections and cached login forms so no test reuses another's (VCR) connections."""
+    from hmis.transport import reset_transport
+
+    yield
+    reset_transport()
@@ -1,5 +1,8 @@
 import datetime
+import hashlib
+import json
 import re
+import uuid
 from datetime import timezone
 from enum import Enum
 from http import HTTPMethod
@@ -12,6 +15,7 @@ from common.constants import HMIS_AUTH_COOKIE_NAME
 from common.errors import NotFoundGQLError, UnauthenticatedGQLError
 from common.utils import dict_keys_to_snake
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied, ValidationError
 from graphql import (
     FieldNode,
@@ -20,6 +24,7 @@ from graphql import (
     InlineFragmentNode,
     SelectionSetNode,
 )
+from hmis import transport
 from hmis.types import (
     CreateHmisClientProfileInput,
     CreateHmisNoteInput,
@@ -111,7 +116,9 @@ class HmisApiBridge:
         forwarded_user_agent = (request.headers.get("User-Agent") or "").strip()
         user_agent_header = {"User-Agent": forwarded_user_agent} if forwarded_user_agent else {}
 
-        self.http = requests.Session()
+        # Own cookie jar per bridge; connections come from the shared pool in ``hmis.transport``.
+        self.http = transport.new_session()
+        self._cache_user = hashlib.sha256(token.encode()).hexdigest() if token else None
 
         self.headers = {
             "Accept": "application/json, text/plain, */*",
@@ -323,17 +330,20 @@ class HmisApiBridge:
         self,
         path: str,
         body: dict[str, Any],
+        operation: str,
         method: HTTPMethod = HTTPMethod.GET,
-        timeout: Optional[float] = None,
     ) -> requests.Response:
         request_args = {
             "url": f"{self.endpoint}{path}",
             "headers": self.headers,
             "json": body,
-            "timeout": timeout,
+            "timeout": transport.operation_timeout(operation),
         }
         resp = self.http.request(method, **request_args)  # type: ignore
 
+        if method != HTTPMethod.GET:
+            self._invalidate_cached_responses()
+
         self._handle_error_response(resp)
 
         # Transparently forward any cookie updates from HMIS to the client
@@ -342,6 +352,60 @@ class HmisApiBridge:
 
         return resp
 
+    # Response cache -------------------------------------------------------
+    #
+    # Keys are scoped to the HMIS user (hash of the bearer token) and a
+    # per-user generation that every write bumps, so a user never reads back
+    # their own stale data after a mutation.
+
+    def _cache_generation_key(self) -> str:
+        return f"hmis:resp:gen:{self._cache_user}"
+
+    def _response_cache_key(self, path: str, body: dict[str, Any]) -> Optional[str]:
+        if not settings.HMIS_RESPONSE_CACHE_TTL or self._cache_user is None:
+            return None
+
+        generation = cache.get(self._cache_generation_key(), "0")
+        query = hashlib.sha256(json.dumps([self.endpoint, path, body], sort_keys=True).encode()).hexdigest()
+        return f"hmis:resp:{self._cache_user}:{generation}:{query}"
+
+    def _invalidate_cached_responses(self) -> None:
+        if settings.HMIS_RESPONSE_CACHE_TTL and self._cache_user is not None:
+            cache.set(self._cache_generation_key(), uuid.uuid4().hex, settings.HMIS_RESPONSE_CACHE_TTL)
+
+    def _get_json(self, path: str, body: dict[str, Any], operation: str) -> Any:
+        """GET *path* and return the decoded body, served from the response cache when enabled."""
+        cache_key = self._response_cache_key(path, body)
+        if cache_key is not None and (cached := cache.get(cache_key)) is not None:
+            return cached
+
+        data = self._make_request(path=path, body=body, operation=operation).json()
+
+        if cache_key is not None:
+            cache.set(cache_key, data, settings.HMIS_RESPONSE_CACHE_TTL)
+        return data
+
+    def _login_form(self, login_url: str, headers: dict[str, str]) -> tuple[str, str]:
+        """Scrape the CSRF parameter and token from the login page into this bridge's session.
+
+        The token is bound to the pre-auth session cookies the page sets, so
+        both stay in this session's cookie jar and are never shared.
+        """
+        response = self.http.get(
+            login_url, headers=headers, allow_redirects=True, timeout=transport.operation_timeout("login")
+        )
+        response.raise_for_status()
+
+        html = response.text
+
+        param_match = re.search(r'meta name="csrf-param" content="([^"]+)"', html)
+        token_match = re.search(r'meta name="csrf-token" content="([^"]+)"', html)
+
+        if not param_match or not token_match:
+            raise ValidationError("Could not extract CSRF tokens from HMIS login page")
+
+        return param_match.group(1), token_match.group(1)
+
     def login(self, username: str, password: str) -> None:
         headers = self.headers.copy()
         headers.pop("Host", None)
@@ -349,19 +413,7 @@ class HmisApiBridge:
         login_url = f"{self.endpoint}/login"
 
         try:
-            response = self.http.get(login_url, headers=headers, allow_redirects=True)
-            response.raise_for_status()
-
-            html = response.text
-
-            param_match = re.search(r'meta name="csrf-param" content="([^"]+)"', html)
-            token_match = re.search(r'meta name="csrf-token" content="([^"]+)"', html)
-
-            if not param_match or not token_match:
-                raise ValidationError("Could not extract CSRF tokens from HMIS login page")
-
-            csrf_key = param_match.group(1)
-            csrf_val = token_match.group(1)
+            csrf_key, csrf_val = self._login_form(login_url, headers)
 
             payload = {
                 csrf_key: csrf_val,
@@ -376,6 +428,7 @@ class HmisApiBridge:
                 data=payload,
                 headers=headers,
                 allow_redirects=True,
+                timeout=transport.operation_timeout("login"),
             )
 
             if post_response.url != login_url and "login" not in post_response.url:
@@ -405,12 +458,13 @@ class HmisApiBridge:
 
         fields_str = self._get_field_str(fields)
 
-        resp = self._make_request(
+        client_data = self._get_json(
             path=f"/clients/{hmis_id}",
             body={"fields": fields_str},
+            operation="get_client",
         )
 
-        return self._format_client_data(resp.json())
+        return self._format_client_data(client_data)
 
     def create_client(self, data: CreateHmisClientProfileInput) -> dict[str, Any]:
         data_dict = strawberry.asdict(data)
@@ -442,6 +496,7 @@ class HmisApiBridge:
             method=HTTPMethod.POST,
             path="/clients",
             body=body,
+            operation="create_client",
         )
 
         return self._format_client_data(resp.json())
@@ -483,6 +538,7 @@ class HmisApiBridge:
             method=HTTPMethod.PUT,
             path=f"/clients/{hmis_id}",
             body=body,
+            operation="update_client",
         )
 
         return self._format_client_data(resp.json())
@@ -496,12 +552,13 @@ class HmisApiBridge:
 
         fields_str = ", ".join(fields | CLIENT_PROGRAM_FIELDS)
 
-        resp = self._make_request(
+        note_data = self._get_json(
             path=f"/clients/{client_hmis_id}/client-notes/{note_hmis_id}",
             body={"fields": fields_str},
+            operation="get_note",
         )
 
-        return self._format_note_data(resp.json())
+        return self._format_note_data(note_data)
 
     def create_note(self, client_hmis_id: str, data: CreateHmisNoteInput) -> dict[str, Any]:
         path = f"/clients/{client_hmis_id}/client-notes"
@@ -528,7 +585,7 @@ class HmisApiBridge:
             "fields": self._get_field_str(fields),
         }
 
-        resp = self._make_request(method=HTTPMethod.POST, path=path, body=body)
+        resp = self._make_request(method=HTTPMethod.POST, path=path, body=body, operation="create_note")
 
         return self._format_note_data(resp.json())
 
@@ -559,6 +616,7 @@ class HmisApiBridge:
             method=HTTPMethod.PUT,
             path=f"/clients/{client_hmis_id}/client-notes/{note_hmis_id}",
             body=body,
+            operation="update_note",
         )
 
         return self._format_note_data(resp.json())
@@ -568,6 +626,7 @@ class HmisApiBridge:
             method=HTTPMethod.DELETE,
             path=f"/clients/{client_hmis_id}/client-notes/{note_hmis_id}",
             body={},
+            operation="delete_note",
         )
         if resp.status_code != 204:
             raise ValidationError(f"Status Code: {resp.status_code}")
@@ -576,12 +635,13 @@ class HmisApiBridge:
         fields = self._get_field_dot_paths(info=self.info, ignored_fields=BA_NOTE_FIELDS)
 
         body = {"fields": self._get_field_str(fields)}
-        resp = self._make_request(
+        programs = self._get_json(
             path=f"/clients/{client_hmis_id}/client-programs",
             body=body,
+            operation="get_client_programs",
         )
 
-        return dict_keys_to_snake(resp.json())
+        return dict_keys_to_snake(programs)
 
     def create_client_program(
         self,
@@ -609,6 +669,7 @@ class HmisApiBridge:
             method=HTTPMethod.POST,
             path=f"/clients/{client_hmis_id}/client-programs/enroll",
             body={**DEFAULT_ENROLLMENT_DATA, "fields": self._get_field_str(fields)},
+            operation="create_client_program",
         )
 
         return dict_keys_to_snake(resp.json())
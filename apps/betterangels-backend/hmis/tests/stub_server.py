@@ -0,0 +1,123 @@
+"""A local stand-in for the HMIS REST API, for exercising the real HTTP transport in tests."""
+
+import json
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+
+@dataclass
+class StubResponse:
+    status: int = 200
+    json: Any = None
+    text: str = ""
+    headers: dict[str, str] = field(default_factory=dict)
+    delay: float = 0.0
+
+
+@dataclass
+class RecordedRequest:
+    method: str
+    path: str
+    body: bytes
+    headers: dict[str, str]
+    client_port: int
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is observable
+    server: "_Server"
+
+    def _handle(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        stub = self.server.stub
+        response = stub._record_and_pick(
+            RecordedRequest(
+                method=self.command,
+                path=self.path,
+                body=body,
+                headers=dict(self.headers.items()),
+                client_port=self.client_address[1],
+            )
+        )
+        if response.delay:
+            time.sleep(response.delay)
+
+        payload = json.dumps(response.json).encode() if response.json is not None else response.text.encode()
+        self.send_response(response.status)
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        if response.json is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: "StubHmisServer"
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients that time out hang up before the (delayed) response is written.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class StubHmisServer:
+    """Threaded HTTP/1.1 server on 127.0.0.1 that replays canned responses per ``(method, path)``.
+
+    Responses queued for a route are served in order; the last one repeats.
+    Every request is recorded, including the client port, so tests can tell
+    whether connections were reused.
+    """
+
+    def __init__(self) -> None:
+        self.requests: list[RecordedRequest] = []
+        self._routes: dict[tuple[str, str], list[StubResponse]] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add(self, method: str, path: str, *responses: StubResponse) -> None:
+        with self._lock:
+            self._routes[(method, path)] = list(responses)
+
+    def hits(self, method: str, path: str) -> int:
+        return sum(1 for r in self.requests if r.method == method and r.path.split("?")[0] == path)
+
+    def _record_and_pick(self, request: RecordedRequest) -> StubResponse:
+        with self._lock:
+            self.requests.append(request)
+            queued = self._routes.get((request.method, request.path.split("?")[0]))
+            if not queued:
+                return StubResponse(status=404, json={"message": "not stubbed"})
+            return queued.pop(0) if len(queued) > 1 else queued[0]
+
+    def start(self) -> "StubHmisServer":
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,149 @@
+from types import SimpleNamespace
+from typing import Any, cast
+
+import requests
+import strawberry
+from django.core.exceptions import ValidationError
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from hmis import transport
+from hmis.api_bridge import HmisApiBridge
+from hmis.tests.stub_server import StubHmisServer, StubResponse
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "hmis-transport"}}
+LOGIN_PAGE = '<meta name="csrf-param" content="_csrf"><meta name="csrf-token" content="tok-1">'
+
+
+class HmisTransportTestCase(SimpleTestCase):
+    """Drives the real requests/urllib3 stack against a local stub HMIS server."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.stub = StubHmisServer().start()
+        self.addCleanup(self.stub.stop)
+
+        settings_override = override_settings(
+            HMIS_HOST="hmis.test",
+            HMIS_REST_URL=self.stub.url,
+            HMIS_CONNECT_TIMEOUT=1.0,
+            HMIS_READ_TIMEOUT=5.0,
+            HMIS_OPERATION_TIMEOUTS={},
+            HMIS_MAX_RETRIES=2,
+            HMIS_RESPONSE_CACHE_TTL=0,
+            CACHES=LOCMEM_CACHES,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        transport.reset_transport()
+        self.addCleanup(transport.reset_transport)
+
+    def _bridge(self, token: str = "token-a") -> HmisApiBridge:
+        request = RequestFactory().get("/graphql", HTTP_X_HMIS_TOKEN=token)
+        info = SimpleNamespace(context={"request": request, "response": HttpResponse()})
+        return HmisApiBridge(info=cast(strawberry.Info, info))
+
+    def _get(self, bridge: HmisApiBridge, path: str = "/clients/1") -> Any:
+        return bridge._get_json(path=path, body={"fields": "id"}, operation="get_client")
+
+    def test_connection_reused_across_bridges(self) -> None:
+        self.stub.add("GET", "/clients/1", StubResponse(json={"id": 1}))
+
+        for _ in range(3):
+            self._get(self._bridge())
+
+        self.assertEqual(self.stub.hits("GET", "/clients/1"), 3)
+        self.assertEqual(len({r.client_port for r in self.stub.requests}), 1)
+
+    def test_cookies_not_shared_between_bridges(self) -> None:
+        self.stub.add("GET", "/clients/1", StubResponse(json={"id": 1}, headers={"Set-Cookie": "sid=abc; Path=/"}))
+
+        first = self._bridge()
+        self._get(first)
+        second = self._bridge()
+        self._get(second)
+
+        self.assertEqual(first.http.cookies.get("sid"), "abc")
+        self.assertNotIn("Cookie", self.stub.requests[1].headers)
+
+    def test_get_retried_on_server_error(self) -> None:
+        self.stub.add("GET", "/clients/1", StubResponse(status=503, json={}), StubResponse(json={"id": 1}))
+
+        self.assertEqual(self._get(self._bridge()), {"id": 1})
+        self.assertEqual(self.stub.hits("GET", "/clients/1"), 2)
+
+    def test_post_not_retried_on_server_error(self) -> None:
+        self.stub.add("POST", "/clients", StubResponse(status=503, json={}), StubResponse(json={"id": 1}))
+
+        resp = self._bridge()._make_request(path="/clients", body={}, operation="create_client", method="POST")  # type: ignore[arg-type]
+
+        self.assertEqual(resp.status_code, 503)
+        self.assertEqual(self.stub.hits("POST", "/clients"), 1)
+
+    @override_settings(HMIS_OPERATION_TIMEOUTS={"get_client": 0.2})
+    def test_operation_read_timeout(self) -> None:
+        self.stub.add("GET", "/clients/1", StubResponse(json={"id": 1}, delay=1.0))
+
+        with self.assertRaises(requests.ReadTimeout):
+            self._get(self._bridge())
+
+        # Read timeouts are not retried: HMIS may still be working on the request.
+        self.assertEqual(self.stub.hits("GET", "/clients/1"), 1)
+
+    @override_settings(HMIS_RESPONSE_CACHE_TTL=60)
+    def test_response_cache_scoped_to_user(self) -> None:
+        self.stub.add("GET", "/clients/1", StubResponse(json={"id": 1}))
+
+        self.assertEqual(self._get(self._bridge("token-a")), {"id": 1})
+        self.assertEqual(self._get(self._bridge("token-a")), {"id": 1})
+        self.assertEqual(self.stub.hits("GET", "/clients/1"), 1)
+
+        self._get(self._bridge("token-b"))
+        self.assertEqual(self.stub.hits("GET", "/clients/1"), 2)
+
+    @override_settings(HMIS_RESPONSE_CACHE_TTL=60)
+    def test_response_cache_invalidated_by_write(self) -> None:
+        self.stub.add("GET", "/clients/1", StubResponse(json={"id": 1}))
+        self.stub.add("DELETE", "/clients/1/client-notes/2", StubResponse(status=204))
+
+        self._get(self._bridge())
+        self._bridge().delete_note(client_hmis_id="1", note_hmis_id="2")
+        self._get(self._bridge())
+
+        self.assertEqual(self.stub.hits("GET", "/clients/1"), 2)
+
+    def test_response_cache_disabled_by_default(self) -> None:
+        self.stub.add("GET", "/clients/1", StubResponse(json={"id": 1}))
+
+        self._get(self._bridge())
+        self._get(self._bridge())
+
+        self.assertEqual(self.stub.hits("GET", "/clients/1"), 2)
+
+    def _stub_login(self, *post_responses: StubResponse) -> None:
+        self.stub.add("GET", "/login", StubResponse(text=LOGIN_PAGE, headers={"Set-Cookie": "PHPSESSID=s1; Path=/"}))
+        self.stub.add("POST", "/login", *(post_responses or (StubResponse(status=302, headers={"Location": "/home"}),)))
+        self.stub.add("GET", "/home", StubResponse(text="ok", headers={"Set-Cookie": "auth_token=jwt; Path=/"}))
+
+    def test_login_scrapes_csrf_form_per_bridge(self) -> None:
+        self._stub_login()
+
+        first = self._bridge()
+        first.login("user", "pass")
+        second = self._bridge()
+        second.login("user", "pass")
+
+        # Neither the CSRF token nor the pre-auth cookies are carried over between users.
+        self.assertEqual(self.stub.hits("GET", "/login"), 2)
+        self.assertEqual(self.stub.hits("POST", "/login"), 2)
+        second_scrape = [r for r in self.stub.requests if r.method == "GET" and r.path == "/login"][1]
+        self.assertNotIn("Cookie", second_scrape.headers)
+        second_post = [r for r in self.stub.requests if r.method == "POST"][1]
+        self.assertIn(b"_csrf=tok-1", second_post.body)
+        self.assertIn("PHPSESSID=s1", second_post.headers["Cookie"])
+
+    def test_login_invalid_credentials(self) -> None:
+        self._stub_login(StubResponse(text="Incorrect username or password."))
+
+        with self.assertRaisesMessage(ValidationError, "Invalid credentials"):
+            self._bridge().login("user", "wrong")
@@ -0,0 +1,81 @@
+"""Process-wide HTTP transport for the HMIS REST API.
+
+Every ``HmisApiBridge`` gets its own ``requests.Session`` (so cookies never
+leak between users) mounted on one shared ``HTTPAdapter``.  The adapter owns
+the keep-alive connection pool and the retry policy, so connections to HMIS
+are reused across GraphQL requests instead of being re-established (TCP + TLS)
+for every bridge.
+
+Retries cover connect errors for every method (nothing reached the server)
+and 5xx responses for idempotent methods only; a POST that reached HMIS is
+never replayed.
+"""
+
+import threading
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+IDEMPOTENT_METHODS = frozenset({"DELETE", "GET", "HEAD", "OPTIONS", "PUT"})
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+RETRY_BACKOFF_FACTOR = 0.2
+RETRY_BACKOFF_MAX = 2.0
+
+_adapter: HTTPAdapter | None = None
+_adapter_lock = threading.Lock()
+
+
+def _build_adapter() -> HTTPAdapter:
+    retry = Retry(
+        total=settings.HMIS_MAX_RETRIES,
+        connect=settings.HMIS_MAX_RETRIES,
+        read=False,  # re-raise read timeouts as-is; HMIS may still be processing the request
+        status=settings.HMIS_MAX_RETRIES,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=IDEMPOTENT_METHODS,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        backoff_max=RETRY_BACKOFF_MAX,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=settings.HMIS_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+
+def get_adapter() -> HTTPAdapter:
+    """Return the process-wide adapter, creating it on first use."""
+    global _adapter
+    if _adapter is None:
+        with _adapter_lock:
+            if _adapter is None:
+                _adapter = _build_adapter()
+    return _adapter
+
+
+def new_session() -> requests.Session:
+    """A fresh session (own cookie jar) that sends through the shared pooled adapter."""
+    session = requests.Session()
+    adapter = get_adapter()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def reset_transport() -> None:
+    """Close pooled connections (settings changes, tests)."""
+    global _adapter
+    with _adapter_lock:
+        if _adapter is not None:
+            _adapter.close()
+        _adapter = None
+
+
+def operation_timeout(operation: str) -> tuple[float, float]:
+    """``(connect, read)`` timeout for *operation*; ``HMIS_OPERATION_TIMEOUTS`` overrides the read part."""
+    read_timeout = settings.HMIS_OPERATION_TIMEOUTS.get(operation, settings.HMIS_READ_TIMEOUT)
+    return (settings.HMIS_CONNECT_TIMEOUT, float(read_timeout))
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.6 on 2026-10-18 22:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0003_remove_note_note_add_insert_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['interacted_at', 'id'], name='note_interacted_at_id_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 6.0.6 on 2026-10-18 22:06
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently, CreateExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # Builds the indexes without blocking writes.
+    atomic = False
+
+    dependencies = [
+        ('notes', '0004_keyset_indexes'),
+    ]
+
+    operations = [
+        CreateExtension("pg_trgm"),
+        AddIndexConcurrently(
+            model_name='note',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('public_details'), name='gin_trgm_ops'), name='note_public_details_trgm'),
+        ),
+    ]
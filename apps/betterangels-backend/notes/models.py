@@ -8,9 +8,11 @@ from betterangels_backend import settings
 from common.models import Attachment, BaseModel, Location
 from common.permissions.utils import permission_enums_to_django_meta_permissions
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import Q
+from django.db.models.functions import Upper
 from django.utils import timezone
 from django_choices_field import TextChoicesField
 from guardian.models import GroupObjectPermissionBase, UserObjectPermissionBase
@@ -190,6 +192,11 @@ class Note(BaseModel):
     class Meta:
         permissions = permission_enums_to_django_meta_permissions([PrivateDetailsPermissions])
         ordering = ["-interacted_at"]
+        indexes = [
+            models.Index(fields=["interacted_at", "id"], name="note_interacted_at_id_idx"),
+            # Matches ``public_details__icontains``, which compiles to ``UPPER(public_details::text) LIKE ...``.
+            GinIndex(OpClass(Upper("public_details"), name="gin_trgm_ops"), name="note_public_details_trgm"),
+        ]
 
 
 @pghistory.track(
@@ -1,4 +1,4 @@
-from typing import Optional, cast
+from typing import List, Optional, cast
 
 import strawberry
 import strawberry_django
@@ -7,12 +7,13 @@ from accounts.selectors import resolve_permission_group
 from accounts.types import OrganizationFilter, OrganizationOrder, OrganizationType
 from clients.models import ClientProfileImportRecord
 from common.graphql.extensions import PermissionedQuerySet
+from common.graphql.pagination import KeysetPaginated, keyset_paginated
 from common.graphql.types import (
     AuthorizedPresignedS3UploadsType,
     DeleteDjangoObjectInput,
     DeletedObjectType,
 )
-from common.graphql.utils import get_object_or_permission_error, maybe_int_value
+from common.graphql.utils import get_object_or_permission_error, maybe_int_value, without_unset
 from common.models import Attachment
 from common.permissions.utils import IsAuthenticated
 from common.services.types import UploadRequest, UploadConfirmation
@@ -26,6 +27,8 @@ from notes.permissions import (
     ServiceRequestPermissions,
 )
 from notes.services import (
+    NoteImportRow,
+    bulk_import_notes,
     create_note_attachment_presigned_uploads,
     note_create,
     note_service_request_create,
@@ -44,6 +47,7 @@ from strawberry_django.pagination import OffsetPaginated
 from strawberry_django.permissions import HasPerm, HasRetvalPerm
 
 from .types import (
+    BulkImportNotesInput,
     CreateNoteDataImportInput,
     CreateNoteInput,
     CreateNoteServiceRequestInput,
@@ -54,6 +58,7 @@ from .types import (
     NoteAttachmentUploadsType,
     NoteDataImportType,
     NoteFilter,
+    NoteImportRecordsType,
     NoteImportRecordType,
     NoteType,
     OrganizationServiceCategoryType,
@@ -76,6 +81,11 @@ class Query:
         permission_classes=[IsAuthenticated],
         extensions=[HasRetvalPerm(NotePermissions.VIEW)],
     )
+    notes_keyset: KeysetPaginated[NoteType] = keyset_paginated(
+        key=("-interacted_at", "-id"),
+        permission_classes=[IsAuthenticated],
+        extensions=[HasRetvalPerm(NotePermissions.VIEW)],
+    )
 
     services: OffsetPaginated[OrganizationServiceType] = strawberry_django.offset_paginated(
         permission_classes=[IsAuthenticated],
@@ -370,6 +380,30 @@ class Mutation:
             )
         return cast(NoteImportRecordType, record)
 
+    @strawberry_django.mutation(
+        permission_classes=[IsAuthenticated], extensions=[HasPerm(NoteImportRecordPermissions.ADD)]
+    )
+    def bulk_import_notes(self, info: Info, data: BulkImportNotesInput) -> NoteImportRecordsType:
+        """Import many rows into one import job; like ``import_note``, failures are recorded per row."""
+        import_job = NoteDataImport.objects.get(id=data.import_job_id)
+        user = cast(User, get_current_user(info))
+        permission_group = resolve_permission_group(user, template=CASEWORKER)
+
+        rows = [
+            NoteImportRow(
+                source_id=record.source_id,
+                source_name=record.source_name,
+                raw_data=record.raw_data,
+                note={**without_unset(strawberry.asdict(record.note)), "team_id": maybe_int_value(record.note.team_id)},
+            )
+            for record in data.records
+        ]
+        records = bulk_import_notes(import_job=import_job, user=user, permission_group=permission_group, rows=rows)
+
+        # Failed rows are written after the batch's successes, so pk order isn't input order.
+        by_pk = NoteImportRecord.objects.select_related("note").in_bulk([r.pk for r in records])
+        return NoteImportRecordsType(records=cast(List[NoteImportRecordType], [by_pk[r.pk] for r in records]))
+
     # ── Note Attachment Presigned S3 Uploads ────────────────────────────
 
     @strawberry_django.mutation(
@@ -1,5 +1,7 @@
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Type, cast
 
 import pghistory
 from accounts.models import PermissionGroup, User
@@ -7,8 +9,9 @@ from accounts.selectors import resolve_permission_group
 from clients.models import ClientProfile
 from common.constants import DEFAULT_DOCUMENT_CONTENT_TYPES, DEFAULT_IMAGE_CONTENT_TYPES
 from common.models import Attachment, Location
-from common.permissions.utils import assign_object_permissions
+from common.permissions.utils import assign_object_permissions, bulk_assign_object_permissions
 from common.services import file_upload
+from common.services.bulk_import import bulk_insert_with_row_retry
 from common.services.file_upload import (
     AttachmentUploadConfig,
     UploadRequest,
@@ -16,17 +19,21 @@ from common.services.file_upload import (
 )
 from common.services.types import AuthorizedPresignedUploadBatch
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import Model, QuerySet
 from django.utils import timezone
 from notes.enums import ServiceRequestStatusEnum, ServiceRequestTypeEnum
 from notes.groups import CASEWORKER
-from notes.models import Note, OrganizationService, ServiceRequest
+from notes.models import Note, NoteDataImport, NoteImportRecord, OrganizationService, ServiceRequest
 from notes.permissions import (
     NotePermissions,
     PrivateDetailsPermissions,
     ServiceRequestPermissions,
 )
+from reports.cache import report_summary_invalidate
 from tasks.services import task_create
+from teams.models import Team
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -172,18 +179,18 @@ def service_request_create(
             client_profile=client_profile,
             created_by=user,
         )
-
-        assign_object_permissions(
-            permission_group.group,
-            sr,
-            [
-                ServiceRequestPermissions.VIEW,
-                ServiceRequestPermissions.CHANGE,
-                ServiceRequestPermissions.DELETE,
-            ],
-        )
         created.append(sr)
 
+    bulk_assign_object_permissions(
+        permission_group.group,
+        created,
+        [
+            ServiceRequestPermissions.VIEW,
+            ServiceRequestPermissions.CHANGE,
+            ServiceRequestPermissions.DELETE,
+        ],
+    )
+
     return created
 
 
@@ -359,14 +366,340 @@ def resolve_note_file_uploads(
             config=NOTE_ATTACHMENT_CONFIG,
         )
 
-        for att in attached:
-            assign_object_permissions(
-                permission_group.group,
-                att,
-                [
-                    Attachment.perms.DELETE,
-                    Attachment.perms.CHANGE,
-                ],
-            )
+        bulk_assign_object_permissions(
+            permission_group.group,
+            attached,
+            [
+                Attachment.perms.DELETE,
+                Attachment.perms.CHANGE,
+            ],
+        )
 
     return attached
+
+
+# ---------------------------------------------------------------------------
+# Bulk import
+# ---------------------------------------------------------------------------
+
+NOTE_IMPORT_BATCH_SIZE = 500
+
+# Checked against each batch's prefetched ids instead: ``full_clean`` would query every one per row.
+_NOTE_IMPORT_RELATIONS = ["client_profile", "created_by", "location", "organization", "team"]
+
+
+@dataclass
+class NoteImportRow:
+    """One source row: the ``ImportNoteDataInput`` fields (snake_case) and where it came from.
+
+    ``note`` may also carry ``provided_services`` and ``requested_services``,
+    lists of ``{"service_id": ...}`` or ``{"service_other": ...}`` as in
+    ``note_create``.
+    """
+
+    source_id: str
+    source_name: str
+    raw_data: Any
+    note: Dict[str, Any]
+
+
+@dataclass
+class _PreparedNote:
+    index: int
+    row: NoteImportRow
+    note: Note
+    # (service request, through model, service_other label to create): the through model
+    # links it to the note; the label names a service the organization doesn't have yet.
+    service_requests: List[Tuple[ServiceRequest, Type[Model], Optional[str]]] = field(default_factory=list)
+
+    def unsaved_instances(self) -> Iterable[Model]:
+        return [self.note, *(sr for sr, _, _ in self.service_requests)]
+
+
+def _existing_ids(queryset: QuerySet[Any], ids: Iterable[Any]) -> Set[str]:
+    """The ones of *ids* that name a row of *queryset*, as strings (one query)."""
+    wanted = {str(pk) for pk in ids if pk is not None and str(pk).isdigit()}
+    if not wanted:
+        return set()
+    return {str(pk) for pk in queryset.filter(pk__in=wanted).values_list("pk", flat=True)}
+
+
+def _note_import_services(
+    rows: Sequence[NoteImportRow], organization: Any
+) -> Dict[Tuple[str, str], OrganizationService]:
+    """The existing services the rows reference, keyed by ``("id", pk)`` or ``("label", label)``.
+
+    ``service_other`` labels the organization doesn't have yet are missing;
+    ``_insert_notes`` creates them with the batch.
+    """
+    items = [
+        item for row in rows for key in ("provided_services", "requested_services") for item in row.note.get(key) or []
+    ]
+    ids = {service_id for item in items if (service_id := str(item.get("service_id") or "")).isdigit()}
+    labels = {item["service_other"] for item in items if not item.get("service_id") and item.get("service_other")}
+
+    services: Dict[Tuple[str, str], OrganizationService] = {}
+    if ids:
+        services.update((("id", str(svc.pk)), svc) for svc in OrganizationService.objects.filter(pk__in=ids))
+    if labels:
+        services.update(
+            (("label", svc.label), svc)
+            for svc in OrganizationService.objects.filter(organization=organization, label__in=labels)
+        )
+
+    return services
+
+
+def _note_import_services_create(organization: Any, labels: Set[str]) -> Dict[str, OrganizationService]:
+    """Create the organization's ``service_other`` *labels*, as ``_resolve_service`` does one item at a time."""
+    # Conflicts are labels created since (e.g. by a concurrent import); the select below picks them up.
+    OrganizationService.objects.bulk_create(
+        [OrganizationService(label=label, organization=organization) for label in sorted(labels)],
+        ignore_conflicts=True,
+    )
+    return {svc.label: svc for svc in OrganizationService.objects.filter(organization=organization, label__in=labels)}
+
+
+def _service_key(item: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    if service_id := item.get("service_id"):
+        return ("id", str(service_id))
+    if service_other := item.get("service_other"):
+        return ("label", service_other)
+    return None
+
+
+def _prepare_note(
+    index: int,
+    row: NoteImportRow,
+    *,
+    user: User,
+    organization: Any,
+    client_profile_ids: Set[str],
+    team_ids: Set[str],
+    services: Dict[Tuple[str, str], OrganizationService],
+) -> _PreparedNote:
+    """An unsaved, validated note and its service requests for *row*; raises ``ValidationError``."""
+    data = row.note
+    client_profile_id = data.get("client_profile")
+    team_id = data.get("team_id")
+
+    note = Note(
+        purpose=data.get("purpose"),
+        team_id=team_id,
+        public_details=data.get("public_details") or "",
+        private_details=data.get("private_details") or "",
+        client_profile_id=client_profile_id,
+        is_submitted=bool(data.get("is_submitted")),
+        interacted_at=data.get("interacted_at") or timezone.now(),
+        created_by=user,
+        organization=organization,
+    )
+    note.clean_fields(exclude=_NOTE_IMPORT_RELATIONS)
+
+    # The checks ``full_clean`` would make per row, against the batch's prefetched ids.
+    if client_profile_id and str(client_profile_id) not in client_profile_ids:
+        raise ValidationError({"client_profile": f"Client profile {client_profile_id} does not exist."})
+    if team_id is not None and str(team_id) not in team_ids:
+        raise ValidationError({"team": "The selected team does not belong to this organization."})
+
+    prepared = _PreparedNote(index=index, row=row, note=note)
+    for key, sr_type, through in (
+        ("provided_services", ServiceRequestTypeEnum.PROVIDED, Note.provided_services.through),
+        ("requested_services", ServiceRequestTypeEnum.REQUESTED, Note.requested_services.through),
+    ):
+        status = _status_for_sr_type(sr_type)
+        for item in data.get(key) or []:
+            service_key = _service_key(item)
+            service = services.get(service_key) if service_key else None
+            new_label = None
+            if service_key and service is None:
+                if service_key[0] != "label":
+                    raise ValidationError({key: f"Service {service_key[1]} does not exist."})
+                new_label = service_key[1]
+
+            sr = ServiceRequest(
+                service=service,
+                status=status,
+                client_profile_id=client_profile_id,
+                created_by=user,
+                # ``ServiceRequest.save`` stamps this; ``bulk_create`` skips it.
+                completed_on=timezone.now() if status == ServiceRequestStatusEnum.COMPLETED else None,
+            )
+            prepared.service_requests.append((sr, through, new_label))
+
+    return prepared
+
+
+def _insert_notes(
+    import_job: NoteDataImport,
+    permission_group: PermissionGroup,
+    prepared: Sequence[_PreparedNote],
+) -> List[NoteImportRecord]:
+    """Write *prepared* rows with one ``bulk_create`` per table and per permission group."""
+    if labels := {label for p in prepared for _, _, label in p.service_requests if label}:
+        created = _note_import_services_create(permission_group.organization, labels)
+        for p in prepared:
+            for sr, _, label in p.service_requests:
+                if label:
+                    sr.service = created[label]
+
+    notes = Note.objects.bulk_create([p.note for p in prepared])
+    service_requests = ServiceRequest.objects.bulk_create([sr for p in prepared for sr, _, _ in p.service_requests])
+
+    links: Dict[Type[Model], List[Model]] = {}
+    for p, note in zip(prepared, notes):
+        for sr, through, _ in p.service_requests:
+            links.setdefault(through, []).append(through(note_id=note.pk, servicerequest_id=sr.pk))
+    for through, objs in links.items():
+        through.objects.bulk_create(objs)
+
+    group = permission_group.group
+    bulk_assign_object_permissions(
+        group, notes, [NotePermissions.CHANGE, NotePermissions.DELETE, PrivateDetailsPermissions.VIEW]
+    )
+    bulk_assign_object_permissions(
+        group,
+        service_requests,
+        [ServiceRequestPermissions.VIEW, ServiceRequestPermissions.CHANGE, ServiceRequestPermissions.DELETE],
+    )
+
+    return NoteImportRecord.objects.bulk_create(
+        NoteImportRecord(
+            import_job=import_job,
+            source_id=p.row.source_id,
+            source_name=p.row.source_name,
+            note=note,
+            raw_data=p.row.raw_data,
+            success=True,
+        )
+        for p, note in zip(prepared, notes)
+    )
+
+
+def _import_note_rows(
+    import_job: NoteDataImport,
+    user: User,
+    permission_group: PermissionGroup,
+    pending: Sequence[Tuple[int, NoteImportRow]],
+) -> Dict[int, NoteImportRecord | str]:
+    """Validate and insert *pending* ``(index, row)`` pairs; returns each row's import record or error by index."""
+    organization = permission_group.organization
+    client_profile_ids = _existing_ids(
+        # Like ``ForeignKey.validate``, which uses the base manager.
+        ClientProfile.objects.including_merged(),
+        {row.note.get("client_profile") for _, row in pending},
+    )
+    team_ids = _existing_ids(
+        Team.objects.filter(organization=organization), {row.note.get("team_id") for _, row in pending}
+    )
+    services = _note_import_services([row for _, row in pending], organization)
+
+    results: Dict[int, NoteImportRecord | str] = {}
+    prepared: List[_PreparedNote] = []
+    for index, row in pending:
+        try:
+            prepared.append(
+                _prepare_note(
+                    index,
+                    row,
+                    user=user,
+                    organization=organization,
+                    client_profile_ids=client_profile_ids,
+                    team_ids=team_ids,
+                    services=services,
+                )
+            )
+        except ValidationError as e:
+            results[index] = "; ".join(
+                f"{name}: {message}" for name, messages in e.message_dict.items() for message in messages
+            )
+
+    if not prepared:
+        return results
+
+    return results | bulk_insert_with_row_retry(
+        prepared, partial(_insert_notes, import_job, permission_group), label="Note import"
+    )
+
+
+def bulk_import_notes(
+    *,
+    import_job: NoteDataImport,
+    user: User,
+    permission_group: PermissionGroup,
+    rows: Sequence[NoteImportRow],
+    batch_size: int = NOTE_IMPORT_BATCH_SIZE,
+) -> List[NoteImportRecord]:
+    """Import *rows* into *import_job*; returns one import record per row, in order.
+
+    Each batch is validated with one query per kind of reference (imported
+    source ids, client profiles, teams, services) and written with one
+    ``bulk_create`` per table, object permissions included.  Rows already
+    imported successfully, or that fail validation, get a failed record.
+    ``bulk_create`` sends no signals, so the organization's cached report
+    summaries are invalidated here once anything was imported.
+    """
+    records: List[NoteImportRecord] = []
+
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start : start + batch_size]
+        imported = set(
+            NoteImportRecord.objects.filter(
+                success=True,
+                source_id__in={row.source_id for row in batch},
+                source_name__in={row.source_name for row in batch},
+            ).values_list("source_name", "source_id")
+        )
+        failures: Dict[int, str] = {}
+        results: Dict[int, NoteImportRecord | str] = {}
+
+        # A source repeated within the batch waits for the earlier row's outcome: it is
+        # only "already imported" once that row's note has been inserted.
+        pending = list(range(len(batch)))
+        while pending:
+            current: List[int] = []
+            later: List[int] = []
+            sources: Set[Tuple[str, str]] = set()
+            for index in pending:
+                source = (batch[index].source_name, batch[index].source_id)
+                if source in imported:
+                    failures[index] = (
+                        f"Source ID {source[1]} with source name '{source[0]}' has already been imported successfully."
+                    )
+                elif source in sources:
+                    later.append(index)
+                else:
+                    sources.add(source)
+                    current.append(index)
+
+            for index, result in _import_note_rows(
+                import_job, user, permission_group, [(index, batch[index]) for index in current]
+            ).items():
+                if isinstance(result, str):
+                    failures[index] = result
+                else:
+                    results[index] = result
+                    imported.add((batch[index].source_name, batch[index].source_id))
+
+            pending = later
+
+        failed = sorted(failures)
+        failed_records = NoteImportRecord.objects.bulk_create(
+            NoteImportRecord(
+                import_job=import_job,
+                source_id=batch[index].source_id,
+                source_name=batch[index].source_name,
+                raw_data=batch[index].raw_data,
+                success=False,
+                error_message=failures[index],
+            )
+            for index in failed
+        )
+        results.update(zip(failed, failed_records))
+
+        records.extend(cast(NoteImportRecord, results[index]) for index in range(len(batch)))
+
+    if any(record.success for record in records):
+        report_summary_invalidate(organization_id=permission_group.organization_id)
+
+    return records
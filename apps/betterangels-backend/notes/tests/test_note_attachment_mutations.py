@@ -224,7 +224,7 @@ class ResolveNoteFileUploadsMutationTest(NoteGraphQLBaseTestCase):
         self.graphql_client.force_login(self.org_1_case_manager_1)
 
     @patch("common.services.file_upload.create_attachment_records")
-    @patch("notes.services.assign_object_permissions")
+    @patch("notes.services.bulk_assign_object_permissions")
     @patch("notes.services.resolve_permission_group")
     def test_creates_attachment_and_returns_it(
         self,
@@ -235,7 +235,7 @@ class ResolveNoteFileUploadsMutationTest(NoteGraphQLBaseTestCase):
         from accounts.models import PermissionGroup
         from django.contrib.contenttypes.models import ContentType
 
-        # Create a real permission group so assign_object_permissions works.
+        # Create a real permission group so bulk_assign_object_permissions works.
         pg = baker.make(PermissionGroup, organization=self.org_1)
         mock_perm_group.return_value = pg
 
@@ -275,7 +275,7 @@ class ResolveNoteFileUploadsMutationTest(NoteGraphQLBaseTestCase):
         self.assertEqual(attachments[0]["originalFilename"], "doc.pdf")
 
     @patch("common.services.file_upload.create_attachment_records")
-    @patch("notes.services.assign_object_permissions")
+    @patch("notes.services.bulk_assign_object_permissions")
     @patch("notes.services.resolve_permission_group")
     def test_creates_multiple_attachments(
         self,
@@ -476,7 +476,7 @@ class ResolveNoteFileUploadsMutationTest(NoteGraphQLBaseTestCase):
         ],
     )
     @patch("common.services.file_upload.create_attachment_records")
-    @patch("notes.services.assign_object_permissions")
+    @patch("notes.services.bulk_assign_object_permissions")
     @patch("notes.services.resolve_permission_group")
     def test_permission_checks(
         self,
@@ -74,7 +74,7 @@ class ResolveNoteAttachmentUploadsTest(TestCase):
         self.permission_group = MagicMock()
         self.permission_group.group = MagicMock()
 
-    @patch("notes.services.assign_object_permissions")
+    @patch("notes.services.bulk_assign_object_permissions")
     @patch("notes.services.resolve_permission_group")
     @patch("common.services.file_upload.create_attachment_records")
     def test_delegates_to_generic_with_correct_params(
@@ -106,7 +106,7 @@ class ResolveNoteAttachmentUploadsTest(TestCase):
             config=NOTE_ATTACHMENT_CONFIG,
         )
 
-    @patch("notes.services.assign_object_permissions")
+    @patch("notes.services.bulk_assign_object_permissions")
     @patch("notes.services.resolve_permission_group")
     @patch("common.services.file_upload.create_attachment_records")
     def test_scopes_permission_group_to_note_organization(
@@ -140,10 +140,10 @@ class ResolveNoteAttachmentUploadsTest(TestCase):
             organization_id=str(self.note.organization_id),
         )
 
-    @patch("notes.services.assign_object_permissions")
+    @patch("notes.services.bulk_assign_object_permissions")
     @patch("notes.services.resolve_permission_group")
     @patch("common.services.file_upload.create_attachment_records")
-    def test_assigns_change_and_delete_permissions_per_attachment(
+    def test_assigns_change_and_delete_permissions_to_all_attachments(
         self,
         mock_generic: MagicMock,
         mock_perm_group: MagicMock,
@@ -174,19 +174,13 @@ class ResolveNoteAttachmentUploadsTest(TestCase):
             ],
         )
 
-        self.assertEqual(mock_assign.call_count, 2)
-        mock_assign.assert_any_call(
+        mock_assign.assert_called_once_with(
             self.permission_group.group,
-            att1,
-            [Attachment.perms.DELETE, Attachment.perms.CHANGE],
-        )
-        mock_assign.assert_any_call(
-            self.permission_group.group,
-            att2,
+            [att1, att2],
             [Attachment.perms.DELETE, Attachment.perms.CHANGE],
         )
 
-    @patch("notes.services.assign_object_permissions")
+    @patch("notes.services.bulk_assign_object_permissions")
     @patch("notes.services.resolve_permission_group")
     @patch("common.services.file_upload.create_attachment_records")
     def test_returns_attachments_from_generic(
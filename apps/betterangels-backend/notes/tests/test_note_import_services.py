@@ -0,0 +1,203 @@
+from datetime import date, datetime, timezone
+from typing import Any
+from unittest.mock import patch
+
+from accounts.selectors import resolve_permission_group
+from clients.models import ClientProfile
+from common.services.bulk_import import DATABASE_ERROR_MESSAGE
+from common.tests.utils import GraphQLBaseTestCase
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from notes.enums import ServiceRequestStatusEnum
+from notes.groups import CASEWORKER
+from notes.models import Note, NoteDataImport, NoteImportRecord, OrganizationService, ServiceRequest
+from notes.services import NoteImportRow, bulk_import_notes
+from reports.selectors import report_summary
+
+
+def _row(source_id: str, **note: Any) -> NoteImportRow:
+    return NoteImportRow(
+        source_id=source_id,
+        source_name="SELAH",
+        raw_data={"id": source_id},
+        note={"purpose": f"Note {source_id}", **note},
+    )
+
+
+class BulkImportNotesTest(GraphQLBaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.user = self.org_1_case_manager_1
+        self.permission_group = resolve_permission_group(self.user, template=CASEWORKER)
+        self.import_job = NoteDataImport.objects.create(source_file="notes.csv", imported_by=self.user)
+        self.client_profile = baker.make(ClientProfile)
+        self.service = baker.make(OrganizationService, label="Water", organization=self.org_1)
+
+    def _import(self, rows: list[NoteImportRow], **kwargs: Any) -> list[NoteImportRecord]:
+        return bulk_import_notes(
+            import_job=self.import_job, user=self.user, permission_group=self.permission_group, rows=rows, **kwargs
+        )
+
+    def test_imports_notes_services_and_permissions(self) -> None:
+        records = self._import(
+            [
+                _row(
+                    "1",
+                    client_profile=str(self.client_profile.pk),
+                    team_id=self.org_1_team_1.pk,
+                    private_details="private",
+                    provided_services=[{"service_id": str(self.service.pk)}],
+                    requested_services=[{"service_other": "Shoes"}, {"service_other": "Shoes"}],
+                ),
+                _row("2"),
+            ]
+        )
+
+        self.assertEqual([r.source_id for r in records], ["1", "2"])
+        self.assertTrue(all(r.success for r in records))
+
+        note = records[0].note
+        assert note is not None
+        self.assertEqual(note.organization, self.org_1)
+        self.assertEqual(note.created_by, self.user)
+        self.assertEqual(note.team, self.org_1_team_1)
+
+        provided = list(note.provided_services.all())
+        self.assertEqual([sr.service for sr in provided], [self.service])
+        self.assertEqual(provided[0].status, ServiceRequestStatusEnum.COMPLETED)
+        self.assertIsNotNone(provided[0].completed_on)
+
+        requested = list(note.requested_services.all())
+        self.assertEqual([sr.service.label for sr in requested if sr.service], ["Shoes", "Shoes"])
+        self.assertEqual({sr.status for sr in requested}, {ServiceRequestStatusEnum.TO_DO})
+        self.assertEqual(OrganizationService.objects.filter(label="Shoes", organization=self.org_1).count(), 1)
+
+        self.assertTrue(self.user.has_perm("notes.change_note", note))
+        self.assertTrue(self.user.has_perm("notes.delete_note", note))
+        self.assertTrue(self.user.has_perm("notes.view_note_private_details", note))
+        for sr in provided + requested:
+            self.assertTrue(self.user.has_perm("notes.change_servicerequest", sr))
+        self.assertFalse(self.org_2_case_manager_1.has_perm("notes.change_note", note))
+
+    def test_reports_failures_per_row(self) -> None:
+        self._import([_row("imported")])
+
+        records = self._import(
+            [
+                _row("imported"),
+                _row("ok"),
+                _row("missing-client", client_profile="999999"),
+                _row("other-org-team", team_id=self.org_2_team_1.pk),
+                _row("missing-service", provided_services=[{"service_id": "999999"}]),
+                _row("long-purpose", purpose="x" * 101),
+            ]
+        )
+
+        self.assertEqual(
+            {r.source_id: r.success for r in records},
+            {
+                "imported": False,
+                "ok": True,
+                "missing-client": False,
+                "other-org-team": False,
+                "missing-service": False,
+                "long-purpose": False,
+            },
+        )
+        errors = {r.source_id: r.error_message for r in records}
+        self.assertIn("has already been imported successfully", errors["imported"])
+        self.assertEqual(errors["missing-client"], "client_profile: Client profile 999999 does not exist.")
+        self.assertEqual(errors["other-org-team"], "team: The selected team does not belong to this organization.")
+        self.assertEqual(errors["missing-service"], "provided_services: Service 999999 does not exist.")
+        self.assertIn("purpose", errors["long-purpose"])
+        self.assertEqual(Note.objects.filter(purpose__startswith="Note ").count(), 2)
+
+    def test_query_count_does_not_grow_with_rows(self) -> None:
+        def import_queries(prefix: str, count: int) -> int:
+            rows = [
+                _row(
+                    f"{prefix}{i}",
+                    client_profile=str(self.client_profile.pk),
+                    provided_services=[{"service_id": str(self.service.pk)}],
+                    requested_services=[{"service_other": "Shoes"}],
+                )
+                for i in range(count)
+            ]
+            with CaptureQueriesContext(connection) as ctx:
+                self._import(rows)
+            return len(ctx.captured_queries)
+
+        import_queries("warmup", 1)
+
+        self.assertEqual(import_queries("few", 5), import_queries("many", 50))
+
+    def test_database_error_fails_only_its_row(self) -> None:
+        real_bulk_create = ServiceRequest.objects.bulk_create
+
+        def bulk_create(objs: list[ServiceRequest], *args: Any, **kwargs: Any) -> list[ServiceRequest]:
+            if any(sr.client_profile_id == self.client_profile.pk for sr in objs):
+                raise DatabaseError("boom")
+            return real_bulk_create(objs, *args, **kwargs)
+
+        with (
+            patch.object(ServiceRequest.objects, "bulk_create", side_effect=bulk_create),
+            self.assertLogs("common.services.bulk_import", "WARNING") as logs,
+        ):
+            records = self._import(
+                [
+                    _row("1", provided_services=[{"service_id": str(self.service.pk)}]),
+                    _row(
+                        "2",
+                        client_profile=str(self.client_profile.pk),
+                        provided_services=[{"service_id": str(self.service.pk)}],
+                        requested_services=[{"service_other": "Boots"}],
+                    ),
+                    _row("3"),
+                ]
+            )
+
+        self.assertEqual([r.success for r in records], [True, False, True])
+        self.assertEqual(records[1].error_message, DATABASE_ERROR_MESSAGE)
+        self.assertIn("Note import of SELAH/2 failed: boom", logs.output[0])
+        self.assertEqual(ServiceRequest.objects.filter(client_profile=self.client_profile).count(), 0)
+        self.assertEqual(Note.objects.filter(purpose__in=["Note 1", "Note 3"]).count(), 2)
+        # The failed row's new service label is rolled back with it.
+        self.assertFalse(OrganizationService.objects.filter(label="Boots").exists())
+
+    def test_repeated_source_in_batch(self) -> None:
+        records = self._import(
+            [
+                _row("invalid-first", client_profile="999999"),
+                _row("invalid-first"),
+                _row("valid-first"),
+                _row("valid-first"),
+            ]
+        )
+
+        self.assertEqual([r.success for r in records], [False, True, True, False])
+        self.assertIn("does not exist", records[0].error_message)
+        self.assertIn("has already been imported successfully", records[3].error_message)
+        self.assertEqual(Note.objects.filter(purpose__in=["Note invalid-first", "Note valid-first"]).count(), 2)
+
+    def test_batches(self) -> None:
+        records = self._import([_row(str(i)) for i in range(5)], batch_size=2)
+
+        self.assertEqual([r.source_id for r in records], ["0", "1", "2", "3", "4"])
+        self.assertTrue(all(r.success for r in records))
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "note-import"}},
+        REPORT_SUMMARY_CACHE_TTL=60,
+    )
+    def test_invalidates_cached_report_summary(self) -> None:
+        cache.clear()
+        window = {"start_date": date(2025, 1, 1), "end_date": date(2025, 1, 31)}
+        self.assertEqual(report_summary(org=self.org_1, **window)["total_notes"], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._import([_row(str(i), interacted_at=datetime(2025, 1, 10, 12, tzinfo=timezone.utc)) for i in range(3)])
+
+        self.assertEqual(report_summary(org=self.org_1, **window)["total_notes"], 3)
@@ -6,7 +6,9 @@ from accounts.models import User
 from accounts.tests.baker_recipes import organization_recipe
 from common.tests.utils import GraphQLBaseTestCase
 from deepdiff import DeepDiff
+from django.db import connection
 from django.test import ignore_warnings
+from django.test.utils import CaptureQueriesContext
 from model_bakery import baker
 from notes.enums import ServiceRequestStatusEnum
 from notes.models import (
@@ -381,6 +383,30 @@ class NoteQueryTestCase(NoteGraphQLBaseTestCase, TaskGraphQLUtilsMixin):
         actual_ids = [n["id"] for n in response["data"]["notes"]["results"]]
         self.assertCountEqual(expected_ids, actual_ids)
 
+    def test_notes_query_search_filter_uses_trigram_indexes(self) -> None:
+        query = """
+            query ($filters: NoteFilter) {
+                notes (filters: $filters) {
+                    results {
+                        id
+                    }
+                }
+            }
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            self.execute_graphql(query, variables={"filters": {"search": "deets coop"}})
+        search_sql = next(q["sql"] for q in ctx.captured_queries if '"public_details"::text) LIKE' in q["sql"])
+
+        with connection.cursor() as cursor:
+            # The test tables are tiny; forbid sequential scans so the plan shows which indexes are usable.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute(f"EXPLAIN {search_sql}")
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+
+        self.assertIn("note_public_details_trgm", plan)
+        self.assertIn("clientprofile_first_name_trgm", plan)
+        self.assertIn("clientprofile_last_name_trgm", plan)
+
     def test_notes_query_order(self) -> None:
         """
         Assert that notes are returned in order of interacted_at timestamp, regardless of client
@@ -432,6 +458,55 @@ class NoteQueryTestCase(NoteGraphQLBaseTestCase, TaskGraphQLUtilsMixin):
             [oldest_note["id"], older_note["id"], self.note["id"]],
         )
 
+    def test_notes_keyset_query(self) -> None:
+        tied_1, tied_2, oldest = [
+            self._create_note_fixture({"purpose": purpose})["data"]["createNote"]["id"]
+            for purpose in ("tied 1", "tied 2", "oldest")
+        ]
+        Note.objects.filter(pk__in=[tied_1, tied_2]).update(interacted_at="2024-03-10T10:11:12+00:00")
+        Note.objects.filter(pk=oldest).update(interacted_at="2024-03-09T10:11:12+00:00")
+
+        query = """
+            query ($after: String) {
+                notesKeyset (pagination: {limit: 2, after: $after}) {
+                    pageInfo {
+                        endCursor
+                        hasNextPage
+                    }
+                    results {
+                        id
+                    }
+                }
+            }
+        """
+        pages = []
+        after = None
+        with CaptureQueriesContext(connection) as ctx:
+            while True:
+                page = self.execute_graphql(query, variables={"after": after})["data"]["notesKeyset"]
+                pages.append([n["id"] for n in page["results"]])
+                if not page["pageInfo"]["hasNextPage"]:
+                    break
+                after = page["pageInfo"]["endCursor"]
+
+        # Ties on interacted_at fall back to the newest id.
+        self.assertEqual(pages, [[self.note["id"], tied_2], [tied_1, oldest]])
+        self.assertFalse([q for q in ctx.captured_queries if "COUNT(" in q["sql"]])
+
+    def test_notes_keyset_query_invalid_cursor(self) -> None:
+        query = """
+            query {
+                notesKeyset (pagination: {after: "not-a-cursor"}) {
+                    results {
+                        id
+                    }
+                }
+            }
+        """
+        response = self.execute_graphql(query)
+
+        self.assertEqual(response["errors"][0]["message"], "Invalid pagination cursor.")
+
 
 class OrganizationServiceQueryTestCase(GraphQLBaseTestCase):
     def setUp(self) -> None:
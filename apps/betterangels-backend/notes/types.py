@@ -5,6 +5,7 @@ import strawberry
 import strawberry_django
 from accounts.models import PermissionGroup, User
 from accounts.types import OrganizationType, UserType
+from clients.models import ClientProfile
 from clients.types import ClientProfileType
 from common.graphql.types import (
     AttachmentInterface,
@@ -121,6 +122,22 @@ class NoteOrder:
     interacted_at: auto
 
 
+def _note_search_matches(term: str) -> QuerySet[models.Note]:
+    """Ids of notes whose public details or client's first/last name contain *term*.
+
+    ``icontains`` compiles to ``UPPER(col::text) LIKE UPPER(%term%)``, which is
+    what the ``UPPER(...)`` trigram indexes on these columns match.
+    """
+    matching_clients = (
+        ClientProfile.objects.including_merged()
+        .filter(Q(first_name__icontains=term) | Q(last_name__icontains=term))
+        .values("pk")
+    )
+    by_details = models.Note.objects.filter(public_details__icontains=term).order_by().values("pk")
+    by_client = models.Note.objects.filter(client_profile_id__in=matching_clients).order_by().values("pk")
+    return by_details.union(by_client)
+
+
 @strawberry_django.filter_type(models.Note)
 class NoteFilter:
     client_profile: ID | None
@@ -139,12 +156,11 @@ class NoteFilter:
         search_terms = value.split()
         query = Q()
 
+        # Each branch is its own subquery so the planner can serve it from a
+        # trigram index (see ``_note_search_matches``); an OR across the
+        # client join would force a sequential scan.
         for term in search_terms:
-            query &= (
-                Q(client_profile__first_name__icontains=term)
-                | Q(client_profile__last_name__icontains=term)
-                | Q(public_details__icontains=term)
-            )
+            query &= Q(pk__in=_note_search_matches(term))
 
         return query
 
@@ -379,6 +395,28 @@ class ImportNoteInput:
     note: ImportNoteDataInput
 
 
+@strawberry_django.input(models.Note)
+class BulkImportNoteDataInput(ImportNoteDataInput):
+    """Import note fields plus the services to record on the note."""
+
+    provided_services: Optional[List[CreateNoteServiceInput]] = None
+    requested_services: Optional[List[CreateNoteServiceInput]] = None
+
+
+@strawberry_django.input(models.NoteImportRecord)
+class ImportNoteRecordInput:
+    source_id: auto
+    source_name: auto
+    raw_data: auto
+    note: BulkImportNoteDataInput
+
+
+@strawberry_django.input(models.NoteImportRecord)
+class BulkImportNotesInput:
+    import_job_id: auto
+    records: List[ImportNoteRecordInput]
+
+
 # Output types for note import
 @strawberry_django.type(models.NoteDataImport)
 class NoteDataImportType:
@@ -401,6 +439,11 @@ class NoteImportRecordType:
     raw_data: auto
 
 
+@strawberry.type
+class NoteImportRecordsType:
+    records: List[NoteImportRecordType]
+
+
 @strawberry_django.type(Attachment, pagination=True)
 class NoteAttachmentType(AttachmentInterface):
     pass
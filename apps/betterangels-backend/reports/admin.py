@@ -4,7 +4,7 @@ from django.contrib import admin
 from django.db.models import QuerySet
 from django.http import HttpRequest
 
-from .models import ScheduledReport
+from .models import ExportJob, ScheduledReport
 from .tasks import send_scheduled_report
 
 
@@ -94,3 +94,28 @@ class ScheduledReportAdmin(admin.ModelAdmin):
             },
         ),
     )
+
+
+@admin.register(ExportJob)
+class ExportJobAdmin(admin.ModelAdmin):
+    """Read-only admin for background report exports."""
+
+    list_display = ("id", "export_type", "organization", "requested_by", "status", "progress", "created_at")
+    list_filter = ("export_type", "status")
+    readonly_fields = (
+        "organization",
+        "requested_by",
+        "export_type",
+        "parameters",
+        "status",
+        "progress",
+        "file",
+        "error_message",
+        "created_at",
+        "started_at",
+        "finished_at",
+        "claimed_until",
+    )
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        return False
@@ -0,0 +1,33 @@
+"""
+Invalidation for the cached report summary.
+
+Cached summaries are keyed by a per-organization generation; bumping it
+orphans every cached range for that organization at once (Redis has no
+cheap "delete by prefix").  Orphans expire with ``REPORT_SUMMARY_CACHE_TTL``.
+"""
+
+import uuid
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+def report_summary_generation_key(organization_id: Any) -> str:
+    return f"reports:summary:gen:{organization_id}"
+
+
+def report_summary_invalidate(*, organization_id: Any) -> None:
+    """Drop the organization's cached summaries once the current transaction commits.
+
+    Bumping before commit would let a concurrent request cache pre-commit
+    data under the new generation.
+    """
+    if not settings.REPORT_SUMMARY_CACHE_TTL or organization_id is None:
+        return
+
+    def bump() -> None:
+        cache.set(report_summary_generation_key(organization_id), uuid.uuid4().hex, settings.REPORT_SUMMARY_CACHE_TTL)
+
+    transaction.on_commit(bump)
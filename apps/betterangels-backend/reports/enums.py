@@ -0,0 +1,18 @@
+import strawberry
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+@strawberry.enum
+class ExportJobTypeEnum(models.TextChoices):
+    INTERACTION_DATA_CSV = "interaction_data_csv", _("Interaction Data (CSV)")
+    SHELTER_METRICS_XLSX = "shelter_metrics_xlsx", _("Shelter Metrics (XLSX)")
+    SHELTER_METRICS_ZIP = "shelter_metrics_zip", _("Shelter Metrics (ZIP of CSVs)")
+
+
+@strawberry.enum
+class ExportJobStatusEnum(models.TextChoices):
+    PENDING = "pending", _("Pending")
+    RUNNING = "running", _("Running")
+    SUCCEEDED = "succeeded", _("Succeeded")
+    FAILED = "failed", _("Failed")
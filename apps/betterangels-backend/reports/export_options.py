@@ -1,8 +1,23 @@
 from enum import StrEnum
 
+import strawberry
 
+
+@strawberry.enum(name="MetricsExportOptionsEnum")
 class MetricsExportOptions(StrEnum):
     DAILY_OCCUPANCY_METRICS = "daily_occupancy_metrics"
     DAILY_BED_STATUS_METRICS = "daily_bed_status_metrics"
     RESERVATION_METRICS = "reservation_metrics"
     AVG_DAYS_TO_OCCUPANCY = "avg_days_to_occupancy"
+
+
+def selected_export_options(options: list[MetricsExportOptions]) -> set[MetricsExportOptions]:
+    """Validate the requested export options; raises ``ValueError`` on unknown or empty selections."""
+    selected_options = set(options)
+    invalid_options = selected_options - set(MetricsExportOptions)
+    if invalid_options:
+        raise ValueError(f"Unknown metric export options: {', '.join(sorted(map(str, invalid_options)))}")
+    if not selected_options:
+        raise ValueError("At least one metric export option must be selected")
+
+    return selected_options
@@ -7,8 +7,9 @@ GraphQL-facing types change.
 
 import csv
 import zipfile
+from collections.abc import Iterable, Iterator
 from datetime import date
-from io import BytesIO, StringIO
+from io import BytesIO, RawIOBase, StringIO
 from typing import Any
 
 from shelters.types.reporting import (
@@ -18,7 +19,12 @@ from shelters.types.reporting import (
     ShelterOccupancyMetricsType,
 )
 
-from .export_options import MetricsExportOptions
+from .export_options import MetricsExportOptions, selected_export_options
+
+CsvData = tuple[list[str], Iterable[dict[str, Any]]]
+
+# Compressed bytes buffered before ``stream_zip`` yields a chunk.
+ZIP_STREAM_CHUNK_SIZE = 64 * 1024
 
 
 def csv_files_to_zip(files: dict[str, str]) -> bytes:
@@ -31,22 +37,149 @@ def csv_files_to_zip(files: dict[str, str]) -> bytes:
     return output.getvalue()
 
 
-def rows_to_csv(rows: list[dict[str, Any]], headers: list[str]) -> str:
-    output = StringIO()
-    writer = csv.DictWriter(output, fieldnames=headers)
+class _ZipStreamSink(RawIOBase):
+    """Unseekable write target that holds compressed bytes until ``stream_zip`` drains them.
+
+    Being unseekable makes ``zipfile`` write data descriptors after each member
+    instead of seeking back to patch sizes into its local header.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self.size += len(chunk)
+        return len(chunk)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        self.size = 0
+        return data
+
+
+def stream_zip(files: Iterable[tuple[str, Iterable[str]]], chunk_size: int = ZIP_STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield a deflated ZIP archive of *files*, given as ``(filename, text chunks)`` pairs.
+
+    Members are written one at a time and compressed output is yielded roughly
+    every *chunk_size* bytes, so neither a whole member nor the archive is held
+    in memory. Feed it to a ``StreamingHttpResponse`` or an upload.
+    """
+    sink = _ZipStreamSink()
+
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+        for filename, chunks in files:
+            with zip_file.open(filename, mode="w") as member:
+                for chunk in chunks:
+                    member.write(chunk.encode())
+                    if sink.size >= chunk_size:
+                        yield sink.drain()
+
+    yield sink.drain()
+
+
+def iter_csv(rows: Iterable[dict[str, Any]], headers: list[str]) -> Iterator[str]:
+    """Yield the CSV header line, then one line per row."""
+    line = StringIO()
+    writer = csv.DictWriter(line, fieldnames=headers)
 
     writer.writeheader()
+    yield line.getvalue()
 
     for row in rows:
+        line.seek(0)
+        line.truncate()
         writer.writerow({header: row.get(header, "") for header in headers})
+        yield line.getvalue()
 
-    return output.getvalue()
+
+def rows_to_csv(rows: Iterable[dict[str, Any]], headers: list[str]) -> str:
+    return "".join(iter_csv(rows, headers))
 
 
 def daily_occupancy_metrics_to_csv(shelter_id: str, metrics: list[DailyOccupancyMetricsType]) -> str:
+    headers, rows = _daily_occupancy_csv_data(shelter_id, metrics)
+    return rows_to_csv(rows, headers)
+
+
+def daily_bed_status_metrics_to_csv(shelter_id: str, metrics: list[DailyBedStatusMetricsType]) -> str:
+    headers, rows = _daily_bed_status_csv_data(shelter_id, metrics)
+    return rows_to_csv(rows, headers)
+
+
+def reservation_metrics_to_csv(
+    shelter_id: str, start_date: date, end_date: date, metrics: ReservationMetricsType
+) -> str:
+    headers, rows = _reservation_csv_data(shelter_id, start_date, end_date, metrics)
+    return rows_to_csv(rows, headers)
+
+
+def avg_days_to_occupancy_to_csv(shelter_id: str, start_date: date, end_date: date, avg_days: float | None) -> str:
+    headers, rows = _avg_days_to_occupancy_csv_data(shelter_id, start_date, end_date, avg_days)
+    return rows_to_csv(rows, headers)
+
+
+def metrics_to_zip(metrics: ShelterOccupancyMetricsType, options: list[MetricsExportOptions]) -> bytes:
+    selected_options = selected_export_options(options)
+    return b"".join(stream_zip(_metrics_csv_files(metrics, selected_options)))
+
+
+def stream_metrics_zip(
+    metrics: Iterable[ShelterOccupancyMetricsType], options: list[MetricsExportOptions]
+) -> Iterator[bytes]:
+    """Stream a ZIP of the selected metric CSVs for any number of shelters.
+
+    Each shelter's files sit in a folder named after its ID. *metrics* is
+    consumed lazily (see ``shelters.selectors.shelters_occupancy_metrics``), so
+    memory does not grow with the number of shelters. Options are validated
+    before the first chunk is produced.
+    """
+    selected_options = selected_export_options(options)
+
+    def files() -> Iterator[tuple[str, Iterable[str]]]:
+        for shelter_metrics in metrics:
+            for filename, csv_lines in _metrics_csv_files(shelter_metrics, selected_options):
+                yield f"{shelter_metrics.shelter_id}/{filename}", csv_lines
+
+    return stream_zip(files())
+
+
+def _metrics_csv_files(
+    metrics: ShelterOccupancyMetricsType, selected_options: set[MetricsExportOptions]
+) -> Iterator[tuple[str, Iterator[str]]]:
+    shelter_id = str(metrics.shelter_id)
+    start_date = metrics.start_date
+    end_date = metrics.end_date
+    start_str = start_date.strftime("%Y%m%d")
+    end_str = end_date.strftime("%Y%m%d")
+
+    if MetricsExportOptions.DAILY_OCCUPANCY_METRICS in selected_options:
+        headers, rows = _daily_occupancy_csv_data(shelter_id, metrics.daily_occupancy)
+        yield f"{start_str}_{end_str}_daily_occupancy_metrics.csv", iter_csv(rows, headers)
+
+    if MetricsExportOptions.DAILY_BED_STATUS_METRICS in selected_options:
+        headers, rows = _daily_bed_status_csv_data(shelter_id, metrics.daily_bed_status)
+        yield f"{start_str}_{end_str}_daily_bed_status_metrics.csv", iter_csv(rows, headers)
+
+    if MetricsExportOptions.RESERVATION_METRICS in selected_options:
+        headers, rows = _reservation_csv_data(shelter_id, start_date, end_date, metrics.reservation_metrics)
+        yield f"{start_str}_{end_str}_reservation_metrics.csv", iter_csv(rows, headers)
+
+    if MetricsExportOptions.AVG_DAYS_TO_OCCUPANCY in selected_options:
+        headers, rows = _avg_days_to_occupancy_csv_data(shelter_id, start_date, end_date, metrics.avg_days_to_occupancy)
+        yield f"{start_str}_{end_str}_avg_days_to_occupancy.csv", iter_csv(rows, headers)
+
+
+def _daily_occupancy_csv_data(shelter_id: str, metrics: list[DailyOccupancyMetricsType]) -> CsvData:
     headers = ["date", "shelter_id", "occupied_count", "total_beds", "occupancy_pct"]
 
-    rows = [
+    rows = (
         {
             "date": metric.date.isoformat(),
             "shelter_id": shelter_id,
@@ -55,15 +188,15 @@ def daily_occupancy_metrics_to_csv(shelter_id: str, metrics: list[DailyOccupancy
             "occupancy_pct": metric.occupancy_pct,
         }
         for metric in metrics
-    ]
+    )
 
-    return rows_to_csv(rows, headers)
+    return headers, rows
 
 
-def daily_bed_status_metrics_to_csv(shelter_id: str, metrics: list[DailyBedStatusMetricsType]) -> str:
+def _daily_bed_status_csv_data(shelter_id: str, metrics: list[DailyBedStatusMetricsType]) -> CsvData:
     headers = ["date", "shelter_id", "available", "occupied", "reserved", "out_of_service", "in_turnaround"]
 
-    rows = [
+    rows = (
         {
             "date": metric.date,
             "shelter_id": shelter_id,
@@ -74,14 +207,14 @@ def daily_bed_status_metrics_to_csv(shelter_id: str, metrics: list[DailyBedStatu
             "in_turnaround": metric.in_turnaround,
         }
         for metric in metrics
-    ]
+    )
 
-    return rows_to_csv(rows, headers)
+    return headers, rows
 
 
-def reservation_metrics_to_csv(
+def _reservation_csv_data(
     shelter_id: str, start_date: date, end_date: date, metrics: ReservationMetricsType
-) -> str:
+) -> CsvData:
     headers = [
         "start_date",
         "end_date",
@@ -104,10 +237,12 @@ def reservation_metrics_to_csv(
         }
     ]
 
-    return rows_to_csv(rows, headers)
+    return headers, rows
 
 
-def avg_days_to_occupancy_to_csv(shelter_id: str, start_date: date, end_date: date, avg_days: float | None) -> str:
+def _avg_days_to_occupancy_csv_data(
+    shelter_id: str, start_date: date, end_date: date, avg_days: float | None
+) -> CsvData:
     headers = ["start_date", "end_date", "shelter_id", "avg_days_to_occupancy"]
 
     rows = [
@@ -119,42 +254,4 @@ def avg_days_to_occupancy_to_csv(shelter_id: str, start_date: date, end_date: da
         }
     ]
 
-    return rows_to_csv(rows, headers)
-
-
-def metrics_to_zip(metrics: ShelterOccupancyMetricsType, options: list[MetricsExportOptions]) -> bytes:
-    shelter_id = str(metrics.shelter_id)
-    start_date = metrics.start_date
-    end_date = metrics.end_date
-    selected_options = set(options)
-    invalid_options = selected_options - set(MetricsExportOptions)
-    if invalid_options:
-        raise ValueError(f"Unknown metric export options: {', '.join(sorted(map(str, invalid_options)))}")
-    if not selected_options:
-        raise ValueError("At least one metric export option must be selected")
-
-    start_str = start_date.strftime("%Y%m%d")
-    end_str = end_date.strftime("%Y%m%d")
-    files = {}
-
-    if MetricsExportOptions.DAILY_OCCUPANCY_METRICS in selected_options:
-        files[f"{start_str}_{end_str}_daily_occupancy_metrics.csv"] = daily_occupancy_metrics_to_csv(
-            shelter_id, metrics.daily_occupancy
-        )
-
-    if MetricsExportOptions.DAILY_BED_STATUS_METRICS in selected_options:
-        files[f"{start_str}_{end_str}_daily_bed_status_metrics.csv"] = daily_bed_status_metrics_to_csv(
-            shelter_id, metrics.daily_bed_status
-        )
-
-    if MetricsExportOptions.RESERVATION_METRICS in selected_options:
-        files[f"{start_str}_{end_str}_reservation_metrics.csv"] = reservation_metrics_to_csv(
-            shelter_id, start_date, end_date, metrics.reservation_metrics
-        )
-
-    if MetricsExportOptions.AVG_DAYS_TO_OCCUPANCY in selected_options:
-        files[f"{start_str}_{end_str}_avg_days_to_occupancy.csv"] = avg_days_to_occupancy_to_csv(
-            shelter_id, start_date, end_date, metrics.avg_days_to_occupancy
-        )
-
-    return csv_files_to_zip(files)
+    return headers, rows
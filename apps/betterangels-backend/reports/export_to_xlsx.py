@@ -5,12 +5,15 @@ These adapters intentionally accept the Strawberry reporting DTOs from
 GraphQL-facing types change.
 """
 
+from collections.abc import Iterable
 from datetime import date
 from io import BytesIO
+from tempfile import SpooledTemporaryFile
 from typing import Any
 
 from openpyxl import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 from shelters.types.reporting import (
     DailyBedStatusMetricsType,
     DailyOccupancyMetricsType,
@@ -18,34 +21,113 @@ from shelters.types.reporting import (
     ShelterOccupancyMetricsType,
 )
 
-from .export_options import MetricsExportOptions
+from .export_options import MetricsExportOptions, selected_export_options
 
-SheetData = tuple[list[str], list[dict[str, Any]]]
+SheetData = tuple[list[str], Iterable[dict[str, Any]]]
+
+# Finished workbooks up to this size stay in memory; larger ones roll over to disk.
+XLSX_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+_WORKSHEET_NAMES = {
+    MetricsExportOptions.DAILY_OCCUPANCY_METRICS: "Daily Occupancy",
+    MetricsExportOptions.DAILY_BED_STATUS_METRICS: "Daily Bed Status",
+    MetricsExportOptions.RESERVATION_METRICS: "Reservation Metrics",
+    MetricsExportOptions.AVG_DAYS_TO_OCCUPANCY: "Avg Days To Occupancy",
+}
 
 
 def metrics_to_xlsx(metrics: ShelterOccupancyMetricsType, options: list[MetricsExportOptions]) -> tuple[str, bytes]:
+    selected_options = selected_export_options(options)
+    workbook = Workbook()
+    worksheet = workbook.active
+    if not isinstance(worksheet, Worksheet):
+        raise RuntimeError("Workbook does not have an active worksheet")
+
+    for index, (option, (headers, rows)) in enumerate(_sheets_data(metrics, selected_options)):
+        if index:
+            worksheet = workbook.create_sheet()
+
+        worksheet.title = _WORKSHEET_NAMES[option]
+        _append_rows(worksheet, rows, headers)
+
+    return _filename(metrics.start_date, metrics.end_date), _workbook_to_bytes(workbook)
+
+
+def shelters_metrics_to_xlsx(
+    metrics: Iterable[ShelterOccupancyMetricsType],
+    options: list[MetricsExportOptions],
+    *,
+    start_date: date,
+    end_date: date,
+) -> tuple[str, SpooledTemporaryFile[bytes]]:
+    """Export metrics for any number of shelters into one workbook, one worksheet per option.
+
+    Uses openpyxl's write-only mode: *metrics* is consumed one shelter at a
+    time and each row goes straight to its worksheet's temporary file, so
+    memory stays flat as shelters and days grow.  Pass a generator (e.g.
+    ``shelters.selectors.shelters_occupancy_metrics``) to keep it that way.
+
+    Returns the filename and the rewound workbook file; the caller closes it
+    (``FileResponse`` does so once the response has been sent).
+    """
+    selected_options = selected_export_options(options)
+    workbook = Workbook(write_only=True)
+    worksheets: dict[MetricsExportOptions, WriteOnlyWorksheet] = {}
+    for option in _WORKSHEET_NAMES:
+        if option in selected_options:
+            worksheets[option] = workbook.create_sheet(_WORKSHEET_NAMES[option])
+
+    for index, shelter_metrics in enumerate(metrics):
+        for option, (headers, rows) in _sheets_data(shelter_metrics, selected_options):
+            if not index:
+                worksheets[option].append(headers)
+
+            for row in rows:
+                worksheets[option].append([_cell_value(row.get(header, "")) for header in headers])
+
+    output: SpooledTemporaryFile[bytes] = SpooledTemporaryFile(max_size=XLSX_SPOOL_MAX_SIZE)
+    try:
+        workbook.save(output)
+    except BaseException:
+        output.close()
+        raise
+
+    output.seek(0)
+    return _filename(start_date, end_date), output
+
+
+def _filename(start_date: date, end_date: date) -> str:
+    return f"{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}_shelter_report.xlsx"
+
+
+def _sheets_data(
+    metrics: ShelterOccupancyMetricsType, selected_options: set[MetricsExportOptions]
+) -> list[tuple[MetricsExportOptions, SheetData]]:
     shelter_id = str(metrics.shelter_id)
     start_date = metrics.start_date
     end_date = metrics.end_date
-    selected_options = set(options)
-    invalid_options = selected_options - set(MetricsExportOptions)
-    if invalid_options:
-        raise ValueError(f"Unknown metric export options: {', '.join(sorted(map(str, invalid_options)))}")
-
-    start_str = start_date.strftime("%Y%m%d")
-    end_str = end_date.strftime("%Y%m%d")
-    sheets: list[tuple[str, SheetData]] = []
+    sheets: list[tuple[MetricsExportOptions, SheetData]] = []
 
     if MetricsExportOptions.DAILY_OCCUPANCY_METRICS in selected_options:
-        sheets.append(("Daily Occupancy", _daily_occupancy_sheet_data(shelter_id, metrics.daily_occupancy)))
+        sheets.append(
+            (
+                MetricsExportOptions.DAILY_OCCUPANCY_METRICS,
+                _daily_occupancy_sheet_data(shelter_id, metrics.daily_occupancy),
+            )
+        )
 
     if MetricsExportOptions.DAILY_BED_STATUS_METRICS in selected_options:
-        sheets.append(("Daily Bed Status", _daily_bed_status_sheet_data(shelter_id, metrics.daily_bed_status)))
+        sheets.append(
+            (
+                MetricsExportOptions.DAILY_BED_STATUS_METRICS,
+                _daily_bed_status_sheet_data(shelter_id, metrics.daily_bed_status),
+            )
+        )
 
     if MetricsExportOptions.RESERVATION_METRICS in selected_options:
         sheets.append(
             (
-                "Reservation Metrics",
+                MetricsExportOptions.RESERVATION_METRICS,
                 _reservation_metrics_sheet_data(shelter_id, start_date, end_date, metrics.reservation_metrics),
             )
         )
@@ -53,32 +135,17 @@ def metrics_to_xlsx(metrics: ShelterOccupancyMetricsType, options: list[MetricsE
     if MetricsExportOptions.AVG_DAYS_TO_OCCUPANCY in selected_options:
         sheets.append(
             (
-                "Avg Days To Occupancy",
+                MetricsExportOptions.AVG_DAYS_TO_OCCUPANCY,
                 _avg_days_to_occupancy_sheet_data(shelter_id, start_date, end_date, metrics.avg_days_to_occupancy),
             )
         )
 
-    if not sheets:
-        raise ValueError("At least one metric export option must be selected")
-
-    workbook = Workbook()
-    worksheet = workbook.active
-    if not isinstance(worksheet, Worksheet):
-        raise RuntimeError("Workbook does not have an active worksheet")
-
-    for index, (worksheet_name, (headers, rows)) in enumerate(sheets):
-        if index:
-            worksheet = workbook.create_sheet()
-
-        worksheet.title = worksheet_name
-        _append_rows(worksheet, rows, headers)
-
-    return f"{start_str}_{end_str}_shelter_report.xlsx", _workbook_to_bytes(workbook)
+    return sheets
 
 
 def _daily_occupancy_sheet_data(shelter_id: str, metrics: list[DailyOccupancyMetricsType]) -> SheetData:
     headers = ["date", "shelter_id", "occupied_count", "total_beds", "occupancy_pct"]
-    rows = [
+    rows = (
         {
             "date": metric.date,
             "shelter_id": shelter_id,
@@ -87,14 +154,14 @@ def _daily_occupancy_sheet_data(shelter_id: str, metrics: list[DailyOccupancyMet
             "occupancy_pct": metric.occupancy_pct,
         }
         for metric in metrics
-    ]
+    )
 
     return headers, rows
 
 
 def _daily_bed_status_sheet_data(shelter_id: str, metrics: list[DailyBedStatusMetricsType]) -> SheetData:
     headers = ["date", "shelter_id", "available", "occupied", "reserved", "out_of_service", "in_turnaround"]
-    rows = [
+    rows = (
         {
             "date": metric.date,
             "shelter_id": shelter_id,
@@ -105,7 +172,7 @@ def _daily_bed_status_sheet_data(shelter_id: str, metrics: list[DailyBedStatusMe
             "in_turnaround": metric.in_turnaround,
         }
         for metric in metrics
-    ]
+    )
 
     return headers, rows
 
@@ -153,7 +220,7 @@ def _avg_days_to_occupancy_sheet_data(
     return headers, rows
 
 
-def _append_rows(worksheet: Worksheet, rows: list[dict[str, Any]], headers: list[str]) -> None:
+def _append_rows(worksheet: Worksheet, rows: Iterable[dict[str, Any]], headers: list[str]) -> None:
     worksheet.append(headers)
 
     for row in rows:
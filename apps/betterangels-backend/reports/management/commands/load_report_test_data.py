@@ -162,6 +162,24 @@ SEED_TEAMS = [
 ]
 
 
+def create_org_services(org: Organization) -> list[OrganizationService]:
+    """Create ``SERVICE_CATEGORIES`` and their services for *org*, reusing existing ones."""
+    all_services: list[OrganizationService] = []
+    for cat_name, svc_labels in SERVICE_CATEGORIES.items():
+        category, _ = OrganizationServiceCategory.objects.get_or_create(
+            name=cat_name,
+            organization=org,
+        )
+        for idx, label in enumerate(svc_labels):
+            svc, _ = OrganizationService.objects.get_or_create(
+                label=label,
+                organization=org,
+                defaults={"category": category, "priority": idx},
+            )
+            all_services.append(svc)
+    return all_services
+
+
 class Command(BaseCommand):
     help = "Load realistic test data for reports (Notes with teams, purposes, services) into test_org."
 
@@ -209,7 +227,7 @@ class Command(BaseCommand):
 
         # 1. Create service categories and services
         self.stdout.write("Creating service categories and services...")
-        services = self._create_services(org)
+        services = create_org_services(org)
         self.stdout.write(
             self.style.SUCCESS(f"  Created {len(services)} services in {len(SERVICE_CATEGORIES)} categories.")
         )
@@ -295,20 +313,3 @@ class Command(BaseCommand):
             )
             profiles.append(profile)
         return profiles
-
-    def _create_services(self, org: Organization) -> list[OrganizationService]:
-        """Create service categories and services, reusing existing ones."""
-        all_services: list[OrganizationService] = []
-        for cat_name, svc_labels in SERVICE_CATEGORIES.items():
-            category, _ = OrganizationServiceCategory.objects.get_or_create(
-                name=cat_name,
-                organization=org,
-            )
-            for idx, label in enumerate(svc_labels):
-                svc, _ = OrganizationService.objects.get_or_create(
-                    label=label,
-                    organization=org,
-                    defaults={"category": category, "priority": idx},
-                )
-                all_services.append(svc)
-        return all_services
@@ -0,0 +1,41 @@
+# Generated by Django 6.0.6 on 2026-10-18 22:37
+
+import django.core.validators
+import django.db.models.deletion
+import reports.models
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0006_alter_organization_slug'),
+        ('reports', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExportJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('export_type', models.CharField(choices=[('interaction_data_csv', 'Interaction Data (CSV)'), ('shelter_metrics_xlsx', 'Shelter Metrics (XLSX)'), ('shelter_metrics_zip', 'Shelter Metrics (ZIP of CSVs)')], max_length=50)),
+                ('parameters', models.JSONField(blank=True, default=dict, help_text='Export arguments: start_date, end_date and, for shelter metrics, shelter_ids and metric_options')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('progress', models.PositiveSmallIntegerField(default=0, help_text='Percent of the export written so far', validators=[django.core.validators.MaxValueValidator(100)])),
+                ('file', models.FileField(blank=True, max_length=255, upload_to=reports.models.export_job_upload_to)),
+                ('error_message', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('organization', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='export_jobs', to='organizations.organization')),
+                ('requested_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='report_export_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['requested_by', '-created_at'], name='reports_exp_request_8ad026_idx')],
+            },
+        ),
+    ]
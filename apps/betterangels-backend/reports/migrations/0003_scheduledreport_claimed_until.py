@@ -0,0 +1,18 @@
+# Generated by Django 6.0.6 on 2026-10-18 22:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0002_export_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scheduledreport',
+            name='claimed_until',
+            field=models.DateTimeField(blank=True, help_text='Set while a dispatched send is in flight; the report is not dispatched again until it passes', null=True),
+        ),
+    ]
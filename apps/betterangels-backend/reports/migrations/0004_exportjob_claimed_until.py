@@ -0,0 +1,18 @@
+# Generated by Django 6.0.6 on 2026-10-18 23:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0003_scheduledreport_claimed_until'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exportjob',
+            name='claimed_until',
+            field=models.DateTimeField(blank=True, help_text='Lease of the worker running the job, renewed as it makes progress; a running job past it has stalled', null=True),
+        ),
+    ]
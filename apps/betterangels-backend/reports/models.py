@@ -1,16 +1,19 @@
 """Reports app models."""
 
 import re
+import uuid
 from typing import Any
 
 from accounts.models import Organization
 from common.permissions.utils import permission_enums_to_django_meta_permissions
 from dateutil.relativedelta import relativedelta
 from django.core.exceptions import ValidationError
+from django.conf import settings
 from django.core.validators import EmailValidator, MaxValueValidator, MinValueValidator
 from django.db import models
 from django.utils import timezone
 
+from .enums import ExportJobStatusEnum, ExportJobTypeEnum
 from .permissions import ReportPermissions
 
 
@@ -112,6 +115,11 @@ class ScheduledReport(models.Model):
         help_text="When this report should be sent next",
         db_index=True,
     )
+    claimed_until = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Set while a dispatched send is in flight; the report is not dispatched again until it passes",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -159,3 +167,53 @@ class ScheduledReport(models.Model):
     def get_recipient_list(self) -> list[str]:
         """Parse the recipients field into a list of email addresses."""
         return [email for email in re.split(r"[,\s;]+", self.recipients) if email]
+
+
+def export_job_upload_to(instance: "ExportJob", filename: str) -> str:
+    """Keep each job's file under its own prefix so filenames never collide."""
+    return f"reports/exports/{instance.pk}/{filename}"
+
+
+class ExportJob(models.Model):
+    """A report export produced in the background and delivered through the default storage."""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    organization = models.ForeignKey(Organization, on_delete=models.CASCADE, related_name="export_jobs")
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="report_export_jobs"
+    )
+    export_type = models.CharField(max_length=50, choices=ExportJobTypeEnum.choices)
+    parameters = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Export arguments: start_date, end_date and, for shelter metrics, shelter_ids and metric_options",
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=ExportJobStatusEnum.choices,
+        default=ExportJobStatusEnum.PENDING,
+    )
+    progress = models.PositiveSmallIntegerField(
+        default=0,
+        validators=[MaxValueValidator(100)],
+        help_text="Percent of the export written so far",
+    )
+    file = models.FileField(upload_to=export_job_upload_to, blank=True, max_length=255)
+    error_message = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    claimed_until = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Lease of the worker running the job, renewed as it makes progress; a running job past it has stalled",
+    )
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["requested_by", "-created_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.get_export_type_display()} export {self.pk} ({self.get_status_display()})"
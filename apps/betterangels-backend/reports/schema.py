@@ -1,15 +1,24 @@
-from datetime import date
-from typing import List, Optional
+import os
+from datetime import date, datetime
+from typing import List, Optional, cast
 
 import strawberry
 import strawberry_django
 from accounts.extensions import HasOrgPerm
+from accounts.models import User
 from common.permissions.utils import IsAuthenticated, get_current_organization
+from django.core.exceptions import PermissionDenied
 from organizations.models import Organization
+from strawberry import ID
 from strawberry.types import Info
+from strawberry_django.auth.utils import get_current_user
 
+from .enums import ExportJobStatusEnum, ExportJobTypeEnum
+from .export_options import MetricsExportOptions
+from .models import ExportJob
 from .permissions import ReportPermissions
-from .selectors import report_default_date_range, report_summary
+from .selectors import export_job_get, report_default_date_range, report_summary
+from .services import export_job_create
 
 
 @strawberry.type
@@ -38,8 +47,55 @@ class ReportSummaryType:
     top_requested_services: List[NameCountType]
 
 
+@strawberry_django.type(ExportJob)
+class ExportJobType:
+    id: ID
+    export_type: ExportJobTypeEnum
+    status: ExportJobStatusEnum
+    progress: int
+    error_message: str
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+
+    @strawberry_django.field(only=["file"])
+    def filename(self, root: ExportJob) -> Optional[str]:
+        return os.path.basename(root.file.name) if root.file else None
+
+    @strawberry_django.field(only=["status", "file"])
+    def download_url(self, root: ExportJob) -> Optional[str]:
+        """Signed by the storage backend once the export has succeeded; expires with that signature."""
+        if root.status != ExportJobStatusEnum.SUCCEEDED or not root.file:
+            return None
+
+        return root.file.url
+
+
+@strawberry.input
+class CreateExportJobInput:
+    export_type: ExportJobTypeEnum
+    start_date: date
+    end_date: date
+    shelter_ids: Optional[List[ID]] = None
+    metric_options: Optional[List[MetricsExportOptions]] = None
+
+
 @strawberry.type
 class Query:
+    @strawberry_django.field(
+        permission_classes=[IsAuthenticated],
+        extensions=[HasOrgPerm(ReportPermissions.VIEW_REPORTS)],
+    )
+    def export_job(self, info: Info, pk: ID) -> ExportJobType:
+        """Poll one of the current user's export jobs."""
+        user = cast(User, get_current_user(info))
+        org = Organization.objects.get(pk=get_current_organization(info))
+        job = export_job_get(pk=pk, user=user, organization=org)
+        if job is None:
+            raise PermissionDenied("You do not have permission to view this export.")
+
+        return cast(ExportJobType, job)
+
     @strawberry_django.field(
         permission_classes=[IsAuthenticated],
         extensions=[HasOrgPerm(ReportPermissions.VIEW_REPORTS)],
@@ -72,3 +128,26 @@ class Query:
             top_provided_services=[NameCountType(**d) for d in summary["top_provided_services"]],
             top_requested_services=[NameCountType(**d) for d in summary["top_requested_services"]],
         )
+
+
+@strawberry.type
+class Mutation:
+    @strawberry_django.mutation(
+        permission_classes=[IsAuthenticated],
+        extensions=[HasOrgPerm(ReportPermissions.VIEW_REPORTS)],
+    )
+    def create_export_job(self, info: Info, data: CreateExportJobInput) -> ExportJobType:
+        """Queue an export; poll ``exportJob`` until it has a ``downloadUrl``."""
+        user = cast(User, get_current_user(info))
+        org = Organization.objects.get(pk=get_current_organization(info))
+
+        job = export_job_create(
+            user=user,
+            organization=org,
+            export_type=data.export_type,
+            start_date=data.start_date,
+            end_date=data.end_date,
+            shelter_ids=[int(pk) for pk in data.shelter_ids] if data.shelter_ids is not None else None,
+            metric_options=data.metric_options,
+        )
+        return cast(ExportJobType, job)
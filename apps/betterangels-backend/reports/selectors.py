@@ -7,14 +7,24 @@ They should not contain write logic — that belongs in services.
 Reference: https://github.com/HackSoftware/Django-Styleguide#selectors
 """
 
-from datetime import date, timedelta
-from typing import Any
-
-from django.db.models import Count, F, QuerySet
-from django.db.models.functions import TruncDate
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from operator import itemgetter
+from typing import Any, cast
+
+from accounts.models import User
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import Prefetch, QuerySet
 from django.utils import timezone
-from notes.models import Note
+from notes.models import Note, OrganizationService, ServiceRequest
 from organizations.models import Organization
+from teams.models import Team
+
+from .cache import report_summary_generation_key
+from .models import ExportJob
 
 
 def report_default_date_range() -> tuple[date, date]:
@@ -47,92 +57,143 @@ def note_list_for_org(
     )
 
 
-def note_count_by_date(*, notes: QuerySet[Note]) -> list[dict[str, Any]]:
-    """Aggregate note counts grouped by date."""
-    return list(
-        notes.annotate(trunc_date=TruncDate("interacted_at"))
-        .values("trunc_date")
-        .annotate(count=Count("id"))
-        .order_by("trunc_date")
-        .values(
-            date=F("trunc_date"),
-            count=F("count"),
-        )
-    )
-
-
-def note_count_by_team(*, notes: QuerySet[Note]) -> list[dict[str, Any]]:
-    """Aggregate note counts grouped by team, with display labels."""
-    rows = notes.exclude(team__isnull=True).values("team__name").annotate(count=Count("id")).order_by("-count")
-    return [{"name": row["team__name"], "count": row["count"]} for row in rows]
-
-
-def note_count_by_purpose(*, notes: QuerySet[Note], limit: int = 10) -> list[dict[str, Any]]:
-    """Aggregate note counts grouped by purpose."""
-    return list(
-        notes.exclude(purpose__isnull=True)
-        .exclude(purpose="")
-        .values("purpose")
-        .annotate(count=Count("id"))
-        .order_by("-count")[:limit]
-        .values(
-            name=F("purpose"),
-            count=F("count"),
-        )
-    )
-
-
-def note_top_services(
-    *,
-    notes: QuerySet[Note],
-    relation: str,
-    limit: int = 15,
-) -> list[dict[str, Any]]:
+def note_list_for_export(*, notes: QuerySet[Note]) -> QuerySet[Note]:
     """
-    Count services across notes via a many-to-many service-request relation.
+    Attach every relation ``NoteResource`` reads while exporting a row.
 
-    Uses a single aggregation query instead of Python-level iteration.
-
-    Args:
-        notes: Base Note queryset.
-        relation: ``"provided_services"`` or ``"requested_services"``.
-        limit: Max number of results.
+    Prefetches are honoured by ``QuerySet.iterator(chunk_size=...)``, which runs
+    them once per chunk rather than once per note.
     """
-    label_field = f"{relation}__service__label"
-    return list(
-        notes.filter(**{f"{relation}__service__isnull": False})
-        .values(name=F(label_field))
-        .annotate(count=Count("id"))
-        .order_by("-count")[:limit]
+    services = ServiceRequest.objects.select_related("service")
+    return notes.select_related(
+        "client_profile",
+        "created_by",
+        "location__address",
+        "organization",
+        "team",
+    ).prefetch_related(
+        Prefetch("provided_services", queryset=services),
+        Prefetch("requested_services", queryset=services),
     )
 
 
-def note_unique_clients_count(*, notes: QuerySet[Note]) -> int:
-    """Count distinct client profiles across the given notes."""
-    return notes.filter(client_profile__isnull=False).values("client_profile").distinct().count()
+def export_job_get(*, pk: str, user: User, organization: Organization) -> ExportJob | None:
+    """Return one of *user*'s export jobs in *organization*, or ``None``."""
+    try:
+        return ExportJob.objects.filter(pk=pk, requested_by=user, organization=organization).first()
+    except ValidationError:
+        return None
+
+
+SUMMARY_TOP_PURPOSES = 10
+SUMMARY_TOP_SERVICES = 15
+
+# Every breakdown of the summary in one statement.  Notes in range are read
+# once (materialized CTE); the note-level breakdowns share a single GROUPING
+# SETS aggregate and service counts come from the same scoped notes through
+# both service-request relations.  Each row is
+# ``(dimension, key, count, unique_clients)``.
+REPORT_SUMMARY_SQL = """
+WITH scoped AS MATERIALIZED (
+    SELECT id, team_id, purpose, client_profile_id, (interacted_at AT TIME ZONE %(tz)s)::date AS day
+    FROM {note}
+    WHERE organization_id = %(org_id)s AND interacted_at >= %(start)s AND interacted_at < %(end)s
+)
+SELECT
+    CASE
+        WHEN GROUPING(n.day) = 0 THEN 'date'
+        WHEN GROUPING(t.name) = 0 THEN 'team'
+        WHEN GROUPING(n.purpose) = 0 THEN 'purpose'
+        ELSE 'total'
+    END,
+    COALESCE(n.day::text, t.name, n.purpose),
+    COUNT(*),
+    COUNT(DISTINCT n.client_profile_id)
+FROM scoped n
+LEFT JOIN {team} t ON t.id = n.team_id
+GROUP BY GROUPING SETS ((), (n.day), (t.name), (n.purpose))
+UNION ALL
+SELECT s.relation, svc.label, COUNT(*), NULL
+FROM (
+    SELECT 'provided_services' AS relation, m.servicerequest_id
+    FROM scoped n JOIN {provided} m ON m.note_id = n.id
+    UNION ALL
+    SELECT 'requested_services', m.servicerequest_id
+    FROM scoped n JOIN {requested} m ON m.note_id = n.id
+) s
+JOIN {service_request} sr ON sr.id = s.servicerequest_id
+JOIN {service} svc ON svc.id = sr.service_id
+GROUP BY s.relation, svc.label
+"""
 
 
-def note_unique_clients_by_date(*, notes: QuerySet[Note]) -> list[dict[str, Any]]:
-    """Count distinct client profiles grouped by interaction date."""
-    return list(
-        notes.filter(client_profile__isnull=False)
-        .annotate(trunc_date=TruncDate("interacted_at"))
-        .values("trunc_date")
-        .annotate(count=Count("client_profile", distinct=True))
-        .order_by("trunc_date")
-        .values(
-            date=F("trunc_date"),
-            count=F("count"),
-        )
+def _report_summary_rows(*, org: Organization, start_date: date, end_date: date) -> list[tuple[str, Any, int, Any]]:
+    """Run ``REPORT_SUMMARY_SQL`` over the same range as :func:`note_list_for_org`."""
+    sql = REPORT_SUMMARY_SQL.format(
+        note=Note._meta.db_table,
+        team=Team._meta.db_table,
+        provided=Note.provided_services.through._meta.db_table,
+        requested=Note.requested_services.through._meta.db_table,
+        service_request=ServiceRequest._meta.db_table,
+        service=OrganizationService._meta.db_table,
     )
+    # Same bounds Django derives for ``interacted_at__gte=<date>``; days are cut in the current timezone like TruncDate.
+    default_tz = timezone.get_default_timezone()
+    params = {
+        "org_id": org.pk,
+        "start": datetime.combine(start_date, time.min, tzinfo=default_tz),
+        "end": datetime.combine(end_date + timedelta(days=1), time.min, tzinfo=default_tz),
+        "tz": timezone.get_current_timezone_name(),
+    }
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def _ranked(counts: dict[str, int], limit: int | None = None) -> list[dict[str, Any]]:
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    return [{"name": name, "count": count} for name, count in ranked[:limit]]
+
+
+def _report_summary_from_rows(
+    rows: list[tuple[str, Any, int, Any]], *, start_date: date, end_date: date
+) -> dict[str, Any]:
+    total_notes = unique_clients = 0
+    notes_by_date: list[dict[str, Any]] = []
+    clients_by_date: list[dict[str, Any]] = []
+    by_dimension: dict[str, dict[str, int]] = defaultdict(dict)
+
+    for dimension, key, count, clients in rows:
+        if dimension == "total":
+            total_notes, unique_clients = count, clients
+        elif dimension == "date":
+            notes_by_date.append({"date": key, "count": count})
+            if clients:
+                clients_by_date.append({"date": key, "count": clients})
+        elif key:  # skip notes without a team or purpose
+            by_dimension[dimension][key] = count
 
+    return {
+        "total_notes": total_notes,
+        "unique_clients": unique_clients,
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "notes_by_date": sorted(notes_by_date, key=itemgetter("date")),
+        "notes_by_team": _ranked(by_dimension["team"]),
+        "notes_by_purpose": _ranked(by_dimension["purpose"], SUMMARY_TOP_PURPOSES),
+        "unique_clients_by_date": sorted(clients_by_date, key=itemgetter("date")),
+        "top_provided_services": _ranked(by_dimension["provided_services"], SUMMARY_TOP_SERVICES),
+        "top_requested_services": _ranked(by_dimension["requested_services"], SUMMARY_TOP_SERVICES),
+    }
+
+
+def _report_summary_cache_key(*, org: Organization, start_date: date, end_date: date) -> str | None:
+    if not settings.REPORT_SUMMARY_CACHE_TTL:
+        return None
 
-def _dates_to_iso(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """Convert date objects in aggregation results to ISO strings."""
-    for entry in rows:
-        if hasattr(entry["date"], "isoformat"):
-            entry["date"] = entry["date"].isoformat()
-    return rows
+    generation = cache.get(report_summary_generation_key(org.pk), "0")
+    tz = timezone.get_current_timezone_name()
+    return f"reports:summary:{org.pk}:{generation}:{start_date.isoformat()}:{end_date.isoformat()}:{tz}"
 
 
 def report_summary(*, org: Organization, start_date: date, end_date: date) -> dict[str, Any]:
@@ -140,18 +201,17 @@ def report_summary(*, org: Organization, start_date: date, end_date: date) -> di
     Build the full report summary for an organization and date range.
 
     Returns a dict ready to be serialized by the GraphQL layer or a DRF view.
+    Computed with a single query and cached per organization and range for
+    ``REPORT_SUMMARY_CACHE_TTL`` seconds; note writes invalidate the
+    organization's entries (see ``reports.signals``).
     """
-    notes = note_list_for_org(org=org, start_date=start_date, end_date=end_date)
+    cache_key = _report_summary_cache_key(org=org, start_date=start_date, end_date=end_date)
+    if cache_key is not None and (cached := cache.get(cache_key)) is not None:
+        return cast(dict[str, Any], cached)
 
-    return {
-        "total_notes": notes.count(),
-        "unique_clients": note_unique_clients_count(notes=notes),
-        "start_date": start_date.isoformat(),
-        "end_date": end_date.isoformat(),
-        "notes_by_date": _dates_to_iso(note_count_by_date(notes=notes)),
-        "notes_by_team": note_count_by_team(notes=notes),
-        "notes_by_purpose": note_count_by_purpose(notes=notes),
-        "unique_clients_by_date": _dates_to_iso(note_unique_clients_by_date(notes=notes)),
-        "top_provided_services": note_top_services(notes=notes, relation="provided_services"),
-        "top_requested_services": note_top_services(notes=notes, relation="requested_services"),
-    }
+    rows = _report_summary_rows(org=org, start_date=start_date, end_date=end_date)
+    summary = _report_summary_from_rows(rows, start_date=start_date, end_date=end_date)
+
+    if cache_key is not None:
+        cache.set(cache_key, summary, settings.REPORT_SUMMARY_CACHE_TTL)
+    return summary
@@ -1,13 +1,40 @@
-from datetime import datetime, timedelta
-from typing import Any
+import csv
+from collections.abc import Callable, Iterable
+from datetime import date, datetime, time, timedelta
+from io import StringIO
+from tempfile import SpooledTemporaryFile
+from typing import IO, Any, Iterator, NamedTuple, TypeVar
 
+from accounts.models import User
+from django.core.exceptions import ValidationError
+from django.core.files import File
 from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from django.db.models import Q, QuerySet
 from django.utils import timezone
 from notes.admin import NoteResource
+from notes.models import Note
+from organizations.models import Organization
 from post_office import mail
+from shelters.models import Shelter
+from shelters.selectors import shelters_occupancy_metrics
+from shelters.types.filters import SHELTER_SCHEDULE_TIME_ZONE
 
-from .models import ScheduledReport
-from .selectors import note_list_for_org
+from .enums import ExportJobStatusEnum, ExportJobTypeEnum
+from .export_options import MetricsExportOptions
+from .export_to_csv import stream_metrics_zip
+from .export_to_xlsx import shelters_metrics_to_xlsx
+from .models import ExportJob, ScheduledReport
+from .selectors import note_list_for_export, note_list_for_org
+
+T = TypeVar("T")
+
+# Notes fetched per server-side cursor round trip (and per prefetch batch) when streaming exports.
+EXPORT_CHUNK_SIZE = 2000
+# Buffered CSV text is flushed to the response once it grows past this many characters.
+EXPORT_FLUSH_SIZE = 64 * 1024
+# How long a dispatched scheduled report stays claimed before it can be dispatched again.
+SCHEDULED_REPORT_CLAIM_LEASE = timedelta(hours=1)
 
 
 def get_previous_month_range() -> tuple[datetime, datetime]:
@@ -24,6 +51,39 @@ def get_previous_month_range() -> tuple[datetime, datetime]:
     return (first_day_previous, first_day_current)
 
 
+class ClaimedReport(NamedTuple):
+    id: int
+    organization_id: int
+    report_type: str
+
+
+def scheduled_reports_claim_due(
+    *, now: datetime, lease: timedelta = SCHEDULED_REPORT_CLAIM_LEASE
+) -> list[ClaimedReport]:
+    """
+    Claim every active report that is due and not already claimed, in one ``UPDATE ... RETURNING``.
+
+    A claim lasts for *lease*. The send clears it once the schedule has advanced.
+    A send that never finishes leaves the claim to lapse, and the report is then
+    claimed again. Concurrent dispatchers can't both claim a report: the loser
+    re-checks ``claimed_until`` after waiting for the winner's row lock.
+    """
+    table = connection.ops.quote_name(ScheduledReport._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {table}
+            SET claimed_until = %s
+            WHERE is_active
+              AND next_run_at <= %s
+              AND (claimed_until IS NULL OR claimed_until <= %s)
+            RETURNING id, organization_id, report_type
+            """,
+            [now + lease, now, now],
+        )
+        return [ClaimedReport(*row) for row in cursor.fetchall()]
+
+
 def generate_report_data(
     report: ScheduledReport, start_date: datetime, end_date: datetime
 ) -> tuple[str, str, dict[str, Any]]:
@@ -49,6 +109,36 @@ def generate_report_data(
     raise ValueError(f"Unknown report type: {report.report_type}")
 
 
+def stream_interaction_data_csv(
+    *,
+    notes: QuerySet[Note],
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+    on_progress: Callable[[int], None] | None = None,
+) -> Iterator[str]:
+    """
+    Yield the interaction data CSV for ``notes`` in pieces.
+
+    Produces the same columns and formatting as ``NoteResource().export(...).csv``
+    while holding at most one chunk of notes in memory. ``on_progress`` is called
+    with the number of notes written so far each time a piece is flushed.
+    """
+    resource = NoteResource()
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(resource.get_export_headers())
+    for written, note in enumerate(note_list_for_export(notes=notes).iterator(chunk_size=chunk_size), start=1):
+        writer.writerow(resource.export_resource(note))
+        if buffer.tell() >= EXPORT_FLUSH_SIZE:
+            if on_progress is not None:
+                on_progress(written)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue()
+
+
 def send_report_email(
     report: ScheduledReport,
     filename: str,
@@ -73,3 +163,172 @@ def send_report_email(
             filename: ContentFile(content.encode("utf-8")),
         },
     )
+
+
+# ── Export jobs ───────────────────────────────────────────────────────────────
+
+# Job progress is written back at most once per this many percentage points.
+EXPORT_JOB_PROGRESS_STEP = 5
+# Job files up to this size are built in memory before upload; larger ones roll over to disk.
+EXPORT_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+# A running job whose worker hasn't renewed its lease for this long is failed by ``fail_stale_export_jobs``.
+EXPORT_JOB_LEASE = timedelta(minutes=10)
+# How often a running job renews its lease while it makes progress.
+EXPORT_JOB_HEARTBEAT = timedelta(minutes=1)
+
+
+def export_job_create(
+    *,
+    user: User,
+    organization: Organization,
+    export_type: ExportJobTypeEnum,
+    start_date: date,
+    end_date: date,
+    shelter_ids: list[int] | None = None,
+    metric_options: list[MetricsExportOptions] | None = None,
+) -> ExportJob:
+    """
+    Record an export request and queue ``run_export_job`` once the transaction commits.
+
+    Shelter metric exports cover every shelter of *organization* unless
+    *shelter_ids* narrows them down; interaction data ignores both shelter
+    arguments.
+    """
+    if start_date > end_date:
+        raise ValidationError("start_date must be before or equal to end_date.")
+
+    parameters: dict[str, Any] = {"start_date": start_date.isoformat(), "end_date": end_date.isoformat()}
+
+    if export_type != ExportJobTypeEnum.INTERACTION_DATA_CSV:
+        if not metric_options:
+            raise ValidationError("At least one metric export option must be selected.")
+        parameters["metric_options"] = [str(option) for option in dict.fromkeys(metric_options)]
+
+        if shelter_ids is not None:
+            shelter_ids = sorted(set(shelter_ids))
+            found = Shelter.objects.filter(organization=organization, pk__in=shelter_ids).count()
+            if found != len(shelter_ids):
+                raise ValidationError("Every shelter must belong to the organization.")
+        parameters["shelter_ids"] = shelter_ids
+
+    job = ExportJob.objects.create(
+        organization=organization,
+        requested_by=user,
+        export_type=export_type,
+        parameters=parameters,
+    )
+
+    # Imported here: tasks imports this module.
+    from .tasks import run_export_job
+
+    transaction.on_commit(lambda: run_export_job.delay(str(job.pk)))
+    return job
+
+
+def export_job_run(*, job: ExportJob) -> None:
+    """Write *job*'s export to a spooled temporary file, save it to the default storage and mark the job done."""
+    filename, output = _export_job_file(job=job, on_progress=_ExportJobProgress(job))
+
+    with output:
+        output.seek(0)
+        job.file.save(filename, File(output), save=False)
+
+    job.status = ExportJobStatusEnum.SUCCEEDED
+    job.progress = 100
+    job.finished_at = timezone.now()
+    job.claimed_until = None
+    job.save(update_fields=["file", "status", "progress", "finished_at", "claimed_until"])
+
+
+def export_jobs_fail_stale(*, now: datetime, lease: timedelta = EXPORT_JOB_LEASE) -> int:
+    """
+    Fail running jobs whose worker stopped renewing the lease (it died or was killed mid-export).
+
+    Jobs are failed rather than requeued: an export that takes its worker down
+    would otherwise be retried forever. Returns the number of jobs failed.
+    """
+    return ExportJob.objects.filter(
+        Q(claimed_until__lt=now) | Q(claimed_until=None, started_at__lt=now - lease),
+        status=ExportJobStatusEnum.RUNNING,
+    ).update(
+        status=ExportJobStatusEnum.FAILED,
+        error_message="The export stopped before it finished. Please request it again.",
+        finished_at=now,
+        claimed_until=None,
+    )
+
+
+class _ExportJobProgress:
+    """
+    Writes a job's percent complete, throttled to ``EXPORT_JOB_PROGRESS_STEP``; 100 is left for ``export_job_run``.
+
+    Also renews the job's lease at least every ``EXPORT_JOB_HEARTBEAT``.
+    """
+
+    def __init__(self, job: ExportJob) -> None:
+        self.job_id = job.pk
+        self.reported = job.progress
+        self.renewed_at = timezone.now()
+
+    def __call__(self, done: int, total: int) -> None:
+        percent = min(99, done * 100 // total) if total else 0
+        now = timezone.now()
+        changes: dict[str, Any] = {}
+        if percent - self.reported >= EXPORT_JOB_PROGRESS_STEP:
+            changes["progress"] = self.reported = percent
+        if changes or now - self.renewed_at >= EXPORT_JOB_HEARTBEAT:
+            changes["claimed_until"] = now + EXPORT_JOB_LEASE
+            self.renewed_at = now
+            ExportJob.objects.filter(pk=self.job_id, status=ExportJobStatusEnum.RUNNING).update(**changes)
+
+
+def _export_job_file(*, job: ExportJob, on_progress: Callable[[int, int], None]) -> tuple[str, IO[bytes]]:
+    start_date = date.fromisoformat(job.parameters["start_date"])
+    end_date = date.fromisoformat(job.parameters["end_date"])
+    start_str = start_date.strftime("%Y%m%d")
+    end_str = end_date.strftime("%Y%m%d")
+    output: SpooledTemporaryFile[bytes]
+
+    if job.export_type == ExportJobTypeEnum.INTERACTION_DATA_CSV:
+        notes = note_list_for_org(org=job.organization, start_date=start_date, end_date=end_date).order_by(
+            "interacted_at"
+        )
+        total = notes.count()
+        output = SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE)
+        for chunk in stream_interaction_data_csv(notes=notes, on_progress=lambda done: on_progress(done, total)):
+            output.write(chunk.encode())
+        return f"interaction_data_{start_str}_{end_str}.csv", output
+
+    shelters = Shelter.objects.filter(organization=job.organization).order_by("pk")
+    if job.parameters.get("shelter_ids") is not None:
+        shelters = shelters.filter(pk__in=job.parameters["shelter_ids"])
+    total = shelters.count()
+
+    tz = SHELTER_SCHEDULE_TIME_ZONE
+    metrics = _with_progress(
+        shelters_occupancy_metrics(
+            shelters=shelters.iterator(),
+            start=datetime.combine(start_date, time.min, tzinfo=tz),
+            end=datetime.combine(end_date, time.min, tzinfo=tz) + timedelta(days=1),
+        ),
+        total=total,
+        on_progress=on_progress,
+    )
+    options = [MetricsExportOptions(option) for option in job.parameters["metric_options"]]
+
+    if job.export_type == ExportJobTypeEnum.SHELTER_METRICS_XLSX:
+        return shelters_metrics_to_xlsx(metrics, options, start_date=start_date, end_date=end_date)
+
+    if job.export_type == ExportJobTypeEnum.SHELTER_METRICS_ZIP:
+        output = SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE)
+        for chunk in stream_metrics_zip(metrics, options):
+            output.write(chunk)
+        return f"{start_str}_{end_str}_shelter_metrics.zip", output
+
+    raise ValueError(f"Unknown export type: {job.export_type}")
+
+
+def _with_progress(items: Iterable[T], *, total: int, on_progress: Callable[[int, int], None]) -> Iterator[T]:
+    for done, item in enumerate(items, start=1):
+        yield item
+        on_progress(done, total)
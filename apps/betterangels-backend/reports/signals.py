@@ -0,0 +1,37 @@
+from typing import Any
+
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from notes.models import Note
+
+from .cache import report_summary_invalidate
+
+
+@receiver(post_save, sender=Note)
+@receiver(post_delete, sender=Note)
+def invalidate_report_summary_on_note_change(sender: Any, instance: Note, **kwargs: Any) -> None:
+    report_summary_invalidate(organization_id=instance.organization_id)
+
+
+@receiver(m2m_changed, sender=Note.provided_services.through)
+@receiver(m2m_changed, sender=Note.requested_services.through)
+def invalidate_report_summary_on_note_services_change(
+    sender: Any, instance: Any, action: str, reverse: bool, pk_set: set[Any] | None, **kwargs: Any
+) -> None:
+    if not reverse:
+        if action.startswith("post_"):
+            report_summary_invalidate(organization_id=instance.organization_id)
+        return
+
+    # Changed from the service-request side: *pk_set* holds note ids, except for
+    # a clear, whose notes can only be looked up before the links are removed.
+    if action in ("post_add", "post_remove"):
+        notes = Note.objects.filter(pk__in=pk_set or ())
+    elif action == "pre_clear":
+        notes = Note.objects.filter(Q(provided_services=instance) | Q(requested_services=instance))
+    else:
+        return
+
+    for organization_id in notes.values_list("organization_id", flat=True).distinct():
+        report_summary_invalidate(organization_id=organization_id)
@@ -1,14 +1,25 @@
 """Reports app Celery tasks."""
 
 import logging
+from collections import defaultdict
+from datetime import datetime
 from typing import Any
 
 from celery import Task, shared_task
 from common.celery import single_instance
 from django.utils import timezone
 
-from .models import ScheduledReport
-from .services import generate_report_data, get_previous_month_range, send_report_email
+from .enums import ExportJobStatusEnum
+from .models import ExportJob, ScheduledReport
+from .services import (
+    EXPORT_JOB_LEASE,
+    export_job_run,
+    export_jobs_fail_stale,
+    generate_report_data,
+    get_previous_month_range,
+    scheduled_reports_claim_due,
+    send_report_email,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,16 +33,55 @@ def process_scheduled_reports(self: Task) -> str:
     """
     Dispatcher Task: Runs hourly (via Celery Beat) to check for reports due now.
 
-    It finds active scheduled reports where next_run_at is in the past.
+    It claims active scheduled reports where next_run_at is in the past, so a
+    report still being sent isn't queued again, and queues one send per
+    organization and report type so their shared data is generated once.
     """
-    now = timezone.now()
-    # Simple query: give me everything that is active and due
-    reports_due = ScheduledReport.objects.filter(is_active=True, next_run_at__lte=now)
+    claimed = scheduled_reports_claim_due(now=timezone.now())
+
+    batches: defaultdict[tuple[int, str], list[int]] = defaultdict(list)
+    for report in claimed:
+        batches[report.organization_id, report.report_type].append(report.id)
 
-    for report in reports_due:
-        send_scheduled_report.delay(report.pk)
+    for report_ids in batches.values():
+        send_scheduled_reports.delay(sorted(report_ids))
 
-    return f"Queued {len(reports_due)} reports for processing"
+    return f"Queued {len(claimed)} reports for processing in {len(batches)} batches"
+
+
+@shared_task(bind=True)
+def send_scheduled_reports(self: Task, report_ids: list[int]) -> list[dict[str, Any]]:
+    """
+    Send scheduled reports that share an organization and report type.
+
+    The report data is generated once, from the first report, and attached to
+    every report's email.  A report that fails to send gets an error result
+    and its claim released; the rest of the batch still goes out.
+
+    Args:
+        report_ids: IDs of ScheduledReports with the same organization and report type.
+    """
+    reports = list(ScheduledReport.objects.select_related("organization").filter(pk__in=report_ids).order_by("pk"))
+    if not reports:
+        return []
+
+    start_date, end_date = get_previous_month_range()
+
+    try:
+        filename, csv_content, meta = generate_report_data(reports[0], start_date, end_date)
+    except ValueError as e:
+        return [{"status": "error", "report_id": report.pk, "message": str(e)} for report in reports]
+
+    results = []
+    for report in reports:
+        try:
+            results.append(_deliver_scheduled_report(report, start_date, filename, csv_content, meta))
+        except Exception as e:
+            logger.exception("Scheduled report %s failed", report.pk)
+            ScheduledReport.objects.filter(pk=report.pk).update(claimed_until=None)
+            results.append({"status": "error", "report_id": report.pk, "message": str(e)})
+
+    return results
 
 
 @shared_task(bind=True)
@@ -50,8 +100,6 @@ def send_scheduled_report(self: Task, report_id: int, recipient_override: str |
 
     # Calculate the date range for the previous month
     start_date, end_date = get_previous_month_range()
-    month_str = start_date.strftime("%m")
-    year_str = start_date.strftime("%Y")
 
     # Generate content
     try:
@@ -59,6 +107,20 @@ def send_scheduled_report(self: Task, report_id: int, recipient_override: str |
     except ValueError as e:
         return {"status": "error", "message": str(e)}
 
+    return _deliver_scheduled_report(report, start_date, filename, csv_content, meta, recipient_override)
+
+
+def _deliver_scheduled_report(
+    report: ScheduledReport,
+    start_date: datetime,
+    filename: str,
+    csv_content: str,
+    meta: dict[str, Any],
+    recipient_override: str | None = None,
+) -> dict[str, Any]:
+    month_str = start_date.strftime("%m")
+    year_str = start_date.strftime("%Y")
+
     if not csv_content:
         return {"status": "error", "message": "No content generated"}
 
@@ -71,7 +133,8 @@ def send_scheduled_report(self: Task, report_id: int, recipient_override: str |
         # we don't end up in an infinite retry loop every hour. (At-most-once delivery)
         report.last_sent_at = timezone.now()
         report.set_next_run()  # Calculate for next month
-        report.save(update_fields=["last_sent_at", "next_run_at"])
+        report.claimed_until = None
+        report.save(update_fields=["last_sent_at", "next_run_at", "claimed_until"])
 
     # Send Email
     recipients = [recipient_override] if recipient_override else report.get_recipient_list()
@@ -79,7 +142,7 @@ def send_scheduled_report(self: Task, report_id: int, recipient_override: str |
 
     return {
         "status": "success",
-        "report_id": report_id,
+        "report_id": report.pk,
         "report_name": report.name,
         "recipients": recipients,
         "month": month_str,
@@ -88,3 +151,51 @@ def send_scheduled_report(self: Task, report_id: int, recipient_override: str |
         "subject": subject,
         **meta,
     }
+
+
+@shared_task(bind=True)
+def run_export_job(self: Task, job_id: str) -> dict[str, Any]:
+    """
+    Produce an ExportJob's file in the background and upload it to the default storage.
+
+    The job is claimed by moving it from pending to running in one UPDATE, so a
+    redelivered message doesn't export the same job twice. The claim holds a
+    lease that progress updates renew; ``fail_stale_export_jobs`` fails the job
+    if the worker dies and the lease runs out.
+
+    Args:
+        job_id: The ID of the ExportJob to run.
+    """
+    now = timezone.now()
+    claimed = ExportJob.objects.filter(pk=job_id, status=ExportJobStatusEnum.PENDING).update(
+        status=ExportJobStatusEnum.RUNNING, started_at=now, claimed_until=now + EXPORT_JOB_LEASE
+    )
+    if not claimed:
+        return {"status": "skipped", "job_id": job_id, "message": "ExportJob is not pending"}
+
+    job = ExportJob.objects.select_related("organization").get(pk=job_id)
+
+    try:
+        export_job_run(job=job)
+    except Exception as e:
+        logger.exception("Export job %s failed", job_id)
+        ExportJob.objects.filter(pk=job_id).update(
+            status=ExportJobStatusEnum.FAILED, error_message=str(e), finished_at=timezone.now(), claimed_until=None
+        )
+        return {"status": "error", "job_id": job_id, "message": str(e)}
+
+    return {"status": "success", "job_id": job_id, "file": job.file.name}
+
+
+@shared_task(bind=True)
+@single_instance(
+    lock_key="celery-lock:reports.tasks.fail_stale_export_jobs",
+    lock_ttl=60 * 5,  # 5 minutes
+)
+def fail_stale_export_jobs(self: Task) -> str:
+    """
+    Periodic Task: Runs every ten minutes (via Celery Beat) to fail running
+    export jobs whose worker stopped renewing the lease.
+    """
+    failed = export_jobs_fail_stale(now=timezone.now())
+    return f"Failed {failed} stale export jobs"
@@ -0,0 +1,393 @@
+"""Tests for background export jobs: service, Celery task and GraphQL API."""
+
+import csv
+import zipfile
+from datetime import date, datetime, timedelta
+from io import StringIO
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+import time_machine
+from accounts.models import Organization, User
+from common.tests.utils import GraphQLBaseTestCase
+from django.core.exceptions import ValidationError
+from django.test import ignore_warnings, override_settings
+from django.utils import timezone
+from model_bakery import baker
+from notes.models import Note
+from openpyxl import load_workbook
+from shelters.tests.baker_recipes import shelter_recipe
+
+from reports.enums import ExportJobStatusEnum, ExportJobTypeEnum
+from reports.export_options import MetricsExportOptions
+from reports.models import ExportJob
+from reports.services import (
+    EXPORT_JOB_HEARTBEAT,
+    EXPORT_JOB_LEASE,
+    _ExportJobProgress,
+    export_job_create,
+    export_job_run,
+)
+from reports.tasks import fail_stale_export_jobs, run_export_job
+from reports.tests.test_views import grant_view_reports
+
+IN_MEMORY_STORAGES = {"default": {"BACKEND": "django.core.files.storage.InMemoryStorage"}}
+
+
+@pytest.fixture(autouse=True)
+def _use_in_memory_storage(settings):  # type: ignore[no-untyped-def]
+    """Stand in for S3 so export files stay in memory."""
+    settings.STORAGES = IN_MEMORY_STORAGES
+
+
+@pytest.fixture
+def org() -> Organization:
+    return baker.make(Organization)
+
+
+@pytest.fixture
+def user(org: Organization) -> User:
+    user = baker.make(User)
+    org.add_user(user)
+    return user
+
+
+def _make_job(org: Organization, user: User, export_type: ExportJobTypeEnum, **parameters: Any) -> ExportJob:
+    return baker.make(
+        ExportJob,
+        organization=org,
+        requested_by=user,
+        export_type=export_type,
+        parameters={"start_date": "2025-01-01", "end_date": "2025-01-31", **parameters},
+    )
+
+
+@pytest.mark.django_db
+class TestExportJobCreate:
+    def test_queues_the_job_once_committed(
+        self, org: Organization, user: User, django_capture_on_commit_callbacks: Any
+    ) -> None:
+        shelter = shelter_recipe.make(organization=org)
+
+        with patch("reports.tasks.run_export_job.delay") as mock_delay:
+            with django_capture_on_commit_callbacks(execute=True):
+                job = export_job_create(
+                    user=user,
+                    organization=org,
+                    export_type=ExportJobTypeEnum.SHELTER_METRICS_XLSX,
+                    start_date=date(2025, 1, 1),
+                    end_date=date(2025, 1, 31),
+                    shelter_ids=[shelter.pk, shelter.pk],
+                    metric_options=[MetricsExportOptions.DAILY_OCCUPANCY_METRICS],
+                )
+
+        mock_delay.assert_called_once_with(str(job.pk))
+        assert job.status == ExportJobStatusEnum.PENDING
+        assert job.parameters == {
+            "start_date": "2025-01-01",
+            "end_date": "2025-01-31",
+            "metric_options": ["daily_occupancy_metrics"],
+            "shelter_ids": [shelter.pk],
+        }
+
+    def test_rejects_reversed_date_range(self, org: Organization, user: User) -> None:
+        with pytest.raises(ValidationError, match="start_date"):
+            export_job_create(
+                user=user,
+                organization=org,
+                export_type=ExportJobTypeEnum.INTERACTION_DATA_CSV,
+                start_date=date(2025, 2, 1),
+                end_date=date(2025, 1, 1),
+            )
+
+    def test_metric_exports_need_options(self, org: Organization, user: User) -> None:
+        with pytest.raises(ValidationError, match="At least one"):
+            export_job_create(
+                user=user,
+                organization=org,
+                export_type=ExportJobTypeEnum.SHELTER_METRICS_ZIP,
+                start_date=date(2025, 1, 1),
+                end_date=date(2025, 1, 31),
+            )
+
+    def test_rejects_shelters_of_other_organizations(self, org: Organization, user: User) -> None:
+        other_shelter = shelter_recipe.make(organization=baker.make(Organization))
+
+        with pytest.raises(ValidationError, match="belong to the organization"):
+            export_job_create(
+                user=user,
+                organization=org,
+                export_type=ExportJobTypeEnum.SHELTER_METRICS_ZIP,
+                start_date=date(2025, 1, 1),
+                end_date=date(2025, 1, 31),
+                shelter_ids=[other_shelter.pk],
+                metric_options=[MetricsExportOptions.RESERVATION_METRICS],
+            )
+        assert not ExportJob.objects.exists()
+
+
+@pytest.mark.django_db
+class TestRunExportJob:
+    def test_interaction_data_csv(self, org: Organization, user: User) -> None:
+        baker.make(
+            Note,
+            organization=org,
+            interacted_at=timezone.make_aware(datetime(2025, 1, 10, 12, 0, 0)),
+            _quantity=3,
+        )
+        baker.make(Note, organization=org, interacted_at=timezone.make_aware(datetime(2025, 2, 10, 12, 0, 0)))
+        job = _make_job(org, user, ExportJobTypeEnum.INTERACTION_DATA_CSV)
+
+        result = run_export_job.apply(args=(str(job.pk),)).get()
+
+        job.refresh_from_db()
+        assert result["status"] == "success"
+        assert job.status == ExportJobStatusEnum.SUCCEEDED
+        assert job.progress == 100
+        assert job.started_at is not None and job.finished_at is not None
+        assert job.file.name == f"reports/exports/{job.pk}/interaction_data_20250101_20250131.csv"
+        with job.file.open("rb") as f:
+            rows = list(csv.reader(StringIO(f.read().decode())))
+        assert len(rows) == 4
+
+    def test_shelter_metrics_xlsx(self, org: Organization, user: User) -> None:
+        shelter = shelter_recipe.make(organization=org)
+        shelter_recipe.make(organization=baker.make(Organization))
+        job = _make_job(
+            org,
+            user,
+            ExportJobTypeEnum.SHELTER_METRICS_XLSX,
+            shelter_ids=None,
+            metric_options=["daily_occupancy_metrics", "reservation_metrics"],
+        )
+
+        run_export_job.apply(args=(str(job.pk),)).get()
+
+        job.refresh_from_db()
+        assert job.status == ExportJobStatusEnum.SUCCEEDED
+        with job.file.open("rb") as f:
+            workbook = load_workbook(f)
+        assert workbook.sheetnames == ["Daily Occupancy", "Reservation Metrics"]
+        daily_rows = list(workbook["Daily Occupancy"].iter_rows(values_only=True))
+        assert len(daily_rows) == 1 + 31
+        assert {row[1] for row in daily_rows[1:]} == {str(shelter.pk)}
+
+    def test_shelter_metrics_zip(self, org: Organization, user: User) -> None:
+        shelter_1 = shelter_recipe.make(organization=org)
+        shelter_2 = shelter_recipe.make(organization=org)
+        shelter_recipe.make(organization=org)
+        job = _make_job(
+            org,
+            user,
+            ExportJobTypeEnum.SHELTER_METRICS_ZIP,
+            shelter_ids=[shelter_1.pk, shelter_2.pk],
+            metric_options=["avg_days_to_occupancy"],
+        )
+
+        run_export_job.apply(args=(str(job.pk),)).get()
+
+        job.refresh_from_db()
+        assert job.file.name.endswith("20250101_20250131_shelter_metrics.zip")
+        with job.file.open("rb") as f, zipfile.ZipFile(f) as zip_file:
+            assert zip_file.namelist() == [
+                f"{shelter_1.pk}/20250101_20250131_avg_days_to_occupancy.csv",
+                f"{shelter_2.pk}/20250101_20250131_avg_days_to_occupancy.csv",
+            ]
+
+    def test_skips_jobs_that_are_not_pending(self, org: Organization, user: User) -> None:
+        job = _make_job(org, user, ExportJobTypeEnum.INTERACTION_DATA_CSV)
+        ExportJob.objects.filter(pk=job.pk).update(status=ExportJobStatusEnum.RUNNING)
+
+        with patch("reports.tasks.export_job_run") as mock_run:
+            result = run_export_job.apply(args=(str(job.pk),)).get()
+
+        assert result["status"] == "skipped"
+        mock_run.assert_not_called()
+
+    @patch("reports.tasks.export_job_run", side_effect=RuntimeError("boom"))
+    def test_records_failures(self, mock_run: MagicMock, org: Organization, user: User) -> None:
+        job = _make_job(org, user, ExportJobTypeEnum.INTERACTION_DATA_CSV)
+
+        result = run_export_job.apply(args=(str(job.pk),)).get()
+
+        job.refresh_from_db()
+        assert result == {"status": "error", "job_id": str(job.pk), "message": "boom"}
+        assert job.status == ExportJobStatusEnum.FAILED
+        assert job.error_message == "boom"
+        assert not job.file
+
+    def test_holds_a_lease_while_running(self, org: Organization, user: User) -> None:
+        job = _make_job(org, user, ExportJobTypeEnum.INTERACTION_DATA_CSV)
+        leases: list[datetime | None] = []
+
+        def run(*, job: ExportJob) -> None:
+            leases.append(ExportJob.objects.get(pk=job.pk).claimed_until)
+            export_job_run(job=job)
+
+        with time_machine.travel("2025-01-15 10:30:00", tick=False):
+            with patch("reports.tasks.export_job_run", side_effect=run):
+                run_export_job.apply(args=(str(job.pk),)).get()
+
+            assert leases == [timezone.now() + EXPORT_JOB_LEASE]
+        job.refresh_from_db()
+        assert job.status == ExportJobStatusEnum.SUCCEEDED
+        assert job.claimed_until is None
+
+    def test_progress_renews_the_lease(self, org: Organization, user: User) -> None:
+        job = _make_job(org, user, ExportJobTypeEnum.INTERACTION_DATA_CSV)
+        ExportJob.objects.filter(pk=job.pk).update(status=ExportJobStatusEnum.RUNNING)
+
+        with time_machine.travel("2025-01-15 10:30:00", tick=False) as traveller:
+            on_progress = _ExportJobProgress(job)
+            on_progress(1, 1000)
+            job.refresh_from_db()
+            assert job.claimed_until is None
+
+            # Below the progress step, but the heartbeat is due.
+            traveller.shift(EXPORT_JOB_HEARTBEAT)
+            on_progress(2, 1000)
+            job.refresh_from_db()
+            assert job.claimed_until == timezone.now() + EXPORT_JOB_LEASE
+            assert job.progress == 0
+
+
+@pytest.mark.django_db
+class TestFailStaleExportJobs:
+    @time_machine.travel("2025-01-15 10:30:00", tick=False)
+    def test_fails_running_jobs_past_their_lease(self, org: Organization, user: User) -> None:
+        now = timezone.now()
+
+        def running(claimed_until: datetime | None) -> ExportJob:
+            job = _make_job(org, user, ExportJobTypeEnum.INTERACTION_DATA_CSV)
+            ExportJob.objects.filter(pk=job.pk).update(
+                status=ExportJobStatusEnum.RUNNING, started_at=now - timedelta(hours=1), claimed_until=claimed_until
+            )
+            return job
+
+        stale = running(now - timedelta(minutes=1))
+        live = running(now + timedelta(minutes=1))
+        # Claimed before leases existed.
+        unleased = running(None)
+        pending = _make_job(org, user, ExportJobTypeEnum.INTERACTION_DATA_CSV)
+
+        result = fail_stale_export_jobs.apply().get()
+
+        assert result == "Failed 2 stale export jobs"
+        statuses = dict(ExportJob.objects.values_list("pk", "status"))
+        assert statuses == {
+            stale.pk: ExportJobStatusEnum.FAILED,
+            live.pk: ExportJobStatusEnum.RUNNING,
+            unleased.pk: ExportJobStatusEnum.FAILED,
+            pending.pk: ExportJobStatusEnum.PENDING,
+        }
+        stale.refresh_from_db()
+        assert stale.finished_at == now
+        assert stale.claimed_until is None
+        assert stale.error_message
+
+
+CREATE_EXPORT_JOB_MUTATION = """
+    mutation CreateExportJob($data: CreateExportJobInput!) {
+        createExportJob(data: $data) {
+            ... on ExportJobType {
+                id
+                exportType
+                status
+                progress
+            }
+            ... on OperationInfo {
+                messages {
+                    message
+                }
+            }
+        }
+    }
+"""
+
+EXPORT_JOB_QUERY = """
+    query ExportJob($pk: ID!) {
+        exportJob(pk: $pk) {
+            id
+            status
+            progress
+            filename
+            downloadUrl
+        }
+    }
+"""
+
+
+@ignore_warnings(category=UserWarning)
+@override_settings(STORAGES=IN_MEMORY_STORAGES)
+class TestExportJobGraphQL(GraphQLBaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        grant_view_reports(self.org_1_case_manager_1, self.org_1)
+        self.graphql_client.force_login(self.org_1_case_manager_1)
+
+    def _create_export_job(self) -> dict[str, Any]:
+        with patch("reports.tasks.run_export_job.delay") as mock_delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.execute_graphql(
+                    CREATE_EXPORT_JOB_MUTATION,
+                    {
+                        "data": {
+                            "exportType": "INTERACTION_DATA_CSV",
+                            "startDate": "2025-01-01",
+                            "endDate": "2025-01-31",
+                        }
+                    },
+                )
+
+        job = response["data"]["createExportJob"]
+        mock_delay.assert_called_once_with(job["id"])
+        return job
+
+    def test_submit_and_poll(self) -> None:
+        job = self._create_export_job()
+        self.assertEqual(job["exportType"], "INTERACTION_DATA_CSV")
+        self.assertEqual(job["status"], "PENDING")
+
+        response = self.execute_graphql(EXPORT_JOB_QUERY, {"pk": job["id"]})
+        self.assertIsNone(response["data"]["exportJob"]["downloadUrl"])
+
+        run_export_job.apply(args=(job["id"],)).get()
+
+        response = self.execute_graphql(EXPORT_JOB_QUERY, {"pk": job["id"]})
+        polled = response["data"]["exportJob"]
+        self.assertEqual(polled["status"], "SUCCEEDED")
+        self.assertEqual(polled["progress"], 100)
+        self.assertEqual(polled["filename"], "interaction_data_20250101_20250131.csv")
+        self.assertIn(f"reports/exports/{job['id']}/", polled["downloadUrl"])
+
+    def test_invalid_request_returns_operation_info(self) -> None:
+        response = self.execute_graphql(
+            CREATE_EXPORT_JOB_MUTATION,
+            {"data": {"exportType": "SHELTER_METRICS_ZIP", "startDate": "2025-01-01", "endDate": "2025-01-31"}},
+        )
+
+        messages = response["data"]["createExportJob"]["messages"]
+        self.assertIn("At least one metric export option", messages[0]["message"])
+        self.assertFalse(ExportJob.objects.exists())
+
+    def test_other_users_cannot_poll_a_job(self) -> None:
+        job = self._create_export_job()
+        grant_view_reports(self.org_1_case_manager_2, self.org_1)
+        self.graphql_client.force_login(self.org_1_case_manager_2)
+
+        response = self.execute_graphql(EXPORT_JOB_QUERY, {"pk": job["id"]})
+
+        self.assertIsNone(response["data"])
+        self.assertIn("permission to view this export", response["errors"][0]["message"])
+
+    def test_requires_view_reports(self) -> None:
+        self.graphql_client.force_login(self.org_1_case_manager_2)
+
+        response = self.execute_graphql(
+            CREATE_EXPORT_JOB_MUTATION,
+            {"data": {"exportType": "INTERACTION_DATA_CSV", "startDate": "2025-01-01", "endDate": "2025-01-31"}},
+        )
+
+        self.assertIsNotNone(response.get("errors"))
+        self.assertFalse(ExportJob.objects.exists())
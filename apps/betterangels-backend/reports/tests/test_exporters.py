@@ -1,11 +1,12 @@
 """Tests for report data export."""
 
 import csv
+import hashlib
 import json
 import zipfile
 from datetime import date
 from io import BytesIO, StringIO
-from typing import Any, cast
+from typing import Any, Iterator, cast
 
 import pytest
 from model_bakery import baker
@@ -29,9 +30,11 @@ from reports.export_to_csv import (
     metrics_to_zip,
     reservation_metrics_to_csv,
     rows_to_csv,
+    stream_metrics_zip,
+    stream_zip,
 )
 from reports.export_to_json import metrics_to_json
-from reports.export_to_xlsx import metrics_to_xlsx
+from reports.export_to_xlsx import metrics_to_xlsx, shelters_metrics_to_xlsx
 
 
 def _xlsx_rows(xlsx_content: bytes, worksheet_name: str = "Sheet1") -> list[list[Any]]:
@@ -338,6 +341,56 @@ class TestShelterMetricsExport:
                 [MetricsExportOptions.DAILY_OCCUPANCY_METRICS, cast(MetricsExportOptions, "unknown_metric")],
             )
 
+    def test_stream_zip_yields_archive_in_chunks(self) -> None:
+        # Hashes barely compress, so the archive spans several chunks.
+        lines = [f"{i},{hashlib.sha256(str(i).encode()).hexdigest()}\r\n" for i in range(5_000)]
+
+        chunks = list(stream_zip([("big.csv", iter(lines)), ("empty.csv", iter([]))], chunk_size=1024))
+
+        assert len(chunks) > 2
+        with zipfile.ZipFile(BytesIO(b"".join(chunks))) as zip_file:
+            assert zip_file.testzip() is None
+            assert zip_file.namelist() == ["big.csv", "empty.csv"]
+            assert zip_file.read("big.csv").decode() == "".join(lines)
+            assert zip_file.read("empty.csv") == b""
+
+    def test_stream_metrics_zip_writes_a_folder_per_shelter(self) -> None:
+        consumed: list[str] = []
+
+        def shelters_metrics() -> Iterator[ShelterOccupancyMetricsType]:
+            for shelter_id in ("shelter-1", "shelter-2"):
+                consumed.append(shelter_id)
+                metrics = _shelter_occupancy_metrics()
+                metrics.shelter_id = ID(shelter_id)
+                yield metrics
+
+        stream = stream_metrics_zip(
+            shelters_metrics(),
+            [MetricsExportOptions.DAILY_OCCUPANCY_METRICS, MetricsExportOptions.AVG_DAYS_TO_OCCUPANCY],
+        )
+        assert consumed == []
+
+        with zipfile.ZipFile(BytesIO(b"".join(stream))) as zip_file:
+            assert zip_file.namelist() == [
+                "shelter-1/20260601_20260630_daily_occupancy_metrics.csv",
+                "shelter-1/20260601_20260630_avg_days_to_occupancy.csv",
+                "shelter-2/20260601_20260630_daily_occupancy_metrics.csv",
+                "shelter-2/20260601_20260630_avg_days_to_occupancy.csv",
+            ]
+            daily_occupancy_rows = list(
+                csv.reader(StringIO(zip_file.read("shelter-2/20260601_20260630_daily_occupancy_metrics.csv").decode()))
+            )
+
+        assert consumed == ["shelter-1", "shelter-2"]
+        assert daily_occupancy_rows == [
+            ["date", "shelter_id", "occupied_count", "total_beds", "occupancy_pct"],
+            ["2026-06-01", "shelter-2", "8", "10", "80.0"],
+        ]
+
+    def test_stream_metrics_zip_rejects_empty_options_before_streaming(self) -> None:
+        with pytest.raises(ValueError, match="At least one"):
+            stream_metrics_zip([_shelter_occupancy_metrics()], [])
+
     def test_metrics_to_xlsx_exports_selected_metrics_as_worksheets(self) -> None:
         filename, xlsx_content = metrics_to_xlsx(
             _shelter_occupancy_metrics(),
@@ -394,6 +447,74 @@ class TestShelterMetricsExport:
                 [MetricsExportOptions.DAILY_OCCUPANCY_METRICS, cast(MetricsExportOptions, "unknown_metric")],
             )
 
+    def test_shelters_metrics_to_xlsx_streams_every_shelter_into_shared_worksheets(self) -> None:
+        consumed: list[str] = []
+
+        def shelters_metrics() -> Iterator[ShelterOccupancyMetricsType]:
+            for shelter_id in ("shelter-1", "shelter-2"):
+                consumed.append(shelter_id)
+                metrics = _shelter_occupancy_metrics()
+                metrics.shelter_id = ID(shelter_id)
+                yield metrics
+
+        filename, xlsx_file = shelters_metrics_to_xlsx(
+            shelters_metrics(),
+            _all_metric_export_options(),
+            start_date=date(2026, 6, 1),
+            end_date=date(2026, 6, 30),
+        )
+        with xlsx_file:
+            xlsx_content = xlsx_file.read()
+
+        assert consumed == ["shelter-1", "shelter-2"]
+        assert filename == "20260601_20260630_shelter_report.xlsx"
+        assert load_workbook(BytesIO(xlsx_content)).sheetnames == [
+            "Daily Occupancy",
+            "Daily Bed Status",
+            "Reservation Metrics",
+            "Avg Days To Occupancy",
+        ]
+        assert _xlsx_rows(xlsx_content, "Daily Occupancy") == [
+            ["date", "shelter_id", "occupied_count", "total_beds", "occupancy_pct"],
+            ["2026-06-01", "shelter-1", 8, 10, 80.0],
+            ["2026-06-01", "shelter-2", 8, 10, 80.0],
+        ]
+        assert _xlsx_rows(xlsx_content, "Avg Days To Occupancy") == [
+            ["start_date", "end_date", "shelter_id", "avg_days_to_occupancy"],
+            ["2026-06-01", "2026-06-30", "shelter-1", 4.5],
+            ["2026-06-01", "2026-06-30", "shelter-2", 4.5],
+        ]
+
+    def test_shelters_metrics_to_xlsx_exports_only_selected_metric_worksheets(self) -> None:
+        _, xlsx_file = shelters_metrics_to_xlsx(
+            [_shelter_occupancy_metrics()],
+            [MetricsExportOptions.RESERVATION_METRICS, MetricsExportOptions.DAILY_OCCUPANCY_METRICS],
+            start_date=date(2026, 6, 1),
+            end_date=date(2026, 6, 30),
+        )
+
+        with xlsx_file:
+            assert load_workbook(xlsx_file).sheetnames == ["Daily Occupancy", "Reservation Metrics"]
+
+    def test_shelters_metrics_to_xlsx_writes_empty_worksheets_without_shelters(self) -> None:
+        _, xlsx_file = shelters_metrics_to_xlsx(
+            [],
+            [MetricsExportOptions.DAILY_BED_STATUS_METRICS],
+            start_date=date(2026, 6, 1),
+            end_date=date(2026, 6, 30),
+        )
+
+        with xlsx_file:
+            rows = _xlsx_rows(xlsx_file.read(), "Daily Bed Status")
+
+        assert rows == []
+
+    def test_shelters_metrics_to_xlsx_rejects_empty_options(self) -> None:
+        with pytest.raises(ValueError, match="At least one"):
+            shelters_metrics_to_xlsx(
+                [_shelter_occupancy_metrics()], [], start_date=date(2026, 6, 1), end_date=date(2026, 6, 30)
+            )
+
     def test_metrics_to_json_exports_selected_metrics_as_date_keyed_report(self) -> None:
         filename, json_content = metrics_to_json(
             _shelter_occupancy_metrics(),
@@ -0,0 +1,165 @@
+from datetime import date, datetime
+from typing import Any, Callable
+
+import pytest
+from accounts.models import Organization
+from clients.models import ClientProfile
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from model_bakery import baker
+from notes.models import Note, OrganizationService, ServiceRequest
+from reports.selectors import report_summary
+from teams.models import Team
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "report-summary"}}
+START, END = date(2025, 1, 1), date(2025, 1, 31)
+
+
+def _at(day: int, hour: int = 12) -> datetime:
+    return timezone.make_aware(datetime(2025, 1, day, hour, 0, 0))
+
+
+@pytest.mark.django_db
+class TestReportSummary:
+    def _make_dataset(self) -> Organization:
+        org = baker.make(Organization)
+        morning = baker.make(Team, organization=org, name="Morning Outreach")
+        dropin = baker.make(Team, organization=org, name="Drop-in Center")
+        water = baker.make(OrganizationService, organization=org, label="Water")
+        meals = baker.make(OrganizationService, organization=org, label="Meals")
+        alice, bob = baker.make(ClientProfile, _quantity=2)
+
+        notes = [
+            baker.make(
+                Note, organization=org, interacted_at=_at(10), team=morning, purpose="Outreach", client_profile=alice
+            ),
+            baker.make(
+                Note, organization=org, interacted_at=_at(10), team=morning, purpose="Outreach", client_profile=alice
+            ),
+            baker.make(
+                Note, organization=org, interacted_at=_at(10), team=dropin, purpose="Follow-up", client_profile=bob
+            ),
+            baker.make(Note, organization=org, interacted_at=_at(20), team=None, purpose="", client_profile=None),
+            baker.make(Note, organization=org, interacted_at=_at(20), team=dropin, purpose=None, client_profile=bob),
+        ]
+        notes[0].provided_services.add(
+            baker.make(ServiceRequest, service=water), baker.make(ServiceRequest, service=meals)
+        )
+        notes[1].provided_services.add(baker.make(ServiceRequest, service=water))
+        notes[2].requested_services.add(baker.make(ServiceRequest, service=meals))
+
+        # Out of range, and another organization.
+        baker.make(Note, organization=org, interacted_at=timezone.make_aware(datetime(2025, 2, 1, 0, 0, 0)))
+        baker.make(Note, organization=baker.make(Organization), interacted_at=_at(10))
+        return org
+
+    def test_summary(self) -> None:
+        org = self._make_dataset()
+
+        assert report_summary(org=org, start_date=START, end_date=END) == {
+            "total_notes": 5,
+            "unique_clients": 2,
+            "start_date": "2025-01-01",
+            "end_date": "2025-01-31",
+            "notes_by_date": [{"date": "2025-01-10", "count": 3}, {"date": "2025-01-20", "count": 2}],
+            "notes_by_team": [{"name": "Drop-in Center", "count": 2}, {"name": "Morning Outreach", "count": 2}],
+            "notes_by_purpose": [{"name": "Outreach", "count": 2}, {"name": "Follow-up", "count": 1}],
+            "unique_clients_by_date": [{"date": "2025-01-10", "count": 2}, {"date": "2025-01-20", "count": 1}],
+            "top_provided_services": [{"name": "Water", "count": 2}, {"name": "Meals", "count": 1}],
+            "top_requested_services": [{"name": "Meals", "count": 1}],
+        }
+
+    def test_empty_range(self) -> None:
+        org = baker.make(Organization)
+
+        summary = report_summary(org=org, start_date=START, end_date=END)
+
+        assert summary["total_notes"] == 0
+        assert summary["unique_clients"] == 0
+        assert summary["notes_by_date"] == []
+        assert summary["top_provided_services"] == []
+
+    def test_single_query(self) -> None:
+        org = self._make_dataset()
+
+        with CaptureQueriesContext(connection) as ctx:
+            report_summary(org=org, start_date=START, end_date=END)
+
+        assert len(ctx.captured_queries) == 1
+
+
+@pytest.mark.django_db
+class TestReportSummaryCache:
+    @pytest.fixture(autouse=True)
+    def _enable_cache(self, settings: Any) -> None:
+        settings.CACHES = LOCMEM_CACHES
+        settings.REPORT_SUMMARY_CACHE_TTL = 60
+        cache.clear()
+
+    def _query_count(self, org: Organization, end_date: date = END) -> int:
+        with CaptureQueriesContext(connection) as ctx:
+            report_summary(org=org, start_date=START, end_date=end_date)
+        return len(ctx.captured_queries)
+
+    def test_repeat_views_hit_cache(self) -> None:
+        org = baker.make(Organization)
+        baker.make(Note, organization=org, interacted_at=_at(10))
+
+        assert self._query_count(org) == 1
+        assert self._query_count(org) == 0
+        # A different range is a different entry.
+        assert self._query_count(org, end_date=date(2025, 1, 15)) == 1
+
+    def test_note_create_update_delete_invalidate(self, django_capture_on_commit_callbacks: Callable[..., Any]) -> None:
+        org = baker.make(Organization)
+        other_org = baker.make(Organization)
+        report_summary(org=other_org, start_date=START, end_date=END)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            note = baker.make(Note, organization=org, interacted_at=_at(10))
+        assert report_summary(org=org, start_date=START, end_date=END)["total_notes"] == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            note.purpose = "Outreach"
+            note.save()
+        assert report_summary(org=org, start_date=START, end_date=END)["notes_by_purpose"] == [
+            {"name": "Outreach", "count": 1}
+        ]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            note.delete()
+        assert report_summary(org=org, start_date=START, end_date=END)["total_notes"] == 0
+
+        # Other organizations keep their entries.
+        assert self._query_count(other_org) == 0
+
+    def test_service_changes_invalidate(self, django_capture_on_commit_callbacks: Callable[..., Any]) -> None:
+        org = baker.make(Organization)
+        note = baker.make(Note, organization=org, interacted_at=_at(10))
+        service_request = baker.make(ServiceRequest, service=baker.make(OrganizationService, label="Water"))
+        report_summary(org=org, start_date=START, end_date=END)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            note.provided_services.add(service_request)
+        assert report_summary(org=org, start_date=START, end_date=END)["top_provided_services"] == [
+            {"name": "Water", "count": 1}
+        ]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            service_request.provided_notes.clear()
+        assert report_summary(org=org, start_date=START, end_date=END)["top_provided_services"] == []
+
+    def test_invalidation_waits_for_commit(self, django_capture_on_commit_callbacks: Callable[..., Any]) -> None:
+        org = baker.make(Organization)
+        report_summary(org=org, start_date=START, end_date=END)
+
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            baker.make(Note, organization=org, interacted_at=_at(10))
+            assert report_summary(org=org, start_date=START, end_date=END)["total_notes"] == 0
+
+        assert callbacks
+        for callback in callbacks:
+            callback()
+        assert report_summary(org=org, start_date=START, end_date=END)["total_notes"] == 1
@@ -1,15 +1,23 @@
 """Tests for report services."""
 
+import gc
+import tracemalloc
 from datetime import datetime
 
 import pytest
 import time_machine
-from accounts.models import Organization
+from accounts.models import Organization, User
+from common.models import Location
+from django.contrib.gis.geos import Point
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from model_bakery import baker
-from notes.models import Note
+from notes.admin import NoteResource
+from notes.models import Note, OrganizationService, ServiceRequest
 from reports.models import ScheduledReport
-from reports.services import generate_report_data, get_previous_month_range
+from reports.services import generate_report_data, get_previous_month_range, stream_interaction_data_csv
+from teams.models import Team
 
 
 @pytest.mark.django_db
@@ -134,6 +142,76 @@ class TestReportService:
         assert "Org2 Note" not in content
 
 
+@pytest.mark.django_db
+class TestStreamInteractionDataCsv:
+    """Tests for the streaming interaction data CSV export."""
+
+    def _make_notes(self, org: Organization, count: int, **kwargs: object) -> None:
+        user = baker.make(User, first_name="Vol", last_name="Unteer")
+        interacted_at = timezone.make_aware(datetime(2025, 1, 15, 12, 0, 0))
+        Note.objects.bulk_create(
+            Note(organization=org, created_by=user, interacted_at=interacted_at, **kwargs) for _ in range(count)
+        )
+
+    def test_matches_note_resource_export(self) -> None:
+        """Streaming yields exactly what the in-memory NoteResource export produces."""
+        org = baker.make(Organization, name="Stream Org")
+        team = baker.make(Team, organization=org, name="Outreach")
+        service = baker.make(OrganizationService, organization=org, label="Water")
+        for i in range(5):
+            note = baker.make(
+                Note,
+                organization=org,
+                team=team,
+                location=baker.make(Location, point=Point(-118.24, 34.05 + i / 100)),
+                purpose=f"purpose, {i}",
+                public_details=f'line one\n"quoted" {i}',
+                interacted_at=timezone.make_aware(datetime(2025, 1, 10 + i, 12, 0, 0)),
+            )
+            note.provided_services.add(baker.make(ServiceRequest, service=service))
+            note.requested_services.add(baker.make(ServiceRequest, service=service))
+
+        notes = Note.objects.filter(organization=org).order_by("interacted_at")
+
+        streamed = "".join(stream_interaction_data_csv(notes=notes, chunk_size=2))
+
+        assert streamed == NoteResource().export(queryset=notes).csv
+
+    def test_query_count_is_per_chunk(self) -> None:
+        """Related rows are fetched once per chunk, not once per note."""
+        org = baker.make(Organization)
+        self._make_notes(org, 50)
+        notes = Note.objects.filter(organization=org).order_by("interacted_at")
+
+        with CaptureQueriesContext(connection) as ctx:
+            rows = "".join(stream_interaction_data_csv(notes=notes, chunk_size=10)).splitlines()
+
+        assert len(rows) == 51
+        # 1 cursor + 2 prefetches (provided/requested services) for each of the 5 chunks.
+        assert len(ctx.captured_queries) <= 1 + 2 * 5
+
+    def test_memory_ceiling(self) -> None:
+        """Peak memory tracks the chunk size, not the size of the export."""
+        org = baker.make(Organization)
+        note_count = 6000
+        self._make_notes(org, note_count, public_details="x" * 2000)
+        gc.collect()
+        notes = Note.objects.filter(organization=org).order_by("interacted_at")
+
+        total_size = 0
+        tracemalloc.start()
+        try:
+            for piece in stream_interaction_data_csv(notes=notes, chunk_size=250):
+                total_size += len(piece)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert total_size > note_count * 2000
+        # The export is ~12MB of CSV; a 250-note chunk is well under 2MB of it.
+        assert peak < total_size / 4
+
+
 class TestGetPreviousMonthRange:
     """Tests for get_previous_month_range function (helper in services.py)."""
 
@@ -10,7 +10,13 @@ from django.utils import timezone
 from model_bakery import baker
 from post_office.models import Email
 from reports.models import ScheduledReport
-from reports.tasks import process_scheduled_reports, send_scheduled_report
+from reports.services import (
+    SCHEDULED_REPORT_CLAIM_LEASE,
+    ClaimedReport,
+    generate_report_data,
+    scheduled_reports_claim_due,
+)
+from reports.tasks import process_scheduled_reports, send_scheduled_report, send_scheduled_reports
 
 
 @pytest.mark.django_db
@@ -60,25 +66,151 @@ class TestProcessScheduledReportsTask:
             next_run_at=now - timedelta(minutes=1),
         )
 
-        # We need to mock the delay call to count invocations
         # Since process_scheduled_reports is a shared_task, calling .apply() executes it synchronously.
         # We check the return string which counts queued reports.
 
-        with patch("reports.tasks.send_scheduled_report") as mock_send:
+        with patch("reports.tasks.send_scheduled_reports") as mock_send:
             result = process_scheduled_reports.apply().get()
 
-            # We expect "Due Now" and "Missed Yesterday" to be queued.
-            assert "Queued 2 reports" in result
+            # We expect "Due Now" and "Missed Yesterday" to be queued, together.
+            assert result == "Queued 2 reports for processing in 1 batches"
+            mock_send.delay.assert_called_once_with(sorted([due_now.pk, missed.pk]))
 
-            assert mock_send.delay.call_count == 2
-            mock_send.delay.assert_has_calls(
-                [
-                    call(due_now.pk),
-                    call(missed.pk),
-                ],
-                any_order=True,
+            # Both are claimed now, so the next dispatch doesn't queue them again.
+            mock_send.delay.reset_mock()
+            result = process_scheduled_reports.apply().get()
+
+            assert "Queued 0 reports" in result
+            mock_send.delay.assert_not_called()
+
+    @time_machine.travel("2025-01-15 10:30:00", tick=False)
+    def test_dispatcher_batches_by_organization(self) -> None:
+        """Test that one send is queued per organization and report type."""
+        org_1, org_2 = baker.make(Organization, _quantity=2)
+        due = timezone.now() - timedelta(minutes=1)
+        org_1_reports = baker.make(ScheduledReport, organization=org_1, next_run_at=due, _quantity=2)
+        org_2_report = baker.make(ScheduledReport, organization=org_2, next_run_at=due)
+
+        with patch("reports.tasks.send_scheduled_reports") as mock_send:
+            result = process_scheduled_reports.apply().get()
+
+        assert result == "Queued 3 reports for processing in 2 batches"
+        mock_send.delay.assert_has_calls(
+            [
+                call(sorted(report.pk for report in org_1_reports)),
+                call([org_2_report.pk]),
+            ],
+            any_order=True,
+        )
+
+
+@pytest.mark.django_db
+class TestScheduledReportsClaimDue:
+    """Tests for the scheduled_reports_claim_due service."""
+
+    def test_claims_due_reports_once(self) -> None:
+        now = timezone.now()
+        report = baker.make(ScheduledReport, is_active=True, next_run_at=now - timedelta(minutes=1))
+
+        claimed = scheduled_reports_claim_due(now=now)
+
+        assert claimed == [ClaimedReport(report.pk, report.organization_id, report.report_type)]
+        report.refresh_from_db()
+        assert report.claimed_until == now + SCHEDULED_REPORT_CLAIM_LEASE
+        assert scheduled_reports_claim_due(now=now + timedelta(minutes=30)) == []
+
+    def test_reclaims_after_the_lease_expires(self) -> None:
+        now = timezone.now()
+        report = baker.make(ScheduledReport, is_active=True, next_run_at=now - timedelta(minutes=1))
+        scheduled_reports_claim_due(now=now)
+
+        later = now + SCHEDULED_REPORT_CLAIM_LEASE
+        claimed = scheduled_reports_claim_due(now=later)
+
+        assert [claim.id for claim in claimed] == [report.pk]
+        report.refresh_from_db()
+        assert report.claimed_until == later + SCHEDULED_REPORT_CLAIM_LEASE
+
+
+@pytest.mark.django_db
+class TestSendScheduledReportsTask:
+    """Tests for the batched send_scheduled_reports task."""
+
+    @pytest.fixture(autouse=True)
+    def _use_in_memory_storage(self, settings):  # type: ignore[no-untyped-def]
+        """Use in-memory storage so email attachments don't hit S3."""
+        settings.STORAGES = {"default": {"BACKEND": "django.core.files.storage.InMemoryStorage"}}
+
+    @patch("reports.tasks.generate_report_data")
+    def test_generator_error_fails_every_report(self, mock_generate: MagicMock) -> None:
+        mock_generate.side_effect = ValueError("Invalid config")
+        reports = baker.make(ScheduledReport, organization=baker.make(Organization), _quantity=2)
+
+        results = send_scheduled_reports.apply(args=([report.pk for report in reports],)).get()
+
+        assert [result["status"] for result in results] == ["error", "error"]
+        assert Email.objects.count() == 0
+
+    @patch("reports.tasks.generate_report_data")
+    def test_failed_report_does_not_stop_the_batch(self, mock_generate: MagicMock) -> None:
+        mock_generate.return_value = ("report.csv", "a,b\n1,2", {})
+        now = timezone.now()
+        broken, sent = baker.make(
+            ScheduledReport,
+            organization=baker.make(Organization),
+            recipients="test@example.com",
+            is_active=True,
+            next_run_at=now - timedelta(minutes=1),
+            _quantity=2,
+        )
+        ScheduledReport.objects.filter(pk=broken.pk).update(subject_template="Report {missing}")
+        scheduled_reports_claim_due(now=now)
+
+        results = send_scheduled_reports.apply(args=([broken.pk, sent.pk],)).get()
+
+        assert [(result["status"], result["report_id"]) for result in results] == [
+            ("error", broken.pk),
+            ("success", sent.pk),
+        ]
+        assert Email.objects.count() == 1
+        broken.refresh_from_db()
+        assert broken.claimed_until is None
+        assert broken.next_run_at <= now
+
+    @time_machine.travel("2025-01-15 10:30:00", tick=False)
+    @patch("reports.tasks.generate_report_data", wraps=generate_report_data)
+    def test_hundreds_of_due_reports(self, mock_generate: MagicMock) -> None:
+        """Each report is sent once, and each organization's data is generated once."""
+        orgs = baker.make(Organization, _quantity=5)
+        now = timezone.now()
+        for org in orgs:
+            baker.make(
+                ScheduledReport,
+                organization=org,
+                recipients="test@example.com",
+                is_active=True,
+                next_run_at=now - timedelta(minutes=1),
+                _quantity=60,
             )
 
+        with patch("reports.tasks.send_scheduled_reports.delay") as mock_delay:
+            process_scheduled_reports.apply().get()
+            # A dispatch that overlaps the sends finds nothing left to queue.
+            process_scheduled_reports.apply().get()
+        results = [
+            result
+            for batch in mock_delay.call_args_list
+            for result in send_scheduled_reports.apply(args=batch.args).get()
+        ]
+
+        assert mock_delay.call_count == len(orgs)
+        assert mock_generate.call_count == len(orgs)
+        assert len(results) == 300
+        assert {result["status"] for result in results} == {"success"}
+        assert Email.objects.count() == 300
+        assert not ScheduledReport.objects.filter(claimed_until__isnull=False).exists()
+        assert not ScheduledReport.objects.filter(next_run_at__lte=now).exists()
+
 
 @pytest.mark.django_db
 class TestSendScheduledReportTask:
@@ -111,6 +111,23 @@ class TestExportInteractionDataView:
         lines = [line for line in content.strip().split("\n") if line.strip()]
         assert len(lines) == 4  # 1 header + 3 data rows
 
+    def test_streaming_csv_download(self, api_client: APIClient, user_with_access: User, org: Organization) -> None:
+        """stream=true returns the same CSV as a streaming response."""
+        baker.make(
+            Note,
+            organization=org,
+            interacted_at=timezone.make_aware(datetime(2025, 1, 15, 12, 0, 0)),
+            _quantity=3,
+        )
+        api_client.force_authenticate(user=user_with_access)
+        buffered = api_client.get(f"/reports/export/?org_id={org.id}&month=1&year=2025")
+        response = api_client.get(f"/reports/export/?org_id={org.id}&month=1&year=2025&stream=true")
+        assert response.status_code == 200
+        assert response.streaming
+        assert response["Content-Type"] == "text/csv"
+        assert 'filename="interaction_data_20250101_20250131.csv"' in response["Content-Disposition"]
+        assert b"".join(response.streaming_content) == buffered.content
+
     def test_successful_csv_download_with_date_range(
         self, api_client: APIClient, user_with_access: User, org: Organization
     ) -> None:
@@ -9,7 +9,7 @@ Reference: https://github.com/HackSoftware/Django-Styleguide#apis--serializers
 from datetime import datetime, timedelta
 from typing import Any
 
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.utils import timezone
 from notes.admin import NoteResource
 from rest_framework import serializers
@@ -19,6 +19,7 @@ from rest_framework.views import APIView
 
 from .permissions import HasReportAccess
 from .selectors import note_list_for_org
+from .services import stream_interaction_data_csv
 
 
 class ExportInteractionDataApi(APIView):
@@ -26,6 +27,9 @@ class ExportInteractionDataApi(APIView):
     GET /reports/export/
 
     Export interaction data as CSV for the authenticated user's organization.
+
+    Pass ``stream=true`` to stream the CSV as it is generated instead of building
+    it in memory first; use it for large date ranges.
     """
 
     permission_classes = [IsAuthenticated, HasReportAccess]
@@ -36,6 +40,7 @@ class ExportInteractionDataApi(APIView):
         # Legacy single-month params
         month = serializers.IntegerField(required=False, min_value=1, max_value=12)
         year = serializers.IntegerField(required=False, min_value=2000, max_value=2100)
+        stream = serializers.BooleanField(required=False, default=False)
 
         def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:  # type: ignore[override]
             start = attrs.get("start_date")
@@ -60,7 +65,7 @@ class ExportInteractionDataApi(APIView):
                 attrs["_resolved_end"] = (datetime(year, month + 1, 1) - timedelta(days=1)).date()
             return attrs
 
-    def get(self, request: Request) -> HttpResponse:
+    def get(self, request: Request) -> HttpResponse | StreamingHttpResponse:
         serializer = self.InputSerializer(data=request.query_params)
         serializer.is_valid(raise_exception=True)
 
@@ -70,13 +75,15 @@ class ExportInteractionDataApi(APIView):
         org = request.permitted_org  # type: ignore[attr-defined]  # set by HasReportAccess
         notes = note_list_for_org(org=org, start_date=start_date, end_date=end_date).order_by("interacted_at")
 
-        resource = NoteResource()
-        dataset = resource.export(queryset=notes)
-
         start_str = start_date.strftime("%Y%m%d")
         end_str = end_date.strftime("%Y%m%d")
         filename = f"interaction_data_{start_str}_{end_str}.csv"
 
-        response = HttpResponse(dataset.csv, content_type="text/csv")
+        response: HttpResponse | StreamingHttpResponse
+        if serializer.validated_data["stream"]:
+            response = StreamingHttpResponse(stream_interaction_data_csv(notes=notes), content_type="text/csv")
+        else:
+            dataset = NoteResource().export(queryset=notes)
+            response = HttpResponse(dataset.csv, content_type="text/csv")
         response["Content-Disposition"] = f'attachment; filename="{filename}"'
         return response
@@ -688,7 +688,7 @@ class ShelterResource(resources.ModelResource):
             "name",
             "organization",
         )
-        exclude = ("id", "created_at", "updated_at")
+        exclude = ("id", "created_at", "updated_at", "property_tags")
 
     def skip_or_raise(self, row: Any, col_of_choice: str) -> None:
         logger.warning(f"Row {self.count}: Bad {col_of_choice} value")
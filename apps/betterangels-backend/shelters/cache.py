@@ -0,0 +1,32 @@
+"""
+Invalidation for the cached shelter map clusters.
+
+Cached tiles are keyed by a global generation; bumping it orphans every
+cached tile at once (Redis has no cheap "delete by prefix").  Orphans
+expire with ``SHELTER_MAP_CLUSTER_CACHE_TTL``.
+"""
+
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+def shelter_map_clusters_generation_key() -> str:
+    return "shelters:map_clusters:gen"
+
+
+def shelter_map_clusters_invalidate() -> None:
+    """Drop every cached map tile once the current transaction commits.
+
+    Bumping before commit would let a concurrent request cache pre-commit
+    data under the new generation.
+    """
+    if not settings.SHELTER_MAP_CLUSTER_CACHE_TTL:
+        return
+
+    def bump() -> None:
+        cache.set(shelter_map_clusters_generation_key(), uuid.uuid4().hex, settings.SHELTER_MAP_CLUSTER_CACHE_TTL)
+
+    transaction.on_commit(bump)
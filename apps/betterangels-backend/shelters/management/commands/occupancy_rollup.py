@@ -0,0 +1,106 @@
+"""
+Management command to backfill and verify the ``BedDailyStatus`` occupancy rollup.
+
+Usage:
+    python manage.py occupancy_rollup                        # incremental refresh, every shelter
+    python manage.py occupancy_rollup --rebuild              # full backfill from each shelter's first bed
+    python manage.py occupancy_rollup --shelter 12 --shelter 14
+    python manage.py occupancy_rollup --check 30             # compare the last 30 rolled days with a replay
+    python manage.py occupancy_rollup --check 30 --repair    # rebuild shelters that drifted
+"""
+
+import datetime
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from shelters.models import Bed, OccupancyRollupState, Shelter
+from shelters.services.occupancy_rollup import occupancy_rollup_check, occupancy_rollup_refresh
+
+
+class Command(BaseCommand):
+    help = "Backfill, refresh or verify the per-bed daily occupancy rollup."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--shelter",
+            type=int,
+            action="append",
+            dest="shelter_ids",
+            help="Limit to this shelter ID (repeatable). Defaults to every shelter that has had a bed.",
+        )
+        parser.add_argument(
+            "--through",
+            type=datetime.date.fromisoformat,
+            help="Last day to roll up (YYYY-MM-DD). Defaults to today.",
+        )
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Discard existing rollup rows and backfill from each shelter's first bed.",
+        )
+        parser.add_argument(
+            "--check",
+            type=int,
+            metavar="DAYS",
+            help="Compare the last DAYS rolled-up days with a fresh replay instead of refreshing.",
+        )
+        parser.add_argument(
+            "--repair",
+            action="store_true",
+            help="With --check, rebuild every shelter whose rollup drifted.",
+        )
+
+    def handle(self, **options: Any) -> None:
+        shelters = self._shelters(options["shelter_ids"])
+
+        if options["check"] is not None:
+            self._check(shelters, days=options["check"], repair=options["repair"])
+            return
+
+        total = 0
+        for shelter in shelters:
+            written = occupancy_rollup_refresh(shelter=shelter, through=options["through"], rebuild=options["rebuild"])
+            total += written
+            self.stdout.write(f"  {shelter} (#{shelter.pk}): {written} rows")
+
+        self.stdout.write(self.style.SUCCESS(f"Rolled up {len(shelters)} shelters ({total} rows written)."))
+
+    def _shelters(self, shelter_ids: list[int] | None) -> list[Shelter]:
+        if shelter_ids:
+            return list(Shelter.objects.filter(pk__in=shelter_ids).order_by("pk"))
+
+        bed_event_model = Bed.pgh_event_model  # type: ignore[attr-defined]
+        with_beds = bed_event_model.objects.filter(pgh_label="bed.add").values("shelter_id")
+        return list(Shelter.objects.filter(pk__in=with_beds).order_by("pk"))
+
+    def _check(self, shelters: list[Shelter], *, days: int, repair: bool) -> None:
+        if days < 1:
+            raise CommandError("--check must be at least 1 day.")
+
+        states = {s.shelter_id: s for s in OccupancyRollupState.objects.filter(shelter__in=shelters)}
+        drifted: list[Shelter] = []
+        for shelter in shelters:
+            state = states.get(shelter.pk)
+            if state is None or state.rolled_through is None:
+                self.stdout.write(self.style.WARNING(f"  {shelter} (#{shelter.pk}): not rolled up yet"))
+                continue
+
+            end_date = state.rolled_through
+            start_date = end_date - datetime.timedelta(days=days - 1)
+            mismatched = occupancy_rollup_check(shelter=shelter, start_date=start_date, end_date=end_date)
+            if mismatched:
+                drifted.append(shelter)
+                shown = ", ".join(d.isoformat() for d in mismatched[:5])
+                more = f" (+{len(mismatched) - 5} more)" if len(mismatched) > 5 else ""
+                self.stdout.write(self.style.ERROR(f"  {shelter} (#{shelter.pk}): drift on {shown}{more}"))
+
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS(f"Rollup matches the replay for {len(shelters)} shelters."))
+            return
+
+        if not repair:
+            raise CommandError(f"{len(drifted)} shelters drifted; rerun with --repair to rebuild them.")
+
+        for shelter in drifted:
+            occupancy_rollup_refresh(shelter=shelter, rebuild=True)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {len(drifted)} drifted shelters."))
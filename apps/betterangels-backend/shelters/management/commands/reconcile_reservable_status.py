@@ -0,0 +1,55 @@
+"""
+Management command to verify the trigger-maintained ``current_status`` of beds and rooms.
+
+Usage:
+    python manage.py reconcile_reservable_status            # report drift, exit non-zero if any
+    python manage.py reconcile_reservable_status --repair   # rewrite drifted rows
+"""
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from shelters.models import Bed, Room
+from shelters.selectors.computed_status import status_drift
+from shelters.services.reservable_status import current_status_repair
+
+
+class Command(BaseCommand):
+    help = "Compare Bed/Room current_status with their reservations and optionally repair drift."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--repair",
+            action="store_true",
+            help="Rewrite current_status on every drifted bed and room.",
+        )
+
+    def handle(self, **options: Any) -> None:
+        drifted = 0
+        for model_class in (Bed, Room):
+            label = model_class._meta.verbose_name_plural
+            if options["repair"]:
+                ids = current_status_repair(model_class=model_class)
+                drifted += len(ids)
+                if ids:
+                    self.stdout.write(self.style.WARNING(f"  {label}: repaired {len(ids)} ({_shown(ids)})"))
+                continue
+
+            rows = list(status_drift(model_class).order_by("pk").values_list("pk", "current_status", "_derived_status"))
+            drifted += len(rows)
+            for pk, stored, derived in rows[:10]:
+                self.stdout.write(self.style.ERROR(f"  {label} #{pk}: stored {stored}, expected {derived}"))
+            if len(rows) > 10:
+                self.stdout.write(self.style.ERROR(f"  {label}: +{len(rows) - 10} more"))
+
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS("current_status matches reservations for every bed and room."))
+        elif options["repair"]:
+            self.stdout.write(self.style.SUCCESS(f"Repaired {drifted} beds/rooms."))
+        else:
+            raise CommandError(f"{drifted} beds/rooms drifted; rerun with --repair to fix them.")
+
+
+def _shown(ids: list[int]) -> str:
+    more = f" +{len(ids) - 5} more" if len(ids) > 5 else ""
+    return ", ".join(f"#{pk}" for pk in ids[:5]) + more
@@ -4,16 +4,12 @@ import datetime
 from typing import TYPE_CHECKING, Iterable, Self, cast
 
 from django.db import models
-from django.db.models import Manager, Q, QuerySet
+from django.db.models import F, Manager, Q, QuerySet
 
 from shelters.enums import BedStatusChoices, RoomStatusChoices, ScheduleTypeChoices
 from shelters.open_at import shelters_open_at
 from shelters.selectors import shelter_list
-from shelters.selectors.computed_status import (
-    StatusChoice,
-    computed_status_case,
-    status_filter_q,
-)
+from shelters.selectors.computed_status import StatusChoice
 
 if TYPE_CHECKING:
     from shelters.models import Bed, Room, Shelter  # noqa: F401
@@ -50,8 +46,9 @@ class ShelterManager(models.Manager["Shelter"]):
 class ReservableStatusQuerySetMixin:
     """Shared status filtering/annotation for Bed and Room querysets.
 
-    Delegates to query-building functions in
-    ``shelters.selectors.computed_status`` per HackSoft style guide.
+    Reads the trigger-maintained ``current_status`` column (see
+    ``shelters/triggers.py``), so status filters are indexed equality
+    lookups instead of per-row reservation subqueries.
     """
 
     reservable_fk: str = "bed_id"
@@ -59,27 +56,22 @@ class ReservableStatusQuerySetMixin:
 
     def with_computed_status(self) -> Self:
         qs = cast(QuerySet, self)
-        return cast(
-            Self,
-            qs.annotate(_computed_status=computed_status_case(self.reservable_fk, self.status_enum)),
-        )
+        return cast(Self, qs.annotate(_computed_status=F("current_status")))
 
     def filter_by_status(self, status: StatusChoice) -> QuerySet:
         return cast(QuerySet, self).filter(self.status_filter_q(status))
 
     def filter_by_statuses(self, statuses: Iterable[StatusChoice]) -> QuerySet:
         # Empty statuses is treated as "no filter" -- return the full queryset unchanged.
-        combined = Q()
-        for status in statuses:
-            combined |= self.status_filter_q(status)
+        values = list(statuses)
         qs = cast(QuerySet, self)
-        if not combined:
+        if not values:
             return qs
-        return qs.filter(combined)
+        return qs.filter(current_status__in=values)
 
     @classmethod
     def status_filter_q(cls, status: StatusChoice) -> Q:
-        return status_filter_q(status, fk_field=cls.reservable_fk, status_enum=cls.status_enum)
+        return Q(current_status=status)
 
 
 class BedQuerySet(ReservableStatusQuerySetMixin, QuerySet):
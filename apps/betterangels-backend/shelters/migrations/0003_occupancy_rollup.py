@@ -0,0 +1,40 @@
+# Generated by Django 6.0.6 on 2026-10-18 21:04
+
+import django.db.models.deletion
+import django_choices_field.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shelters', '0002_shelter_schedule_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OccupancyRollupState',
+            fields=[
+                ('shelter', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='occupancy_rollup_state', serialize=False, to='shelters.shelter')),
+                ('rolled_through', models.DateField(blank=True, null=True)),
+                ('bed_event_watermark', models.BigIntegerField(default=0)),
+                ('reservation_event_watermark', models.BigIntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='BedDailyStatus',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bed_id', models.BigIntegerField()),
+                ('date', models.DateField()),
+                ('status', django_choices_field.fields.TextChoicesField(choices=[('available', 'Available'), ('in_turnaround', 'In Turnaround'), ('occupied', 'Occupied'), ('out_of_service', 'Out-of-Service'), ('reserved', 'Reserved')], max_length=14)),
+                ('is_occupied', models.BooleanField(default=False)),
+                ('shelter', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='shelters.shelter')),
+            ],
+            options={
+                'verbose_name_plural': 'Bed daily statuses',
+                'constraints': [models.UniqueConstraint(fields=('shelter', 'date', 'bed_id'), name='unique_bed_daily_status')],
+            },
+        ),
+    ]
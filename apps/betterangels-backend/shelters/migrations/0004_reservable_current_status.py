@@ -0,0 +1,62 @@
+# Generated by Django 6.0.6 on 2026-10-18 21:18
+
+import django_choices_field.fields
+import pgtrigger.compiler
+import pgtrigger.migrations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shelters', '0003_occupancy_rollup'),
+    ]
+
+    operations = [
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='bed',
+            name='bed_update_update',
+        ),
+        migrations.AddField(
+            model_name='bed',
+            name='current_status',
+            field=django_choices_field.fields.TextChoicesField(choices=[('available', 'Available'), ('in_turnaround', 'In Turnaround'), ('occupied', 'Occupied'), ('out_of_service', 'Out-of-Service'), ('reserved', 'Reserved')], db_default='available', editable=False, help_text='Maintained by database triggers; see shelters/triggers.py.', max_length=14),
+        ),
+        migrations.AddField(
+            model_name='room',
+            name='current_status',
+            field=django_choices_field.fields.TextChoicesField(choices=[('available', 'Available'), ('in_turnaround', 'In Turnaround'), ('occupied', 'Occupied'), ('out_of_service', 'Out-of-Service'), ('reserved', 'Reserved')], db_default='available', editable=False, help_text='Maintained by database triggers; see shelters/triggers.py.', max_length=14),
+        ),
+        migrations.AddIndex(
+            model_name='bed',
+            index=models.Index(fields=['shelter', 'current_status'], name='bed_shelter_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='room',
+            index=models.Index(fields=['shelter', 'current_status'], name='room_shelter_status_idx'),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='bed',
+            trigger=pgtrigger.compiler.Trigger(name='bed_current_status', sql=pgtrigger.compiler.UpsertTriggerSql(func='NEW."current_status" := CASE\n        WHEN NEW."maintenance_flag" THEN \'out_of_service\'\n        WHEN EXISTS (SELECT 1 FROM "shelters_reservation" r WHERE r."bed_id" = NEW."id" AND r."status" = \'checked_in\') THEN \'occupied\'\n        WHEN EXISTS (\n            SELECT 1 FROM "shelters_reservation" r WHERE r."bed_id" = NEW."id" AND r."status" IN (\'confirmed\', \'check_in_overdue\')\n        ) THEN \'reserved\'\n        WHEN EXISTS (\n            SELECT 1 FROM "shelters_reservation" r WHERE r."bed_id" = NEW."id"\n              AND r."status" = \'completed\'\n              AND r."checked_out_at" IS NOT NULL\n              AND (NEW."last_cleaned" IS NULL OR NEW."last_cleaned" <= r."checked_out_at")\n        ) THEN \'in_turnaround\'\n        ELSE \'available\'\n    END;\nRETURN NEW;', hash='7bf41f6126e6353815326d1f3f624c60f276ec50', operation='INSERT OR UPDATE OF "maintenance_flag", "last_cleaned", "current_status"', pgid='pgtrigger_bed_current_status_34a25', table='shelters_bed', when='BEFORE')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='bed',
+            trigger=pgtrigger.compiler.Trigger(name='bed_update_update', sql=pgtrigger.compiler.UpsertTriggerSql(condition='WHEN (OLD."b7" IS DISTINCT FROM (NEW."b7") OR OLD."created_at" IS DISTINCT FROM (NEW."created_at") OR OLD."fees" IS DISTINCT FROM (NEW."fees") OR OLD."id" IS DISTINCT FROM (NEW."id") OR OLD."last_cleaned" IS DISTINCT FROM (NEW."last_cleaned") OR OLD."last_cleaned_inspected" IS DISTINCT FROM (NEW."last_cleaned_inspected") OR OLD."maintenance_flag" IS DISTINCT FROM (NEW."maintenance_flag") OR OLD."name" IS DISTINCT FROM (NEW."name") OR OLD."room_id" IS DISTINCT FROM (NEW."room_id") OR OLD."shelter_id" IS DISTINCT FROM (NEW."shelter_id") OR OLD."status_notes" IS DISTINCT FROM (NEW."status_notes") OR OLD."storage" IS DISTINCT FROM (NEW."storage") OR OLD."type" IS DISTINCT FROM (NEW."type") OR OLD."updated_at" IS DISTINCT FROM (NEW."updated_at"))', func='INSERT INTO "shelters_bedevent" ("b7", "created_at", "fees", "id", "last_cleaned", "last_cleaned_inspected", "maintenance_flag", "name", "pgh_context_id", "pgh_created_at", "pgh_label", "pgh_obj_id", "room_id", "shelter_id", "status_notes", "storage", "type", "updated_at") VALUES (NEW."b7", NEW."created_at", NEW."fees", NEW."id", NEW."last_cleaned", NEW."last_cleaned_inspected", NEW."maintenance_flag", NEW."name", _pgh_attach_context(), NOW(), \'bed.update\', NEW."id", NEW."room_id", NEW."shelter_id", NEW."status_notes", NEW."storage", NEW."type", NEW."updated_at"); RETURN NULL;', hash='7501151d65ea3c1f6961076b8a2e0018f771632e', operation='UPDATE', pgid='pgtrigger_bed_update_update_1a0e7', table='shelters_bed', when='AFTER')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reservation',
+            trigger=pgtrigger.compiler.Trigger(name='reservation_sync_current_status', sql=pgtrigger.compiler.UpsertTriggerSql(func='IF TG_OP = \'UPDATE\'\n    AND OLD."bed_id" IS NOT DISTINCT FROM NEW."bed_id"\n    AND OLD."room_id" IS NOT DISTINCT FROM NEW."room_id"\n    AND OLD."status" IS NOT DISTINCT FROM NEW."status"\n    AND OLD."checked_out_at" IS NOT DISTINCT FROM NEW."checked_out_at"\nTHEN\n    RETURN NULL;\nEND IF;\nUPDATE "shelters_bed" SET "current_status" = "current_status"\n    WHERE "id" IN (OLD."bed_id", NEW."bed_id");\nUPDATE "shelters_room" SET "current_status" = "current_status"\n    WHERE "id" IN (OLD."room_id", NEW."room_id");\nRETURN NULL;', hash='11d492f81c9eb0f217c52b0f035c73a168c7933e', operation='INSERT OR UPDATE OR DELETE', pgid='pgtrigger_reservation_sync_current_status_0fe68', table='shelters_reservation', when='AFTER')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='room',
+            trigger=pgtrigger.compiler.Trigger(name='room_current_status', sql=pgtrigger.compiler.UpsertTriggerSql(func='NEW."current_status" := CASE\n        WHEN NEW."maintenance_flag" THEN \'out_of_service\'\n        WHEN EXISTS (SELECT 1 FROM "shelters_reservation" r WHERE r."room_id" = NEW."id" AND r."status" = \'checked_in\') THEN \'occupied\'\n        WHEN EXISTS (\n            SELECT 1 FROM "shelters_reservation" r WHERE r."room_id" = NEW."id" AND r."status" IN (\'confirmed\', \'check_in_overdue\')\n        ) THEN \'reserved\'\n        WHEN EXISTS (\n            SELECT 1 FROM "shelters_reservation" r WHERE r."room_id" = NEW."id"\n              AND r."status" = \'completed\'\n              AND r."checked_out_at" IS NOT NULL\n              AND (NEW."last_cleaned" IS NULL OR NEW."last_cleaned" <= r."checked_out_at")\n        ) THEN \'in_turnaround\'\n        ELSE \'available\'\n    END;\nRETURN NEW;', hash='e50fb7e0c6b54cb7ec7ecd5d859488fb8cba7ece', operation='INSERT OR UPDATE OF "maintenance_flag", "last_cleaned", "current_status"', pgid='pgtrigger_room_current_status_7e86d', table='shelters_room', when='BEFORE')),
+        ),
+        # Backfill: rewriting the column fires the new triggers, which compute every row's status.
+        migrations.RunSQL(
+            sql=[
+                'UPDATE "shelters_bed" SET "current_status" = "current_status";',
+                'UPDATE "shelters_room" SET "current_status" = "current_status";',
+            ],
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 6.0.6 on 2026-10-18 21:43
+
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+import django_choices_field.fields
+import pgtrigger.compiler
+import pgtrigger.migrations
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shelters', '0004_reservable_current_status'),
+    ]
+
+    operations = [
+        # GiST over (schedule_type, minutes) needs btree operator classes for the text column.
+        BtreeGistExtension(),
+        migrations.CreateModel(
+            name='ScheduleOpenInterval',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('schedule_type', django_choices_field.fields.TextChoicesField(choices=[('operating', 'Operating Hours'), ('intake', 'Intake Hours'), ('meal_service', 'Meal Service Hours'), ('staff_availability', 'Staff Availability')], max_length=18)),
+                ('is_exception', models.BooleanField()),
+                ('start_date', models.DateField(null=True)),
+                ('end_date', models.DateField(null=True)),
+                ('minutes', django.contrib.postgres.fields.ranges.IntegerRangeField()),
+            ],
+        ),
+        migrations.RemoveIndex(
+            model_name='schedule',
+            name='sched_shelter_type_except_idx',
+        ),
+        migrations.AddField(
+            model_name='scheduleopeninterval',
+            name='schedule',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='open_intervals', to='shelters.schedule'),
+        ),
+        migrations.AddField(
+            model_name='scheduleopeninterval',
+            name='shelter',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='shelters.shelter'),
+        ),
+        migrations.AddIndex(
+            model_name='scheduleopeninterval',
+            index=django.contrib.postgres.indexes.GistIndex(fields=['schedule_type', 'minutes'], name='sched_interval_type_minutes_gist'),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='schedule',
+            trigger=pgtrigger.compiler.Trigger(name='schedule_open_intervals', sql=pgtrigger.compiler.UpsertTriggerSql(func='IF TG_OP <> \'INSERT\' THEN\n    DELETE FROM "shelters_scheduleopeninterval" WHERE "schedule_id" = OLD."id";\nEND IF;\nIF TG_OP = \'DELETE\' THEN\n    RETURN NULL;\nEND IF;\nINSERT INTO "shelters_scheduleopeninterval" ("schedule_id", "shelter_id", "schedule_type", "is_exception", "start_date", "end_date", "minutes")\nWITH spans AS (SELECT lo, lo + COALESCE(NEW."duration_minutes", 1440) AS hi FROM (\n        SELECT k * 1440 + COALESCE(NEW."start_cycle_minutes", 0) AS lo\n        FROM generate_series(0, 6) AS k\n        WHERE NEW."day" IS NULL\n        UNION ALL\n        SELECT COALESCE(\n            NEW."start_cycle_minutes",\n            (array_position(ARRAY[\'monday\', \'tuesday\', \'wednesday\', \'thursday\', \'friday\', \'saturday\', \'sunday\']::text[], NEW."day"::text) - 1) * 1440\n        )\n        WHERE NEW."day" IS NOT NULL\n    ) starts)\nSELECT NEW."id", NEW."shelter_id", NEW."schedule_type", NEW."is_exception", NEW."start_date", NEW."end_date", int4range(lo, LEAST(hi, 10080)) FROM spans\nUNION ALL\nSELECT NEW."id", NEW."shelter_id", NEW."schedule_type", NEW."is_exception", NEW."start_date", NEW."end_date", int4range(0, hi - 10080) FROM spans WHERE hi > 10080;\nRETURN NULL;', hash='b76e7f11653c8ccabc855854decc24ef05040af8', operation='INSERT OR UPDATE OR DELETE', pgid='pgtrigger_schedule_open_intervals_846ac', table='shelters_schedule', when='AFTER')),
+        ),
+        # Backfill: rewriting every schedule fires the new trigger, which writes its intervals.
+        migrations.RunSQL(
+            sql='UPDATE "shelters_schedule" SET "id" = "id";',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,144 @@
+# Generated by Django 6.0.6 on 2026-10-18 21:47
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+import pgtrigger.compiler
+import pgtrigger.migrations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0006_alter_organization_slug'),
+        ('pghistory', '0007_auto_20250421_0444'),
+        ('shelters', '0005_schedule_open_intervals'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrackedReferralRequirementEvent',
+            fields=[
+                ('pgh_id', models.AutoField(primary_key=True, serialize=False)),
+                ('pgh_created_at', models.DateTimeField(auto_now_add=True)),
+                ('pgh_label', models.TextField(help_text='The event label.')),
+                ('id', models.BigIntegerField()),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='TrackedReferralRequirement',
+            fields=[
+            ],
+            options={
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('shelters.shelter_referral_requirement',),
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='shelter',
+            name='shelter_update_update',
+        ),
+        migrations.AddField(
+            model_name='shelter',
+            name='property_tags',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), blank=True, default=list, editable=False, help_text='Maintained by database triggers; see shelters/triggers.py.'),
+        ),
+        migrations.AddIndex(
+            model_name='shelter',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['property_tags'], name='shelter_property_tags_gin'),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='shelter',
+            trigger=pgtrigger.compiler.Trigger(name='shelter_property_tags', sql=pgtrigger.compiler.UpsertTriggerSql(func='NEW."property_tags" := ARRAY(SELECT tag FROM (\n        SELECT \'accessibility:\' || l."name" FROM "shelters_shelter_accessibility" t\n            JOIN "shelters_accessibility" l ON l."id" = t."accessibility_id"\n            WHERE t."shelter_id" = NEW."id" AND l."name" IS NOT NULL\n        UNION ALL SELECT \'accessibility:\' WHERE NOT EXISTS (SELECT 1 FROM "shelters_shelter_accessibility" t WHERE t."shelter_id" = NEW."id")\n        UNION ALL SELECT \'demographics:\' || l."name" FROM "shelters_shelter_demographics" t\n            JOIN "shelters_demographic" l ON l."id" = t."demographic_id"\n            WHERE t."shelter_id" = NEW."id" AND l."name" IS NOT NULL\n        UNION ALL SELECT \'demographics:\' WHERE NOT EXISTS (SELECT 1 FROM "shelters_shelter_demographics" t WHERE t."shelter_id" = NEW."id")\n        UNION ALL SELECT \'entry_requirements:\' || l."name" FROM "shelters_shelter_entry_requirements" t\n            JOIN "shelters_entryrequirement" l ON l."id" = t."entryrequirement_id"\n            WHERE t."shelter_id" = NEW."id" AND l."name" IS NOT NULL\n        UNION ALL SELECT \'entry_requirements:\' WHERE NOT EXISTS (SELECT 1 FROM "shelters_shelter_entry_requirements" t WHERE t."shelter_id" = NEW."id")\n        UNION ALL SELECT \'funders:\' || l."name" FROM "shelters_shelter_funders" t\n            JOIN "shelters_funder" l ON l."id" = t."funder_id"\n            WHERE t."shelter_id" = NEW."id" AND l."name" IS NOT NULL\n        UNION ALL SELECT \'funders:\' WHERE NOT EXISTS (SELECT 1 FROM "shelters_shelter_funders" t WHERE t."shelter_id" = NEW."id")\n        UNION ALL SELECT \'parking:\' || l."name" FROM "shelters_shelter_parking" t\n            JOIN "shelters_parking" l ON l."id" = t."parking_id"\n            WHERE t."shelter_id" = NEW."id" AND l."name" IS NOT NULL\n        UNION ALL SELECT \'parking:\' WHERE NOT EXISTS (SELECT 1 FROM "shelters_shelter_parking" t WHERE t."shelter_id" = NEW."id")\n        UNION ALL SELECT \'pets:\' || l."name" FROM "shelters_shelter_pets" t\n            JOIN "shelters_pet" l ON l."id" = t."pet_id"\n            WHERE t."shelter_id" = NEW."id" AND l."name" IS NOT NULL\n        UNION ALL SELECT \'pets:\' WHERE NOT EXISTS (SELECT 1 FROM "shelters_shelter_pets" t WHERE t."shelter_id" = NEW."id")\n        UNION ALL SELECT \'referral_requirement:\' || l."name" FROM "shelters_shelter_referral_requirement" t\n            JOIN "shelters_referralrequirement" l ON l."id" = t."referralrequirement_id"\n            WHERE t."shelter_id" = NEW."id" AND l."name" IS NOT NULL\n        UNION ALL SELECT \'referral_requirement:\' WHERE NOT EXISTS (SELECT 1 FROM "shelters_shelter_referral_requirement" t WHERE t."shelter_id" = NEW."id")\n        UNION ALL SELECT \'room_styles:\' || l."name" FROM "shelters_shelter_room_styles" t\n            JOIN "shelters_roomstyle" l ON l."id" = t."roomstyle_id"\n            WHERE t."shelter_id" = NEW."id" AND l."name" IS NOT NULL\n        UNION ALL SELECT \'room_styles:\' WHERE NOT EXISTS (SELECT 1 FROM "shelters_shelter_room_styles" t WHERE t."shelter_id" = NEW."id")\n        UNION ALL SELECT \'shelter_programs:\' || l."name" FROM "shelters_shelter_shelter_programs" t\n            JOIN "shelters_shelterprogram" l ON l."id" = t."shelterprogram_id"\n            WHERE t."shelter_id" = NEW."id" AND l."name" IS NOT NULL\n        UNION ALL SELECT \'shelter_programs:\' WHERE NOT EXISTS (SELECT 1 FROM "shelters_shelter_shelter_programs" t WHERE t."shelter_id" = NEW."id")\n        UNION ALL SELECT \'shelter_types:\' || l."name" FROM "shelters_shelter_shelter_types" t\n            JOIN "shelters_sheltertype" l ON l."id" = t."sheltertype_id"\n            WHERE t."shelter_id" = NEW."id" AND l."name" IS NOT NULL\n        UNION ALL SELECT \'shelter_types:\' WHERE NOT EXISTS (SELECT 1 FROM "shelters_shelter_shelter_types" t WHERE t."shelter_id" = NEW."id")\n        UNION ALL SELECT \'special_situation_restrictions:\' || l."name" FROM "shelters_shelter_special_situation_restrictions" t\n            JOIN "shelters_specialsituationrestriction" l ON l."id" = t."specialsituationrestriction_id"\n            WHERE t."shelter_id" = NEW."id" AND l."name" IS NOT NULL\n        UNION ALL SELECT \'special_situation_restrictions:\' WHERE NOT EXISTS (SELECT 1 FROM "shelters_shelter_special_situation_restrictions" t WHERE t."shelter_id" = NEW."id")\n        UNION ALL SELECT \'storage:\' || l."name" FROM "shelters_shelter_storage" t\n            JOIN "shelters_storage" l ON l."id" = t."storage_id"\n            WHERE t."shelter_id" = NEW."id" AND l."name" IS NOT NULL\n        UNION ALL SELECT \'storage:\' WHERE NOT EXISTS (SELECT 1 FROM "shelters_shelter_storage" t WHERE t."shelter_id" = NEW."id")\n        UNION ALL SELECT \'vaccination_requirement:\' || l."name" FROM "shelters_shelter_vaccination_requirement" t\n            JOIN "shelters_vaccinationrequirement" l ON l."id" = t."vaccinationrequirement_id"\n            WHERE t."shelter_id" = NEW."id" AND l."name" IS NOT NULL\n        UNION ALL SELECT \'vaccination_requirement:\' WHERE NOT EXISTS (SELECT 1 FROM "shelters_shelter_vaccination_requirement" t WHERE t."shelter_id" = NEW."id")\n    ) tags (tag) ORDER BY tag);\nRETURN NEW;', hash='8f433de9960279264d496a1484aa05e0c8f2336a', operation='INSERT OR UPDATE OF "property_tags"', pgid='pgtrigger_shelter_property_tags_e27de', table='shelters_shelter', when='BEFORE')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='shelter',
+            trigger=pgtrigger.compiler.Trigger(name='shelter_update_update', sql=pgtrigger.compiler.UpsertTriggerSql(condition='WHEN (OLD."add_notes_shelter_details" IS DISTINCT FROM (NEW."add_notes_shelter_details") OR OLD."add_notes_sleeping_details" IS DISTINCT FROM (NEW."add_notes_sleeping_details") OR OLD."bed_fees" IS DISTINCT FROM (NEW."bed_fees") OR OLD."city_id" IS DISTINCT FROM (NEW."city_id") OR OLD."city_council_district" IS DISTINCT FROM (NEW."city_council_district") OR OLD."created_at" IS DISTINCT FROM (NEW."created_at") OR OLD."curfew" IS DISTINCT FROM (NEW."curfew") OR OLD."declined_ba_visit" IS DISTINCT FROM (NEW."declined_ba_visit") OR OLD."demographics_other" IS DISTINCT FROM (NEW."demographics_other") OR OLD."description" IS DISTINCT FROM (NEW."description") OR OLD."email" IS DISTINCT FROM (NEW."email") OR OLD."emergency_surge" IS DISTINCT FROM (NEW."emergency_surge") OR OLD."entry_info" IS DISTINCT FROM (NEW."entry_info") OR OLD."exit_policy_other" IS DISTINCT FROM (NEW."exit_policy_other") OR OLD."funders_other" IS DISTINCT FROM (NEW."funders_other") OR OLD."geolocation" IS DISTINCT FROM (NEW."geolocation") OR OLD."hero_image_id" IS DISTINCT FROM (NEW."hero_image_id") OR OLD."id" IS DISTINCT FROM (NEW."id") OR OLD."instagram" IS DISTINCT FROM (NEW."instagram") OR OLD."is_private" IS DISTINCT FROM (NEW."is_private") OR OLD."location" IS DISTINCT FROM (NEW."location") OR OLD."max_stay" IS DISTINCT FROM (NEW."max_stay") OR OLD."name" IS DISTINCT FROM (NEW."name") OR OLD."on_site_security" IS DISTINCT FROM (NEW."on_site_security") OR OLD."organization_id" IS DISTINCT FROM (NEW."organization_id") OR OLD."other_rules" IS DISTINCT FROM (NEW."other_rules") OR OLD."other_services" IS DISTINCT FROM (NEW."other_services") OR OLD."overall_rating" IS DISTINCT FROM (NEW."overall_rating") OR OLD."phone" IS DISTINCT FROM (NEW."phone") OR OLD."program_fees" IS DISTINCT FROM (NEW."program_fees") OR OLD."room_styles_other" IS DISTINCT FROM (NEW."room_styles_other") OR OLD."shelter_programs_other" IS DISTINCT FROM (NEW."shelter_programs_other") OR OLD."shelter_types_other" IS DISTINCT FROM (NEW."shelter_types_other") OR OLD."spa_id" IS DISTINCT FROM (NEW."spa_id") OR OLD."status" IS DISTINCT FROM (NEW."status") OR OLD."subjective_review" IS DISTINCT FROM (NEW."subjective_review") OR OLD."supervisorial_district" IS DISTINCT FROM (NEW."supervisorial_district") OR OLD."total_beds" IS DISTINCT FROM (NEW."total_beds") OR OLD."updated_at" IS DISTINCT FROM (NEW."updated_at") OR OLD."visitors_allowed" IS DISTINCT FROM (NEW."visitors_allowed") OR OLD."website" IS DISTINCT FROM (NEW."website"))', func='INSERT INTO "shelters_shelterevent" ("add_notes_shelter_details", "add_notes_sleeping_details", "bed_fees", "city_council_district", "city_id", "created_at", "curfew", "declined_ba_visit", "demographics_other", "description", "email", "emergency_surge", "entry_info", "exit_policy_other", "funders_other", "geolocation", "hero_image_id", "id", "instagram", "is_private", "location", "max_stay", "name", "on_site_security", "organization_id", "other_rules", "other_services", "overall_rating", "pgh_context_id", "pgh_created_at", "pgh_label", "pgh_obj_id", "phone", "program_fees", "room_styles_other", "shelter_programs_other", "shelter_types_other", "spa_id", "status", "subjective_review", "supervisorial_district", "total_beds", "updated_at", "visitors_allowed", "website") VALUES (NEW."add_notes_shelter_details", NEW."add_notes_sleeping_details", NEW."bed_fees", NEW."city_council_district", NEW."city_id", NEW."created_at", NEW."curfew", NEW."declined_ba_visit", NEW."demographics_other", NEW."description", NEW."email", NEW."emergency_surge", NEW."entry_info", NEW."exit_policy_other", NEW."funders_other", NEW."geolocation", NEW."hero_image_id", NEW."id", NEW."instagram", NEW."is_private", NEW."location", NEW."max_stay", NEW."name", NEW."on_site_security", NEW."organization_id", NEW."other_rules", NEW."other_services", NEW."overall_rating", _pgh_attach_context(), NOW(), \'shelter.update\', NEW."id", NEW."phone", NEW."program_fees", NEW."room_styles_other", NEW."shelter_programs_other", NEW."shelter_types_other", NEW."spa_id", NEW."status", NEW."subjective_review", NEW."supervisorial_district", NEW."total_beds", NEW."updated_at", NEW."visitors_allowed", NEW."website"); RETURN NULL;', hash='3158704f11a7ab07dca5b58bea49e907951eec20', operation='UPDATE', pgid='pgtrigger_shelter_update_update_086d2', table='shelters_shelter', when='AFTER')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='trackedaccessibility',
+            trigger=pgtrigger.compiler.Trigger(name='accessibility_property_tags', sql=pgtrigger.compiler.UpsertTriggerSql(func='UPDATE "shelters_shelter" SET "property_tags" = "property_tags"\n    WHERE "id" IN (OLD."shelter_id", NEW."shelter_id");\nRETURN NULL;', hash='2340f386cf6d0f46925802e9b90e7724ca5c98dd', operation='INSERT OR UPDATE OR DELETE', pgid='pgtrigger_accessibility_property_tags_320cc', table='shelters_shelter_accessibility', when='AFTER')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='trackeddemographic',
+            trigger=pgtrigger.compiler.Trigger(name='demographics_property_tags', sql=pgtrigger.compiler.UpsertTriggerSql(func='UPDATE "shelters_shelter" SET "property_tags" = "property_tags"\n    WHERE "id" IN (OLD."shelter_id", NEW."shelter_id");\nRETURN NULL;', hash='42bb78600a14a0ba2b33792b744a5c0609132fc1', operation='INSERT OR UPDATE OR DELETE', pgid='pgtrigger_demographics_property_tags_941f9', table='shelters_shelter_demographics', when='AFTER')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='trackedentryrequirement',
+            trigger=pgtrigger.compiler.Trigger(name='entry_requirements_property_tags', sql=pgtrigger.compiler.UpsertTriggerSql(func='UPDATE "shelters_shelter" SET "property_tags" = "property_tags"\n    WHERE "id" IN (OLD."shelter_id", NEW."shelter_id");\nRETURN NULL;', hash='8d13c9c8055bde7db238ca1aeb56e928bbe1a67e', operation='INSERT OR UPDATE OR DELETE', pgid='pgtrigger_entry_requirements_property_tags_e9bc9', table='shelters_shelter_entry_requirements', when='AFTER')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='trackedfunder',
+            trigger=pgtrigger.compiler.Trigger(name='funders_property_tags', sql=pgtrigger.compiler.UpsertTriggerSql(func='UPDATE "shelters_shelter" SET "property_tags" = "property_tags"\n    WHERE "id" IN (OLD."shelter_id", NEW."shelter_id");\nRETURN NULL;', hash='4ee2afce6bd973004273bbeabc6d7d1b529138fe', operation='INSERT OR UPDATE OR DELETE', pgid='pgtrigger_funders_property_tags_a38cb', table='shelters_shelter_funders', when='AFTER')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='trackedparking',
+            trigger=pgtrigger.compiler.Trigger(name='parking_property_tags', sql=pgtrigger.compiler.UpsertTriggerSql(func='UPDATE "shelters_shelter" SET "property_tags" = "property_tags"\n    WHERE "id" IN (OLD."shelter_id", NEW."shelter_id");\nRETURN NULL;', hash='c5fa3ea179b0813bc9725963529766e13219b676', operation='INSERT OR UPDATE OR DELETE', pgid='pgtrigger_parking_property_tags_7141a', table='shelters_shelter_parking', when='AFTER')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='trackedpet',
+            trigger=pgtrigger.compiler.Trigger(name='pets_property_tags', sql=pgtrigger.compiler.UpsertTriggerSql(func='UPDATE "shelters_shelter" SET "property_tags" = "property_tags"\n    WHERE "id" IN (OLD."shelter_id", NEW."shelter_id");\nRETURN NULL;', hash='b970534e3325aa3264a2e732bff8a38c914a8196', operation='INSERT OR UPDATE OR DELETE', pgid='pgtrigger_pets_property_tags_5178c', table='shelters_shelter_pets', when='AFTER')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='trackedroomstyle',
+            trigger=pgtrigger.compiler.Trigger(name='room_styles_property_tags', sql=pgtrigger.compiler.UpsertTriggerSql(func='UPDATE "shelters_shelter" SET "property_tags" = "property_tags"\n    WHERE "id" IN (OLD."shelter_id", NEW."shelter_id");\nRETURN NULL;', hash='c20de87cce3c12c5debf4e397737e96fc4c6b574', operation='INSERT OR UPDATE OR DELETE', pgid='pgtrigger_room_styles_property_tags_23776', table='shelters_shelter_room_styles', when='AFTER')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='trackedshelterprogram',
+            trigger=pgtrigger.compiler.Trigger(name='shelter_programs_property_tags', sql=pgtrigger.compiler.UpsertTriggerSql(func='UPDATE "shelters_shelter" SET "property_tags" = "property_tags"\n    WHERE "id" IN (OLD."shelter_id", NEW."shelter_id");\nRETURN NULL;', hash='db7191604569dc3e29b9035bc69052fb4976f8b2', operation='INSERT OR UPDATE OR DELETE', pgid='pgtrigger_shelter_programs_property_tags_59339', table='shelters_shelter_shelter_programs', when='AFTER')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='trackedsheltertype',
+            trigger=pgtrigger.compiler.Trigger(name='shelter_types_property_tags', sql=pgtrigger.compiler.UpsertTriggerSql(func='UPDATE "shelters_shelter" SET "property_tags" = "property_tags"\n    WHERE "id" IN (OLD."shelter_id", NEW."shelter_id");\nRETURN NULL;', hash='65d0fe7759ab2ff36c795f4b8eb5002416938ccd', operation='INSERT OR UPDATE OR DELETE', pgid='pgtrigger_shelter_types_property_tags_74b97', table='shelters_shelter_shelter_types', when='AFTER')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='trackedspecialsituationrestriction',
+            trigger=pgtrigger.compiler.Trigger(name='special_situation_restrictions_property_tags', sql=pgtrigger.compiler.UpsertTriggerSql(func='UPDATE "shelters_shelter" SET "property_tags" = "property_tags"\n    WHERE "id" IN (OLD."shelter_id", NEW."shelter_id");\nRETURN NULL;', hash='972b7528def89d4c1d78bf81deb1ad64eabf7bf2', operation='INSERT OR UPDATE OR DELETE', pgid='pgtrigger_special_situation_restrictions_property_tags_41361', table='shelters_shelter_special_situation_restrictions', when='AFTER')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='trackedstorage',
+            trigger=pgtrigger.compiler.Trigger(name='storage_property_tags', sql=pgtrigger.compiler.UpsertTriggerSql(func='UPDATE "shelters_shelter" SET "property_tags" = "property_tags"\n    WHERE "id" IN (OLD."shelter_id", NEW."shelter_id");\nRETURN NULL;', hash='6946071ca259f5121d8f6b8ec219bf34d5bbe5f9', operation='INSERT OR UPDATE OR DELETE', pgid='pgtrigger_storage_property_tags_1a977', table='shelters_shelter_storage', when='AFTER')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='trackedvaccinationrequirement',
+            trigger=pgtrigger.compiler.Trigger(name='vaccination_requirement_property_tags', sql=pgtrigger.compiler.UpsertTriggerSql(func='UPDATE "shelters_shelter" SET "property_tags" = "property_tags"\n    WHERE "id" IN (OLD."shelter_id", NEW."shelter_id");\nRETURN NULL;', hash='e9a5d7ed20dbda2503f76b1ac4cbea68b4bc1d33', operation='INSERT OR UPDATE OR DELETE', pgid='pgtrigger_vaccination_requirement_property_tags_9f21c', table='shelters_shelter_vaccination_requirement', when='AFTER')),
+        ),
+        migrations.AddField(
+            model_name='trackedreferralrequirementevent',
+            name='pgh_context',
+            field=models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='pghistory.context'),
+        ),
+        migrations.AddField(
+            model_name='trackedreferralrequirementevent',
+            name='referralrequirement',
+            field=models.ForeignKey(db_constraint=False, db_tablespace='', on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', related_query_name='+', to='shelters.referralrequirement'),
+        ),
+        migrations.AddField(
+            model_name='trackedreferralrequirementevent',
+            name='shelter',
+            field=models.ForeignKey(db_constraint=False, db_tablespace='', on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', related_query_name='+', to='shelters.shelter'),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='trackedreferralrequirement',
+            trigger=pgtrigger.compiler.Trigger(name='referral_requirement_property_tags', sql=pgtrigger.compiler.UpsertTriggerSql(func='UPDATE "shelters_shelter" SET "property_tags" = "property_tags"\n    WHERE "id" IN (OLD."shelter_id", NEW."shelter_id");\nRETURN NULL;', hash='68fa43fe060e29a110b8864483cb63059132d015', operation='INSERT OR UPDATE OR DELETE', pgid='pgtrigger_referral_requirement_property_tags_9ce67', table='shelters_shelter_referral_requirement', when='AFTER')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='trackedreferralrequirement',
+            trigger=pgtrigger.compiler.Trigger(name='shelter_referral_requirement_add_insert', sql=pgtrigger.compiler.UpsertTriggerSql(func='INSERT INTO "shelters_trackedreferralrequirementevent" ("id", "pgh_context_id", "pgh_created_at", "pgh_label", "referralrequirement_id", "shelter_id") VALUES (NEW."id", _pgh_attach_context(), NOW(), \'shelter.referral_requirement.add\', NEW."referralrequirement_id", NEW."shelter_id"); RETURN NULL;', hash='4fba8d086a888342d5b368e5e540741ae22f8d8e', operation='INSERT', pgid='pgtrigger_shelter_referral_requirement_add_insert_597e4', table='shelters_shelter_referral_requirement', when='AFTER')),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='trackedreferralrequirement',
+            trigger=pgtrigger.compiler.Trigger(name='shelter_referral_requirement_remove_delete', sql=pgtrigger.compiler.UpsertTriggerSql(func='INSERT INTO "shelters_trackedreferralrequirementevent" ("id", "pgh_context_id", "pgh_created_at", "pgh_label", "referralrequirement_id", "shelter_id") VALUES (OLD."id", _pgh_attach_context(), NOW(), \'shelter.referral_requirement.remove\', OLD."referralrequirement_id", OLD."shelter_id"); RETURN NULL;', hash='de8a4765ccb7f069144dcd1075c9b2aae1aa7e5a', operation='DELETE', pgid='pgtrigger_shelter_referral_requirement_remove_delete_041f2', table='shelters_shelter_referral_requirement', when='AFTER')),
+        ),
+        # Backfill: touching every shelter fires the tags trigger, which rebuilds its tags.
+        migrations.RunSQL(
+            sql='UPDATE "shelters_shelter" SET "property_tags" = "property_tags";',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.0.6 on 2026-10-18 22:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shelters', '0006_shelter_property_tags'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bed',
+            index=models.Index(fields=['created_at', 'id'], name='bed_created_at_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['created_at', 'id'], name='reservation_created_at_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='room',
+            index=models.Index(fields=['created_at', 'id'], name='room_created_at_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shelter',
+            index=models.Index(fields=['created_at', 'id'], name='shelter_created_at_id_idx'),
+        ),
+    ]
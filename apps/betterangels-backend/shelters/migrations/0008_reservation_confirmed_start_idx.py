@@ -0,0 +1,17 @@
+# Generated by Django 6.0.6 on 2026-10-18 22:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shelters', '0007_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(condition=models.Q(('status', 'confirmed')), fields=['start_date'], name='reservation_confirmed_start_idx'),
+        ),
+    ]
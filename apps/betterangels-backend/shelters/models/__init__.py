@@ -31,8 +31,9 @@ from .media import (
     Video,
     upload_path,
 )
+from .occupancy import BedDailyStatus, OccupancyRollupState  # noqa: F401
 from .reservation import Reservation, ReservationClient  # noqa: F401
-from .schedule import Schedule  # noqa: F401
+from .schedule import Schedule, ScheduleOpenInterval  # noqa: F401
 from .service import Service, ServiceCategory  # noqa: F401
 from .shelter import (
     Bed,
@@ -49,6 +50,7 @@ from .tracked import (
     TrackedFunder,
     TrackedParking,
     TrackedPet,
+    TrackedReferralRequirement,
     TrackedRoomStyle,
     TrackedShelterProgram,
     TrackedShelterType,
@@ -0,0 +1,62 @@
+"""Occupancy rollup models — per-bed, per-day status precomputed from the event history."""
+
+from django.db import models
+from django_choices_field import TextChoicesField
+
+from shelters.enums import BedStatusChoices
+
+from .shelter import Shelter
+
+
+class BedDailyStatus(models.Model):
+    """A bed's end-of-day status on one calendar day.
+
+    Days are calendar dates in ``SHELTER_SCHEDULE_TIME_ZONE``.  A row exists
+    only for days on which the bed existed, so ``COUNT(*)`` per day is the
+    shelter's bed total.  ``is_occupied`` is tracked separately from
+    ``status`` because an out-of-service bed can still hold a checked-in
+    reservation (daily occupancy counts it, the status chain does not).
+
+    ``bed_id`` is a plain integer rather than a foreign key: like the
+    ``BedEvent`` history it is derived from, a rollup row outlives the bed.
+    """
+
+    shelter = models.ForeignKey(Shelter, on_delete=models.CASCADE, related_name="+")
+    bed_id = models.BigIntegerField()
+    date = models.DateField()
+    status = TextChoicesField(choices_enum=BedStatusChoices)
+    is_occupied = models.BooleanField(default=False)
+
+    class Meta:
+        verbose_name_plural = "Bed daily statuses"
+        constraints = [
+            models.UniqueConstraint(fields=["shelter", "date", "bed_id"], name="unique_bed_daily_status"),
+        ]
+
+    def __str__(self) -> str:
+        return f"Bed #{self.bed_id} on {self.date} ({self.status})"
+
+
+class OccupancyRollupState(models.Model):
+    """Bookkeeping for a shelter's ``BedDailyStatus`` rows.
+
+    ``rolled_through`` is the last day with rollup rows.  The two watermarks
+    are the highest ``pgh_id`` of each event table that had been applied when
+    the rows were written; any event for the shelter above a watermark means
+    the rows from that event's day onward are stale.  ``refreshed_at`` anchors
+    the refresh's lookback for events committed below a watermark.
+    """
+
+    shelter = models.OneToOneField(
+        Shelter,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="occupancy_rollup_state",
+    )
+    rolled_through = models.DateField(blank=True, null=True)
+    bed_event_watermark = models.BigIntegerField(default=0)
+    reservation_event_watermark = models.BigIntegerField(default=0)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"{self.shelter} rolled through {self.rolled_through}"
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pghistory
 from common.models import BaseModel
@@ -9,6 +9,7 @@ from django.db import models
 from django.db.models import UniqueConstraint
 from django_choices_field import TextChoicesField
 from shelters.enums import ReservationStatusChoices
+from shelters.triggers import reservation_status_sync_trigger
 
 from .shelter import ACTIVE_RESERVATION_STATUSES, Bed, Room
 
@@ -43,6 +44,13 @@ class Reservation(BaseModel):
             models.Index(fields=["bed", "status"], name="reservation_bed_status_idx"),
             models.Index(fields=["room", "status", "checked_out_at"], name="reservation_room_status_co_idx"),
             models.Index(fields=["room", "status"], name="reservation_room_status_idx"),
+            models.Index(fields=["created_at", "id"], name="reservation_created_at_id_idx"),
+            # Serves the overdue sweep, which only ever looks at confirmed reservations.
+            models.Index(
+                fields=["start_date"],
+                condition=models.Q(status=ReservationStatusChoices.CONFIRMED),
+                name="reservation_confirmed_start_idx",
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -56,6 +64,31 @@ class Reservation(BaseModel):
                 name="unique_active_reservation_per_room",
             ),
         ]
+        triggers = [reservation_status_sync_trigger(name="reservation_sync_current_status")]
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        super().save(*args, **kwargs)
+        self._refresh_reservable_status()
+
+    def delete(self, *args: Any, **kwargs: Any) -> tuple[int, dict[str, int]]:
+        deleted = super().delete(*args, **kwargs)
+        self._refresh_reservable_status()
+        return deleted
+
+    def _refresh_reservable_status(self) -> None:
+        """Reload ``current_status`` on the bed and room instances this reservation holds.
+
+        The write above already changed their rows through the status trigger;
+        this keeps the in-memory instances (the ones callers passed in, or
+        ``clean()`` loaded) in step.  A bed or room the reservation was moved
+        away from is no longer held here and must be refreshed by its owner.
+        """
+        for name in ("bed", "room"):
+            reservable = self._meta.get_field(name).get_cached_value(self, default=None)  # type: ignore[union-attr]
+            if reservable is not None and reservable.pk is not None:
+                reservable.refresh_from_db(fields=["current_status"])
+                # A ``with_computed_status()`` annotation would shadow the reloaded column.
+                reservable.__dict__.pop("_computed_status", None)
 
     def clean(self) -> None:
         super().clean()
@@ -2,6 +2,8 @@
 
 import pghistory
 from common.models import BaseModel
+from django.contrib.postgres.fields import IntegerRangeField
+from django.contrib.postgres.indexes import GistIndex
 from django.db import models
 from django.db.models import Case, ExpressionWrapper, F, Q, UniqueConstraint, Value, When
 from django.db.models.functions import Cast, Coalesce, Extract, Mod, NullIf
@@ -9,6 +11,7 @@ from django_choices_field import TextChoicesField
 
 from shelters.constants import DAILY_MINUTES
 from shelters.enums import ConditionChoices, DayOfWeekChoices, ScheduleTypeChoices
+from shelters.triggers import schedule_open_intervals_trigger
 
 from .lookups import Demographic
 from .shelter import Shelter
@@ -159,16 +162,7 @@ class Schedule(BaseModel):
     is_exception = models.BooleanField(default=False, blank=True)
 
     class Meta:
-        # Composite index backing the correlated ``Exists`` subqueries in
-        # ``shelters.open_at.shelters_open_at``, which filter schedules by
-        # (shelter, schedule_type, is_exception) — especially when multiple
-        # schedule types are requested in one query.
-        indexes = [
-            models.Index(
-                fields=["shelter", "schedule_type", "is_exception"],
-                name="sched_shelter_type_except_idx",
-            ),
-        ]
+        triggers = [schedule_open_intervals_trigger(name="schedule_open_intervals")]
         constraints = [
             UniqueConstraint(
                 fields=["shelter", "schedule_type", "day", "start_time", "start_date"],
@@ -210,3 +204,32 @@ class Schedule(BaseModel):
         if self.start_time and self.end_time:
             return f"{label} ({self.start_time.strftime('%I:%M%p')}-{self.end_time.strftime('%I:%M%p')})"
         return label
+
+
+class ScheduleOpenInterval(models.Model):
+    """One contiguous range of the week in which a schedule row applies.
+
+    ``minutes`` is a half-open range on the 10080-minute week clock (Monday
+    00:00 = 0); see ``shelters.triggers`` for how schedules are expanded.
+    The date bounds, type and exception flag are copied from the schedule so
+    ``shelters_open_at`` can answer from this table alone.
+
+    Rows are written and removed only by the ``schedule_open_intervals``
+    trigger on ``Schedule``, hence ``DO_NOTHING``.
+    """
+
+    schedule = models.ForeignKey(Schedule, on_delete=models.DO_NOTHING, related_name="open_intervals")
+    shelter = models.ForeignKey(Shelter, on_delete=models.DO_NOTHING, related_name="+")
+    schedule_type = TextChoicesField(choices_enum=ScheduleTypeChoices)
+    is_exception = models.BooleanField()
+    start_date = models.DateField(null=True)
+    end_date = models.DateField(null=True)
+    minutes = IntegerRangeField()
+
+    class Meta:
+        indexes = [
+            GistIndex(fields=["schedule_type", "minutes"], name="sched_interval_type_minutes_gist"),
+        ]
+
+    def __str__(self) -> str:
+        return f"Schedule #{self.schedule_id} {self.schedule_type} {self.minutes}"
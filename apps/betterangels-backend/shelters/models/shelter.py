@@ -8,6 +8,8 @@ import pghistory
 from common.models import BaseModel
 from common.permissions.utils import PermissionSet, perm
 from django.contrib.gis.db.models import PointField
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.contrib.gis.geos import Point
 from django.db import models
 from django.db.models import UniqueConstraint
@@ -30,8 +32,9 @@ from shelters.enums import (
     StatusChoices,
 )
 from shelters.managers import BedManager, RoomManager, ShelterManager
-from shelters.open_at import shelters_open_at
-from shelters.status import compute_bed_status, compute_room_status, get_last_completed_checkout
+from shelters.open_at import open_shelter_ids
+from shelters.selectors.computed_status import ShelterStatusCounts
+from shelters.triggers import current_status_trigger, shelter_property_tags_trigger
 
 from .lookups import (
     SPA,
@@ -65,6 +68,8 @@ ACTIVE_RESERVATION_STATUSES = (
     pghistory.InsertEvent("shelter.add"),
     pghistory.UpdateEvent("shelter.update"),
     pghistory.DeleteEvent("shelter.remove"),
+    # Derived from the property M2Ms by trigger; those changes are tracked on the through tables.
+    exclude=["property_tags"],
 )
 class Shelter(BaseModel):
     class perms(PermissionSet):
@@ -73,6 +78,10 @@ class Shelter(BaseModel):
 
     objects: ShelterManager = ShelterManager()
 
+    # Computed status counts; prefetch them for a list of shelters (see ``ShelterStatusCounts``).
+    bed_status_counts = ShelterStatusCounts("beds")
+    room_status_counts = ShelterStatusCounts("rooms")
+
     # Basic Information
     name = models.CharField(max_length=255)
     organization = models.ForeignKey(Organization, on_delete=models.SET_NULL, blank=True, null=True)
@@ -185,8 +194,22 @@ class Shelter(BaseModel):
         help_text="Private shelters are only visible to verified case workers with the appropriate permission.",
     )
 
+    # Denormalized property choices, see shelters/property_tags.py
+    property_tags = ArrayField(
+        models.TextField(),
+        default=list,
+        blank=True,
+        editable=False,
+        help_text="Maintained by database triggers; see shelters/triggers.py.",
+    )
+
     class Meta:
-        indexes = [models.Index(fields=["status", "is_private"])]
+        indexes = [
+            models.Index(fields=["status", "is_private"]),
+            GinIndex(fields=["property_tags"], name="shelter_property_tags_gin"),
+            models.Index(fields=["created_at", "id"], name="shelter_created_at_id_idx"),
+        ]
+        triggers = [shelter_property_tags_trigger(name="shelter_property_tags")]
 
     def __str__(self) -> str:
         return self.name
@@ -196,14 +219,14 @@ class Shelter(BaseModel):
         dt: datetime.datetime,
         schedule_type: ScheduleTypeChoices | None = None,
     ) -> bool:
-        """Return whether this shelter is open at *dt* per its schedule."""
+        """Return whether this shelter is open at *dt* per its schedule.
+
+        For many shelters use ``shelters.open_at.open_shelter_ids``, which
+        answers for all of them in one query.
+        """
         if schedule_type is None:
             schedule_type = ScheduleTypeChoices.OPERATING
-        return shelters_open_at(
-            type(self).objects.filter(pk=self.pk),
-            dt=dt,
-            schedule_types=[schedule_type],
-        ).exists()
+        return self.pk in open_shelter_ids([self.pk], dt=dt, schedule_types=[schedule_type])
 
     def save(self, *args: Any, **kwargs: Any) -> None:
         latitude = self.location.latitude if self.location else None
@@ -217,12 +240,48 @@ class Shelter(BaseModel):
         super().save(*args, **kwargs)
 
 
+class CurrentStatusMixin(models.Model):
+    """Reload the trigger-maintained ``current_status`` on every save.
+
+    On update the column is written as ``F("current_status")``: that re-fires
+    the status trigger and lets Django read the recomputed value back through
+    ``RETURNING``.  Inserts write ``DEFAULT`` and read the trigger's value the
+    same way.  ``bulk_create`` and ``QuerySet.update()`` still go through the
+    triggers but leave in-memory instances as they were.
+
+    The value is a snapshot: a reservation written elsewhere changes the row
+    but not instances already in memory.  ``Reservation.save()`` and
+    ``delete()`` reload the bed and room they hold; any other instance needs
+    ``refresh_from_db(fields=["current_status"])`` before its status is read.
+    """
+
+    current_status: Any
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"maintenance_flag", "last_cleaned"} & set(update_fields):
+            update_fields = kwargs["update_fields"] = {*update_fields, "current_status"}
+
+        if self._state.adding:
+            # Whatever was assigned is replaced by the trigger; DEFAULT makes Django read it back.
+            self.current_status = self._meta.get_field("current_status").get_default()
+        elif update_fields is None or "current_status" in update_fields:
+            self.current_status = models.F("current_status")
+
+        super().save(*args, **kwargs)
+
+
 @pghistory.track(
     pghistory.InsertEvent("bed.add"),
     pghistory.DeleteEvent("bed.remove"),
     pghistory.UpdateEvent("bed.update"),
+    # Derived from reservations by trigger; recording it would add an event per status change.
+    exclude=["current_status"],
 )
-class Bed(CloneMixin, BaseModel):
+class Bed(CurrentStatusMixin, CloneMixin, BaseModel):
     objects = BedManager()
 
     _clone_linked_m2m_fields = [
@@ -234,6 +293,7 @@ class Bed(CloneMixin, BaseModel):
     ]
     _clone_excluded_fields = [
         # Excluded so cloned beds always start AVAILABLE (maintenance_flag=False).
+        "current_status",
         "last_cleaned",
         "last_cleaned_inspected",
         "maintenance_flag",
@@ -242,6 +302,12 @@ class Bed(CloneMixin, BaseModel):
 
     accessibility = models.ManyToManyField(Accessibility, blank=True)
     b7 = models.BooleanField(default=False, blank=True)
+    current_status = TextChoicesField(
+        choices_enum=BedStatusChoices,
+        db_default=BedStatusChoices.AVAILABLE,
+        editable=False,
+        help_text="Maintained by database triggers; see shelters/triggers.py.",
+    )
     demographics = models.ManyToManyField(Demographic, blank=True)
     fees = models.PositiveIntegerField(blank=True, null=True)
     funders = models.ManyToManyField(Funder, blank=True)
@@ -260,30 +326,23 @@ class Bed(CloneMixin, BaseModel):
     class Meta:
         indexes = [
             models.Index(fields=["shelter"]),
+            models.Index(fields=["shelter", "current_status"], name="bed_shelter_status_idx"),
+            models.Index(fields=["created_at", "id"], name="bed_created_at_id_idx"),
         ]
+        triggers = [current_status_trigger(name="bed_current_status", fk_column="bed_id")]
 
     @property
     def computed_status(self) -> BedStatusChoices:
         """Return computed status.
 
-        List/detail querysets should use ``Bed.objects.with_computed_status()`` so
-        ``_computed_status`` is set via SQL annotation. Otherwise falls back to
-        pure-Python rules in ``status.py`` (single-object paths like tests).
+        Reads the trigger-maintained ``current_status`` column, or the
+        ``_computed_status`` annotation set by ``Bed.objects.with_computed_status()``.
         """
         annotated = getattr(self, "_computed_status", None)
-        if annotated is not None:
-            return BedStatusChoices(annotated)
-
-        active = self.reservations.filter(status__in=ACTIVE_RESERVATION_STATUSES)
-        return compute_bed_status(
-            maintenance_flag=self.maintenance_flag,
-            last_cleaned=self.last_cleaned,
-            last_checkout=get_last_completed_checkout(self.reservations.all()),
-            active_reservation_statuses={r.status for r in active},
-        )
+        return BedStatusChoices(annotated if annotated is not None else self.current_status)
 
 
-class Room(CloneMixin, BaseModel):
+class Room(CurrentStatusMixin, CloneMixin, BaseModel):
     objects = RoomManager()
 
     _clone_linked_m2m_fields = [
@@ -294,6 +353,7 @@ class Room(CloneMixin, BaseModel):
     ]
     _clone_excluded_fields = [
         # Excluded so cloned rooms start fresh (AVAILABLE, no operational state).
+        "current_status",
         "last_cleaned",
         "last_cleaned_inspected",
         "maintenance_flag",
@@ -302,6 +362,12 @@ class Room(CloneMixin, BaseModel):
     ]
     accessibility = models.ManyToManyField(Accessibility, blank=True)
     amenities = models.TextField(blank=True, null=True)
+    current_status = TextChoicesField(
+        choices_enum=RoomStatusChoices,
+        db_default=RoomStatusChoices.AVAILABLE,
+        editable=False,
+        help_text="Maintained by database triggers; see shelters/triggers.py.",
+    )
     demographics = models.ManyToManyField(Demographic, blank=True)
     funders = models.ManyToManyField(Funder, blank=True)
     last_cleaned = models.DateTimeField(blank=True, null=True)
@@ -323,6 +389,11 @@ class Room(CloneMixin, BaseModel):
                 name="unique_room_per_shelter",
             )
         ]
+        indexes = [
+            models.Index(fields=["shelter", "current_status"], name="room_shelter_status_idx"),
+            models.Index(fields=["created_at", "id"], name="room_created_at_id_idx"),
+        ]
+        triggers = [current_status_trigger(name="room_current_status", fk_column="room_id")]
 
     def __str__(self) -> str:
         return f"{self.shelter.name} - {self.name}"
@@ -331,21 +402,11 @@ class Room(CloneMixin, BaseModel):
     def computed_status(self) -> RoomStatusChoices:
         """Return computed status.
 
-        List/detail querysets should use ``Room.objects.with_computed_status()`` so
-        ``_computed_status`` is set via SQL annotation. Otherwise falls back to
-        pure-Python rules in ``status.py`` (single-object paths like tests).
+        Reads the trigger-maintained ``current_status`` column, or the
+        ``_computed_status`` annotation set by ``Room.objects.with_computed_status()``.
         """
         annotated = getattr(self, "_computed_status", None)
-        if annotated is not None:
-            return RoomStatusChoices(annotated)
-
-        active = self.reservations.filter(status__in=ACTIVE_RESERVATION_STATUSES)
-        return compute_room_status(
-            maintenance_flag=self.maintenance_flag,
-            last_cleaned=self.last_cleaned,
-            last_checkout=get_last_completed_checkout(self.reservations.all()),
-            active_reservation_statuses={r.status for r in active},
-        )
+        return RoomStatusChoices(annotated if annotated is not None else self.current_status)
 
 
 @pghistory.track(
@@ -2,6 +2,8 @@
 
 import pghistory
 
+from shelters.triggers import shelter_property_sync_trigger
+
 from .shelter import Shelter
 
 
@@ -13,6 +15,7 @@ from .shelter import Shelter
 class TrackedDemographic(Shelter.demographics.through):  # type: ignore[name-defined]
     class Meta:
         proxy = True
+        triggers = [shelter_property_sync_trigger(name="demographics_property_tags")]
 
 
 @pghistory.track(
@@ -23,6 +26,7 @@ class TrackedDemographic(Shelter.demographics.through):  # type: ignore[name-def
 class TrackedSpecialSituationRestriction(Shelter.special_situation_restrictions.through):  # type: ignore[name-defined]
     class Meta:
         proxy = True
+        triggers = [shelter_property_sync_trigger(name="special_situation_restrictions_property_tags")]
 
 
 @pghistory.track(
@@ -33,6 +37,7 @@ class TrackedSpecialSituationRestriction(Shelter.special_situation_restrictions.
 class TrackedShelterType(Shelter.shelter_types.through):  # type: ignore[name-defined]
     class Meta:
         proxy = True
+        triggers = [shelter_property_sync_trigger(name="shelter_types_property_tags")]
 
 
 @pghistory.track(
@@ -43,6 +48,7 @@ class TrackedShelterType(Shelter.shelter_types.through):  # type: ignore[name-de
 class TrackedRoomStyle(Shelter.room_styles.through):  # type: ignore[name-defined]
     class Meta:
         proxy = True
+        triggers = [shelter_property_sync_trigger(name="room_styles_property_tags")]
 
 
 @pghistory.track(
@@ -53,6 +59,7 @@ class TrackedRoomStyle(Shelter.room_styles.through):  # type: ignore[name-define
 class TrackedAccessibility(Shelter.accessibility.through):  # type: ignore[name-defined]
     class Meta:
         proxy = True
+        triggers = [shelter_property_sync_trigger(name="accessibility_property_tags")]
 
 
 @pghistory.track(
@@ -63,6 +70,7 @@ class TrackedAccessibility(Shelter.accessibility.through):  # type: ignore[name-
 class TrackedStorage(Shelter.storage.through):  # type: ignore[name-defined]
     class Meta:
         proxy = True
+        triggers = [shelter_property_sync_trigger(name="storage_property_tags")]
 
 
 @pghistory.track(
@@ -73,6 +81,7 @@ class TrackedStorage(Shelter.storage.through):  # type: ignore[name-defined]
 class TrackedPet(Shelter.pets.through):  # type: ignore[name-defined]
     class Meta:
         proxy = True
+        triggers = [shelter_property_sync_trigger(name="pets_property_tags")]
 
 
 @pghistory.track(
@@ -83,6 +92,7 @@ class TrackedPet(Shelter.pets.through):  # type: ignore[name-defined]
 class TrackedParking(Shelter.parking.through):  # type: ignore[name-defined]
     class Meta:
         proxy = True
+        triggers = [shelter_property_sync_trigger(name="parking_property_tags")]
 
 
 @pghistory.track(
@@ -93,6 +103,18 @@ class TrackedParking(Shelter.parking.through):  # type: ignore[name-defined]
 class TrackedEntryRequirement(Shelter.entry_requirements.through):  # type: ignore[name-defined]
     class Meta:
         proxy = True
+        triggers = [shelter_property_sync_trigger(name="entry_requirements_property_tags")]
+
+
+@pghistory.track(
+    pghistory.InsertEvent("shelter.referral_requirement.add"),
+    pghistory.DeleteEvent("shelter.referral_requirement.remove"),
+    obj_field=None,
+)
+class TrackedReferralRequirement(Shelter.referral_requirement.through):  # type: ignore[name-defined]
+    class Meta:
+        proxy = True
+        triggers = [shelter_property_sync_trigger(name="referral_requirement_property_tags")]
 
 
 @pghistory.track(
@@ -103,6 +125,7 @@ class TrackedEntryRequirement(Shelter.entry_requirements.through):  # type: igno
 class TrackedVaccinationRequirement(Shelter.vaccination_requirement.through):  # type: ignore[name-defined]
     class Meta:
         proxy = True
+        triggers = [shelter_property_sync_trigger(name="vaccination_requirement_property_tags")]
 
 
 @pghistory.track(
@@ -133,6 +156,7 @@ class TrackedSPA(Shelter.spas_served.through):  # type: ignore[name-defined]
 class TrackedShelterProgram(Shelter.shelter_programs.through):  # type: ignore[name-defined]
     class Meta:
         proxy = True
+        triggers = [shelter_property_sync_trigger(name="shelter_programs_property_tags")]
 
 
 @pghistory.track(
@@ -143,3 +167,4 @@ class TrackedShelterProgram(Shelter.shelter_programs.through):  # type: ignore[n
 class TrackedFunder(Shelter.funders.through):  # type: ignore[name-defined]
     class Meta:
         proxy = True
+        triggers = [shelter_property_sync_trigger(name="funders_property_tags")]
@@ -1,17 +1,41 @@
 """Shelter open-at query — determines which shelters are open at a given datetime."""
 
 import datetime
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Iterable, Sequence
 
-from django.db.models import Exists, F, OuterRef, Q, QuerySet, Value
-from django.db.models.functions import Mod
-from django.db.models.lookups import LessThan
+from django.db.models import Count, Q, QuerySet
 
-from shelters.constants import DAILY_MINUTES, WEEK_MINUTES
-from shelters.enums import DayOfWeekChoices, ScheduleTypeChoices
+from shelters.constants import DAILY_MINUTES
+from shelters.enums import ScheduleTypeChoices
 
 if TYPE_CHECKING:
-    from shelters.models import Shelter
+    from shelters.models import ScheduleOpenInterval, Shelter
+
+
+def _open_interval_groups(
+    *,
+    dt: datetime.datetime,
+    schedule_types: Sequence[ScheduleTypeChoices],
+) -> "QuerySet[ScheduleOpenInterval]":
+    """``(shelter_id, schedule_type)`` groups that are open at *dt*, as ``values("shelter_id")``."""
+    from shelters.models import ScheduleOpenInterval
+
+    # Python's weekday() returns Monday=0, the origin of the interval week clock.
+    query_wm = dt.weekday() * DAILY_MINUTES + dt.hour * 60 + dt.minute
+    date = dt.date()
+
+    return (
+        ScheduleOpenInterval.objects.filter(
+            Q(start_date=None) | Q(start_date__lte=date),
+            Q(end_date=None) | Q(end_date__gte=date),
+            schedule_type__in=schedule_types,
+            minutes__contains=query_wm,
+        )
+        .values("shelter_id", "schedule_type")
+        .annotate(exceptions=Count("pk", filter=Q(is_exception=True)))
+        .filter(exceptions=0)
+        .values("shelter_id")
+    )
 
 
 def shelters_open_at(
@@ -22,110 +46,47 @@ def shelters_open_at(
 ) -> "QuerySet[Shelter]":
     """Return shelters whose schedule says they are open at *dt* in ANY of *schedule_types*.
 
-    The filter:
-    1. Finds a non-exception schedule row matching the weekday + time window
-       (respecting optional seasonal date bounds and overnight schedules).
-    2. Excludes shelters that have an active exception covering *dt*
-       (full-day or partial-day).
+    A shelter is open under a schedule type when, at *dt*:
+    1. a non-exception schedule row of that type covers the weekday + time
+       (respecting optional seasonal date bounds and overnight schedules), and
+    2. no exception row of that type (full-day or partial-day) covers it.
 
     When multiple ``schedule_types`` are supplied, the shelter is included if it
     is open under **any** of the given types (union). Exceptions apply per-type:
     a partial-day exception for INTAKE does not affect the OPERATING window.
+    An empty ``schedule_types`` leaves the queryset unfiltered.
 
-    Uses precomputed ``start_cycle_minutes`` / ``duration_minutes`` columns
-    with modular arithmetic so that overnight schedules (e.g. 6 PM – 2 AM)
-    and normal schedules (9 AM – 5 PM) are handled by the same branchless
-    condition — no is_normal / is_overnight distinction needed.
-
-    **How the modulo check works**
-
-    Every schedule is represented as a cyclic interval
-    ``[start_cycle_minutes, start_cycle_minutes + duration_minutes)`` on a
-    10080-minute clock (Monday 00:00 = 0, Sunday 23:59 = 10079).  For a
-    query at week-minute *q*, the condition
+    **How it works**
 
-        ``(q − start + 10080) % 10080 < duration``
-
-    is true exactly when *q* falls inside the interval.  Adding 10080
-    before the modulo ensures the dividend is never negative.
-
-    For every-day schedules (``day=None``) the interval is stored on a
-    1440-minute daily clock instead.
+    Every schedule row is kept, by a trigger, as one or more
+    ``ScheduleOpenInterval`` ranges on a 10080-minute week clock (Monday
+    00:00 = 0).  Every-day schedules are expanded to each weekday, full-day
+    schedules cover the whole day, and overnight spans past Sunday midnight
+    wrap to Monday.  Both conditions above then reduce to one GiST-indexed
+    containment probe, ``minutes @> q``, grouped per (shelter, type): the
+    group is open when none of its covering rows is an exception.
 
     .. note::
 
         Start time is **inclusive**, end time is **exclusive**.
         A close time of 15:00 means the shelter is closed *at* 15:00.
     """
-    from shelters.models import Schedule
-
-    # Python's weekday() returns Monday=0, matching the model's day_offset
-    # Case (Monday=0, …, Sunday=6).
-    query_wm = dt.weekday() * DAILY_MINUTES + dt.hour * 60 + dt.minute
-    query_dm = dt.hour * 60 + dt.minute
-    date = dt.date()
-    day_enum = DayOfWeekChoices.from_date(date)
-
-    # Branchless time-window cover for both normal and overnight schedules.
-    # Every-day schedules (day=None) use the daily clock; day-specific
-    # schedules use the weekly clock.
-    every_day_window = Q(
-        day__isnull=True,
-    ) & Q(
-        LessThan(
-            Mod(Value(query_dm) - F("start_cycle_minutes") + DAILY_MINUTES, DAILY_MINUTES),
-            F("duration_minutes"),
-        ),
-    )
-    day_specific_window = Q(
-        day__isnull=False,
-    ) & Q(
-        LessThan(
-            Mod(Value(query_wm) - F("start_cycle_minutes") + WEEK_MINUTES, WEEK_MINUTES),
-            F("duration_minutes"),
-        ),
-    )
-    timed_covers = every_day_window | day_specific_window
-
-    # Full-day schedules (start_time IS NULL) match purely by day.
-    full_day_covers = Q(start_time__isnull=True) & (Q(day__isnull=True) | Q(day=day_enum))
-
-    covers = timed_covers | full_day_covers
-
-    # For each requested schedule type independently:
-    #   - The shelter must have a non-exception schedule row of that type
-    #     covering *dt*.
-    #   - The shelter must NOT have an active exception of that type
-    #     covering *dt*.
-    # The shelter is included in the final result if it is "open" under ANY
-    # of the requested schedule types (union / OR).  An empty iterable
-    # results in ``Q()``, which is a no-op filter.
-    open_condition = Q()
-    for schedule_type in schedule_types:
-        is_open = Exists(
-            Schedule.objects.filter(
-                shelter=OuterRef("pk"),
-                schedule_type=schedule_type,
-                is_exception=False,
-            ).filter(
-                covers,
-                Q(start_date=None) | Q(start_date__lte=date),
-                Q(end_date=None) | Q(end_date__gte=date),
-            )
-        )
+    if not schedule_types:
+        return queryset
 
-        has_active_exception = Exists(
-            Schedule.objects.filter(
-                shelter=OuterRef("pk"),
-                schedule_type=schedule_type,
-                is_exception=True,
-            ).filter(
-                covers,
-                Q(start_date=None) | Q(start_date__lte=date),
-                Q(end_date=None) | Q(end_date__gte=date),
-            )
-        )
+    return queryset.filter(pk__in=_open_interval_groups(dt=dt, schedule_types=schedule_types))
 
-        open_condition |= is_open & ~has_active_exception
 
-    return queryset.filter(open_condition)
+def open_shelter_ids(
+    shelter_ids: Iterable[int],
+    *,
+    dt: datetime.datetime,
+    schedule_types: Sequence[ScheduleTypeChoices],
+) -> set[int]:
+    """Batch ``Shelter.is_open_at``: the subset of *shelter_ids* open at *dt*, in one query."""
+    shelter_ids = list(shelter_ids)
+    if not shelter_ids or not schedule_types:
+        return set()
+
+    groups = _open_interval_groups(dt=dt, schedule_types=schedule_types).filter(shelter_id__in=shelter_ids)
+    return set(groups.values_list("shelter_id", flat=True))
@@ -0,0 +1,54 @@
+"""Shelter property tags — the denormalized ``Shelter.property_tags`` array.
+
+Every choice a shelter holds in one of its property M2Ms is stored as a
+``"<field>:<value>"`` tag, and a field with no choices at all as the bare
+``"<field>:"`` tag.  The array is kept current by database triggers (see
+``shelters/triggers.py``) and GIN-indexed, so property filters are array
+overlaps on the shelter row instead of one join (plus ``DISTINCT``) per
+M2M.
+"""
+
+from typing import Iterable
+
+from django.db.models import Q
+
+# Shelter M2M field -> lowercased lookup model.  Through tables and their
+# columns follow Django's defaults (``shelters_shelter_<field>``,
+# ``shelter_id``, ``<lookup>_id``).
+SHELTER_PROPERTY_LOOKUPS = {
+    "accessibility": "accessibility",
+    "demographics": "demographic",
+    "entry_requirements": "entryrequirement",
+    "funders": "funder",
+    "parking": "parking",
+    "pets": "pet",
+    "referral_requirement": "referralrequirement",
+    "room_styles": "roomstyle",
+    "shelter_programs": "shelterprogram",
+    "shelter_types": "sheltertype",
+    "special_situation_restrictions": "specialsituationrestriction",
+    "storage": "storage",
+    "vaccination_requirement": "vaccinationrequirement",
+}
+
+
+def property_tag(field: str, value: str | None = None) -> str:
+    """Tag for *value* of *field*; without a value, the tag of an empty *field*."""
+    return f"{field}:{value or ''}"
+
+
+def property_filter(
+    field: str,
+    values: Iterable[str] | None,
+    *,
+    include_null: bool = False,
+    prefix: str = "",
+) -> Q:
+    """Shelters holding any of *values* in *field* (or, with *include_null*, none at all)."""
+    tags = [property_tag(field, value) for value in values or ()]
+    if include_null:
+        tags.append(property_tag(field))
+    if not tags:
+        return Q()
+
+    return Q(**{f"{prefix}property_tags__overlap": tags})
@@ -5,6 +5,7 @@ import strawberry
 import strawberry_django
 from accounts.extensions import HasOrgPerm
 from accounts.models import User
+from common.graphql.pagination import KeysetPaginated, keyset_paginated
 from common.graphql.types import (
     AuthorizedPresignedS3UploadsType,
     BulkDeleteInput,
@@ -15,9 +16,14 @@ from django.db.models import Max
 from django.utils import timezone
 from shelters.enums import StatusChoices
 from shelters.models import Bed, Reservation, Room, Shelter
-from shelters.selectors import shelter_get, shelter_occupancy_metrics as shelter_occupancy_metrics_selector
+from shelters.selectors import (
+    shelter_get,
+    shelter_list,
+    shelter_occupancy_metrics as shelter_occupancy_metrics_selector,
+)
+from shelters.selectors.map import shelter_map_clusters as shelter_map_clusters_selector
 from shelters.services import shelter_photo
-from shelters.types.filters import SHELTER_SCHEDULE_TIME_ZONE
+from shelters.types.filters import SHELTER_SCHEDULE_TIME_ZONE, get_current_shelter_schedule_datetime
 from shelters.services.shelter_photo import UploadRequest, ShelterPhotoResolveItem
 from shelters.services.bed import bed_clone, bed_create, bed_delete, bed_update
 from shelters.services.reservation import reservation_create, reservation_delete, reservation_update
@@ -36,6 +42,8 @@ from shelters.types import (
     ResolveShelterPhotoUploadsInput,
     RoomType,
     ServiceCategoryType,
+    ShelterFilter,
+    ShelterMapClusterType,
     ShelterOccupancyMetricsType,
     ShelterPhotoType,
     ShelterPhotoUploadsType,
@@ -63,9 +71,15 @@ class Query:
         permission_classes=[IsAuthenticated],
         extensions=[HasOrgPerm(Shelter.perms.VIEW)],
     )
+    operator_shelters_keyset: KeysetPaginated[OperatorShelterType] = keyset_paginated(
+        key=("-created_at", "-id"),
+        permission_classes=[IsAuthenticated],
+        extensions=[HasOrgPerm(Shelter.perms.VIEW)],
+    )
 
     shelter: ShelterType = strawberry_django.field()
     shelters: OffsetPaginated[ShelterType] = strawberry_django.offset_paginated()
+    shelters_keyset: KeysetPaginated[ShelterType] = keyset_paginated(key=("-created_at", "-id"))
 
     bed: BedType = strawberry_django.field(
         permission_classes=[IsAuthenticated],
@@ -75,6 +89,11 @@ class Query:
         permission_classes=[IsAuthenticated],
         extensions=[HasOrgPerm(Bed.perms.VIEW)],
     )
+    beds_keyset: KeysetPaginated[BedType] = keyset_paginated(
+        key=("-created_at", "-id"),
+        permission_classes=[IsAuthenticated],
+        extensions=[HasOrgPerm(Bed.perms.VIEW)],
+    )
 
     reservation: ReservationType = strawberry_django.field(
         permission_classes=[IsAuthenticated],
@@ -84,6 +103,11 @@ class Query:
         permission_classes=[IsAuthenticated],
         extensions=[HasOrgPerm(Reservation.perms.VIEW)],
     )
+    reservations_keyset: KeysetPaginated[ReservationType] = keyset_paginated(
+        key=("-created_at", "-id"),
+        permission_classes=[IsAuthenticated],
+        extensions=[HasOrgPerm(Reservation.perms.VIEW)],
+    )
 
     room: RoomType = strawberry_django.field(
         permission_classes=[IsAuthenticated],
@@ -93,6 +117,11 @@ class Query:
         permission_classes=[IsAuthenticated],
         extensions=[HasOrgPerm(Room.perms.VIEW)],
     )
+    rooms_keyset: KeysetPaginated[RoomType] = keyset_paginated(
+        key=("-created_at", "-id"),
+        permission_classes=[IsAuthenticated],
+        extensions=[HasOrgPerm(Room.perms.VIEW)],
+    )
 
     shelter_service_categories: OffsetPaginated[ServiceCategoryType] = strawberry_django.offset_paginated(
         permission_classes=[IsAuthenticated],
@@ -105,6 +134,36 @@ class Query:
         permission_classes=[IsAuthenticated],
     )
 
+    @strawberry.field()
+    def shelter_map_clusters(
+        self,
+        info: Info,
+        zoom: int,
+        x: int,
+        y: int,
+        filters: Optional[ShelterFilter] = None,
+    ) -> list[ShelterMapClusterType]:
+        user = get_current_user(info)
+        queryset = shelter_list(Shelter.objects.all(), user=user)
+        # Besides the filters, results depend on private-shelter visibility and, through
+        # the organizations filter, on the user's own organizations.
+        if filters and filters.organizations and user.is_authenticated:
+            scope: object = user.pk
+        else:
+            scope = user.is_authenticated and user.has_perm(Shelter.perms.VIEW_PRIVATE)
+        signature: dict[str, object] = {"filters": strawberry.asdict(filters) if filters else None, "scope": scope}
+        if filters and (filters.open_now or filters.open_now_for):
+            # Open-now results move with the clock; schedules resolve to the minute.
+            signature["open_at"] = get_current_shelter_schedule_datetime().replace(second=0, microsecond=0)
+        clusters = shelter_map_clusters_selector(
+            strawberry_django.filters.apply(filters, queryset, info=info),
+            zoom=zoom,
+            x=x,
+            y=y,
+            signature=signature,
+        )
+        return [ShelterMapClusterType(**cluster) for cluster in clusters]
+
     @strawberry.field()
     def shelter_max_stay(self, info: Info) -> Optional[int]:
         return Shelter.objects.filter(status=StatusChoices.APPROVED).aggregate(Max("max_stay"))["max_stay__max"] or None
@@ -19,4 +19,5 @@ from shelters.selectors.reports import (
     report_bed_status_counts,
     reservation_status_change_counts,
     shelter_occupancy_metrics,
+    shelters_occupancy_metrics,
 )
@@ -3,13 +3,18 @@
 Query-building functions that encode the status priority chain:
 OUT_OF_SERVICE -> OCCUPIED -> RESERVED -> IN_TURNAROUND -> AVAILABLE
 
+Reads go through the trigger-maintained ``current_status`` column; the
+``CASE`` built here is the reference the triggers are reconciled against.
+
 Moved from ``shelters/managers.py`` per HackSoft style guide:
 *"Business logic should not live in Custom managers or querysets."*
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Union, cast
+import dataclasses
+from operator import attrgetter, itemgetter
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Union, cast, overload
 
 from django.db.models import (
     Case,
@@ -17,18 +22,21 @@ from django.db.models import (
     Count,
     DateTimeField,
     Exists,
+    F,
     IntegerField,
     OuterRef,
     Q,
+    QuerySet,
     Subquery,
     Value,
     When,
+    prefetch_related_objects,
 )
 
 from shelters.enums import BedStatusChoices, ReservationStatusChoices, RoomStatusChoices
 
 if TYPE_CHECKING:
-    from shelters.models import Bed, Reservation, Room
+    from shelters.models import Bed, Reservation, Room, Shelter
 
 # Not a TypeVar -- the two enums are independent and correspondence can't be enforced here.
 StatusChoice = Union[BedStatusChoices, RoomStatusChoices]
@@ -77,12 +85,6 @@ def completed_checkout_exists(fk_field: str) -> Exists:
     )
 
 
-def active_reservation_exists(fk_field: str) -> Exists:
-    from shelters.models.shelter import ACTIVE_RESERVATION_STATUSES
-
-    return _reservation_exists(fk_field, status__in=list(ACTIVE_RESERVATION_STATUSES))
-
-
 def latest_completed_checkout_subquery(fk_field: str) -> Subquery:
     Reservation = _reservation_model()
     return Subquery(
@@ -104,33 +106,6 @@ def in_turnaround_filter_q(fk_field: str) -> Q:
     return has_completed_checkout & needs_cleaning
 
 
-def status_filter_q(
-    status: StatusChoice,
-    *,
-    fk_field: str,
-    status_enum: type[BedStatusChoices] | type[RoomStatusChoices],
-) -> Q:
-    """Build a ``Q`` object for filtering a single computed status (index-friendly Exists)."""
-    if status == status_enum.OUT_OF_SERVICE:
-        return Q(maintenance_flag=True)
-
-    base = Q(maintenance_flag=False)
-
-    if status == status_enum.OCCUPIED:
-        return base & Q(checked_in_exists(fk_field))
-
-    if status == status_enum.RESERVED:
-        return base & Q(confirmed_or_overdue_exists(fk_field)) & ~Q(checked_in_exists(fk_field))
-
-    if status == status_enum.IN_TURNAROUND:
-        return base & in_turnaround_filter_q(fk_field) & ~Q(active_reservation_exists(fk_field))
-
-    if status == status_enum.AVAILABLE:
-        return base & ~in_turnaround_filter_q(fk_field) & ~Q(active_reservation_exists(fk_field))
-
-    return Q()
-
-
 def computed_status_case(
     fk_field: str,
     status_enum: type[BedStatusChoices] | type[RoomStatusChoices],
@@ -146,12 +121,19 @@ def computed_status_case(
     )
 
 
-def bed_computed_status_annotation() -> Case:
-    return computed_status_case("bed_id", BedStatusChoices)
+def status_drift(model_class: type[Bed] | type[Room]) -> QuerySet:
+    """Beds (or rooms) whose stored ``current_status`` disagrees with their reservations.
 
+    The triggers in ``shelters/triggers.py`` should keep this empty; rows
+    here mean a write bypassed them (e.g. triggers disabled for a restore).
+    Annotates ``_derived_status`` with the value the row should hold.
+    """
+    from shelters.managers import BedQuerySet, RoomQuerySet
 
-def room_computed_status_annotation() -> Case:
-    return computed_status_case("room_id", RoomStatusChoices)
+    qs = cast(BedQuerySet | RoomQuerySet, model_class.objects.all())
+    return qs.annotate(_derived_status=computed_status_case(qs.reservable_fk, qs.status_enum)).exclude(
+        current_status=F("_derived_status")
+    )
 
 
 def shelter_count_subquery(
@@ -171,3 +153,77 @@ def shelter_count_subquery(
         qs.order_by().values("shelter").annotate(c=Count("pk")).values("c"),
         output_field=IntegerField(),
     )
+
+
+@dataclasses.dataclass(frozen=True)
+class StatusCounts:
+    """Number of a shelter's beds (or rooms) in each computed status."""
+
+    available: int = 0
+    in_turnaround: int = 0
+    occupied: int = 0
+    out_of_service: int = 0
+    reserved: int = 0
+    total: int = 0
+
+
+def shelter_status_counts(model_class: type[Bed] | type[Room], shelter_ids: Iterable[int]) -> dict[int, StatusCounts]:
+    """Status counts of each of *shelter_ids*' beds (or rooms) in one ``GROUP BY shelter, status`` query.
+
+    Every id gets an entry; a shelter with none is all zero.
+    """
+    shelter_ids = list(shelter_ids)
+    by_shelter: dict[int, dict[str, int]] = {pk: {} for pk in shelter_ids}
+    rows = (
+        model_class.objects.filter(shelter_id__in=shelter_ids)
+        .order_by()
+        .values_list("shelter_id", "current_status")
+        .annotate(n=Count("pk"))
+    )
+    for shelter_id, status, n in rows:
+        counts = by_shelter[shelter_id]
+        counts[status] = n
+        counts["total"] = counts.get("total", 0) + n
+
+    return {pk: StatusCounts(**counts) for pk, counts in by_shelter.items()}
+
+
+class ShelterStatusCounts:
+    """A shelter's ``StatusCounts`` for the beds (or rooms) behind *related_name*.
+
+    Prefetchable: ``prefetch_related("bed_status_counts")`` loads the counts of
+    every shelter in the result with one ``shelter_status_counts`` query.
+    Reading it on a shelter that wasn't prefetched queries that shelter alone.
+    """
+
+    def __init__(self, related_name: str) -> None:
+        self.related_name = related_name
+        self.cache_name = ""
+
+    def __set_name__(self, owner: type[Shelter], name: str) -> None:
+        self.cache_name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type[Shelter]) -> ShelterStatusCounts: ...
+
+    @overload
+    def __get__(self, instance: Shelter, owner: type[Shelter]) -> StatusCounts: ...
+
+    def __get__(self, instance: Shelter | None, owner: type[Shelter]) -> ShelterStatusCounts | StatusCounts:
+        if instance is None:
+            return self
+        if not self.is_cached(instance):
+            prefetch_related_objects([instance], self.cache_name)
+        row = instance._state.fields_cache[self.cache_name]
+        return row[1] if row else StatusCounts()
+
+    def is_cached(self, instance: Shelter) -> bool:
+        return self.cache_name in instance._state.fields_cache
+
+    def get_prefetch_querysets(
+        self, instances: list[Shelter], querysets: list[QuerySet] | None = None
+    ) -> tuple[list[tuple[int, StatusCounts]], Callable[..., Any], Callable[..., Any], bool, str, bool]:
+        """Django's prefetcher hook: the counts as ``(shelter_id, counts)`` rows, matched on ``pk``."""
+        model_class = instances[0]._meta.get_field(self.related_name).related_model
+        counts = shelter_status_counts(model_class, [instance.pk for instance in instances])
+        return list(counts.items()), itemgetter(0), attrgetter("pk"), True, self.cache_name, False
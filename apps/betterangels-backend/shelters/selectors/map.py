@@ -0,0 +1,153 @@
+"""Map selectors — server-side clustering of shelters per web-map tile.
+
+Clusters are computed per slippy-map tile ``(zoom, x, y)``: each tile is
+cut into a ``CLUSTER_CELLS_PER_TILE`` square grid in Web Mercator and the
+tile's shelters are grouped with ``ST_SnapToGrid``.  Cell edges line up
+with tile edges, so a cluster never straddles two tiles and every tile can
+be cached on its own (see :func:`shelter_map_clusters`).
+"""
+
+import hashlib
+import json
+import math
+from typing import TYPE_CHECKING, Any, cast
+
+from django.conf import settings
+from django.contrib.gis.db.models import PointField
+from django.contrib.gis.db.models.aggregates import Collect
+from django.contrib.gis.db.models.functions import Centroid, SnapToGrid, Transform
+from django.contrib.gis.geos import Polygon
+from django.core.cache import cache
+from django.db.models import Count, FloatField, Func, Min, QuerySet, Sum
+from django.db.models.functions import Cast
+
+from shelters.cache import shelter_map_clusters_generation_key
+
+if TYPE_CHECKING:
+    from shelters.models import Shelter
+
+MAX_ZOOM = 22
+CLUSTER_CELLS_PER_TILE = 8
+WEB_MERCATOR_SRID = 3857
+# Half the width of the Web Mercator world, in metres.
+WEB_MERCATOR_EXTENT = 20037508.342789244
+# Fraction of a tile added around the index prefilter; the exact tile test runs in Web Mercator.
+_PREFILTER_MARGIN = 0.05
+
+
+def _tile_lng(x: float, zoom: int) -> float:
+    return x / 2**zoom * 360.0 - 180.0
+
+
+def _tile_lat(y: float, zoom: int) -> float:
+    return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y / 2**zoom))))
+
+
+def _check_tile(zoom: int, x: int, y: int) -> None:
+    if not 0 <= zoom <= MAX_ZOOM:
+        raise ValueError(f"zoom must be between 0 and {MAX_ZOOM}")
+    if not (0 <= x < 2**zoom and 0 <= y < 2**zoom):
+        raise ValueError(f"tile ({x}, {y}) does not exist at zoom {zoom}")
+
+
+def _prefilter_bbox(zoom: int, x: int, y: int) -> Polygon | None:
+    """Lon/lat box a little larger than the tile, for the GiST index; ``None`` near world scale."""
+    if zoom < 2:
+        return None
+    lo, hi = -_PREFILTER_MARGIN, 1 + _PREFILTER_MARGIN
+    return Polygon.from_bbox(
+        (_tile_lng(x + lo, zoom), _tile_lat(y + hi, zoom), _tile_lng(x + hi, zoom), _tile_lat(y + lo, zoom))
+    )
+
+
+def _clusters(queryset: "QuerySet[Shelter]", *, zoom: int, x: int, y: int) -> list[dict[str, Any]]:
+    tile_size = 2 * WEB_MERCATOR_EXTENT / 2**zoom
+    min_x = -WEB_MERCATOR_EXTENT + x * tile_size
+    max_y = WEB_MERCATOR_EXTENT - y * tile_size
+    cell = tile_size / CLUSTER_CELLS_PER_TILE
+
+    point = Cast("geolocation", PointField(srid=4326))
+    mercator = Transform(point, WEB_MERCATOR_SRID)
+
+    if (bbox := _prefilter_bbox(zoom, x, y)) is not None:
+        queryset = queryset.filter(geolocation__bboverlaps=bbox)
+
+    rows = (
+        queryset.order_by()
+        .annotate(
+            mercator_x=Func(mercator, function="ST_X", output_field=FloatField()),
+            mercator_y=Func(mercator, function="ST_Y", output_field=FloatField()),
+        )
+        # Half-open on every edge, so a shelter on a shared edge lands in exactly one tile.
+        .filter(
+            mercator_x__gte=min_x,
+            mercator_x__lt=min_x + tile_size,
+            mercator_y__gt=max_y - tile_size,
+            mercator_y__lte=max_y,
+        )
+        # Origin at half a cell: every shelter snaps to the centre of its cell.
+        .annotate(cell=SnapToGrid(mercator, cell, cell, cell / 2, cell / 2))
+        .values("cell")
+        .annotate(
+            count=Count("pk"),
+            center=Centroid(Collect(point)),
+            available_beds=Sum("availability__non_restricted_beds", default=0)
+            + Sum("availability__restricted_beds", default=0),
+            first_shelter_id=Min("pk"),
+        )
+        .order_by("-count", "first_shelter_id")
+    )
+
+    return [
+        {
+            "latitude": row["center"].y,
+            "longitude": row["center"].x,
+            "count": row["count"],
+            "available_beds": row["available_beds"],
+            "shelter_id": row["first_shelter_id"] if row["count"] == 1 else None,
+        }
+        for row in rows
+    ]
+
+
+def shelter_map_clusters_cache_key(*, zoom: int, x: int, y: int, signature: Any) -> str | None:
+    """Cache key of one tile's clusters; *signature* is anything JSON-serializable that scopes the result."""
+    if not settings.SHELTER_MAP_CLUSTER_CACHE_TTL:
+        return None
+
+    generation = cache.get(shelter_map_clusters_generation_key(), "0")
+    digest = hashlib.sha1(json.dumps(signature, sort_keys=True, default=str).encode()).hexdigest()
+    return f"shelters:map_clusters:{generation}:{zoom}:{x}:{y}:{digest}"
+
+
+def shelter_map_clusters(
+    queryset: "QuerySet[Shelter]",
+    *,
+    zoom: int,
+    x: int,
+    y: int,
+    signature: Any = None,
+) -> list[dict[str, Any]]:
+    """Cluster the shelters of *queryset* that fall in tile ``(zoom, x, y)``.
+
+    Returns one dict per non-empty grid cell, largest first, with the
+    centroid of its shelters, their count, their summed available beds and,
+    for single-shelter cells, the shelter id.
+
+    With ``SHELTER_MAP_CLUSTER_CACHE_TTL`` set, results are cached per tile
+    and *signature*, which must identify everything that shaped *queryset*
+    (filters, visibility, and the clock for time-based filters).  Shelter,
+    availability, schedule and shelter property writes invalidate every
+    cached tile.
+    """
+    _check_tile(zoom, x, y)
+
+    cache_key = shelter_map_clusters_cache_key(zoom=zoom, x=x, y=y, signature=signature)
+    if cache_key is not None and (cached := cache.get(cache_key)) is not None:
+        return cast(list[dict[str, Any]], cached)
+
+    clusters = _clusters(queryset, zoom=zoom, x=x, y=y)
+
+    if cache_key is not None:
+        cache.set(cache_key, clusters, settings.SHELTER_MAP_CLUSTER_CACHE_TTL)
+    return clusters
@@ -1,12 +1,14 @@
 """Report-gathering selectors — historical data aggregation."""
 
+import bisect
 import dataclasses
 import datetime
+import heapq
 from collections import Counter, defaultdict
 from itertools import groupby
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Iterable, Iterator, cast
 
-from django.db.models import Count, Q, TextField
+from django.db.models import Count, Min, Q, TextField
 from django.db.models.functions import Cast
 
 import pghistory
@@ -87,15 +89,6 @@ def _bed_lifecycles(*, shelter: "Shelter", before: datetime.datetime) -> list[Be
     return [BedLifecycle(bed_id=bid, added_at=added[bid], removed_at=removed.get(bid)) for bid in sorted(added)]
 
 
-@dataclasses.dataclass(frozen=True, slots=True)
-class OccupancyInterval:
-    """A period when a reservation occupied a bed."""
-
-    check_in: datetime.datetime
-    freed: datetime.datetime | None  # None = still occupied
-    reservation_id: int
-
-
 def _occupancy_pct(occupied: int, total: int) -> float:
     """Occupancy percentage rounded to two places, or ``0.0`` when no beds exist."""
     return round(occupied / total * 100, 2) if total else 0.0
@@ -109,147 +102,365 @@ def _day_end(day: datetime.date, tz: datetime.tzinfo) -> datetime.datetime:
     return datetime.datetime.combine(day + datetime.timedelta(days=1), datetime.time.min, tzinfo=tz)
 
 
-# ── Shared data reconstruction ────────────────────────────────────────────────
+# ── Event sweep ───────────────────────────────────────────────────────────────
 
+# Reservation statuses that put a bed in OCCUPIED / RESERVED.
+_CHECKED_IN = frozenset({"checked_in"})
+_CONFIRMED_OR_OVERDUE = frozenset({"confirmed", "check_in_overdue"})
 
-def _reservation_status_intervals(
-    *,
-    bed_ids: set[int],
-    before: datetime.datetime,
-    target_statuses: frozenset[str],
-) -> dict[int, list[OccupancyInterval]]:
-    """Reconstruct per-bed intervals where a reservation was in one of *target_statuses*.
-
-    Reads every ``ReservationEvent`` (any label) with ``pgh_created_at < before``
-    whose snapshotted ``bed_id`` is in ``bed_ids``, groups by reservation, and
-    walks each chronologically.  An interval opens when a reservation enters a
-    target status (without already being in one) and closes when it leaves the
-    set.  Still-open intervals at the reservation's last event are returned with
-    ``freed=None``.
-
-    *before* must be timezone-aware; Django converts it to UTC automatically.
-
-    Used for both CHECKED_IN occupancy and RESERVED (CONFIRMED/CHECK_IN_OVERDUE)
-    intervals — the only difference is *target_statuses*.
-
-    Returns ``{bed_id: [OccupancyInterval, ...]}`` with each list sorted by
-    ``check_in``.
+
+@dataclasses.dataclass(slots=True)
+class _SweepBed:
+    """A bed's point-in-time state while ``_sweep_days`` walks the event history."""
+
+    exists: bool = False
+    maintenance_flag: bool = False
+    last_cleaned: datetime.datetime | None = None
+    checked_out_at: datetime.datetime | None = None  # from the latest COMPLETED status change
+    checked_in: set[int] = dataclasses.field(default_factory=set)  # reservations holding a CHECKED_IN interval
+    reserved: set[int] = dataclasses.field(default_factory=set)  # reservations holding a CONFIRMED/OVERDUE interval
+
+    def awaits_turnaround(self) -> bool:
+        """Return ``True`` if the latest checkout has not been cleaned after yet."""
+        co = self.checked_out_at
+        return co is not None and (self.last_cleaned is None or co > self.last_cleaned)
+
+    def status_at(self, at: datetime.datetime) -> BedStatusChoices:
+        """Apply the priority chain: first matching status wins.
+
+        OUT_OF_SERVICE → OCCUPIED → RESERVED → IN_TURNAROUND → AVAILABLE
+        """
+        if self.maintenance_flag:
+            return BedStatusChoices.OUT_OF_SERVICE
+        if self.checked_in:
+            return BedStatusChoices.OCCUPIED
+        if self.reserved:
+            return BedStatusChoices.RESERVED
+        if self.awaits_turnaround() and cast(datetime.datetime, self.checked_out_at) < at:
+            return BedStatusChoices.IN_TURNAROUND
+        return BedStatusChoices.AVAILABLE
+
+
+@dataclasses.dataclass(slots=True)
+class _SweepReservation:
+    """The last event seen for a reservation and the beds its open intervals are on."""
+
+    status: str | None = None
+    bed_id: int | None = None
+    checked_in_bed: int | None = None
+    reserved_bed: int | None = None
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _SweepDay:
+    """End-of-day state yielded by ``_sweep_days``.
+
+    ``beds`` maps every bed that exists at end of day to ``(status,
+    is_occupied)``.  It is the sweep's live state: read it before advancing
+    the iterator.  The other fields are the day's own values and stay valid
+    after it advances.
     """
-    from shelters.models import Reservation  # inline to avoid circular import
 
-    if not bed_ids:
-        return {}
+    date: datetime.date
+    counts: "DailyBedCounts"
+    occupied: int
+    total_beds: int
+    beds: dict[int, tuple[BedStatusChoices, bool]]
+
+
+def _sweep_days(*, shelter: "Shelter", days: list[datetime.date], tz: datetime.tzinfo) -> Iterator[_SweepDay]:
+    """Replay *shelter*'s bed and reservation history once and yield the state at the end of each of *days*.
+
+    Reads two time-ordered streams — ``BedEvent`` rows (existence,
+    ``maintenance_flag`` and ``last_cleaned``) and ``ReservationEvent`` rows
+    (CHECKED_IN and CONFIRMED / CHECK_IN_OVERDUE intervals, and COMPLETED
+    checkouts) — for every bed ever added to the shelter, merges them and
+    applies each event to the affected bed.  At each day boundary only beds
+    touched since the previous boundary are re-evaluated, so the work is
+    proportional to the number of events plus the number of days rather
+    than beds × days.
+
+    Reservation intervals follow the reservation, not the bed: an interval
+    opens on the bed the reservation is on when it enters a target status
+    and closes on that same bed when it leaves the set.  Consecutive
+    duplicate events (same status and bed) are skipped — pghistory can emit
+    several in one transaction.
+
+    *days* must be sorted ascending; *tz* decides where each day ends.
+    Every day is yielded, including days before the first bed existed.
+
+    Expected indexes: ``(shelter_id, pgh_label, pgh_created_at)`` on
+    BedEvent, ``bed_id`` on ReservationEvent.
+    """
+    from shelters.models import BedEvent, Reservation  # type: ignore[attr-defined]  # inline to avoid circular import
+
+    if not days:
+        return
 
+    end = _day_end(days[-1], tz)
     reservation_event_model = Reservation.pgh_event_model  # type: ignore[attr-defined]
-    rows = (
-        reservation_event_model.objects.filter(bed_id__in=bed_ids, pgh_created_at__lt=before)
-        .order_by("pgh_obj_id", "pgh_created_at", "pgh_id")
-        .values_list("pgh_obj_id", "bed_id", "status", "pgh_created_at")
+
+    shelter_bed_ids = BedEvent.objects.filter(
+        shelter_id=shelter.pk, pgh_label="bed.add", pgh_created_at__lt=end
+    ).values("pgh_obj_id")
+    bed_rows = (
+        BedEvent.objects.filter(
+            pgh_obj_id__in=shelter_bed_ids,
+            pgh_label__in=["bed.add", "bed.update", "bed.remove"],
+            pgh_created_at__lt=end,
+        )
+        .order_by("pgh_created_at", "pgh_id")
+        .values_list("pgh_created_at", "pgh_obj_id", "pgh_label", "maintenance_flag", "last_cleaned")
+    )
+    reservation_rows = (
+        reservation_event_model.objects.filter(bed_id__in=shelter_bed_ids, pgh_created_at__lt=end)
+        .order_by("pgh_created_at", "pgh_id")
+        .values_list("pgh_created_at", "pgh_obj_id", "bed_id", "pgh_label", "status", "checked_out_at")
     )
+    events = heapq.merge(
+        ((row, True) for row in bed_rows),
+        ((row, False) for row in reservation_rows),
+        key=lambda event: event[0][0],
+    )
+
+    beds: dict[int, _SweepBed] = defaultdict(_SweepBed)
+    reservations: dict[int, _SweepReservation] = defaultdict(_SweepReservation)
+    dirty: set[int] = set()
+    # (checked_out_at, bed_id) for beds whose checkout is still in the future
+    # at the boundary they were last evaluated on; they turn over without a
+    # further event once a day ends after it.
+    turnaround_due: list[tuple[datetime.datetime, int]] = []
 
-    intervals_by_bed: dict[int, list[OccupancyInterval]] = defaultdict(list)
-
-    for reservation_id, group in groupby(rows, key=lambda r: r[0]):
-        open_start: datetime.datetime | None = None
-        open_bed: int | None = None
-        prev_status: str | None = None
-        prev_bed: int | None = None
-        for _, bed_id, status, created_at in group:
-            # Skip consecutive duplicate events (pghistory can emit multiples
-            # in a transaction — same pattern as _bed_lifecycles dedup).
-            if status == prev_status and bed_id == prev_bed:
+    current: dict[int, tuple[BedStatusChoices, bool]] = {}
+    tally: Counter[str] = Counter()
+    occupied = 0
+
+    pending = next(events, None)
+    for day in days:
+        day_end = _day_end(day, tz)
+
+        # 1. Apply every event before the end of the day.
+        while pending is not None and pending[0][0] < day_end:
+            row, is_bed_event = pending
+            pending = next(events, None)
+
+            if is_bed_event:
+                _, bed_id, label, maintenance_flag, last_cleaned = row
+                bed = beds[bed_id]
+                if label == "bed.remove":
+                    bed.exists = False
+                else:
+                    bed.exists = bed.exists or label == "bed.add"
+                    bed.maintenance_flag = bool(maintenance_flag)
+                    bed.last_cleaned = last_cleaned
+                dirty.add(bed_id)
                 continue
-            was_target = prev_status in target_statuses
-            is_target = status in target_statuses
-
-            if is_target and not was_target:
-                open_start, open_bed = created_at, bed_id
-            elif was_target and not is_target and open_start is not None:
-                assert open_bed is not None  # set together with open_start
-                intervals_by_bed[open_bed].append(
-                    OccupancyInterval(check_in=open_start, freed=created_at, reservation_id=reservation_id)
-                )
-                open_start = None
-            prev_status = status
-            prev_bed = bed_id
-
-        if open_start is not None:
-            assert open_bed is not None  # set together with open_start
-            intervals_by_bed[open_bed].append(
-                OccupancyInterval(check_in=open_start, freed=None, reservation_id=reservation_id)
-            )
 
-    for intervals in intervals_by_bed.values():
-        intervals.sort(key=lambda interval: interval.check_in)
-    return dict(intervals_by_bed)
+            _, reservation_id, bed_id, label, status, checked_out_at = row
+            if (
+                label == "reservation.status_change"
+                and status == ReservationStatusChoices.COMPLETED
+                and checked_out_at is not None
+            ):
+                beds[bed_id].checked_out_at = checked_out_at
+                dirty.add(bed_id)
+
+            reservation = reservations[reservation_id]
+            if status == reservation.status and bed_id == reservation.bed_id:
+                continue
 
+            was, now = reservation.status in _CHECKED_IN, status in _CHECKED_IN
+            if now and not was:
+                reservation.checked_in_bed = bed_id
+                beds[bed_id].checked_in.add(reservation_id)
+                dirty.add(bed_id)
+            elif was and not now and reservation.checked_in_bed is not None:
+                beds[reservation.checked_in_bed].checked_in.discard(reservation_id)
+                dirty.add(reservation.checked_in_bed)
+                reservation.checked_in_bed = None
+
+            was, now = reservation.status in _CONFIRMED_OR_OVERDUE, status in _CONFIRMED_OR_OVERDUE
+            if now and not was:
+                reservation.reserved_bed = bed_id
+                beds[bed_id].reserved.add(reservation_id)
+                dirty.add(bed_id)
+            elif was and not now and reservation.reserved_bed is not None:
+                beds[reservation.reserved_bed].reserved.discard(reservation_id)
+                dirty.add(reservation.reserved_bed)
+                reservation.reserved_bed = None
+
+            reservation.status, reservation.bed_id = status, bed_id
+
+        while turnaround_due and turnaround_due[0][0] < day_end:
+            dirty.add(heapq.heappop(turnaround_due)[1])
+
+        # 2. Re-evaluate the beds that changed and keep the tallies in step.
+        for bed_id in dirty:
+            bed = beds[bed_id]
+            previous = current.pop(bed_id, None)
+            if previous is not None:
+                tally[previous[0].value] -= 1
+                occupied -= previous[1]
+            if not bed.exists:
+                continue
 
-# Reserved statuses used by callers of _reservation_status_intervals.
-_CHECKED_IN = frozenset({"checked_in"})
-_CONFIRMED_OR_OVERDUE = frozenset({"confirmed", "check_in_overdue"})
+            status, is_occupied = bed.status_at(day_end), bool(bed.checked_in)
+            current[bed_id] = (status, is_occupied)
+            tally[status.value] += 1
+            occupied += is_occupied
+            if bed.awaits_turnaround() and cast(datetime.datetime, bed.checked_out_at) >= day_end:
+                heapq.heappush(turnaround_due, (cast(datetime.datetime, bed.checked_out_at), bed_id))
+        dirty.clear()
+
+        yield _SweepDay(
+            date=day,
+            counts=DailyBedCounts(date=day, **tally),
+            occupied=occupied,
+            total_beds=len(current),
+            beds=current,
+        )
 
 
-def _latest_checkout_by_bed(*, bed_ids: set[int], before: datetime.datetime) -> dict[int, datetime.datetime]:
-    """Return ``{bed_id: latest_checkout_datetime}`` for COMPLETED reservations with ``checked_out_at`` set.
+def _swept_daily_occupancy(swept: _SweepDay) -> "DailyOccupancyMetricsType":
+    """``daily_occupancy`` row for one swept day."""
+    from shelters.types.reporting import DailyOccupancyMetricsType  # inline to avoid circular import
 
-    Only returns checkouts where ``checked_out_at < before``.
-    *before* must be timezone-aware; Django converts it to UTC automatically.
-    """
-    from shelters.models import Reservation  # inline to avoid circular import
+    return DailyOccupancyMetricsType(
+        date=swept.date,
+        occupied_count=swept.occupied,
+        total_beds=swept.total_beds,
+        occupancy_pct=_occupancy_pct(swept.occupied, swept.total_beds),
+    )
+
+
+# ── Occupancy rollup ──────────────────────────────────────────────────────────
 
-    if not bed_ids:
-        return {}
+
+def pending_rollup_event_at(
+    *,
+    shelter: "Shelter",
+    bed_event_watermark: int,
+    reservation_event_watermark: int,
+    created_since: datetime.datetime | None = None,
+) -> datetime.datetime | None:
+    """Return the earliest ``pgh_created_at`` among *shelter*'s events above the watermarks.
+
+    Covers ``BedEvent`` rows snapshotting the shelter and ``ReservationEvent``
+    rows for any bed the shelter has ever had — the same scope the replay
+    reads.  Events are matched by ``pgh_id`` rather than time, so a
+    late-arriving or backdated event is still found and its own timestamp
+    decides which days it invalidates.  With *created_since*, events created
+    at or after it count as pending whatever their ``pgh_id``.  Returns
+    ``None`` when nothing is pending.
+    """
+    from shelters.models import BedEvent, Reservation  # type: ignore[attr-defined]  # inline to avoid circular import
 
     reservation_event_model = Reservation.pgh_event_model  # type: ignore[attr-defined]
-    # The most recent status_change to COMPLETED with checked_out_at set.
-    # Rows are ordered by bed ASC, created_at DESC — groupby picks the first
-    # (latest) per bed, same pattern as _bed_lifecycles.
+    shelter_bed_ids = BedEvent.objects.filter(shelter_id=shelter.pk, pgh_label="bed.add").values("pgh_obj_id")
+
+    recent = Q(pgh_created_at__gte=created_since) if created_since is not None else Q(pk__in=[])
+
+    bed_at = BedEvent.objects.filter(Q(pgh_id__gt=bed_event_watermark) | recent, shelter_id=shelter.pk).aggregate(
+        at=Min("pgh_created_at")
+    )["at"]
+    reservation_at = reservation_event_model.objects.filter(
+        Q(pgh_id__gt=reservation_event_watermark) | recent, bed_id__in=shelter_bed_ids
+    ).aggregate(at=Min("pgh_created_at"))["at"]
+
+    pending = [at for at in (bed_at, reservation_at) if at is not None]
+    return min(pending) if pending else None
+
+
+def rollup_served_through(*, shelter: "Shelter", tz: datetime.tzinfo) -> datetime.date | None:
+    """Return the last day ``BedDailyStatus`` rows can answer for *shelter*, or ``None`` when they can't be used.
+
+    The rollup is keyed by calendar days in ``SHELTER_SCHEDULE_TIME_ZONE``, so
+    callers using any other timezone always replay.  Otherwise the rollup is
+    good through ``rolled_through``, or through the day before the earliest
+    event that arrived since it was written: that event only changes its own
+    day and the days after it.  An event committed below the watermark isn't
+    seen here; the next refresh applies it (see ``ROLLUP_EVENT_LOOKBACK``).
+    """
+    from shelters.models import OccupancyRollupState  # inline to avoid circular import
+    from shelters.types.filters import SHELTER_SCHEDULE_TIME_ZONE  # inline to avoid circular import
+
+    if getattr(tz, "key", None) != SHELTER_SCHEDULE_TIME_ZONE.key:
+        return None
+
+    state = OccupancyRollupState.objects.filter(shelter_id=shelter.pk).first()
+    if state is None or state.rolled_through is None:
+        return None
+
+    pending_at = pending_rollup_event_at(
+        shelter=shelter,
+        bed_event_watermark=state.bed_event_watermark,
+        reservation_event_watermark=state.reservation_event_watermark,
+    )
+    if pending_at is None:
+        return state.rolled_through
+
+    return min(state.rolled_through, pending_at.astimezone(tz).date() - datetime.timedelta(days=1))
+
+
+def _split_at_rollup(
+    *, shelter: "Shelter", days: list[datetime.date], tz: datetime.tzinfo
+) -> tuple[list[datetime.date], list[datetime.date]]:
+    """Split *days* into the prefix the rollup answers and the suffix to replay (see ``rollup_served_through``)."""
+    served_through = rollup_served_through(shelter=shelter, tz=tz)
+    if served_through is None:
+        return [], days
+
+    split = bisect.bisect_right(days, served_through)
+    return days[:split], days[split:]
+
+
+def _rollup_bed_status_counts(*, shelter: "Shelter", days: list[datetime.date]) -> list["DailyBedCounts"]:
+    """``report_bed_status_counts`` rows read from ``BedDailyStatus`` in one grouped query."""
+    from shelters.models import BedDailyStatus  # inline to avoid circular import
+
+    if not days:
+        return []
+
+    by_day = {day: DailyBedCounts(date=day) for day in days}
     rows = (
-        reservation_event_model.objects.filter(
-            bed_id__in=bed_ids,
-            pgh_created_at__lt=before,
-            pgh_label="reservation.status_change",
-            status=ReservationStatusChoices.COMPLETED,
-            checked_out_at__isnull=False,
-        )
-        .order_by("bed_id", "-pgh_created_at")
-        .values_list("bed_id", "checked_out_at")
+        BedDailyStatus.objects.filter(shelter_id=shelter.pk, date__gte=days[0], date__lte=days[-1])
+        .order_by()
+        .values_list("date", "status")
+        .annotate(n=Count("pk"))
     )
+    for day, status, n in rows:
+        setattr(by_day[day], BedStatusChoices(status).value, n)
+    return list(by_day.values())
 
-    result: dict[int, datetime.datetime] = {}
-    for bed_id, group in groupby(rows, key=lambda r: r[0]):
-        result[bed_id] = next(group)[1]  # first in group = latest checkout
-    return result
-
-
-def _interval_active_at(
-    intervals: list[OccupancyInterval],
-    at: datetime.datetime,
-) -> bool:
-    """Return ``True`` if *at* falls within any interval (``[check_in, freed)``)."""
-    for interval in intervals:
-        if interval.check_in < at and (interval.freed is None or interval.freed >= at):
-            return True
-        if interval.check_in >= at:
-            break  # intervals are sorted by check_in
-    return False
-
-
-def _in_turnaround_at(
-    bed_id: int,
-    at: datetime.datetime,
-    last_cleaned: datetime.datetime | None,
-    checkout_times: dict[int, datetime.datetime],
-) -> bool:
-    """Return ``True`` if *bed_id* is IN_TURNAROUND at *at*.
-
-    A bed is in turnaround when a completed checkout exists after
-    ``last_cleaned`` (or the bed was never cleaned at all).
-    """
-    co = checkout_times.get(bed_id)
-    if co is None:
-        return False
-    return (last_cleaned is None or co > last_cleaned) and co < at
+
+def _rollup_daily_occupancy(*, shelter: "Shelter", days: list[datetime.date]) -> "list[DailyOccupancyMetricsType]":
+    """``daily_occupancy`` rows read from ``BedDailyStatus`` in one grouped query."""
+    from shelters.models import BedDailyStatus  # inline to avoid circular import
+    from shelters.types.reporting import DailyOccupancyMetricsType  # inline to avoid circular import
+
+    if not days:
+        return []
+
+    rows = (
+        BedDailyStatus.objects.filter(shelter_id=shelter.pk, date__gte=days[0], date__lte=days[-1])
+        .order_by()
+        .values_list("date")
+        .annotate(occupied=Count("pk", filter=Q(is_occupied=True)), total=Count("pk"))
+    )
+    counts = {day: (occupied, total) for day, occupied, total in rows}
+
+    results: list[DailyOccupancyMetricsType] = []
+    for day in days:
+        occupied, total = counts.get(day, (0, 0))
+        results.append(
+            DailyOccupancyMetricsType(
+                date=day,
+                occupied_count=occupied,
+                total_beds=total,
+                occupancy_pct=_occupancy_pct(occupied, total),
+            )
+        )
+    return results
 
 
 # ── Public types ──────────────────────────────────────────────────────────────
@@ -267,29 +478,56 @@ class DailyBedCounts:
     in_turnaround: int = 0
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class BedDayStatus:
+    """One bed's end-of-day status on one report day."""
+
+    date: datetime.date
+    bed_id: int
+    status: BedStatusChoices
+    is_occupied: bool
+
+
 # ── Public selectors ──────────────────────────────────────────────────────────
 
 
-def report_bed_status_counts(
-    *, shelter: "Shelter", start: datetime.datetime, end: datetime.datetime
-) -> list[DailyBedCounts]:
-    """Return daily bed status counts for *shelter* across an inclusive date range.
+def replay_bed_day_statuses(
+    *, shelter: "Shelter", days: list[datetime.date], tz: datetime.tzinfo
+) -> Iterator[BedDayStatus]:
+    """Yield the end-of-day status of every bed that existed on each of *days*.
 
     Bed status follows the priority chain defined in
     :mod:`shelters.selectors.computed_status`:
 
         OUT_OF_SERVICE → OCCUPIED → RESERVED → IN_TURNAROUND → AVAILABLE
 
-    The status at end-of-day on each date is reconstructed from three
-    independent event streams:
+    The status at end-of-day on each date is reconstructed by ``_sweep_days``
+    from the bed events (``maintenance_flag`` and ``last_cleaned``
+    snapshots), the reservation ``CHECKED_IN`` and ``CONFIRMED`` /
+    ``CHECK_IN_OVERDUE`` intervals, and the latest COMPLETED checkout.
+
+    ``is_occupied`` is the raw ``CHECKED_IN`` test, independent of the
+    priority chain, so an out-of-service bed with a guest still counts as
+    occupied for daily occupancy.
+
+    *days* must be sorted ascending; *tz* decides where each day ends.
+    Rows are yielded day by day, beds in ``bed_id`` order within a day.
+    """
+    for swept in _sweep_days(shelter=shelter, days=days, tz=tz):
+        for bed_id in sorted(swept.beds):
+            status, is_occupied = swept.beds[bed_id]
+            yield BedDayStatus(date=swept.date, bed_id=bed_id, status=status, is_occupied=is_occupied)
 
-    * **Bed events** (``bed.add`` / ``bed.update``) — ``maintenance_flag``
-      and ``last_cleaned`` snapshots.
-    * **Reservation occupancy intervals** — ``CHECKED_IN`` periods
-      (see ``_reservation_status_intervals``).
-    * **Reservation reserved intervals** — ``CONFIRMED`` /
-      ``CHECK_IN_OVERDUE`` periods before check-in
-      (see ``_reservation_status_intervals``).
+
+def report_bed_status_counts(
+    *, shelter: "Shelter", start: datetime.datetime, end: datetime.datetime
+) -> list[DailyBedCounts]:
+    """Return daily bed status counts for *shelter* across an inclusive date range.
+
+    Days the ``BedDailyStatus`` rollup covers are read from it; the rest come
+    from a single ``_sweep_days`` pass over the event history (see
+    ``replay_bed_day_statuses`` for the status rules and
+    ``rollup_served_through`` for which days the rollup answers).
 
     *start* and *end* are timezone-aware datetimes.  The caller's timezone
     determines where each day begins and ends.  *end* is exclusive (midnight
@@ -298,8 +536,6 @@ def report_bed_status_counts(
     Raises:
         ValueError: if *end* is before *start*, or if either is naive.
     """
-    from shelters.models import BedEvent  # type: ignore[attr-defined]  # pghistory event model; inline to avoid circular import
-
     if end < start:
         raise ValueError("end must be on or after start")
     if start.tzinfo is None:
@@ -313,100 +549,10 @@ def report_bed_status_counts(
     end_date = (end - datetime.timedelta(microseconds=1)).date() if end > start else start_date
     days = _report_days(start_date, end_date)
 
-    # 1. Bed existence windows.
-    lifecycles = _bed_lifecycles(shelter=shelter, before=end)
-    if not lifecycles:
-        return [DailyBedCounts(date=day) for day in days]
-
-    scope_bed_ids = {lc.bed_id for lc in lifecycles}
-
-    # 2. Bed operational state snapshots — the latest ``bed.add`` or
-    #    ``bed.update`` before *end* for each bed, keyed by (bed_id, time).
-    bed_snapshots: dict[int, list[tuple[datetime.datetime, bool, datetime.datetime | None]]] = defaultdict(list)
-    snapshot_rows = (
-        BedEvent.objects.filter(
-            pgh_obj_id__in=list(scope_bed_ids),
-            pgh_created_at__lt=end,
-            pgh_label__in=["bed.add", "bed.update"],
-        )
-        .order_by("pgh_obj_id", "pgh_created_at")
-        .values_list("pgh_obj_id", "pgh_created_at", "maintenance_flag", "last_cleaned")
-    )
-    for bed_id, created_at, maint_flag, lc_val in snapshot_rows:
-        bed_snapshots[bed_id].append((created_at, bool(maint_flag), lc_val))
-
-    # 3. Occupancy intervals (CHECKED_IN).
-    occupancy = _reservation_status_intervals(bed_ids=scope_bed_ids, before=end, target_statuses=_CHECKED_IN)
-
-    # 4. Reserved intervals (CONFIRMED / CHECK_IN_OVERDUE before check-in).
-    reserved = _reservation_status_intervals(bed_ids=scope_bed_ids, before=end, target_statuses=_CONFIRMED_OR_OVERDUE)
-
-    # 5. Completed checkout times (for IN_TURNAROUND).
-    checkout_times = _latest_checkout_by_bed(bed_ids=scope_bed_ids, before=end)
-
-    # 6. Per-day status computation — point-in-time at end-of-day.
-    #    The priority chain is applied per bed: each bed gets exactly one
-    #    status per day.
-    #
-    #    Snapshot lookup uses forward-only cursors: day_end is monotonic,
-    #    so each bed's latest applicable snapshot index only moves forward.
-    #    Total cost is O(S) across all days instead of O(S × D).
-    snapshot_cursors: dict[int, int] = defaultdict(lambda: -1)
-
-    results: list[DailyBedCounts] = []
-    for day in days:
-        day_end = _day_end(day, tz)
-
-        counts: Counter[str] = Counter()
-
-        for lc in lifecycles:
-            if lc.added_at >= day_end:
-                continue  # bed not yet added
-            if lc.removed_at is not None and lc.removed_at < day_end:
-                continue  # bed already removed
-
-            bed_id = lc.bed_id
-
-            # Advance cursor to the latest snapshot ≤ day_end.
-            snapshots = bed_snapshots.get(bed_id, ())
-            idx = snapshot_cursors[bed_id]
-            while idx + 1 < len(snapshots) and snapshots[idx + 1][0] < day_end:
-                idx += 1
-            snapshot_cursors[bed_id] = idx
-
-            maint_flag = False
-            last_cleaned: datetime.datetime | None = None
-            if idx >= 0:
-                _, maint_flag, last_cleaned = snapshots[idx]
-
-            # Apply the priority chain: first matching status wins.
-            # OUT_OF_SERVICE → OCCUPIED → RESERVED → IN_TURNAROUND → AVAILABLE
-            occupied = _interval_active_at(occupancy.get(bed_id, []), day_end)
-            reserved_active = _interval_active_at(reserved.get(bed_id, []), day_end)
-            in_turnaround = _in_turnaround_at(bed_id, day_end, last_cleaned, checkout_times)
-
-            if maint_flag:
-                counts[BedStatusChoices.OUT_OF_SERVICE] += 1
-            elif occupied:
-                counts[BedStatusChoices.OCCUPIED] += 1
-            elif reserved_active:
-                counts[BedStatusChoices.RESERVED] += 1
-            elif in_turnaround:
-                counts[BedStatusChoices.IN_TURNAROUND] += 1
-            else:
-                counts[BedStatusChoices.AVAILABLE] += 1
-
-        results.append(
-            DailyBedCounts(
-                date=day,
-                available=counts.get(BedStatusChoices.AVAILABLE, 0),
-                occupied=counts.get(BedStatusChoices.OCCUPIED, 0),
-                reserved=counts.get(BedStatusChoices.RESERVED, 0),
-                out_of_service=counts.get(BedStatusChoices.OUT_OF_SERVICE, 0),
-                in_turnaround=counts.get(BedStatusChoices.IN_TURNAROUND, 0),
-            )
-        )
-    return results
+    rolled_days, replayed_days = _split_at_rollup(shelter=shelter, days=days, tz=tz)
+    return _rollup_bed_status_counts(shelter=shelter, days=rolled_days) + [
+        swept.counts for swept in _sweep_days(shelter=shelter, days=replayed_days, tz=tz)
+    ]
 
 
 def reservation_status_change_counts(
@@ -492,10 +638,11 @@ def daily_occupancy(
     """Daily occupied-bed counts and occupancy percentage for a shelter.
 
     A bed is occupied on a day when a reconstructed ``CHECKED_IN`` interval
-    (see ``_reservation_status_intervals``) overlaps that day.  ``total_beds``
+    (see ``_sweep_days``) is open at the end of that day.  ``total_beds``
     is the number of beds that existed that day, from ``bed.add`` / ``bed.remove``.
     ``occupancy_pct`` is ``occupied / total * 100`` rounded to two places
-    (``0.0`` when no beds existed).
+    (``0.0`` when no beds existed).  Days the ``BedDailyStatus`` rollup covers
+    are read from it instead (see ``rollup_served_through``).
 
     *start* and *end* are timezone-aware datetimes.  The caller's timezone
     determines where each day begins and ends (e.g. ``ZoneInfo("America/Los_Angeles")``).
@@ -503,8 +650,6 @@ def daily_occupancy(
     Raises:
         ValueError: if ``end`` is before ``start``.
     """
-    from shelters.types.reporting import DailyOccupancyMetricsType  # inline to avoid circular import
-
     if end < start:
         raise ValueError("end must be on or after start")
 
@@ -517,64 +662,10 @@ def daily_occupancy(
     end_date = (end - datetime.timedelta(microseconds=1)).date() if end > start else start_date
     days = _report_days(start_date, end_date)
 
-    lifecycles = _bed_lifecycles(shelter=shelter, before=end)
-    if not lifecycles:
-        return [DailyOccupancyMetricsType(date=day, occupied_count=0, total_beds=0, occupancy_pct=0.0) for day in days]
-
-    scope_bed_ids = {lc.bed_id for lc in lifecycles}
-    intervals_by_bed = _reservation_status_intervals(bed_ids=scope_bed_ids, before=end, target_statuses=_CHECKED_IN)
-
-    # Pre-compute occupied-bed sets by calendar date (O(I × avg_stay_days)).
-    # Each interval is expanded to the calendar dates it covers (clamped to
-    # the report range) so that the per-day lookup is O(1).
-    occupied_by_day: dict[datetime.date, set[int]] = defaultdict(set)
-    for bed_id, intervals in intervals_by_bed.items():
-        for interval in intervals:
-            first = interval.check_in.astimezone(tz).date()
-            if first < start_date:
-                first = start_date
-            if interval.freed is None:
-                last = end_date
-            else:
-                # The last fully-occupied day is the day *before* the freed
-                # date (in the caller's tz).  At end-of-day D the interval is
-                # only active if freed >= midnight of D+1, which fails on the
-                # freed date itself.
-                freed_day = interval.freed.astimezone(tz).date()
-                last = freed_day - datetime.timedelta(days=1)
-                if last < start_date:
-                    continue  # interval ended entirely before the report range
-                if last > end_date:
-                    last = end_date
-            cursor = first
-            while cursor <= last:
-                occupied_by_day[cursor].add(bed_id)
-                cursor += datetime.timedelta(days=1)
-
-    results: list[DailyOccupancyMetricsType] = []
-    for day in days:
-        day_end = _day_end(day, tz)
-
-        # Beds that exist on this day: added before day_end, not yet removed.
-        # ``lifecycles`` are sorted by added_at, so we can break early.
-        existing_bed_ids: set[int] = set()
-        for lc in lifecycles:
-            if lc.added_at >= day_end:
-                break
-            if lc.removed_at is None or lc.removed_at >= day_end:
-                existing_bed_ids.add(lc.bed_id)
-
-        occupied_bed_ids = occupied_by_day.get(day, set()) & existing_bed_ids
-
-        results.append(
-            DailyOccupancyMetricsType(
-                date=day,
-                occupied_count=len(occupied_bed_ids),
-                total_beds=len(existing_bed_ids),
-                occupancy_pct=_occupancy_pct(len(occupied_bed_ids), len(existing_bed_ids)),
-            )
-        )
-    return results
+    rolled_days, replayed_days = _split_at_rollup(shelter=shelter, days=days, tz=tz)
+    return _rollup_daily_occupancy(shelter=shelter, days=rolled_days) + [
+        _swept_daily_occupancy(swept) for swept in _sweep_days(shelter=shelter, days=replayed_days, tz=tz)
+    ]
 
 
 def avg_days_to_occupancy(
@@ -668,18 +759,37 @@ def shelter_occupancy_metrics(
     """Invoke the individual metric selectors for *shelter* and assemble a ``ShelterOccupancyMetricsType``.
 
     *start* and *end* are timezone-aware datetimes; *end* is exclusive, matching
-    the other selectors in this module.
+    the other selectors in this module.  Daily bed status and daily occupancy
+    share the rollup reads and one ``_sweep_days`` pass for the days after them.
+
+    Raises:
+        ValueError: if *end* is before *start*, or if either is naive.
     """
     from shelters.types.reporting import DailyBedStatusMetricsType, ShelterOccupancyMetricsType
 
-    bed_status_counts = report_bed_status_counts(shelter=shelter, start=start, end=end)
+    if end < start:
+        raise ValueError("end must be on or after start")
+    if start.tzinfo is None:
+        raise ValueError("start must be timezone-aware")
+    if end.tzinfo is None:
+        raise ValueError("end must be timezone-aware")
+
+    tz = start.tzinfo
     end_date = (end - datetime.timedelta(microseconds=1)).date() if end > start else start.date()
+    days = _report_days(start.date(), end_date)
+
+    rolled_days, replayed_days = _split_at_rollup(shelter=shelter, days=days, tz=tz)
+    bed_status_counts = _rollup_bed_status_counts(shelter=shelter, days=rolled_days)
+    occupancy = _rollup_daily_occupancy(shelter=shelter, days=rolled_days)
+    for swept in _sweep_days(shelter=shelter, days=replayed_days, tz=tz):
+        bed_status_counts.append(swept.counts)
+        occupancy.append(_swept_daily_occupancy(swept))
 
     return ShelterOccupancyMetricsType(
         shelter_id=cast(ID, shelter.pk),
         start_date=start.date(),
         end_date=end_date,
-        daily_occupancy=daily_occupancy(shelter=shelter, start=start, end=end),
+        daily_occupancy=occupancy,
         daily_bed_status=[
             DailyBedStatusMetricsType(
                 date=d.date,
@@ -694,3 +804,15 @@ def shelter_occupancy_metrics(
         reservation_metrics=reservation_status_change_counts(shelter=shelter, start=start, end=end),
         avg_days_to_occupancy=avg_days_to_occupancy(shelter=shelter, start=start, end=end),
     )
+
+
+def shelters_occupancy_metrics(
+    *, shelters: Iterable["Shelter"], start: datetime.datetime, end: datetime.datetime
+) -> Iterator["ShelterOccupancyMetricsType"]:
+    """Yield ``shelter_occupancy_metrics`` for each of *shelters*, one shelter at a time.
+
+    Lazy, so exporters can write a shelter's rows before the next one is
+    computed; pass a queryset's ``.iterator()`` to avoid caching the shelters too.
+    """
+    for shelter in shelters:
+        yield shelter_occupancy_metrics(shelter=shelter, start=start, end=end)
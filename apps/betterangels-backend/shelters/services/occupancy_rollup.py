@@ -0,0 +1,148 @@
+"""Occupancy rollup maintenance — keeps ``BedDailyStatus`` in step with the event history."""
+
+import datetime
+import itertools
+
+from django.db import transaction
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from shelters.models import Bed, BedDailyStatus, OccupancyRollupState, Reservation, Shelter
+from shelters.selectors.reports import (
+    BedDayStatus,
+    _report_days,
+    pending_rollup_event_at,
+    replay_bed_day_statuses,
+)
+from shelters.types.filters import SHELTER_SCHEDULE_TIME_ZONE
+
+_BULK_BATCH_SIZE = 2000
+
+# How far before the previous refresh events are looked at again.  Event ids
+# are taken when a transaction writes them, not when it commits, so a
+# transaction still open during that refresh can commit an id below its
+# watermark; pghistory stamps the event with the transaction's start time,
+# which this window reaches back to as long as the transaction was shorter.
+ROLLUP_EVENT_LOOKBACK = datetime.timedelta(hours=1)
+
+
+def _row_key(row: BedDayStatus) -> tuple[datetime.date, int, str, bool]:
+    return (row.date, row.bed_id, str(row.status), row.is_occupied)
+
+
+@transaction.atomic
+def occupancy_rollup_refresh(
+    *,
+    shelter: Shelter,
+    through: datetime.date | None = None,
+    rebuild: bool = False,
+) -> int:
+    """Bring *shelter*'s ``BedDailyStatus`` rows up to date through *through* and return the rows written.
+
+    *through* defaults to today in ``SHELTER_SCHEDULE_TIME_ZONE``.  Only the
+    stale suffix is recomputed: the day after ``rolled_through``, or the day
+    of the earliest event that arrived since the last refresh, whichever is
+    earlier.  Events created within ``ROLLUP_EVENT_LOOKBACK`` of the last
+    refresh count as arrived too, so one committed below the watermark is
+    still applied; recomputing a day twice writes the same rows.
+    ``rebuild=True`` (and the first refresh of a shelter) backfills from the
+    shelter's first ``bed.add``.
+
+    The state row is locked for the duration, so concurrent refreshes of the
+    same shelter serialize instead of interleaving deletes and inserts.
+    """
+    bed_event_model = Bed.pgh_event_model  # type: ignore[attr-defined]
+    reservation_event_model = Reservation.pgh_event_model  # type: ignore[attr-defined]
+    tz = SHELTER_SCHEDULE_TIME_ZONE
+    through = through or timezone.now().astimezone(tz).date()
+
+    state, _ = OccupancyRollupState.objects.select_for_update().get_or_create(shelter=shelter)
+
+    # Capture the new watermarks before replaying: an event committed while
+    # the replay runs lands above them and is picked up by the next refresh.
+    bed_event_watermark = bed_event_model.objects.aggregate(m=Max("pgh_id"))["m"] or 0
+    reservation_event_watermark = reservation_event_model.objects.aggregate(m=Max("pgh_id"))["m"] or 0
+
+    start: datetime.date | None
+    if rebuild or state.rolled_through is None:
+        first_added_at = bed_event_model.objects.filter(shelter_id=shelter.pk, pgh_label="bed.add").aggregate(
+            at=Min("pgh_created_at")
+        )["at"]
+        start = first_added_at.astimezone(tz).date() if first_added_at else None
+        last = through
+        BedDailyStatus.objects.filter(shelter=shelter).delete()
+    else:
+        start = state.rolled_through + datetime.timedelta(days=1)
+        pending_at = pending_rollup_event_at(
+            shelter=shelter,
+            bed_event_watermark=state.bed_event_watermark,
+            reservation_event_watermark=state.reservation_event_watermark,
+            created_since=state.refreshed_at - ROLLUP_EVENT_LOOKBACK,
+        )
+        if pending_at is not None:
+            start = min(start, pending_at.astimezone(tz).date())
+        last = max(through, state.rolled_through)
+        BedDailyStatus.objects.filter(shelter=shelter, date__gte=start).delete()
+
+    written = 0
+    if start is not None and start <= last:
+        rows = (
+            BedDailyStatus(
+                shelter=shelter,
+                bed_id=row.bed_id,
+                date=row.date,
+                status=row.status,
+                is_occupied=row.is_occupied,
+            )
+            for row in replay_bed_day_statuses(shelter=shelter, days=_report_days(start, last), tz=tz)
+        )
+        for batch in itertools.batched(rows, _BULK_BATCH_SIZE, strict=False):
+            written += len(BedDailyStatus.objects.bulk_create(batch))
+
+    state.rolled_through = last
+    state.bed_event_watermark = bed_event_watermark
+    state.reservation_event_watermark = reservation_event_watermark
+    state.save()
+
+    return written
+
+
+def occupancy_rollup_refresh_all(*, through: datetime.date | None = None) -> dict[int, int]:
+    """Refresh the rollup of every shelter that has ever had a bed.
+
+    Each shelter is refreshed in its own transaction.  Returns
+    ``{shelter_id: rows_written}``.
+    """
+    bed_event_model = Bed.pgh_event_model  # type: ignore[attr-defined]
+    shelter_ids = bed_event_model.objects.filter(pgh_label="bed.add").values("shelter_id")
+    return {
+        shelter.pk: occupancy_rollup_refresh(shelter=shelter, through=through)
+        for shelter in Shelter.objects.filter(pk__in=shelter_ids).order_by("pk")
+    }
+
+
+def occupancy_rollup_check(
+    *,
+    shelter: Shelter,
+    start_date: datetime.date,
+    end_date: datetime.date,
+) -> list[datetime.date]:
+    """Compare *shelter*'s rollup with a fresh replay and return the days that disagree.
+
+    Rows are compared bed by bed, so a swapped status between two beds is
+    caught even when the daily counts still match.  Only meaningful for days
+    the rollup claims to cover; days past ``rolled_through`` are reported as
+    drift when the replay has beds on them.
+    """
+    days = _report_days(start_date, end_date)
+
+    expected = {
+        _row_key(row) for row in replay_bed_day_statuses(shelter=shelter, days=days, tz=SHELTER_SCHEDULE_TIME_ZONE)
+    }
+    actual = {
+        (day, bed_id, str(status), is_occupied)
+        for day, bed_id, status, is_occupied in BedDailyStatus.objects.filter(
+            shelter=shelter, date__gte=start_date, date__lte=end_date
+        ).values_list("date", "bed_id", "status", "is_occupied")
+    }
+    return sorted({key[0] for key in expected ^ actual})
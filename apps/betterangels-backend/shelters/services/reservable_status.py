@@ -0,0 +1,27 @@
+"""Repair of the trigger-maintained ``current_status`` column on beds and rooms."""
+
+from typing import cast
+
+from django.db import transaction
+
+from shelters.managers import BedQuerySet, RoomQuerySet
+from shelters.models import Bed, Room
+from shelters.selectors.computed_status import computed_status_case, status_drift
+
+
+@transaction.atomic
+def current_status_repair(*, model_class: type[Bed] | type[Room]) -> list[int]:
+    """Rewrite ``current_status`` on every drifted bed (or room) and return their IDs.
+
+    The value is written from ``computed_status_case`` rather than by touching
+    the row, so the repair also works while the status triggers are disabled.
+    Drifted rows are locked first, so a concurrent reservation change either
+    lands before the repair or re-fires the trigger after it.
+    """
+    drifted = list(
+        status_drift(model_class).select_for_update(of=("self",)).order_by("pk").values_list("pk", flat=True)
+    )
+    if drifted:
+        qs = cast(BedQuerySet | RoomQuerySet, model_class.objects.filter(pk__in=drifted))
+        qs.update(current_status=computed_status_case(qs.reservable_fk, qs.status_enum))
+    return drifted
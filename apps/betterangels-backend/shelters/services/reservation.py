@@ -1,5 +1,7 @@
+import datetime
 from typing import TYPE_CHECKING, Any, Dict
 
+import pghistory
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import transaction
 from django.utils import timezone
@@ -10,6 +12,7 @@ from shelters.models.shelter import ACTIVE_RESERVATION_STATUSES
 from shelters.selectors import bed_get, reservation_get, room_get
 from shelters.selectors.operator import reservation_queryset
 from shelters.status import get_last_completed_checkout, is_in_turnaround
+from shelters.types.filters import SHELTER_SCHEDULE_TIME_ZONE
 
 if TYPE_CHECKING:
     from accounts.models import User
@@ -189,3 +192,27 @@ def reservation_delete(*, user: "User", organization_id: str, reservation_ids: l
         raise ObjectDoesNotExist("No matching reservations found.")
     qs.delete()
     return deleted_ids
+
+
+@transaction.atomic
+def reservation_mark_overdue(*, today: datetime.date | None = None) -> int:
+    """Move CONFIRMED reservations whose start date has passed to CHECK_IN_OVERDUE and return how many moved.
+
+    *today* defaults to today in ``SHELTER_SCHEDULE_TIME_ZONE``; a reservation
+    becomes overdue once its whole start day has gone by without a check-in.
+
+    A single ``UPDATE`` moves every match, served by the partial
+    ``reservation_confirmed_start_idx`` index.  The ``reservation.status_change``
+    history trigger records one event per row inside that statement, labelled
+    with the sweep's context, and the status sync trigger keeps the beds and
+    rooms RESERVED.  A reservation checked in while the sweep waits on its row
+    lock no longer matches and is left alone.
+    """
+    now = timezone.now()
+    today = today or now.astimezone(SHELTER_SCHEDULE_TIME_ZONE).date()
+
+    with pghistory.context(timestamp=now, label="reservation_mark_overdue"):
+        return Reservation.objects.filter(
+            status=ReservationStatusChoices.CONFIRMED,
+            start_date__lt=today,
+        ).update(status=ReservationStatusChoices.CHECK_IN_OVERDUE, updated_at=now)
@@ -1,12 +1,33 @@
 from typing import Any
 
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
-from .models import Shelter, ShelterAvailability
+from .cache import shelter_map_clusters_invalidate
+from .models import Schedule, Shelter, ShelterAvailability
 
 
 @receiver(post_save, sender=Shelter)
 def create_shelter_availability(sender: Any, instance: Shelter, created: bool, **kwargs: Any) -> None:
     if created:
         ShelterAvailability.objects.get_or_create(shelter=instance)
+
+
+@receiver(post_save, sender=Shelter)
+@receiver(post_delete, sender=Shelter)
+@receiver(post_save, sender=ShelterAvailability)
+@receiver(post_delete, sender=ShelterAvailability)
+@receiver(post_save, sender=Schedule)
+@receiver(post_delete, sender=Schedule)
+def invalidate_shelter_map_clusters(sender: Any, **kwargs: Any) -> None:
+    shelter_map_clusters_invalidate()
+
+
+def invalidate_shelter_map_clusters_on_m2m_change(sender: Any, action: str, **kwargs: Any) -> None:
+    if action.startswith("post_"):
+        shelter_map_clusters_invalidate()
+
+
+# Shelter filters match on the property M2Ms (and the tags derived from them).
+for _field in Shelter._meta.many_to_many:
+    m2m_changed.connect(invalidate_shelter_map_clusters_on_m2m_change, sender=_field.remote_field.through)
@@ -0,0 +1,35 @@
+"""Shelters app Celery tasks."""
+
+from celery import Task, shared_task
+from common.celery import single_instance
+
+from .services.occupancy_rollup import occupancy_rollup_refresh_all
+from .services.reservation import reservation_mark_overdue
+
+
+@shared_task(bind=True)
+@single_instance(
+    lock_key="celery-lock:shelters.tasks.refresh_occupancy_rollups",
+    lock_ttl=60 * 30,  # 30 minutes
+)
+def refresh_occupancy_rollups(self: Task) -> str:
+    """
+    Periodic Task: Runs every 15 minutes (via Celery Beat) to roll new bed and
+    reservation events into the ``BedDailyStatus`` rollup.
+    """
+    refreshed = occupancy_rollup_refresh_all()
+    return f"Refreshed {len(refreshed)} shelters ({sum(refreshed.values())} rows written)"
+
+
+@shared_task(bind=True)
+@single_instance(
+    lock_key="celery-lock:shelters.tasks.mark_overdue_reservations",
+    lock_ttl=60 * 30,  # 30 minutes
+)
+def mark_overdue_reservations(self: Task) -> str:
+    """
+    Periodic Task: Runs hourly (via Celery Beat) to move confirmed reservations
+    whose start date has passed without a check-in to CHECK_IN_OVERDUE.
+    """
+    marked = reservation_mark_overdue()
+    return f"Marked {marked} reservations overdue"
@@ -1,5 +1,7 @@
 from accounts.tests.baker_recipes import organization_recipe
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from model_bakery import baker
 from shelters.enums import BedStatusChoices, BedTypeChoices, ReservationStatusChoices, StatusChoices
 from shelters.models import Bed, Reservation, Room
@@ -115,6 +117,31 @@ class BedsQueryTestCase(BedQueriesTestCase):
         self.assertEqual(bed["room"], {"id": str(self.room.pk)})
         self.assertEqual(bed["shelter"], {"id": str(self.shelter.pk)})
 
+    def test_nested_shelter_counts_do_not_query_per_shelter(self) -> None:
+        query = """
+            query ($pagination: OffsetPaginationInput) {
+                beds(pagination: $pagination) {
+                    results { shelter { id bedCounts { total } roomCounts { total } } }
+                }
+            }
+        """
+        variables = {"pagination": {"offset": 0, "limit": 10}}
+
+        with CaptureQueriesContext(connection) as one_shelter:
+            self.execute_graphql(query, variables=variables)
+
+        for _ in range(3):
+            baker.make(Bed, shelter=shelter_recipe.make(organization=self.org), _quantity=2)
+        with CaptureQueriesContext(connection) as four_shelters:
+            response = self.execute_graphql(query, variables=variables)
+
+        self.assertEqual(len(four_shelters), len(one_shelter))
+        results = response["data"]["beds"]["results"]
+        self.assertEqual(len(results), 7)
+        for bed in results:
+            expected_total = 1 if bed["shelter"]["id"] == str(self.shelter.pk) else 2
+            self.assertEqual(bed["shelter"]["bedCounts"], {"total": expected_total})
+
     def test_beds_query_filters_by_shelter_id(self) -> None:
         other_shelter = shelter_recipe.make(organization=self.org)
         other_bed = baker.make(Bed, shelter=other_shelter, name="Bed-2")
@@ -205,3 +232,24 @@ class BedsQueryTestCase(BedQueriesTestCase):
         response = self.execute_graphql(self.beds_query, variables={"pagination": {"offset": 0, "limit": 10}})
 
         self.assertGraphQLUnauthenticated(response)
+
+    def test_beds_keyset_query(self) -> None:
+        other_shelter = shelter_recipe.make(organization=organization_recipe.make())
+        baker.make(Bed, shelter=other_shelter, name="Other-Bed")
+        newer, newest = baker.make(Bed, shelter=self.shelter, _quantity=2)
+
+        self.assertEqual(
+            self._keyset_pages("bedsKeyset", "BedFilter"),
+            [[str(newest.pk), str(newer.pk)], [str(self.bed.pk)]],
+        )
+
+    def test_beds_keyset_query_without_permission_returns_permission_denied(self) -> None:
+        self.operator.user_permissions.clear()
+        self.operator.groups.clear()
+
+        response = self.execute_graphql("query { bedsKeyset { results { id } } }")
+
+        self.assertIn(
+            "You do not have permission to perform this action in this organization.",
+            response["errors"][0]["message"],
+        )
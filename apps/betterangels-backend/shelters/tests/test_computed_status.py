@@ -1,12 +1,16 @@
 """Tests for computed bed/room status (Python rules, queryset annotation, filters)."""
 
 import datetime
+from io import StringIO
 
+import pgtrigger
+from django.core.management import CommandError, call_command
 from django.test import TestCase
 from django.utils import timezone
 from model_bakery import baker
 from shelters.enums import BedStatusChoices, ReservationStatusChoices, RoomStatusChoices
 from shelters.models import Bed, Reservation, Room, Shelter
+from shelters.selectors.computed_status import status_drift
 from shelters.status import compute_bed_status, compute_room_status
 
 
@@ -172,3 +176,108 @@ class ComputeRoomStatusTestCase(TestCase):
             ),
             RoomStatusChoices.IN_TURNAROUND,
         )
+
+
+class CurrentStatusTriggerTestCase(TestCase):
+    """``current_status`` is kept in step with reservations by database triggers."""
+
+    def setUp(self) -> None:
+        self.shelter = baker.make(Shelter, name="Test Shelter")
+        self.room = baker.make(Room, shelter=self.shelter, name="Room-1")
+        self.bed = baker.make(Bed, shelter=self.shelter, room=self.room)
+
+    def _stored(self, obj: Bed | Room) -> str:
+        return type(obj).objects.values_list("current_status", flat=True).get(pk=obj.pk)
+
+    def test_follows_reservation_lifecycle(self) -> None:
+        reservation = baker.make(Reservation, bed=self.bed, room=self.room, status=ReservationStatusChoices.CONFIRMED)
+        self.assertEqual(self._stored(self.bed), BedStatusChoices.RESERVED)
+        self.assertEqual(self._stored(self.room), RoomStatusChoices.RESERVED)
+
+        reservation.status = ReservationStatusChoices.CHECKED_IN
+        reservation.save()
+        self.assertEqual(self._stored(self.bed), BedStatusChoices.OCCUPIED)
+
+        Reservation.objects.filter(pk=reservation.pk).update(
+            status=ReservationStatusChoices.COMPLETED, checked_out_at=timezone.now()
+        )
+        self.assertEqual(self._stored(self.bed), BedStatusChoices.IN_TURNAROUND)
+        self.assertEqual(self._stored(self.room), RoomStatusChoices.IN_TURNAROUND)
+
+        Bed.objects.filter(pk=self.bed.pk).update(last_cleaned=timezone.now())
+        self.assertEqual(self._stored(self.bed), BedStatusChoices.AVAILABLE)
+
+        reservation.delete()
+        Bed.objects.filter(pk=self.bed.pk).update(last_cleaned=None)
+        self.assertEqual(self._stored(self.bed), BedStatusChoices.AVAILABLE)
+
+    def test_moving_a_reservation_updates_both_beds(self) -> None:
+        other = baker.make(Bed, shelter=self.shelter, room=self.room)
+        reservation = baker.make(Reservation, bed=self.bed, status=ReservationStatusChoices.CHECKED_IN)
+
+        reservation.bed = other
+        reservation.save()
+
+        self.assertEqual(self._stored(self.bed), BedStatusChoices.AVAILABLE)
+        self.assertEqual(self._stored(other), BedStatusChoices.OCCUPIED)
+
+    def test_save_reads_back_recomputed_status(self) -> None:
+        bed = baker.make(Bed, shelter=self.shelter, maintenance_flag=True)
+        self.assertEqual(bed.computed_status, BedStatusChoices.OUT_OF_SERVICE)
+
+        bed.maintenance_flag = False
+        bed.save(update_fields=["maintenance_flag"])
+        self.assertEqual(bed.computed_status, BedStatusChoices.AVAILABLE)
+
+        # Status is not written when the save doesn't touch its inputs.
+        baker.make(Reservation, bed=bed, status=ReservationStatusChoices.CONFIRMED)
+        bed.name = "Renamed"
+        bed.save(update_fields=["name"])
+        self.assertEqual(bed.current_status, BedStatusChoices.AVAILABLE)
+        self.assertEqual(self._stored(bed), BedStatusChoices.RESERVED)
+
+    def test_status_changes_do_not_record_bed_events(self) -> None:
+        bed_event_model = Bed.pgh_event_model  # type: ignore[attr-defined]
+        baker.make(Reservation, bed=self.bed, status=ReservationStatusChoices.CHECKED_IN)
+
+        self.assertFalse(bed_event_model.objects.filter(pgh_obj_id=self.bed.pk, pgh_label="bed.update").exists())
+
+    def test_filters_use_stored_status(self) -> None:
+        baker.make(Reservation, bed=self.bed, status=ReservationStatusChoices.CHECK_IN_OVERDUE)
+
+        with self.assertNumQueries(1):
+            ids = list(Bed.objects.filter_by_statuses([BedStatusChoices.RESERVED]).values_list("pk", flat=True))
+        self.assertEqual(ids, [self.bed.pk])
+
+
+class ReconcileReservableStatusCommandTestCase(TestCase):
+    def setUp(self) -> None:
+        shelter = baker.make(Shelter, name="Test Shelter")
+        self.bed = baker.make(Bed, shelter=shelter)
+        self.room = baker.make(Room, shelter=shelter, name="Room-1")
+        baker.make(Reservation, bed=self.bed, room=self.room, status=ReservationStatusChoices.CHECKED_IN)
+
+    def _drift(self) -> None:
+        with pgtrigger.ignore("shelters.Bed:bed_current_status", "shelters.Room:room_current_status"):
+            Bed.objects.filter(pk=self.bed.pk).update(current_status=BedStatusChoices.AVAILABLE)
+            Room.objects.filter(pk=self.room.pk).update(current_status=RoomStatusChoices.AVAILABLE)
+
+    def test_reports_nothing_when_in_sync(self) -> None:
+        out = StringIO()
+        call_command("reconcile_reservable_status", stdout=out)
+
+        self.assertIn("matches", out.getvalue())
+
+    def test_detects_and_repairs_drift(self) -> None:
+        self._drift()
+        self.assertEqual(list(status_drift(Bed).values_list("pk", flat=True)), [self.bed.pk])
+
+        with self.assertRaises(CommandError):
+            call_command("reconcile_reservable_status", stdout=StringIO())
+
+        with pgtrigger.ignore("shelters.Bed:bed_current_status", "shelters.Room:room_current_status"):
+            call_command("reconcile_reservable_status", repair=True, stdout=StringIO())
+
+        self.assertFalse(status_drift(Bed).exists())
+        self.assertFalse(status_drift(Room).exists())
+        self.assertEqual(Bed.objects.get(pk=self.bed.pk).computed_status, BedStatusChoices.OCCUPIED)
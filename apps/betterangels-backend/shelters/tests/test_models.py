@@ -9,17 +9,22 @@ from shelters.enums import (
     ConditionChoices,
     DayOfWeekChoices,
     DemographicChoices,
+    PetChoices,
     ScheduleTypeChoices,
     ShelterChoices,
 )
 from shelters.models import (
     Demographic,
+    Pet,
     Schedule,
+    ScheduleOpenInterval,
     Service,
     ServiceCategory,
     Shelter,
     ShelterType,
 )
+from shelters.open_at import open_shelter_ids
+from shelters.property_tags import SHELTER_PROPERTY_LOOKUPS, property_filter, property_tag
 
 
 class ShelterModelTestCase(TestCase):
@@ -723,6 +728,175 @@ class ScheduleModelTestCase(TestCase):
         self.assertNotIn(shelter, Shelter.objects.open_at(wed_noon))
 
 
+class ScheduleOpenIntervalTestCase(TestCase):
+    """The trigger-maintained week-clock intervals behind ``shelters_open_at``."""
+
+    def setUp(self) -> None:
+        self.shelter = Shelter.objects.create(name="Interval Shelter")
+
+    def _minutes(self, schedule: Schedule) -> list[tuple[int, int]]:
+        return sorted(
+            (r.minutes.lower, r.minutes.upper) for r in ScheduleOpenInterval.objects.filter(schedule=schedule)
+        )
+
+    def test_intervals_follow_schedule_writes(self) -> None:
+        schedule = Schedule.objects.create(
+            shelter=self.shelter,
+            day=DayOfWeekChoices.TUESDAY,
+            start_time=datetime.time(9, 0),
+            end_time=datetime.time(17, 0),
+        )
+        self.assertEqual(self._minutes(schedule), [(1440 + 540, 1440 + 1020)])
+
+        schedule.day = DayOfWeekChoices.WEDNESDAY
+        schedule.save()
+        self.assertEqual(self._minutes(schedule), [(2880 + 540, 2880 + 1020)])
+
+        schedule_id = schedule.pk
+        schedule.delete()
+        self.assertFalse(ScheduleOpenInterval.objects.filter(schedule_id=schedule_id).exists())
+
+    def test_every_day_overnight_wraps_into_monday(self) -> None:
+        schedule = Schedule.objects.create(
+            shelter=self.shelter,
+            day=None,
+            start_time=datetime.time(22, 0),
+            end_time=datetime.time(6, 0),
+        )
+
+        minutes = self._minutes(schedule)
+        self.assertEqual(len(minutes), 8)
+        self.assertEqual(minutes[0], (0, 360))
+        self.assertEqual(minutes[-1], (6 * 1440 + 1320, 7 * 1440))
+
+        # Sunday 11 PM and the following Monday 3 AM are both covered.
+        self.assertTrue(self.shelter.is_open_at(datetime.datetime(2026, 3, 8, 23, 0)))
+        self.assertTrue(self.shelter.is_open_at(datetime.datetime(2026, 3, 9, 3, 0)))
+        self.assertFalse(self.shelter.is_open_at(datetime.datetime(2026, 3, 9, 12, 0)))
+
+    def test_full_day_schedule_covers_whole_day(self) -> None:
+        schedule = Schedule.objects.create(
+            shelter=self.shelter,
+            day=DayOfWeekChoices.FRIDAY,
+            start_time=None,
+            end_time=None,
+        )
+
+        self.assertEqual(self._minutes(schedule), [(4 * 1440, 5 * 1440)])
+
+    def test_open_shelter_ids(self) -> None:
+        closed = Shelter.objects.create(name="Closed Shelter")
+        excepted = Shelter.objects.create(name="Excepted Shelter")
+        for shelter in (self.shelter, excepted):
+            Schedule.objects.create(
+                shelter=shelter,
+                day=DayOfWeekChoices.WEDNESDAY,
+                start_time=datetime.time(9, 0),
+                end_time=datetime.time(17, 0),
+            )
+        Schedule.objects.create(
+            shelter=excepted,
+            day=DayOfWeekChoices.WEDNESDAY,
+            start_time=datetime.time(12, 0),
+            end_time=datetime.time(13, 0),
+            is_exception=True,
+        )
+        wed_noon = datetime.datetime(2026, 3, 4, 12, 30)
+
+        with self.assertNumQueries(1):
+            result = open_shelter_ids(
+                [self.shelter.pk, closed.pk, excepted.pk],
+                dt=wed_noon,
+                schedule_types=[ScheduleTypeChoices.OPERATING],
+            )
+
+        self.assertEqual(result, {self.shelter.pk})
+        self.assertEqual(open_shelter_ids([], dt=wed_noon, schedule_types=[ScheduleTypeChoices.OPERATING]), set())
+
+    def test_open_at_is_single_query(self) -> None:
+        Schedule.objects.create(
+            shelter=self.shelter,
+            day=DayOfWeekChoices.WEDNESDAY,
+            start_time=datetime.time(9, 0),
+            end_time=datetime.time(17, 0),
+        )
+
+        with self.assertNumQueries(1):
+            result = list(Shelter.objects.open_at(datetime.datetime(2026, 3, 4, 12, 30)))
+
+        self.assertEqual(result, [self.shelter])
+
+
+class ShelterPropertyTagsTestCase(TestCase):
+    """The trigger-maintained ``Shelter.property_tags``."""
+
+    def _tags(self, shelter: Shelter) -> list[str]:
+        shelter.refresh_from_db(fields=["property_tags"])
+        return shelter.property_tags
+
+    def test_lookups_match_through_tables(self) -> None:
+        for field, lookup in SHELTER_PROPERTY_LOOKUPS.items():
+            m2m = Shelter._meta.get_field(field)
+            through = m2m.remote_field.through._meta
+            self.assertEqual(through.db_table, f"shelters_shelter_{field}")
+            self.assertEqual(m2m.related_model._meta.model_name, lookup)
+            self.assertEqual(through.get_field(lookup).column, f"{lookup}_id")
+
+    def test_tags_follow_m2m_changes(self) -> None:
+        shelter = Shelter.objects.create(name="Tagged Shelter")
+        self.assertEqual(self._tags(shelter), sorted(property_tag(field) for field in SHELTER_PROPERTY_LOOKUPS))
+
+        cats = Pet.objects.get_or_create(name=PetChoices.CATS)[0]
+        exotics = Pet.objects.get_or_create(name=PetChoices.EXOTICS)[0]
+        shelter.pets.add(cats, exotics)
+        tags = self._tags(shelter)
+        self.assertIn(property_tag("pets", PetChoices.CATS), tags)
+        self.assertIn(property_tag("pets", PetChoices.EXOTICS), tags)
+        self.assertNotIn(property_tag("pets"), tags)
+
+        shelter.pets.remove(exotics)
+        tags = self._tags(shelter)
+        self.assertIn(property_tag("pets", PetChoices.CATS), tags)
+        self.assertNotIn(property_tag("pets", PetChoices.EXOTICS), tags)
+
+        shelter.pets.clear()
+        self.assertIn(property_tag("pets"), self._tags(shelter))
+
+    def test_stale_save_keeps_tags(self) -> None:
+        shelter = Shelter.objects.create(name="Tagged Shelter")
+        stale = Shelter.objects.get(pk=shelter.pk)
+        shelter.demographics.add(Demographic.objects.get_or_create(name=DemographicChoices.FAMILIES)[0])
+
+        stale.name = "Renamed Shelter"
+        stale.save()
+
+        self.assertIn(property_tag("demographics", DemographicChoices.FAMILIES), self._tags(shelter))
+
+    def test_tag_changes_do_not_record_shelter_updates(self) -> None:
+        shelter = Shelter.objects.create(name="Tagged Shelter")
+
+        shelter.pets.add(Pet.objects.get_or_create(name=PetChoices.CATS)[0])
+
+        self.assertFalse(Events.objects.filter(pgh_label="shelter.update").exists())
+        self.assertTrue(Events.objects.filter(pgh_label="shelter.pet.add").exists())
+
+    def test_property_filter_is_single_table(self) -> None:
+        matching = Shelter.objects.create(name="Families")
+        matching.demographics.add(Demographic.objects.get_or_create(name=DemographicChoices.FAMILIES)[0])
+        untagged = Shelter.objects.create(name="Untagged")
+        Shelter.objects.create(name="Other").demographics.add(
+            Demographic.objects.get_or_create(name=DemographicChoices.SINGLE_MEN)[0]
+        )
+
+        qs = Shelter.objects.filter(
+            property_filter("demographics", [DemographicChoices.FAMILIES], include_null=True)
+            & property_filter("pets", None, include_null=True)
+        )
+
+        self.assertNotIn("JOIN", str(qs.query))
+        self.assertEqual(set(qs), {matching, untagged})
+
+
 class CreateSchedulesServiceTestCase(TestCase):
     """Tests for _create_schedules multi-day fan-out."""
 
@@ -0,0 +1,212 @@
+import datetime
+from io import StringIO
+from zoneinfo import ZoneInfo
+
+from django.core.management import CommandError, call_command
+from django.db.models import Max
+from django.test import TestCase
+from model_bakery import baker
+from shelters.enums import BedStatusChoices, ReservationStatusChoices
+from shelters.models import Bed, BedDailyStatus, OccupancyRollupState, Reservation, Shelter
+from shelters.selectors import daily_occupancy, report_bed_status_counts
+from shelters.selectors.reports import rollup_served_through
+from shelters.services.occupancy_rollup import occupancy_rollup_check, occupancy_rollup_refresh
+
+ReservationEvent = Reservation.pgh_event_model  # type: ignore[attr-defined]
+BedEvent = Bed.pgh_event_model  # type: ignore[attr-defined]
+
+TZ_LA = ZoneInfo("America/Los_Angeles")
+
+
+def _la(y: int, m: int, d: int, hh: int = 12) -> datetime.datetime:
+    return datetime.datetime(y, m, d, hh, tzinfo=TZ_LA)
+
+
+class OccupancyRollupTestCase(TestCase):
+    """Tests for the ``BedDailyStatus`` rollup and the selectors that read it."""
+
+    CI = ReservationStatusChoices.CHECKED_IN
+    DONE = ReservationStatusChoices.COMPLETED
+
+    def setUp(self) -> None:
+        self.shelter = Shelter.objects.create(name="Test Shelter")
+        self.start = datetime.datetime(2026, 1, 10, tzinfo=TZ_LA)
+        self.end = datetime.datetime(2026, 1, 15, tzinfo=TZ_LA)  # exclusive
+        self.through = datetime.date(2026, 1, 14)
+
+        self.bed = self._make_bed(added_at=_la(2026, 1, 1))
+        self.other_bed = self._make_bed(added_at=_la(2026, 1, 1))
+        self._stay(self.bed, events=[(self.CI, _la(2026, 1, 11)), (self.DONE, _la(2026, 1, 13))])
+
+    # -- fixture helpers -----------------------------------------------------
+
+    def _make_bed(self, *, added_at: datetime.datetime) -> Bed:
+        bed: Bed = baker.make(Bed, shelter=self.shelter)
+        BedEvent.objects.filter(pgh_obj_id=bed.pk, pgh_label="bed.add").update(pgh_created_at=added_at)
+        return bed
+
+    def _stay(self, bed: Bed, *, events: list[tuple[ReservationStatusChoices, datetime.datetime]]) -> Reservation:
+        reservation = Reservation.objects.create(bed=bed)
+        for status, _when in events:
+            reservation.status = status
+            reservation.save()
+
+        ReservationEvent.objects.filter(pgh_obj_id=reservation.pk, pgh_label="reservation.add").update(
+            pgh_created_at=events[0][1] - datetime.timedelta(seconds=1)
+        )
+        for status, when in events:
+            ReservationEvent.objects.filter(
+                pgh_obj_id=reservation.pk, pgh_label="reservation.status_change", status=status
+            ).update(pgh_created_at=when)
+        return reservation
+
+    def _replayed(self) -> tuple[list, list]:
+        """Selector output computed by the event replay (no rollup state)."""
+        OccupancyRollupState.objects.filter(shelter=self.shelter).delete()
+        return (
+            report_bed_status_counts(shelter=self.shelter, start=self.start, end=self.end),
+            daily_occupancy(shelter=self.shelter, start=self.start, end=self.end),
+        )
+
+    # -- tests ---------------------------------------------------------------
+
+    def test_backfill_writes_one_row_per_bed_per_day(self) -> None:
+        written = occupancy_rollup_refresh(shelter=self.shelter, through=self.through)
+
+        # Two beds, Jan 1 (first bed.add) through Jan 14.
+        self.assertEqual(written, 2 * 14)
+        state = OccupancyRollupState.objects.get(shelter=self.shelter)
+        self.assertEqual(state.rolled_through, self.through)
+
+        row = BedDailyStatus.objects.get(shelter=self.shelter, bed_id=self.bed.pk, date=datetime.date(2026, 1, 12))
+        self.assertEqual(row.status, BedStatusChoices.OCCUPIED)
+        self.assertTrue(row.is_occupied)
+
+    def test_selectors_read_rollup_and_match_replay(self) -> None:
+        expected_counts, expected_occupancy = self._replayed()
+        occupancy_rollup_refresh(shelter=self.shelter, through=self.through)
+        self.assertEqual(rollup_served_through(shelter=self.shelter, tz=TZ_LA), self.through)
+
+        # State lookup + two pending-event probes + one grouped read.
+        with self.assertNumQueries(4):
+            counts = report_bed_status_counts(shelter=self.shelter, start=self.start, end=self.end)
+        with self.assertNumQueries(4):
+            occupancy = daily_occupancy(shelter=self.shelter, start=self.start, end=self.end)
+
+        self.assertEqual(counts, expected_counts)
+        self.assertEqual(
+            [(o.date, o.occupied_count, o.total_beds, o.occupancy_pct) for o in occupancy],
+            [(o.date, o.occupied_count, o.total_beds, o.occupancy_pct) for o in expected_occupancy],
+        )
+
+    def test_not_served_for_other_time_zones(self) -> None:
+        occupancy_rollup_refresh(shelter=self.shelter, through=self.through)
+
+        self.assertIsNone(rollup_served_through(shelter=self.shelter, tz=datetime.timezone.utc))
+
+    def test_days_after_rolled_through_are_replayed(self) -> None:
+        self.end = datetime.datetime(2026, 1, 16, tzinfo=TZ_LA)
+        expected_counts, expected_occupancy = self._replayed()
+        occupancy_rollup_refresh(shelter=self.shelter, through=datetime.date(2026, 1, 12))
+        self.assertEqual(rollup_served_through(shelter=self.shelter, tz=TZ_LA), datetime.date(2026, 1, 12))
+
+        self.assertEqual(
+            report_bed_status_counts(shelter=self.shelter, start=self.start, end=self.end), expected_counts
+        )
+        self.assertEqual(
+            [
+                (o.date, o.occupied_count, o.total_beds)
+                for o in daily_occupancy(shelter=self.shelter, start=self.start, end=self.end)
+            ],
+            [(o.date, o.occupied_count, o.total_beds) for o in expected_occupancy],
+        )
+
+    def test_pending_event_only_replays_from_its_day(self) -> None:
+        occupancy_rollup_refresh(shelter=self.shelter, through=self.through)
+        self._stay(self.other_bed, events=[(self.CI, _la(2026, 1, 12))])
+
+        self.assertEqual(rollup_served_through(shelter=self.shelter, tz=TZ_LA), datetime.date(2026, 1, 11))
+
+        # Jan 10 and 11 come from the rollup, Jan 12..14 from the replay, which sees the new stay.
+        counts = report_bed_status_counts(shelter=self.shelter, start=self.start, end=self.end)
+        self.assertEqual([c.occupied for c in counts], [0, 1, 2, 1, 1])
+        expected_counts, _ = self._replayed()
+        self.assertEqual(counts, expected_counts)
+
+    def test_late_arriving_event_invalidates_and_refresh_recomputes_from_its_day(self) -> None:
+        occupancy_rollup_refresh(shelter=self.shelter, through=self.through)
+
+        # A reservation whose events are timestamped in the already-rolled past.
+        self._stay(self.other_bed, events=[(self.CI, _la(2026, 1, 12))])
+        self.assertEqual(rollup_served_through(shelter=self.shelter, tz=TZ_LA), datetime.date(2026, 1, 11))
+
+        written = occupancy_rollup_refresh(shelter=self.shelter, through=self.through)
+
+        # Only Jan 12..14 were recomputed.
+        self.assertEqual(written, 2 * 3)
+        self.assertEqual(rollup_served_through(shelter=self.shelter, tz=TZ_LA), self.through)
+        row = BedDailyStatus.objects.get(bed_id=self.other_bed.pk, date=datetime.date(2026, 1, 12))
+        self.assertEqual(row.status, BedStatusChoices.OCCUPIED)
+        self.assertEqual(
+            occupancy_rollup_check(shelter=self.shelter, start_date=datetime.date(2026, 1, 1), end_date=self.through),
+            [],
+        )
+
+    def test_event_committed_below_the_watermark_is_applied_by_the_next_refresh(self) -> None:
+        occupancy_rollup_refresh(shelter=self.shelter, through=self.through)
+        self._stay(self.other_bed, events=[(self.CI, _la(2026, 1, 12))])
+
+        # As if the stay's transaction had been open during that refresh: the
+        # refresh ran just after it started and already saw a higher event id.
+        OccupancyRollupState.objects.filter(shelter=self.shelter).update(
+            bed_event_watermark=BedEvent.objects.aggregate(m=Max("pgh_id"))["m"],
+            reservation_event_watermark=ReservationEvent.objects.aggregate(m=Max("pgh_id"))["m"],
+            refreshed_at=_la(2026, 1, 12, 13),
+        )
+
+        written = occupancy_rollup_refresh(shelter=self.shelter, through=self.through)
+
+        self.assertEqual(written, 2 * 3)
+        self.assertEqual(
+            occupancy_rollup_check(shelter=self.shelter, start_date=datetime.date(2026, 1, 1), end_date=self.through),
+            [],
+        )
+
+    def test_removed_bed_keeps_history(self) -> None:
+        bed_pk = self.other_bed.pk
+        self.other_bed.delete()
+        BedEvent.objects.filter(pgh_obj_id=bed_pk, pgh_label="bed.remove").update(pgh_created_at=_la(2026, 1, 12))
+
+        occupancy_rollup_refresh(shelter=self.shelter, through=self.through)
+
+        self.assertTrue(BedDailyStatus.objects.filter(bed_id=bed_pk, date=datetime.date(2026, 1, 11)).exists())
+        self.assertFalse(BedDailyStatus.objects.filter(bed_id=bed_pk, date=datetime.date(2026, 1, 12)).exists())
+
+    def test_check_reports_drift(self) -> None:
+        occupancy_rollup_refresh(shelter=self.shelter, through=self.through)
+        BedDailyStatus.objects.filter(bed_id=self.other_bed.pk, date=datetime.date(2026, 1, 13)).update(
+            status=BedStatusChoices.OUT_OF_SERVICE
+        )
+
+        self.assertEqual(
+            occupancy_rollup_check(shelter=self.shelter, start_date=self.start.date(), end_date=self.through),
+            [datetime.date(2026, 1, 13)],
+        )
+
+    def test_command_check_and_repair(self) -> None:
+        call_command("occupancy_rollup", through=self.through, stdout=StringIO())
+        BedDailyStatus.objects.filter(bed_id=self.bed.pk, date=self.through).delete()
+
+        with self.assertRaises(CommandError):
+            call_command("occupancy_rollup", check=5, stdout=StringIO())
+
+        call_command("occupancy_rollup", check=5, repair=True, stdout=StringIO())
+
+        state = OccupancyRollupState.objects.get(shelter=self.shelter)
+        self.assertTrue(BedDailyStatus.objects.filter(bed_id=self.bed.pk, date=self.through).exists())
+        self.assertEqual(
+            occupancy_rollup_check(
+                shelter=self.shelter, start_date=datetime.date(2026, 1, 1), end_date=state.rolled_through
+            ),
+            [],
+        )
@@ -166,6 +166,28 @@ class OperatorShelterQueryTestCase(GraphQLBaseTestCase):
             response["errors"][0]["message"],
         )
 
+    def test_operator_shelters_keyset_query(self) -> None:
+        """Keyset pages cover the user's organizations' shelters and only those."""
+        self.graphql_client.force_login(self.org_1_case_manager_1)
+        newer, newest = shelter_recipe.make(_quantity=2, organization=self.org_1)
+        shelter_recipe.make(organization=self.org_2)
+
+        self.assertEqual(
+            self._keyset_pages("operatorSheltersKeyset", "ShelterFilter"),
+            [[str(newest.id), str(newer.id)], [str(self.shelter.id)]],
+        )
+
+    def test_operator_shelters_keyset_query_without_permission(self) -> None:
+        self.graphql_client.force_login(self.non_case_manager_user)
+
+        response = self.execute_graphql("query { operatorSheltersKeyset { results { id } } }")
+
+        self.assertIsNone(response["data"])
+        self.assertIn(
+            "You do not have permission to perform this action in this organization.",
+            response["errors"][0]["message"],
+        )
+
     def test_operator_shelters_filter_by_name(self) -> None:
         """Name filter returns only shelters whose name matches (case-insensitive)."""
         self.graphql_client.force_login(self.org_1_case_manager_1)
@@ -262,7 +284,7 @@ class OperatorShelterQueryTestCase(GraphQLBaseTestCase):
                 }
             }
         """
-        expected_query_count = 3
+        expected_query_count = 4
         with self.assertNumQueriesWithoutCache(expected_query_count):
             response = self.execute_graphql(query, variables={"orgIds": [str(self.org_1.id)]})
         results = response["data"]["operatorShelters"]["results"]
@@ -293,7 +315,7 @@ class OperatorShelterQueryTestCase(GraphQLBaseTestCase):
                 }
             }
         """
-        expected_query_count = 3
+        expected_query_count = 4
         with self.assertNumQueriesWithoutCache(expected_query_count):
             response = self.execute_graphql(query, variables={"orgIds": [str(self.org_1.id)]})
         results = response["data"]["operatorShelters"]["results"]
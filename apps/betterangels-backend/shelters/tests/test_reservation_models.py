@@ -151,6 +151,18 @@ class BedComputedStatusTestCase(TestCase):
         self._make_completed_reservation(bed, checkout)
         self.assertEqual(bed.computed_status, BedStatusChoices.OUT_OF_SERVICE)
 
+    def test_reservation_writes_refresh_the_held_bed(self) -> None:
+        bed = Bed.objects.with_computed_status().get(pk=self._make_bed().pk)
+        reservation = baker.make(Reservation, bed=bed, status=ReservationStatusChoices.CONFIRMED)
+        self.assertEqual(bed.computed_status, BedStatusChoices.RESERVED)
+
+        reservation.status = ReservationStatusChoices.CHECKED_IN
+        reservation.save()
+        self.assertEqual(bed.computed_status, BedStatusChoices.OCCUPIED)
+
+        reservation.delete()
+        self.assertEqual(bed.computed_status, BedStatusChoices.AVAILABLE)
+
 
 class RoomComputedStatusTestCase(TestCase):
     """
@@ -231,3 +231,22 @@ class ReservationsQueryTestCase(ReservationQueriesTestCase):
             )
 
         self.assertGraphQLUnauthenticated(response)
+
+    def test_reservations_keyset_query(self) -> None:
+        other_shelter = shelter_recipe.make(organization=organization_recipe.make())
+        other_bed = baker.make(Bed, shelter=other_shelter, name="Other-Bed")
+        baker.make(Reservation, bed=other_bed, status=ReservationStatusChoices.CONFIRMED)
+        oldest, newer, newest = baker.make(
+            Reservation, bed=self.bed, status=ReservationStatusChoices.CONFIRMED, _quantity=3
+        )
+
+        self.assertEqual(
+            self._keyset_pages("reservationsKeyset", "ReservationFilter"),
+            [[str(newest.pk), str(newer.pk)], [str(oldest.pk)]],
+        )
+
+    def test_reservations_keyset_query_without_permission_returns_empty(self) -> None:
+        baker.make(Reservation, bed=self.bed, status=ReservationStatusChoices.CONFIRMED)
+        self.operator.user_permissions.clear()
+
+        self.assertEqual(self._keyset_pages("reservationsKeyset", "ReservationFilter"), [[]])
@@ -7,9 +7,15 @@ from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.test import TestCase
 from model_bakery import baker
 
-from shelters.enums import ReservationStatusChoices
+from shelters.enums import BedStatusChoices, ReservationStatusChoices
 from shelters.models import Bed, Reservation, ReservationClient, Room
-from shelters.services.reservation import reservation_create, reservation_delete, reservation_update
+from shelters.services.reservation import (
+    reservation_create,
+    reservation_delete,
+    reservation_mark_overdue,
+    reservation_update,
+)
+from shelters.tasks import mark_overdue_reservations
 from shelters.tests.baker_recipes import shelter_recipe
 
 
@@ -371,3 +377,60 @@ class ReservationDeleteTestCase(ReservationServiceTestCase):
     def test_empty_list_raises(self) -> None:
         with self.assertRaises(ObjectDoesNotExist):
             reservation_delete(user=self.user, organization_id=self.org.pk, reservation_ids=[])
+
+
+class ReservationMarkOverdueTestCase(ReservationServiceTestCase):
+    TODAY = datetime.date(2026, 3, 10)
+
+    def _reserve(self, start_date: datetime.date | None, **kwargs: object) -> Reservation:
+        bed = baker.make(Bed, shelter=self.shelter, room=self.room_1)
+        return baker.make(Reservation, bed=bed, start_date=start_date, **kwargs)
+
+    def test_marks_confirmed_reservations_past_their_start_date(self) -> None:
+        overdue = [self._reserve(self.TODAY - datetime.timedelta(days=days)) for days in (1, 30)]
+        starts_today = self._reserve(self.TODAY)
+        undated = self._reserve(None)
+        checked_in = self._reserve(self.TODAY - datetime.timedelta(days=1), status=ReservationStatusChoices.CHECKED_IN)
+
+        marked = reservation_mark_overdue(today=self.TODAY)
+
+        self.assertEqual(marked, 2)
+        self.assertEqual(
+            set(Reservation.objects.filter(status=ReservationStatusChoices.CHECK_IN_OVERDUE)),
+            set(overdue),
+        )
+        for untouched, status in (
+            (starts_today, ReservationStatusChoices.CONFIRMED),
+            (undated, ReservationStatusChoices.CONFIRMED),
+            (checked_in, ReservationStatusChoices.CHECKED_IN),
+        ):
+            untouched.refresh_from_db()
+            self.assertEqual(untouched.status, status)
+        self.assertEqual(reservation_mark_overdue(today=self.TODAY), 0)
+
+    def test_records_status_change_events(self) -> None:
+        reservation = self._reserve(self.TODAY - datetime.timedelta(days=1))
+
+        reservation_mark_overdue(today=self.TODAY)
+
+        event = Reservation.pgh_event_model.objects.get(  # type: ignore[attr-defined]
+            pgh_obj_id=reservation.pk, pgh_label="reservation.status_change"
+        )
+        self.assertEqual(event.status, ReservationStatusChoices.CHECK_IN_OVERDUE)
+        self.assertEqual(event.pgh_context.metadata["label"], "reservation_mark_overdue")
+
+    def test_bed_stays_reserved(self) -> None:
+        reservation = self._reserve(self.TODAY - datetime.timedelta(days=1))
+
+        reservation_mark_overdue(today=self.TODAY)
+
+        assert reservation.bed
+        reservation.bed.refresh_from_db()
+        self.assertEqual(reservation.bed.current_status, BedStatusChoices.RESERVED)
+
+    def test_task_reports_marked_count(self) -> None:
+        self._reserve(datetime.date(2020, 1, 1))
+
+        result = mark_overdue_reservations.apply().get()
+
+        self.assertEqual(result, "Marked 1 reservations overdue")
@@ -239,3 +239,24 @@ class RoomsQueryTestCase(RoomQueriesTestCase):
         response = self.execute_graphql(self.rooms_query, variables={"pagination": {"offset": 0, "limit": 10}})
 
         self.assertGraphQLUnauthenticated(response)
+
+    def test_rooms_keyset_query(self) -> None:
+        other_shelter = shelter_recipe.make(organization=organization_recipe.make())
+        baker.make(Room, shelter=other_shelter, name="Other-Room")
+        newer, newest = baker.make(Room, shelter=self.shelter, _quantity=2)
+
+        self.assertEqual(
+            self._keyset_pages("roomsKeyset", "RoomFilter"),
+            [[str(newest.pk), str(newer.pk)], [str(self.room.pk)]],
+        )
+
+    def test_rooms_keyset_query_without_permission_returns_permission_denied(self) -> None:
+        self.operator.user_permissions.clear()
+        self.operator.groups.clear()
+
+        response = self.execute_graphql("query { roomsKeyset { results { id } } }")
+
+        self.assertIn(
+            "You do not have permission to perform this action in this organization.",
+            response["errors"][0]["message"],
+        )
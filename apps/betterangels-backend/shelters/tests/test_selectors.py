@@ -408,6 +408,42 @@ class DailyOccupancyTestCase(TestCase):
         self.assertEqual(rows["2026-01-13"].total_beds, 1)
         self.assertEqual(rows["2026-01-14"].total_beds, 1)
 
+    def test_shelter_occupancy_metrics_total_beds_reflects_add_and_remove(self) -> None:
+        """The combined selector keeps each day's bed count, not the last day's."""
+        from shelters.selectors import shelter_occupancy_metrics
+
+        bed_a = self._make_bed(name="A")
+        bed_b = self._make_bed(name="B")
+        self._stay(bed_a, events=[(self.CI, self._utc(2026, 1, 10))])
+        self._remove_bed(bed_b, at=self._utc(2026, 1, 13, 8))
+
+        s, e = self._dt_range(2026, 1, 11, 14)
+        metrics = shelter_occupancy_metrics(shelter=self.shelter, start=s, end=e)
+
+        self.assertEqual(
+            [(row.date.isoformat(), row.total_beds, row.occupancy_pct) for row in metrics.daily_occupancy],
+            [
+                ("2026-01-11", 2, 50.0),
+                ("2026-01-12", 2, 50.0),
+                ("2026-01-13", 1, 100.0),
+                ("2026-01-14", 1, 100.0),
+            ],
+        )
+
+    def test_total_beds_counts_beds_regardless_of_id_order(self) -> None:
+        """A bed added late does not hide an earlier-added bed with a higher ID."""
+        late_bed = self._make_bed(name="A")
+        BedEvent.objects.filter(pgh_obj_id=late_bed.pk, pgh_label="bed.add").update(
+            pgh_created_at=self._utc(2026, 1, 12)
+        )
+        self._make_bed(name="B")
+
+        s, e = self._dt_range(2026, 1, 11, 12)
+        rows = self._occupancy(s, e)
+
+        self.assertEqual(rows["2026-01-11"].total_beds, 1)
+        self.assertEqual(rows["2026-01-12"].total_beds, 2)
+
     def test_removed_bed_occupancy_retained_for_days_it_existed(self) -> None:
         bed = self._make_bed()
         self._stay(bed, events=[(self.CI, self._utc(2026, 1, 10))])
@@ -988,6 +1024,38 @@ class BedStatusCountsTestCase(TestCase):
         self.assertEqual(counts[datetime.date(2026, 1, 12)].available, 1)
         self.assertEqual(counts[datetime.date(2026, 1, 13)].available, 1)
 
+    def test_in_turnaround_uses_checkout_known_at_end_of_day(self) -> None:
+        """Each day is judged against the latest checkout recorded by then, not a later one."""
+        bed = self._make_bed(added_at=self._utc(2025, 12, 1))
+        first = self._stay(bed, events=[(self.CI, self._utc(2026, 1, 9)), (self.DONE, self._utc(2026, 1, 10))])
+        self._set_last_cleaned(bed, self._utc(2026, 1, 11, 0), at=self._utc(2026, 1, 11, 0))
+        second = self._stay(bed, events=[(self.CI, self._utc(2026, 1, 12)), (self.DONE, self._utc(2026, 1, 13))])
+        for reservation, checked_out_at in ((first, self._utc(2026, 1, 10)), (second, self._utc(2026, 1, 13))):
+            ReservationEvent.objects.filter(
+                pgh_obj_id=reservation.pk, pgh_label="reservation.status_change", status=self.DONE
+            ).update(checked_out_at=checked_out_at)
+
+        counts = self._counts(self._dt_la(2026, 1, 10), self._dt_la(2026, 1, 14))
+        self.assertEqual(counts[datetime.date(2026, 1, 10)].in_turnaround, 1)
+        self.assertEqual(counts[datetime.date(2026, 1, 11)].available, 1)
+        self.assertEqual(counts[datetime.date(2026, 1, 12)].occupied, 1)
+        self.assertEqual(counts[datetime.date(2026, 1, 13)].in_turnaround, 1)
+
+    def test_reads_each_event_table_once(self) -> None:
+        """The replay issues one bed-event and one reservation-event query however many beds and days."""
+        for i in range(5):
+            bed = self._make_bed(name=f"Bed {i}", added_at=self._utc(2025, 12, 1))
+            self._stay(bed, events=[(self.CONFIRMED, self._utc(2026, 1, 2 + i)), (self.CI, self._utc(2026, 1, 10 + i))])
+            self._set_maintenance(bed, True, at=self._utc(2026, 1, 20 + i))
+
+        # Rollup state lookup + bed events + reservation events.
+        with self.assertNumQueries(3):
+            counts = self._counts(self._dt_la(2026, 1, 1), self._dt_la(2026, 2, 1))
+
+        self.assertEqual(counts[datetime.date(2026, 1, 12)].occupied, 3)
+        self.assertEqual(counts[datetime.date(2026, 1, 12)].reserved, 2)
+        self.assertEqual(counts[datetime.date(2026, 1, 31)].out_of_service, 5)
+
     def test_no_bed_added_yet_zero_counts(self) -> None:
         """A bed added after the range start appears only from its first day."""
         self._make_bed(added_at=self._utc(2026, 1, 12))
@@ -72,6 +72,38 @@ class ShelterFilterQueryTestCase(GraphQLBaseTestCase):
         # s1 is ~27 miles away from the reference point, so it was not included in the response payload
         self.assertEqual(result_shelter_ids, [str(s3.pk), str(s2.pk)])
 
+    def test_shelter_location_filter_nearest_first(self) -> None:
+        _, near, nearest = [
+            Shelter.objects.create(
+                location=Places(place=f"place {i}", latitude=f"34.{i}", longitude=f"-118.{i}"),
+                status=StatusChoices.APPROVED,
+            )
+            for i in range(3, 0, -1)
+        ]
+        Shelter.objects.create(name="No location", status=StatusChoices.APPROVED)
+
+        query = """
+            query ($filters: ShelterFilter, $pagination: OffsetPaginationInput) {
+                shelters(filters: $filters, pagination: $pagination) {
+                    results {
+                        id
+                        distanceInMiles
+                    }
+                }
+            }
+        """
+        filters = {"geolocation": {"latitude": 34, "longitude": -118, "nearestFirst": True}}
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.execute_graphql(
+                query, variables={"filters": filters, "pagination": {"offset": 0, "limit": 2}}
+            )
+
+        results = response["data"]["shelters"]["results"]
+        self.assertEqual([r["id"] for r in results], [str(nearest.pk), str(near.pk)])
+        self.assertLess(results[0]["distanceInMiles"], results[1]["distanceInMiles"])
+        self.assertTrue(any('"geolocation" <->' in q["sql"] for q in context.captured_queries))
+
     def test_shelter_map_bounds_filter(self) -> None:
         """Test map bounds filter for querying shelters within a defined area.
 
@@ -0,0 +1,158 @@
+import datetime
+import math
+from typing import Any
+
+import time_machine
+
+from common.tests.utils import GraphQLBaseTestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from places import Places
+
+from shelters.enums import DayOfWeekChoices, PetChoices, ScheduleTypeChoices, StatusChoices
+from shelters.models import Pet, Schedule, Shelter
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "map-clusters"}}
+ZOOM = 10
+
+SHELTER_MAP_CLUSTERS_QUERY = """
+    query ($zoom: Int!, $x: Int!, $y: Int!, $filters: ShelterFilter) {
+        shelterMapClusters(zoom: $zoom, x: $x, y: $y, filters: $filters) {
+            latitude
+            longitude
+            count
+            availableBeds
+            shelterId
+        }
+    }
+"""
+
+
+def _tile(latitude: float, longitude: float, zoom: int) -> tuple[int, int]:
+    n = 2**zoom
+    lat = math.radians(latitude)
+    x = int((longitude + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(lat)) / math.pi) / 2.0 * n)
+    return x, y
+
+
+class ShelterMapClustersQueryTestCase(GraphQLBaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        # Downtown Los Angeles: three shelters a hundred metres apart, one in the valley (same tile).
+        self.downtown = [
+            self._shelter(34.0345, -118.2349, beds=2),
+            self._shelter(34.0352, -118.2355, beds=3),
+            self._shelter(34.0338, -118.2342, beds=0),
+        ]
+        self.x, self.y = _tile(34.0345, -118.2349, ZOOM)
+        self.far = self._shelter(34.2163, -118.3667, beds=1)
+        # Unapproved shelters are never clustered.
+        self._shelter(34.0345, -118.2349, beds=10, status=StatusChoices.DRAFT)
+
+    def _shelter(self, latitude: float, longitude: float, *, beds: int, **kwargs: Any) -> Shelter:
+        shelter = Shelter.objects.create(
+            location=Places(place="place", latitude=str(latitude), longitude=str(longitude)),
+            status=kwargs.pop("status", StatusChoices.APPROVED),
+            **kwargs,
+        )
+        shelter.availability.non_restricted_beds = beds
+        shelter.availability.save()
+        return shelter
+
+    def _clusters(self, zoom: int = ZOOM, x: int | None = None, y: int | None = None, **filters: Any) -> Any:
+        variables = {"zoom": zoom, "x": self.x if x is None else x, "y": self.y if y is None else y}
+        if filters:
+            variables["filters"] = filters
+        response = self.execute_graphql(SHELTER_MAP_CLUSTERS_QUERY, variables=variables)
+        self.assertIsNone(response.get("errors"))
+        return response["data"]["shelterMapClusters"]
+
+    def test_clusters(self) -> None:
+        clusters = self._clusters()
+
+        self.assertEqual(len(clusters), 2)
+        downtown, far = clusters
+        self.assertEqual((downtown["count"], downtown["availableBeds"], downtown["shelterId"]), (3, 5, None))
+        self.assertAlmostEqual(downtown["latitude"], 34.0345, places=3)
+        self.assertAlmostEqual(downtown["longitude"], -118.2349, places=3)
+        self.assertEqual((far["count"], far["availableBeds"], far["shelterId"]), (1, 1, str(self.far.pk)))
+
+    def test_child_tiles_partition_parent(self) -> None:
+        parent_x, parent_y = _tile(34.0345, -118.2349, ZOOM - 3)
+        total = sum(c["count"] for c in self._clusters(zoom=ZOOM - 3, x=parent_x, y=parent_y))
+
+        children = [
+            cluster
+            for x in range(parent_x * 8, parent_x * 8 + 8)
+            for y in range(parent_y * 8, parent_y * 8 + 8)
+            for cluster in self._clusters(zoom=ZOOM, x=x, y=y)
+        ]
+
+        self.assertEqual(total, 4)
+        self.assertEqual(sum(c["count"] for c in children), total)
+
+    def test_honors_shelter_filters(self) -> None:
+        self.downtown[0].pets.add(Pet.objects.get_or_create(name=PetChoices.CATS)[0])
+
+        clusters = self._clusters(properties={"pets": [PetChoices.CATS.name]})
+
+        self.assertEqual(len(clusters), 1)
+        self.assertEqual((clusters[0]["count"], clusters[0]["shelterId"]), (1, str(self.downtown[0].pk)))
+
+    def test_invalid_tile(self) -> None:
+        response = self.execute_graphql(SHELTER_MAP_CLUSTERS_QUERY, variables={"zoom": 2, "x": 4, "y": 0})
+
+        self.assertEqual(response["errors"][0]["message"], "tile (4, 0) does not exist at zoom 2")
+
+    @override_settings(CACHES=LOCMEM_CACHES, SHELTER_MAP_CLUSTER_CACHE_TTL=60)
+    def test_cached_per_tile_and_filters(self) -> None:
+        cache.clear()
+        self._clusters()
+
+        with CaptureQueriesContext(connection) as ctx:
+            self._clusters()
+        cluster_queries = [q for q in ctx.captured_queries if "ST_SnapToGrid" in q["sql"]]
+        self.assertEqual(cluster_queries, [])
+
+        # A different filter set is a different entry.
+        self.assertEqual(self._clusters(isPrivate=True), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.far.availability.non_restricted_beds = 4
+            self.far.availability.save()
+        self.assertEqual(self._clusters()[1]["availableBeds"], 4)
+
+    @override_settings(CACHES=LOCMEM_CACHES, SHELTER_MAP_CLUSTER_CACHE_TTL=60)
+    def test_property_changes_invalidate_cache(self) -> None:
+        cache.clear()
+        cats = Pet.objects.get_or_create(name=PetChoices.CATS)[0]
+        self.assertEqual(self._clusters(properties={"pets": [PetChoices.CATS.name]}), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.far.pets.add(cats)
+        self.assertEqual(len(self._clusters(properties={"pets": [PetChoices.CATS.name]})), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            cats.shelter_set.clear()
+        self.assertEqual(self._clusters(properties={"pets": [PetChoices.CATS.name]}), [])
+
+    @override_settings(CACHES=LOCMEM_CACHES, SHELTER_MAP_CLUSTER_CACHE_TTL=60)
+    def test_open_now_cached_per_minute(self) -> None:
+        cache.clear()
+        Schedule.objects.create(
+            shelter=self.far,
+            schedule_type=ScheduleTypeChoices.OPERATING,
+            day=DayOfWeekChoices.MONDAY,
+            start_time=datetime.time(8, 0),
+            end_time=datetime.time(10, 0),
+        )
+        open_now = {"openNow": {"scheduleType": [ScheduleTypeChoices.OPERATING.name]}}
+
+        # Monday 2026-01-05, 09:59 and 10:30 in Los Angeles.
+        with time_machine.travel(datetime.datetime(2026, 1, 5, 17, 59, tzinfo=datetime.UTC), tick=False):
+            self.assertEqual(len(self._clusters(**open_now)), 1)
+        with time_machine.travel(datetime.datetime(2026, 1, 5, 18, 30, tzinfo=datetime.UTC), tick=False):
+            self.assertEqual(self._clusters(**open_now), [])
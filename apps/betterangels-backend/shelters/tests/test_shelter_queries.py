@@ -406,6 +406,31 @@ class PublicShelterQueryTestCase(ShelterGraphQLFixtureMixin, GraphQLBaseTestCase
         self.assertIsNone(response.get("errors"))
         self.assertEqual(response["data"]["shelter"]["id"], str(self.shelter.pk))
 
+    def test_shelters_keyset_query_is_public(self) -> None:
+        newer, newest = shelter_recipe.make(_quantity=2, status=StatusChoices.APPROVED)
+        shelter_recipe.make(status=StatusChoices.DRAFT)
+
+        self.assertEqual(
+            self._keyset_pages("sheltersKeyset", "ShelterFilter"),
+            [[str(newest.pk), str(newer.pk)], [str(self.shelter.pk)]],
+        )
+
+    def test_shelters_keyset_query_rejects_geolocation_ordering(self) -> None:
+        response = self.execute_graphql(
+            """
+            query {
+                sheltersKeyset (filters: {geolocation: {latitude: 34.0549, longitude: -118.2426}}) {
+                    results { id }
+                }
+            }
+            """
+        )
+
+        self.assertEqual(
+            response["errors"][0]["message"],
+            "Keyset pagination can't be combined with filters that order the results; use the offset query.",
+        )
+
 
 class ShelterMaxStayQueryTestCase(ShelterGraphQLFixtureMixin, GraphQLBaseTestCase):
     def test_shelter_max_stay_query(self) -> None:
@@ -0,0 +1,163 @@
+import datetime
+from typing import Any
+
+from common.tests.utils import GraphQLBaseTestCase
+from django.contrib.auth.models import Permission
+from django.db.models import prefetch_related_objects
+from django.test import TestCase
+from model_bakery import baker
+
+from shelters.enums import BedStatusChoices, ReservationStatusChoices, RoomStatusChoices
+from shelters.models import Bed, Reservation, Room, Shelter
+from shelters.selectors.computed_status import (
+    StatusCounts,
+    shelter_count_subquery,
+    shelter_status_counts,
+)
+from shelters.tests.baker_recipes import shelter_recipe
+
+_CHECKED_OUT_AT = datetime.datetime(2026, 1, 10, tzinfo=datetime.timezone.utc)
+
+
+def _populate(shelter: Shelter) -> None:
+    """Give *shelter* one bed in every status and rooms in three of them."""
+    baker.make(Bed, shelter=shelter, maintenance_flag=True)
+    baker.make(Reservation, bed=baker.make(Bed, shelter=shelter), status=ReservationStatusChoices.CHECKED_IN)
+    baker.make(Reservation, bed=baker.make(Bed, shelter=shelter), status=ReservationStatusChoices.CONFIRMED)
+    baker.make(
+        Reservation,
+        bed=baker.make(Bed, shelter=shelter),
+        status=ReservationStatusChoices.COMPLETED,
+        checked_out_at=_CHECKED_OUT_AT,
+    )
+    baker.make(Bed, shelter=shelter, _quantity=2)
+
+    baker.make(Room, shelter=shelter, maintenance_flag=True)
+    baker.make(Reservation, room=baker.make(Room, shelter=shelter), status=ReservationStatusChoices.CHECK_IN_OVERDUE)
+    baker.make(Room, shelter=shelter)
+
+
+def _counts(shelter_ids: list[int]) -> dict[int, tuple[StatusCounts, StatusCounts]]:
+    """``(beds, rooms)`` counts per shelter, read through ``shelter_status_counts``."""
+    beds, rooms = shelter_status_counts(Bed, shelter_ids), shelter_status_counts(Room, shelter_ids)
+    return {pk: (beds[pk], rooms[pk]) for pk in shelter_ids}
+
+
+def _per_status_counts(shelter_ids: list[int]) -> dict[int, tuple[StatusCounts, StatusCounts]]:
+    """The previous per-status ``shelter_count_subquery`` annotations, for comparison."""
+    annotations: dict[str, Any] = {}
+    for kind, model_class, status_enum in (("beds", Bed, BedStatusChoices), ("rooms", Room, RoomStatusChoices)):
+        annotations[f"{kind}_total"] = shelter_count_subquery(model_class)
+        for status in status_enum:
+            annotations[f"{kind}_{status.value}"] = shelter_count_subquery(model_class, status)
+
+    result: dict[int, tuple[StatusCounts, StatusCounts]] = {}
+    for row in Shelter.objects.filter(pk__in=shelter_ids).annotate(**annotations).values("pk", *annotations):
+        by_kind: dict[str, dict[str, int]] = {"beds": {}, "rooms": {}}
+        for name in annotations:
+            kind, field = name.split("_", 1)
+            by_kind[kind][field] = row[name] or 0
+        result[row["pk"]] = (StatusCounts(**by_kind["beds"]), StatusCounts(**by_kind["rooms"]))
+    return result
+
+
+class ShelterStatusCountsTestCase(TestCase):
+    """Tests for ``shelter_status_counts`` and the ``Shelter.bed_status_counts`` / ``room_status_counts`` prefetches."""
+
+    def setUp(self) -> None:
+        self.shelter = shelter_recipe.make()
+        _populate(self.shelter)
+        self.empty_shelter = shelter_recipe.make()
+
+    def test_counts_every_status_for_beds_and_rooms(self) -> None:
+        counts = _counts([self.shelter.pk])
+
+        self.assertEqual(
+            counts[self.shelter.pk],
+            (
+                StatusCounts(available=2, in_turnaround=1, occupied=1, out_of_service=1, reserved=1, total=6),
+                StatusCounts(available=1, out_of_service=1, reserved=1, total=3),
+            ),
+        )
+
+    def test_shelter_without_beds_or_rooms_is_all_zero(self) -> None:
+        counts = _counts([self.shelter.pk, self.empty_shelter.pk])
+
+        self.assertEqual(counts[self.empty_shelter.pk], (StatusCounts(), StatusCounts()))
+
+    def test_matches_per_status_annotations_in_one_query_per_kind(self) -> None:
+        other = shelter_recipe.make()
+        _populate(other)
+        baker.make(Bed, shelter=other, maintenance_flag=True)
+        shelter_ids = [self.shelter.pk, other.pk, self.empty_shelter.pk]
+
+        with self.assertNumQueries(2):
+            counts = _counts(shelter_ids)
+
+        self.assertEqual(counts, _per_status_counts(shelter_ids))
+
+    def test_prefetch_loads_every_shelter_in_one_query_per_kind(self) -> None:
+        shelters = list(Shelter.objects.filter(pk__in=[self.shelter.pk, self.empty_shelter.pk]).order_by("pk"))
+
+        with self.assertNumQueries(2):
+            prefetch_related_objects(shelters, "bed_status_counts", "room_status_counts")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                [(shelter.bed_status_counts.total, shelter.room_status_counts.total) for shelter in shelters],
+                [(6, 3), (0, 0)],
+            )
+
+    def test_attribute_loads_without_prefetch(self) -> None:
+        shelter = Shelter.objects.get(pk=self.shelter.pk)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(shelter.bed_status_counts.occupied, 1)
+            self.assertEqual(shelter.bed_status_counts.total, 6)
+
+
+class ShelterStatusCountsQueryTestCase(GraphQLBaseTestCase):
+    """``bedCounts`` / ``roomCounts`` are prefetched for the whole page, not queried per shelter."""
+
+    QUERY = """
+        query OperatorShelters($orgIds: [ID!]) {
+            operatorShelters(filters: { organizations: $orgIds }) {
+                results {
+                    id
+                    bedCounts { available inTurnaround occupied outOfService reserved total }
+                    roomCounts { available inTurnaround occupied outOfService reserved total }
+                }
+            }
+        }
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        from notes.groups import CASEWORKER
+
+        app_label, codename = Shelter.perms.VIEW.split(".")
+        perm = Permission.objects.get(codename=codename, content_type__app_label=app_label)
+        self.org_1.permission_groups.get(template__name=CASEWORKER.name).group.permissions.add(perm)
+        self.graphql_client.force_login(self.org_1_case_manager_1)
+
+    def _results(self) -> list[dict[str, Any]]:
+        response = self.execute_graphql(self.QUERY, variables={"orgIds": [str(self.org_1.id)]})
+        return response["data"]["operatorShelters"]["results"]
+
+    def test_query_count_does_not_grow_with_page_size(self) -> None:
+        # Session/permission lookups + shelters + one grouped count query each for beds and rooms.
+        expected_query_count = 5
+
+        _populate(shelter_recipe.make(organization=self.org_1))
+        with self.assertNumQueriesWithoutCache(expected_query_count):
+            self._results()
+
+        for _ in range(4):
+            _populate(shelter_recipe.make(organization=self.org_1))
+        with self.assertNumQueriesWithoutCache(expected_query_count):
+            results = self._results()
+
+        self.assertEqual(len(results), 5)
+        for result in results:
+            self.assertEqual(result["bedCounts"]["total"], 6)
+            self.assertEqual(result["roomCounts"]["total"], 3)
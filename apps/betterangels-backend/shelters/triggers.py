@@ -0,0 +1,204 @@
+"""Database triggers that keep derived shelter data in sync.
+
+``Bed.current_status`` / ``Room.current_status``
+------------------------------------------------
+The status priority chain is the same one ``computed_status_case`` and
+``compute_reservable_status`` encode:
+OUT_OF_SERVICE -> OCCUPIED -> RESERVED -> IN_TURNAROUND -> AVAILABLE
+
+* A ``BEFORE INSERT OR UPDATE OF maintenance_flag, last_cleaned, current_status``
+  trigger on each reservable table recomputes the row's own status, so the
+  column can only ever hold the derived value.
+* An ``AFTER`` trigger on ``shelters_reservation`` touches the old and new
+  bed/room whenever a reservation's bed, room, status or checkout changes,
+  which re-fires the trigger above.
+
+Both run inside the writing statement, so the column is consistent with
+reservations as soon as the transaction that changed them commits.
+``manage.py reconcile_reservable_status`` detects (and repairs) any drift.
+
+``ScheduleOpenInterval``
+------------------------
+An ``AFTER`` trigger on ``shelters_schedule`` rewrites the schedule's
+week-clock intervals on every insert, update and delete; see
+:func:`schedule_open_intervals_trigger`.
+
+``Shelter.property_tags``
+-------------------------
+A ``BEFORE INSERT OR UPDATE OF property_tags`` trigger on ``shelters_shelter``
+rebuilds the tags from the property through tables, and an ``AFTER`` trigger
+on each of those through tables touches the shelter; see
+:func:`shelter_property_tags_trigger`.
+"""
+
+import pgtrigger
+
+from shelters.constants import DAILY_MINUTES, WEEK_MINUTES
+from shelters.enums import BedStatusChoices, DayOfWeekChoices, ReservationStatusChoices
+from shelters.property_tags import SHELTER_PROPERTY_LOOKUPS
+
+RESERVATION_TABLE = "shelters_reservation"
+
+# Bed and room statuses share values, so one set of literals serves both tables.
+_S = BedStatusChoices
+_R = ReservationStatusChoices
+
+
+def _status_case(fk_column: str) -> str:
+    """SQL ``CASE`` computing the status of the ``NEW`` bed/room row."""
+    reservations = f'SELECT 1 FROM "{RESERVATION_TABLE}" r WHERE r."{fk_column}" = NEW."id"'
+    return f"""CASE
+        WHEN NEW."maintenance_flag" THEN '{_S.OUT_OF_SERVICE}'
+        WHEN EXISTS ({reservations} AND r."status" = '{_R.CHECKED_IN}') THEN '{_S.OCCUPIED}'
+        WHEN EXISTS (
+            {reservations} AND r."status" IN ('{_R.CONFIRMED}', '{_R.CHECK_IN_OVERDUE}')
+        ) THEN '{_S.RESERVED}'
+        WHEN EXISTS (
+            {reservations}
+              AND r."status" = '{_R.COMPLETED}'
+              AND r."checked_out_at" IS NOT NULL
+              AND (NEW."last_cleaned" IS NULL OR NEW."last_cleaned" <= r."checked_out_at")
+        ) THEN '{_S.IN_TURNAROUND}'
+        ELSE '{_S.AVAILABLE}'
+    END"""
+
+
+def current_status_trigger(*, name: str, fk_column: str) -> pgtrigger.Trigger:
+    """Row trigger recomputing ``current_status`` of a bed or room from its own reservations."""
+    return pgtrigger.Trigger(
+        name=name,
+        when=pgtrigger.Before,
+        operation=pgtrigger.Insert | pgtrigger.UpdateOf("maintenance_flag", "last_cleaned", "current_status"),
+        func=f'NEW."current_status" := {_status_case(fk_column)};\nRETURN NEW;',
+    )
+
+
+def _touch(table: str, fk_column: str) -> str:
+    # Assigning the column to itself fires ``current_status_trigger`` for the row.
+    return f"""UPDATE "{table}" SET "current_status" = "current_status"
+    WHERE "id" IN (OLD."{fk_column}", NEW."{fk_column}");"""
+
+
+def reservation_status_sync_trigger(*, name: str) -> pgtrigger.Trigger:
+    """Row trigger on reservations that refreshes the affected beds' and rooms' ``current_status``."""
+    return pgtrigger.Trigger(
+        name=name,
+        when=pgtrigger.After,
+        operation=pgtrigger.Insert | pgtrigger.Update | pgtrigger.Delete,
+        func=f"""IF TG_OP = 'UPDATE'
+    AND OLD."bed_id" IS NOT DISTINCT FROM NEW."bed_id"
+    AND OLD."room_id" IS NOT DISTINCT FROM NEW."room_id"
+    AND OLD."status" IS NOT DISTINCT FROM NEW."status"
+    AND OLD."checked_out_at" IS NOT DISTINCT FROM NEW."checked_out_at"
+THEN
+    RETURN NULL;
+END IF;
+{_touch("shelters_bed", "bed_id")}
+{_touch("shelters_room", "room_id")}
+RETURN NULL;""",
+    )
+
+
+# Schedule open intervals -----------------------------------------------------
+#
+# ``ScheduleOpenInterval`` holds each schedule row as plain ranges on the
+# 10080-minute week clock (Monday 00:00 = 0), so "open at minute q" is a range
+# containment instead of modular arithmetic per row:
+#
+# * every-day schedules (``day`` NULL) become one span per weekday;
+# * full-day schedules (``start_time`` NULL) span the whole day;
+# * spans running past Sunday 24:00 are split and the tail wrapped to Monday.
+
+SCHEDULE_TABLE = "shelters_schedule"
+SCHEDULE_OPEN_INTERVAL_TABLE = "shelters_scheduleopeninterval"
+
+
+def _schedule_spans_sql() -> str:
+    """``SELECT lo, hi`` of the ``NEW`` schedule's spans, before wrapping."""
+    days = ", ".join(f"'{day}'" for day in DayOfWeekChoices)
+    return f"""SELECT lo, lo + COALESCE(NEW."duration_minutes", {DAILY_MINUTES}) AS hi FROM (
+        SELECT k * {DAILY_MINUTES} + COALESCE(NEW."start_cycle_minutes", 0) AS lo
+        FROM generate_series(0, 6) AS k
+        WHERE NEW."day" IS NULL
+        UNION ALL
+        SELECT COALESCE(
+            NEW."start_cycle_minutes",
+            (array_position(ARRAY[{days}]::text[], NEW."day"::text) - 1) * {DAILY_MINUTES}
+        )
+        WHERE NEW."day" IS NOT NULL
+    ) starts"""
+
+
+def schedule_open_intervals_trigger(*, name: str) -> pgtrigger.Trigger:
+    """Row trigger on schedules that rewrites the schedule's ``ScheduleOpenInterval`` rows.
+
+    ``AFTER`` so the stored generated columns are available on ``NEW``.
+    """
+    columns = '"schedule_id", "shelter_id", "schedule_type", "is_exception", "start_date", "end_date", "minutes"'
+    values = 'NEW."id", NEW."shelter_id", NEW."schedule_type", NEW."is_exception", NEW."start_date", NEW."end_date"'
+    return pgtrigger.Trigger(
+        name=name,
+        when=pgtrigger.After,
+        operation=pgtrigger.Insert | pgtrigger.Update | pgtrigger.Delete,
+        func=f"""IF TG_OP <> 'INSERT' THEN
+    DELETE FROM "{SCHEDULE_OPEN_INTERVAL_TABLE}" WHERE "schedule_id" = OLD."id";
+END IF;
+IF TG_OP = 'DELETE' THEN
+    RETURN NULL;
+END IF;
+INSERT INTO "{SCHEDULE_OPEN_INTERVAL_TABLE}" ({columns})
+WITH spans AS ({_schedule_spans_sql()})
+SELECT {values}, int4range(lo, LEAST(hi, {WEEK_MINUTES})) FROM spans
+UNION ALL
+SELECT {values}, int4range(0, hi - {WEEK_MINUTES}) FROM spans WHERE hi > {WEEK_MINUTES};
+RETURN NULL;""",
+    )
+
+
+# Shelter property tags -------------------------------------------------------
+
+SHELTER_TABLE = "shelters_shelter"
+
+
+def _shelter_property_tags_sql() -> str:
+    """SQL ``text[]`` of the ``NEW`` shelter's property tags (see ``shelters/property_tags.py``)."""
+    selects = []
+    for field, lookup in SHELTER_PROPERTY_LOOKUPS.items():
+        through = f"{SHELTER_TABLE}_{field}"
+        selects.append(
+            f"""SELECT '{field}:' || l."name" FROM "{through}" t
+            JOIN "shelters_{lookup}" l ON l."id" = t."{lookup}_id"
+            WHERE t."shelter_id" = NEW."id" AND l."name" IS NOT NULL"""
+        )
+        selects.append(
+            f"""SELECT '{field}:' WHERE NOT EXISTS (SELECT 1 FROM "{through}" t WHERE t."shelter_id" = NEW."id")"""
+        )
+    union = "\n        UNION ALL ".join(selects)
+    return f"ARRAY(SELECT tag FROM (\n        {union}\n    ) tags (tag) ORDER BY tag)"
+
+
+def shelter_property_tags_trigger(*, name: str) -> pgtrigger.Trigger:
+    """Row trigger rebuilding ``property_tags`` of a shelter from its property through tables.
+
+    Fires on ``UPDATE OF property_tags`` too, so a ``save()`` of a stale
+    instance cannot write old tags back.
+    """
+    return pgtrigger.Trigger(
+        name=name,
+        when=pgtrigger.Before,
+        operation=pgtrigger.Insert | pgtrigger.UpdateOf("property_tags"),
+        func=f'NEW."property_tags" := {_shelter_property_tags_sql()};\nRETURN NEW;',
+    )
+
+
+def shelter_property_sync_trigger(*, name: str) -> pgtrigger.Trigger:
+    """Row trigger on a property through table that refreshes the shelter's ``property_tags``."""
+    return pgtrigger.Trigger(
+        name=name,
+        when=pgtrigger.After,
+        operation=pgtrigger.Insert | pgtrigger.Update | pgtrigger.Delete,
+        # Assigning the column to itself fires ``shelter_property_tags_trigger`` for the row.
+        func=f"""UPDATE "{SHELTER_TABLE}" SET "property_tags" = "property_tags"
+    WHERE "id" IN (OLD."shelter_id", NEW."shelter_id");
+RETURN NULL;""",
+    )
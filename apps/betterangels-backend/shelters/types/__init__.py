@@ -57,6 +57,7 @@ from shelters.types.outputs import (
     RoomType,
     ShelterAvailabilityType,
     ShelterLocationType,
+    ShelterMapClusterType,
     ShelterPhotoType,
     ShelterPhotoUploadsType,
     ShelterType,
@@ -124,6 +125,7 @@ __all__ = [
     "RoomType",
     "ShelterAvailabilityType",
     "ShelterLocationType",
+    "ShelterMapClusterType",
     "ShelterPhotoType",
     "ShelterPhotoUploadsType",
     "ShelterType",
@@ -14,10 +14,11 @@ from common.graphql.types import (
     make_in_filter,
     make_m2m_in_filter,
 )
-from django.contrib.gis.db.models.functions import Distance
+from django.contrib.gis.db.models import PointField
+from django.contrib.gis.db.models.functions import Distance, GeometryDistance
 from django.contrib.gis.geos import Point, Polygon
 from django.contrib.gis.measure import D
-from django.db.models import Count, Q, QuerySet
+from django.db.models import Count, Q, QuerySet, Value
 from strawberry import ID, Info, asdict, auto
 from strawberry_django.auth.utils import get_current_user
 
@@ -40,8 +41,8 @@ from shelters.enums import (
     ShelterChoices,
     SpecialSituationRestrictionChoices,
 )
-from shelters.managers import BedQuerySet, RoomQuerySet
 from shelters.open_at import shelters_open_at
+from shelters.property_tags import property_filter
 
 SHELTER_SCHEDULE_TIME_ZONE = ZoneInfo("America/Los_Angeles")
 
@@ -55,6 +56,8 @@ class GeolocationInput:
     latitude: float
     longitude: float
     range_in_miles: Optional[int] = None
+    # Order by the GiST index's (spherical) KNN distance instead of sorting on the exact one.
+    nearest_first: Optional[bool] = False
 
 
 @strawberry.input
@@ -136,11 +139,9 @@ class ShelterFilter:
         return Q(**{f"{prefix}organization__in": allowed_organizations})
 
     @strawberry_django.filter_field
-    def properties(
-        self, queryset: QuerySet, value: Optional[ShelterPropertyInput], prefix: str
-    ) -> Tuple[QuerySet[models.Shelter], Q]:
+    def properties(self, info: Info, value: Optional[ShelterPropertyInput], prefix: str) -> Q:
         if value is None:
-            return queryset, Q()
+            return Q()
 
         # Fields that have corresponding include_null flags
         property_fields = [
@@ -157,18 +158,16 @@ class ShelterFilter:
         value_dict = asdict(value)
         combined_q = Q()
 
+        # One GIN-indexed overlap on the denormalized tags per field; no M2M joins.
         for field in property_fields:
-            values = value_dict.get(field)
-            include_null = value_dict.get(f"{field}_include_null", False)
-
-            if values and include_null:
-                combined_q &= Q(**{f"{field}__name__in": values}) | Q(**{f"{field}__isnull": True})
-            elif values:
-                combined_q &= Q(**{f"{field}__name__in": values})
-            elif include_null:
-                combined_q &= Q(**{f"{field}__isnull": True})
+            combined_q &= property_filter(
+                field,
+                value_dict.get(field),
+                include_null=bool(value_dict.get(f"{field}_include_null")),
+                prefix=prefix,
+            )
 
-        return queryset.filter(combined_q).distinct(), Q()
+        return combined_q
 
     @strawberry_django.filter_field(deprecation_reason="Use openNow instead")
     def open_now_for(
@@ -234,7 +233,14 @@ class ShelterFilter:
 
         reference_point = Point(x=value.longitude, y=value.latitude, srid=4326)
 
-        queryset = queryset.annotate(distance=Distance("geolocation", reference_point)).order_by("distance")
+        # Only computed for the rows returned when ordering nearest-first.
+        queryset = queryset.annotate(distance=Distance("geolocation", reference_point))
+        if value.nearest_first:
+            # ``geography <-> geography`` walks the GiST index on geolocation in distance order.
+            reference = Value(reference_point, output_field=PointField(srid=4326, geography=True))
+            queryset = queryset.order_by(GeometryDistance("geolocation", reference))
+        else:
+            queryset = queryset.order_by("distance")
 
         if value.range_in_miles:
             queryset = queryset.filter(geolocation__dwithin=(reference_point, D(mi=value.range_in_miles)))
@@ -307,10 +313,7 @@ class BedFilter(CommonBedRoomFilterMixin):
         if not value:
             return queryset, Q()
 
-        q = Q()
-        for choice in value:
-            q |= BedQuerySet.status_filter_q(choice)
-        return queryset, q
+        return queryset, Q(**{f"{prefix}current_status__in": value})
 
 
 @strawberry_django.filter_type(models.Room)
@@ -335,10 +338,7 @@ class RoomFilter(CommonBedRoomFilterMixin):
         if not value:
             return queryset, Q()
 
-        q = Q()
-        for choice in value:
-            q |= RoomQuerySet.status_filter_q(choice)
-        return queryset, q
+        return queryset, Q(**{f"{prefix}current_status__in": value})
 
 
 @strawberry_django.filter_type(models.Reservation)
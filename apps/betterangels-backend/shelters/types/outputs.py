@@ -1,5 +1,6 @@
 """Output types for shelter queries and mutations."""
 
+import dataclasses
 from datetime import date, datetime
 from typing import List, Optional, cast
 
@@ -26,11 +27,6 @@ from shelters.enums import (
     ShelterPhotoTypeChoices,
 )
 from shelters.selectors import bed_queryset, room_queryset, shelter_list, shelter_queryset
-from shelters.selectors.computed_status import (
-    bed_computed_status_annotation,
-    room_computed_status_annotation,
-    shelter_count_subquery,
-)
 from shelters.selectors.operator import reservation_queryset
 from shelters.types.lookups import (
     AccessibilityType,
@@ -67,11 +63,6 @@ from .filters import (
 )
 
 
-def _annotated_count(root: models.Shelter, name: str) -> int:
-    value = getattr(root, name, None)
-    return 0 if value is None else value
-
-
 @strawberry.type
 class ShelterLocationType:
     place: str
@@ -79,6 +70,16 @@ class ShelterLocationType:
     longitude: float
 
 
+@strawberry.type
+class ShelterMapClusterType:
+    latitude: float
+    longitude: float
+    count: int
+    available_beds: int
+    # Set when the cluster is a single shelter.
+    shelter_id: Optional[ID]
+
+
 @strawberry_django.type(models.ShelterPhoto)
 class ShelterPhotoType:
     id: ID
@@ -229,45 +230,13 @@ class ShelterTypeMixin:
 
         return None
 
-    @strawberry_django.field(
-        annotate={
-            "_bed_available": lambda info: shelter_count_subquery(models.Bed, BedStatusChoices.AVAILABLE),
-            "_bed_in_turnaround": lambda info: shelter_count_subquery(models.Bed, BedStatusChoices.IN_TURNAROUND),
-            "_bed_occupied": lambda info: shelter_count_subquery(models.Bed, BedStatusChoices.OCCUPIED),
-            "_bed_out_of_service": lambda info: shelter_count_subquery(models.Bed, BedStatusChoices.OUT_OF_SERVICE),
-            "_bed_reserved": lambda info: shelter_count_subquery(models.Bed, BedStatusChoices.RESERVED),
-            "_bed_total": lambda info: shelter_count_subquery(models.Bed),
-        }
-    )
+    @strawberry_django.field(prefetch_related=["bed_status_counts"])
     def bed_counts(self, root: models.Shelter) -> BedCountType:
-        return BedCountType(
-            available=_annotated_count(root, "_bed_available"),
-            in_turnaround=_annotated_count(root, "_bed_in_turnaround"),
-            occupied=_annotated_count(root, "_bed_occupied"),
-            out_of_service=_annotated_count(root, "_bed_out_of_service"),
-            reserved=_annotated_count(root, "_bed_reserved"),
-            total=_annotated_count(root, "_bed_total"),
-        )
+        return BedCountType(**dataclasses.asdict(root.bed_status_counts))
 
-    @strawberry_django.field(
-        annotate={
-            "_room_available": lambda info: shelter_count_subquery(models.Room, RoomStatusChoices.AVAILABLE),
-            "_room_in_turnaround": lambda info: shelter_count_subquery(models.Room, RoomStatusChoices.IN_TURNAROUND),
-            "_room_occupied": lambda info: shelter_count_subquery(models.Room, RoomStatusChoices.OCCUPIED),
-            "_room_out_of_service": lambda info: shelter_count_subquery(models.Room, RoomStatusChoices.OUT_OF_SERVICE),
-            "_room_reserved": lambda info: shelter_count_subquery(models.Room, RoomStatusChoices.RESERVED),
-            "_room_total": lambda info: shelter_count_subquery(models.Room),
-        }
-    )
+    @strawberry_django.field(prefetch_related=["room_status_counts"])
     def room_counts(self, root: models.Shelter) -> RoomCountType:
-        return RoomCountType(
-            available=_annotated_count(root, "_room_available"),
-            in_turnaround=_annotated_count(root, "_room_in_turnaround"),
-            occupied=_annotated_count(root, "_room_occupied"),
-            out_of_service=_annotated_count(root, "_room_out_of_service"),
-            reserved=_annotated_count(root, "_room_reserved"),
-            total=_annotated_count(root, "_room_total"),
-        )
+        return RoomCountType(**dataclasses.asdict(root.room_status_counts))
 
 
 @strawberry_django.type(models.Shelter, filters=ShelterFilter, ordering=ShelterOrder)
@@ -298,7 +267,7 @@ def _get_hero_image(shelter: models.Shelter) -> Optional[models.ShelterPhoto]:
 
 def _room_beds_prefetch(info: Info) -> Prefetch:
     user = get_current_user(info)
-    bed_qs: QuerySet[models.Bed] = models.Bed.objects.with_computed_status()
+    bed_qs: QuerySet[models.Bed] = models.Bed.objects.all()
     if user is not None and user.is_authenticated:
         org_id = get_current_organization(info)
         bed_qs = bed_queryset(bed_qs, user=cast(User, user), organization_id=org_id, perms=[models.Bed.perms.VIEW])
@@ -340,7 +309,7 @@ class BedType:
     type: Optional[BedTypeChoices]
 
     @strawberry_django.field(
-        annotate={"_computed_status": lambda info: bed_computed_status_annotation()},
+        only=["current_status"],
     )
     def status(self, root: models.Bed) -> BedStatusChoices:
         return root.computed_status
@@ -377,7 +346,7 @@ class RoomType:
     type_other: auto
 
     @strawberry_django.field(
-        annotate={"_computed_status": lambda info: room_computed_status_annotation()},
+        only=["current_status"],
     )
     def status(self, root: models.Room) -> RoomStatusChoices:
         return root.computed_status
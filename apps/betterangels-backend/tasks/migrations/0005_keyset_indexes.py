@@ -0,0 +1,24 @@
+# Generated by Django 6.0.6 on 2026-10-18 22:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0003_keyset_indexes'),
+        ('hmis', '0002_initial'),
+        ('notes', '0004_keyset_indexes'),
+        ('organizations', '0006_alter_organization_slug'),
+        ('tasks', '0004_alter_task_created_by_alter_task_organization_and_more'),
+        ('teams', '0003_remove_team_unique_team_slug_per_org_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['created_at', 'id'], name='task_created_at_id_idx'),
+        ),
+    ]
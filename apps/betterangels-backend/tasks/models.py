@@ -79,6 +79,7 @@ class Task(BaseModel):
                 fields=["summary"],
                 opclasses=["gin_trgm_ops"],
             ),
+            models.Index(fields=["created_at", "id"], name="task_created_at_id_idx"),
         ]
         constraints = [
             models.CheckConstraint(
@@ -7,6 +7,7 @@ from accounts.selectors import resolve_permission_group
 from clients.models import ClientProfile
 from common.constants import HMIS_SESSION_KEY_NAME
 from common.graphql.extensions import PermissionedQuerySet
+from common.graphql.pagination import KeysetPaginated, keyset_paginated
 from common.graphql.types import DeleteDjangoObjectInput, DeletedObjectType
 from common.graphql.utils import maybe_int_value
 from common.permissions.utils import IsAuthenticated
@@ -43,6 +44,16 @@ class Query:
 
         return Task.objects.tasks_for_user(is_hmis_user)  # type: ignore
 
+    @keyset_paginated(
+        key=("-created_at", "-id"),
+        permission_classes=[IsAuthenticated],
+        extensions=[HasRetvalPerm(Task.perms.VIEW)],
+    )
+    def tasks_keyset(self, info: Info) -> KeysetPaginated[TaskType]:
+        is_hmis_user = bool(info.context["request"].session.get(HMIS_SESSION_KEY_NAME, False))
+
+        return Task.objects.tasks_for_user(is_hmis_user)  # type: ignore
+
 
 @strawberry.type
 class Mutation:
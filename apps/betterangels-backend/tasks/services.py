@@ -2,7 +2,7 @@ from typing import Any, Dict, List, Optional
 
 from accounts.models import PermissionGroup, User
 from clients.models import ClientProfile
-from common.permissions.utils import assign_object_permissions
+from common.permissions.utils import bulk_assign_object_permissions
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
 from hmis.models import HmisClientProfile, HmisNote
@@ -49,17 +49,17 @@ def task_create(
             # a concurrent write landed between the check and the insert.
             raise ValidationError(str(e)) from e
 
-        assign_object_permissions(
-            permission_group.group,
-            task,
-            [
-                Task.perms.CHANGE,
-                Task.perms.DELETE,
-            ],
-        )
-
         created.append(task)
 
+    bulk_assign_object_permissions(
+        permission_group.group,
+        created,
+        [
+            Task.perms.CHANGE,
+            Task.perms.DELETE,
+        ],
+    )
+
     return created
 
 
@@ -176,3 +176,22 @@ class TaskPermissionTestCase(GraphQLBaseTestCase, TaskGraphQLUtilsMixin):
             self.assertTrue("errors" in response)
             if user_label is None:
                 self.assertGraphQLUnauthenticated(response)
+
+    @parametrize(
+        "user_label, expected_task_count",
+        [
+            ("org_1_case_manager_1", 1),  # Owner should succeed
+            ("org_2_case_manager_1", 1),  # Other case manager should succeed
+            ("non_case_manager_user", 0),  # Non CM should not succeed
+            (None, None),  # Anonymous user should return error
+        ],
+    )
+    def test_view_tasks_keyset_permission(self, user_label: Optional[str], expected_task_count: Optional[int]) -> None:
+        self._handle_user_login(user_label)
+
+        response = self.execute_graphql("query { tasksKeyset { results { id } } }")
+
+        if expected_task_count is not None:
+            self.assertEqual(len(response["data"]["tasksKeyset"]["results"]), expected_task_count)
+        else:
+            self.assertGraphQLUnauthenticated(response)
@@ -118,6 +118,16 @@ class TaskQueryTestCase(GraphQLBaseTestCase, TaskGraphQLUtilsMixin):
         self.assertEqual(response["data"]["tasks"]["totalCount"], 2)
         self.assertEqual(response["data"]["tasks"]["results"][1], expected_task)
 
+    def test_tasks_keyset_query(self) -> None:
+        newer, newest = [
+            self.create_task_fixture({"clientProfile": str(self.client_profile.pk), "summary": summary})["data"][
+                "createTask"
+            ]["id"]
+            for summary in ("task 2 summary", "task 3 summary")
+        ]
+
+        self.assertEqual(self._keyset_pages("tasksKeyset", "TaskFilter"), [[newest, newer], [self.task["id"]]])
+
     def test_tasks_query_authors_filter(self) -> None:
         self.graphql_client.force_login(self.org_1_case_manager_2)
 
@@ -171,6 +171,15 @@ export enum BedTypeChoices {
   Twin = 'TWIN'
 }
 
+export type BedTypeKeysetPaginated = {
+  __typename?: 'BedTypeKeysetPaginated';
+  pageInfo: KeysetPaginationInfo;
+  /** List of paginated results. */
+  results: Array<BedType>;
+  /** Total count of existing results. */
+  totalCount: Scalars['Int']['output'];
+};
+
 export type BedTypeOffsetPaginated = {
   __typename?: 'BedTypeOffsetPaginated';
   pageInfo: OffsetPaginationInfo;
@@ -189,6 +198,32 @@ export type BulkDeleteResult = {
   ids: Array<Scalars['ID']['output']>;
 };
 
+export type BulkImportClientProfilesInput = {
+  importJobId: Scalars['UUID']['input'];
+  records: Array<ImportClientProfileRecordInput>;
+};
+
+export type BulkImportClientProfilesPayload = ClientProfileImportRecordsType | OperationInfo;
+
+export type BulkImportNoteDataInput = {
+  clientProfile?: InputMaybe<Scalars['ID']['input']>;
+  interactedAt?: InputMaybe<Scalars['DateTime']['input']>;
+  isSubmitted?: InputMaybe<Scalars['Boolean']['input']>;
+  privateDetails?: InputMaybe<Scalars['String']['input']>;
+  providedServices?: InputMaybe<Array<CreateNoteServiceInput>>;
+  publicDetails?: InputMaybe<Scalars['String']['input']>;
+  purpose?: InputMaybe<Scalars['String']['input']>;
+  requestedServices?: InputMaybe<Array<CreateNoteServiceInput>>;
+  teamId?: InputMaybe<Scalars['ID']['input']>;
+};
+
+export type BulkImportNotesInput = {
+  importJobId: Scalars['UUID']['input'];
+  records: Array<ImportNoteRecordInput>;
+};
+
+export type BulkImportNotesPayload = NoteImportRecordsType | OperationInfo;
+
 export type ChangeOrganizationMemberRoleInput = {
   organizationId: Scalars['ID']['input'];
   permissionTemplate: PermissionTemplateEnum;
@@ -391,6 +426,11 @@ export type ClientProfileImportRecordsBulkInput = {
   sourceIds: Array<Scalars['String']['input']>;
 };
 
+export type ClientProfileImportRecordsType = {
+  __typename?: 'ClientProfileImportRecordsType';
+  records: Array<ClientProfileImportRecordType>;
+};
+
 export type ClientProfileOrder = {
   firstName?: InputMaybe<Ordering>;
   id?: InputMaybe<Ordering>;
@@ -451,6 +491,15 @@ export type ClientProfileType = {
   veteranStatus?: Maybe<VeteranStatusEnum>;
 };
 
+export type ClientProfileTypeKeysetPaginated = {
+  __typename?: 'ClientProfileTypeKeysetPaginated';
+  pageInfo: KeysetPaginationInfo;
+  /** List of paginated results. */
+  results: Array<ClientProfileType>;
+  /** Total count of existing results. */
+  totalCount: Scalars['Int']['output'];
+};
+
 export type ClientProfileTypeOffsetPaginated = {
   __typename?: 'ClientProfileTypeOffsetPaginated';
   pageInfo: OffsetPaginationInfo;
@@ -567,6 +616,16 @@ export type CreateClientProfileInput = {
 
 export type CreateClientProfilePayload = ClientProfileType | OperationInfo;
 
+export type CreateExportJobInput = {
+  endDate: Scalars['Date']['input'];
+  exportType: ExportJobTypeEnum;
+  metricOptions?: InputMaybe<Array<MetricsExportOptionsEnum>>;
+  shelterIds?: InputMaybe<Array<Scalars['ID']['input']>>;
+  startDate: Scalars['Date']['input'];
+};
+
+export type CreateExportJobPayload = ExportJobType | OperationInfo;
+
 export type CreateHmisClientProfileInput = {
   adaAccommodation?: InputMaybe<Array<AdaAccommodationEnum>>;
   additionalRaceEthnicityDetail?: InputMaybe<Scalars['String']['input']>;
@@ -997,6 +1056,33 @@ export type ExitPolicyType = {
   name?: Maybe<ExitPolicyChoices>;
 };
 
+export enum ExportJobStatusEnum {
+  Failed = 'FAILED',
+  Pending = 'PENDING',
+  Running = 'RUNNING',
+  Succeeded = 'SUCCEEDED'
+}
+
+export type ExportJobType = {
+  __typename?: 'ExportJobType';
+  createdAt: Scalars['DateTime']['output'];
+  downloadUrl?: Maybe<Scalars['String']['output']>;
+  errorMessage: Scalars['String']['output'];
+  exportType: ExportJobTypeEnum;
+  filename?: Maybe<Scalars['String']['output']>;
+  finishedAt?: Maybe<Scalars['DateTime']['output']>;
+  id: Scalars['ID']['output'];
+  progress: Scalars['Int']['output'];
+  startedAt?: Maybe<Scalars['DateTime']['output']>;
+  status: ExportJobStatusEnum;
+};
+
+export enum ExportJobTypeEnum {
+  InteractionDataCsv = 'INTERACTION_DATA_CSV',
+  ShelterMetricsXlsx = 'SHELTER_METRICS_XLSX',
+  ShelterMetricsZip = 'SHELTER_METRICS_ZIP'
+}
+
 export enum EyeColorEnum {
   Blue = 'BLUE',
   Brown = 'BROWN',
@@ -1079,6 +1165,7 @@ export type GenerateShelterPhotoUploadsPayload = AuthorizedPresignedS3UploadsTyp
 export type GeolocationInput = {
   latitude: Scalars['Float']['input'];
   longitude: Scalars['Float']['input'];
+  nearestFirst?: InputMaybe<Scalars['Boolean']['input']>;
   rangeInMiles?: InputMaybe<Scalars['Int']['input']>;
 };
 
@@ -1406,6 +1493,13 @@ export type ImportClientProfileInput = {
 
 export type ImportClientProfilePayload = ClientProfileImportRecordType | OperationInfo;
 
+export type ImportClientProfileRecordInput = {
+  clientProfile: CreateClientProfileInput;
+  rawData: Scalars['JSON']['input'];
+  sourceId: Scalars['String']['input'];
+  sourceName: Scalars['String']['input'];
+};
+
 export type ImportNoteDataInput = {
   clientProfile?: InputMaybe<Scalars['ID']['input']>;
   interactedAt?: InputMaybe<Scalars['DateTime']['input']>;
@@ -1426,6 +1520,13 @@ export type ImportNoteInput = {
 
 export type ImportNotePayload = NoteImportRecordType | OperationInfo;
 
+export type ImportNoteRecordInput = {
+  note: BulkImportNoteDataInput;
+  rawData: Scalars['JSON']['input'];
+  sourceId: Scalars['String']['input'];
+  sourceName: Scalars['String']['input'];
+};
+
 export type InteractionAuthorFilter = {
   AND?: InputMaybe<InteractionAuthorFilter>;
   DISTINCT?: InputMaybe<Scalars['Boolean']['input']>;
@@ -1485,6 +1586,18 @@ export enum LivingSituationEnum {
   Vehicle = 'VEHICLE'
 }
 
+export type KeysetPaginationInfo = {
+  __typename?: 'KeysetPaginationInfo';
+  endCursor?: Maybe<Scalars['String']['output']>;
+  hasNextPage: Scalars['Boolean']['output'];
+  limit?: Maybe<Scalars['Int']['output']>;
+};
+
+export type KeysetPaginationInput = {
+  after?: InputMaybe<Scalars['String']['input']>;
+  limit?: InputMaybe<Scalars['Int']['input']>;
+};
+
 export type LocationInput = {
   address?: InputMaybe<AddressInput>;
   point: Scalars['Point']['input'];
@@ -1548,9 +1661,18 @@ export type MedicalNeedType = {
   name?: Maybe<MedicalNeedChoices>;
 };
 
+export enum MetricsExportOptionsEnum {
+  AvgDaysToOccupancy = 'AVG_DAYS_TO_OCCUPANCY',
+  DailyBedStatusMetrics = 'DAILY_BED_STATUS_METRICS',
+  DailyOccupancyMetrics = 'DAILY_OCCUPANCY_METRICS',
+  ReservationMetrics = 'RESERVATION_METRICS'
+}
+
 export type Mutation = {
   __typename?: 'Mutation';
   addOrganizationMember: AddOrganizationMemberPayload;
+  bulkImportClientProfiles: BulkImportClientProfilesPayload;
+  bulkImportNotes: BulkImportNotesPayload;
   changeOrganizationMemberRole: ChangeOrganizationMemberRolePayload;
   cloneBed: CloneBedPayload;
   cloneRoom: CloneRoomPayload;
@@ -1560,6 +1682,7 @@ export type Mutation = {
   createClientHouseholdMember: CreateClientHouseholdMemberPayload;
   createClientProfile: CreateClientProfilePayload;
   createClientProfileDataImport: CreateClientProfileDataImportPayload;
+  createExportJob: CreateExportJobPayload;
   createHmisClientProfile: CreateHmisClientProfilePayload;
   createHmisClientProgram: CreateHmisClientProgramPayload;
   createHmisNote: CreateHmisNotePayload;
@@ -1641,6 +1764,16 @@ export type MutationAddOrganizationMemberArgs = {
 };
 
 
+export type MutationBulkImportClientProfilesArgs = {
+  data: BulkImportClientProfilesInput;
+};
+
+
+export type MutationBulkImportNotesArgs = {
+  data: BulkImportNotesInput;
+};
+
+
 export type MutationChangeOrganizationMemberRoleArgs = {
   data: ChangeOrganizationMemberRoleInput;
 };
@@ -1686,6 +1819,11 @@ export type MutationCreateClientProfileDataImportArgs = {
 };
 
 
+export type MutationCreateExportJobArgs = {
+  data: CreateExportJobInput;
+};
+
+
 export type MutationCreateHmisClientProfileArgs = {
   data: CreateHmisClientProfileInput;
 };
@@ -2110,6 +2248,11 @@ export type NoteImportRecordType = {
   success: Scalars['Boolean']['output'];
 };
 
+export type NoteImportRecordsType = {
+  __typename?: 'NoteImportRecordsType';
+  records: Array<NoteImportRecordType>;
+};
+
 export type NoteOrder = {
   id?: InputMaybe<Ordering>;
   interactedAt?: InputMaybe<Ordering>;
@@ -2154,6 +2297,15 @@ export type NoteTypeTasksArgs = {
   pagination?: InputMaybe<OffsetPaginationInput>;
 };
 
+export type NoteTypeKeysetPaginated = {
+  __typename?: 'NoteTypeKeysetPaginated';
+  pageInfo: KeysetPaginationInfo;
+  /** List of paginated results. */
+  results: Array<NoteType>;
+  /** Total count of existing results. */
+  totalCount: Scalars['Int']['output'];
+};
+
 export type NoteTypeOffsetPaginated = {
   __typename?: 'NoteTypeOffsetPaginated';
   pageInfo: OffsetPaginationInfo;
@@ -2278,6 +2430,15 @@ export type OperatorShelterTypeHeroImageArgs = {
   processingOptions?: InputMaybe<Scalars['String']['input']>;
 };
 
+export type OperatorShelterTypeKeysetPaginated = {
+  __typename?: 'OperatorShelterTypeKeysetPaginated';
+  pageInfo: KeysetPaginationInfo;
+  /** List of paginated results. */
+  results: Array<OperatorShelterType>;
+  /** Total count of existing results. */
+  totalCount: Scalars['Int']['output'];
+};
+
 export type OperatorShelterTypeOffsetPaginated = {
   __typename?: 'OperatorShelterTypeOffsetPaginated';
   pageInfo: OffsetPaginationInfo;
@@ -2518,6 +2679,7 @@ export type Query = {
   __typename?: 'Query';
   bed: BedType;
   beds: BedTypeOffsetPaginated;
+  bedsKeyset: BedTypeKeysetPaginated;
   bulkClientProfileImportRecords: ClientProfileImportRecordTypeOffsetPaginated;
   caseworkerOrganizations: OrganizationTypeOffsetPaginated;
   clientContact: ClientContactType;
@@ -2527,8 +2689,11 @@ export type Query = {
   clientHouseholdMember: ClientHouseholdMemberType;
   clientHouseholdMembers: ClientHouseholdMemberTypeOffsetPaginated;
   clientProfile: ClientProfileType;
+  clientProfileSearch: Array<ClientProfileType>;
   clientProfiles: ClientProfileTypeOffsetPaginated;
+  clientProfilesKeyset: ClientProfileTypeKeysetPaginated;
   currentUser: CurrentUserType;
+  exportJob: ExportJobType;
   featureControls: FeatureControlData;
   hmisClientProfile: HmisClientProfileType;
   hmisClientProfiles: HmisClientProfileTypeOffsetPaginated;
@@ -2540,8 +2705,10 @@ export type Query = {
   interactionAuthors: InteractionAuthorTypeOffsetPaginated;
   note: NoteType;
   notes: NoteTypeOffsetPaginated;
+  notesKeyset: NoteTypeKeysetPaginated;
   operatorShelter: OperatorShelterType;
   operatorShelters: OperatorShelterTypeOffsetPaginated;
+  operatorSheltersKeyset: OperatorShelterTypeKeysetPaginated;
   organizationMember: OrganizationMemberType;
   organizationMembers: OrganizationMemberTypeOffsetPaginated;
   referral: ReferralType;
@@ -2549,21 +2716,26 @@ export type Query = {
   reportSummary: ReportSummaryType;
   reservation: ReservationType;
   reservations: ReservationTypeOffsetPaginated;
+  reservationsKeyset: ReservationTypeKeysetPaginated;
   room: RoomType;
   rooms: RoomTypeOffsetPaginated;
+  roomsKeyset: RoomTypeKeysetPaginated;
   serviceCategories: OrganizationServiceCategoryTypeOffsetPaginated;
   services: OrganizationServiceTypeOffsetPaginated;
   shelter: ShelterType;
   shelterCities: CityTypeOffsetPaginated;
+  shelterMapClusters: Array<ShelterMapClusterType>;
   shelterMaxStay?: Maybe<Scalars['Int']['output']>;
   shelterOccupancyMetrics: ShelterOccupancyMetricsType;
   shelterServiceCategories: ServiceCategoryTypeOffsetPaginated;
   shelterSpas: SpaTypeOffsetPaginated;
   shelters: ShelterTypeOffsetPaginated;
+  sheltersKeyset: ShelterTypeKeysetPaginated;
   socialMediaProfile: SocialMediaProfileType;
   socialMediaProfiles: SocialMediaProfileTypeOffsetPaginated;
   task: TaskType;
   tasks: TaskTypeOffsetPaginated;
+  tasksKeyset: TaskTypeKeysetPaginated;
   teams: TeamTypeOffsetPaginated;
 };
 
@@ -2580,6 +2752,12 @@ export type QueryBedsArgs = {
 };
 
 
+export type QueryBedsKeysetArgs = {
+  filters?: InputMaybe<BedFilter>;
+  pagination?: InputMaybe<KeysetPaginationInput>;
+};
+
+
 export type QueryBulkClientProfileImportRecordsArgs = {
   data: ClientProfileImportRecordsBulkInput;
   pagination?: InputMaybe<OffsetPaginationInput>;
@@ -2630,6 +2808,12 @@ export type QueryClientProfileArgs = {
 };
 
 
+export type QueryClientProfileSearchArgs = {
+  limit?: Scalars['Int']['input'];
+  text: Scalars['String']['input'];
+};
+
+
 export type QueryClientProfilesArgs = {
   filters?: InputMaybe<ClientProfileFilter>;
   ordering?: Array<ClientProfileOrder>;
@@ -2637,6 +2821,17 @@ export type QueryClientProfilesArgs = {
 };
 
 
+export type QueryClientProfilesKeysetArgs = {
+  filters?: InputMaybe<ClientProfileFilter>;
+  pagination?: InputMaybe<KeysetPaginationInput>;
+};
+
+
+export type QueryExportJobArgs = {
+  pk: Scalars['ID']['input'];
+};
+
+
 export type QueryHmisClientProfileArgs = {
   id: Scalars['ID']['input'];
 };
@@ -2695,6 +2890,12 @@ export type QueryNotesArgs = {
 };
 
 
+export type QueryNotesKeysetArgs = {
+  filters?: InputMaybe<NoteFilter>;
+  pagination?: InputMaybe<KeysetPaginationInput>;
+};
+
+
 export type QueryOperatorShelterArgs = {
   pk: Scalars['ID']['input'];
 };
@@ -2707,6 +2908,12 @@ export type QueryOperatorSheltersArgs = {
 };
 
 
+export type QueryOperatorSheltersKeysetArgs = {
+  filters?: InputMaybe<ShelterFilter>;
+  pagination?: InputMaybe<KeysetPaginationInput>;
+};
+
+
 export type QueryOrganizationMemberArgs = {
   organizationId: Scalars['String']['input'];
   userId: Scalars['String']['input'];
@@ -2753,6 +2960,12 @@ export type QueryReservationsArgs = {
 };
 
 
+export type QueryReservationsKeysetArgs = {
+  filters?: InputMaybe<ReservationFilter>;
+  pagination?: InputMaybe<KeysetPaginationInput>;
+};
+
+
 export type QueryRoomArgs = {
   pk: Scalars['ID']['input'];
 };
@@ -2765,6 +2978,12 @@ export type QueryRoomsArgs = {
 };
 
 
+export type QueryRoomsKeysetArgs = {
+  filters?: InputMaybe<RoomFilter>;
+  pagination?: InputMaybe<KeysetPaginationInput>;
+};
+
+
 export type QueryServiceCategoriesArgs = {
   ordering?: Array<OrganizationServiceCategoryOrdering>;
   pagination?: InputMaybe<OffsetPaginationInput>;
@@ -2787,6 +3006,14 @@ export type QueryShelterCitiesArgs = {
 };
 
 
+export type QueryShelterMapClustersArgs = {
+  filters?: InputMaybe<ShelterFilter>;
+  x: Scalars['Int']['input'];
+  y: Scalars['Int']['input'];
+  zoom: Scalars['Int']['input'];
+};
+
+
 export type QueryShelterOccupancyMetricsArgs = {
   endDate?: InputMaybe<Scalars['Date']['input']>;
   shelterId: Scalars['ID']['input'];
@@ -2811,6 +3038,12 @@ export type QuerySheltersArgs = {
 };
 
 
+export type QuerySheltersKeysetArgs = {
+  filters?: InputMaybe<ShelterFilter>;
+  pagination?: InputMaybe<KeysetPaginationInput>;
+};
+
+
 export type QuerySocialMediaProfileArgs = {
   pk: Scalars['ID']['input'];
 };
@@ -2833,6 +3066,12 @@ export type QueryTasksArgs = {
 };
 
 
+export type QueryTasksKeysetArgs = {
+  filters?: InputMaybe<TaskFilter>;
+  pagination?: InputMaybe<KeysetPaginationInput>;
+};
+
+
 export type QueryTeamsArgs = {
   filters?: InputMaybe<TeamFilter>;
   pagination?: InputMaybe<OffsetPaginationInput>;
@@ -3015,6 +3254,15 @@ export type ReservationType = {
   status: ReservationStatusChoices;
 };
 
+export type ReservationTypeKeysetPaginated = {
+  __typename?: 'ReservationTypeKeysetPaginated';
+  pageInfo: KeysetPaginationInfo;
+  /** List of paginated results. */
+  results: Array<ReservationType>;
+  /** Total count of existing results. */
+  totalCount: Scalars['Int']['output'];
+};
+
 export type ReservationTypeOffsetPaginated = {
   __typename?: 'ReservationTypeOffsetPaginated';
   pageInfo: OffsetPaginationInfo;
@@ -3143,6 +3391,15 @@ export type RoomTypeBedsArgs = {
   ordering?: Array<BedOrder>;
 };
 
+export type RoomTypeKeysetPaginated = {
+  __typename?: 'RoomTypeKeysetPaginated';
+  pageInfo: KeysetPaginationInfo;
+  /** List of paginated results. */
+  results: Array<RoomType>;
+  /** Total count of existing results. */
+  totalCount: Scalars['Int']['output'];
+};
+
 export type RoomTypeOffsetPaginated = {
   __typename?: 'RoomTypeOffsetPaginated';
   pageInfo: OffsetPaginationInfo;
@@ -3322,6 +3579,15 @@ export type ShelterLocationType = {
   place: Scalars['String']['output'];
 };
 
+export type ShelterMapClusterType = {
+  __typename?: 'ShelterMapClusterType';
+  availableBeds: Scalars['Int']['output'];
+  count: Scalars['Int']['output'];
+  latitude: Scalars['Float']['output'];
+  longitude: Scalars['Float']['output'];
+  shelterId?: Maybe<Scalars['ID']['output']>;
+};
+
 export type ShelterOccupancyMetricsType = {
   __typename?: 'ShelterOccupancyMetricsType';
   avgDaysToOccupancy?: Maybe<Scalars['Float']['output']>;
@@ -3487,6 +3753,15 @@ export type ShelterTypeHeroImageArgs = {
   processingOptions?: InputMaybe<Scalars['String']['input']>;
 };
 
+export type ShelterTypeKeysetPaginated = {
+  __typename?: 'ShelterTypeKeysetPaginated';
+  pageInfo: KeysetPaginationInfo;
+  /** List of paginated results. */
+  results: Array<ShelterType>;
+  /** Total count of existing results. */
+  totalCount: Scalars['Int']['output'];
+};
+
 export type ShelterTypeOffsetPaginated = {
   __typename?: 'ShelterTypeOffsetPaginated';
   pageInfo: OffsetPaginationInfo;
@@ -3631,6 +3906,15 @@ export type TaskType = {
   updatedAt: Scalars['DateTime']['output'];
 };
 
+export type TaskTypeKeysetPaginated = {
+  __typename?: 'TaskTypeKeysetPaginated';
+  pageInfo: KeysetPaginationInfo;
+  /** List of paginated results. */
+  results: Array<TaskType>;
+  /** Total count of existing results. */
+  totalCount: Scalars['Int']['output'];
+};
+
 export type TaskTypeOffsetPaginated = {
   __typename?: 'TaskTypeOffsetPaginated';
   pageInfo: OffsetPaginationInfo;
@@ -1,2 +1,2 @@
 // This file is generated - do not edit
-export const schema = "\"\"\"\nRequires the user to have the specified permission(s) in the organization set via X-Organization-ID header.\n\"\"\"\ndirective @hasOrgPerm(permissions: [PermDefinition!]!, any: Boolean! = true) repeatable on FIELD_DEFINITION\n\n\"\"\"\nWill check if the user has any/all permissions for the resolved value of this field before returning it.\n\nWhen the condition fails, the following can be returned (following this priority):\n1) `OperationInfo`/`OperationMessage` if those types are allowed at the return type\n2) `null` in case the field is not mandatory (e.g. `String` or `[String]`)\n3) An empty list in case the field is a list (e.g. `[String]!`)\n4) An empty `Connection` in case the return type is a relay connection\n2) Otherwise, an error will be raised\n\"\"\"\ndirective @hasRetvalPerm(permissions: [PermDefinition!]!, any: Boolean! = true) repeatable on FIELD_DEFINITION\n\n\"\"\"\nWill check if the user has any/all permissions for the resolved value of this field before returning it.\n\nWhen the condition fails, the following can be returned (following this priority):\n1) `OperationInfo`/`OperationMessage` if those types are allowed at the return type\n2) `null` in case the field is not mandatory (e.g. `String` or `[String]`)\n3) An empty list in case the field is a list (e.g. `[String]!`)\n4) An empty `Connection` in case the return type is a relay connection\n2) Otherwise, an error will be raised\n\"\"\"\ndirective @permissionedQuerySet(permissions: [PermDefinition!]!, any: Boolean! = true) repeatable on FIELD_DEFINITION\n\n\"\"\"\nWill check if the user has any/all permissions to resolve this.\n\nWhen the condition fails, the following can be returned (following this priority):\n1) `OperationInfo`/`OperationMessage` if those types are allowed at the return type\n2) `null` in case the field is not mandatory (e.g. `String` or `[String]`)\n3) An empty list in case the field is a list (e.g. `[String]!`)\n4) An empty `Connection` in case the return type is a relay connection\n2) Otherwise, an error will be raised\n\"\"\"\ndirective @hasPerm(permissions: [PermDefinition!]!, any: Boolean! = true) repeatable on FIELD_DEFINITION\n\ndirective @hmisDirective on FIELD_DEFINITION\n\ndirective @isHmisAuthenticated on FIELD_DEFINITION\n\nenum AccessibilityChoices {\n  MEDICAL_EQUIPMENT_PERMITTED\n  WHEELCHAIR_ACCESSIBLE\n  ADA_ROOMS\n}\n\ntype AccessibilityType {\n  name: AccessibilityChoices\n}\n\nenum AdaAccommodationEnum {\n  HEARING\n  MOBILITY\n  VISUAL\n  OTHER\n}\n\nunion AddOrganizationMemberPayload = OrganizationMemberType | OperationInfo\n\ninput AddressInput {\n  addressComponents: JSON = null\n  formattedAddress: String = null\n}\n\ntype AddressType {\n  id: ID!\n  street: String\n  city: String\n  state: String\n  zipCode: String\n}\n\ninterface AttachmentInterface {\n  id: ID!\n  file: DjangoFileType!\n  attachmentType: AttachmentType!\n  mimeType: String!\n  originalFilename: String\n  createdAt: DateTime!\n  updatedAt: DateTime!\n}\n\nenum AttachmentType {\n  IMAGE\n  DOCUMENT\n  AUDIO\n  VIDEO\n  UNKNOWN\n}\n\ntype AuthResponse {\n  status_code: String!\n}\n\ntype AuthorizedPresignedS3UploadType {\n  refId: String!\n  url: String!\n  fields: JSON!\n  presignedKey: String!\n  uploadToken: String!\n}\n\ntype AuthorizedPresignedS3UploadsType {\n  uploads: [AuthorizedPresignedS3UploadType!]!\n}\n\ntype BedCountType {\n  available: Int!\n  inTurnaround: Int!\n  occupied: Int!\n  outOfService: Int!\n  reserved: Int!\n  total: Int!\n}\n\ninput BedFilter {\n  id: ID\n  maintenanceFlag: Boolean\n  shelterId: ID\n  AND: BedFilter\n  OR: BedFilter\n  NOT: BedFilter\n  DISTINCT: Boolean\n  type: [BedTypeChoices!]\n  medicalNeeds: [MedicalNeedChoices!]\n  status: [BedStatusChoices!]\n}\n\ninput BedOrder {\n  name: Ordering\n  createdAt: Ordering\n  updatedAt: Ordering\n}\n\nenum BedStatusChoices {\n  AVAILABLE\n  IN_TURNAROUND\n  OCCUPIED\n  OUT_OF_SERVICE\n  RESERVED\n}\n\ntype BedType {\n  id: ID!\n  accessibility: [AccessibilityType!]!\n  b7: Boolean!\n  demographics: [DemographicType!]!\n  fees: Int\n  funders: [FunderType!]!\n  lastCleanedInspected: DateTime\n  lastCleaned: DateTime\n  maintenanceFlag: Boolean!\n  medicalNeeds: [MedicalNeedType!]!\n  name: String\n  pets: [PetType!]!\n  room: RoomType\n  shelter: OperatorShelterType!\n  statusNotes: String\n  storage: Boolean!\n  type: BedTypeChoices\n  status: BedStatusChoices!\n}\n\nenum BedTypeChoices {\n  TWIN\n  BUNK\n  ROLLAWAY\n  OTHER\n}\n\ntype BedTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [BedType!]!\n}\n\ninput BulkDeleteInput {\n  ids: [ID!]!\n}\n\ntype BulkDeleteResult {\n  ids: [ID!]!\n}\n\ninput ChangeOrganizationMemberRoleInput {\n  userId: ID!\n  organizationId: ID!\n  permissionTemplate: PermissionTemplateEnum!\n}\n\nunion ChangeOrganizationMemberRolePayload = OrganizationMemberType | OperationInfo\n\ntype CityType {\n  id: ID!\n  name: String!\n}\n\ntype CityTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [CityType!]!\n}\n\ninput ClientContactInput {\n  name: String\n  email: String\n  mailingAddress: String\n  phoneNumber: PhoneNumber\n  relationshipToClient: RelationshipTypeEnum\n  relationshipToClientOther: String\n  id: ID\n  clientProfile: ID\n}\n\ntype ClientContactType {\n  name: String\n  email: String\n  mailingAddress: String\n  phoneNumber: PhoneNumber\n  relationshipToClient: RelationshipTypeEnum\n  relationshipToClientOther: String\n  id: ID!\n  clientProfile: DjangoModelType!\n  updatedAt: DateTime!\n}\n\ntype ClientContactTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ClientContactType!]!\n}\n\ninput ClientDocumentFilter {\n  AND: ClientDocumentFilter\n  OR: ClientDocumentFilter\n  NOT: ClientDocumentFilter\n  DISTINCT: Boolean\n  documentGroups: [ClientDocumentGroupEnum!]\n}\n\ninput ClientDocumentFromUploadsInput {\n  presignedKey: String!\n  uploadToken: String!\n  filename: String!\n  contentType: String!\n  namespace: ClientDocumentNamespaceEnum!\n}\n\nenum ClientDocumentGroupEnum {\n  DOC_READY\n  FORMS\n  OTHER\n}\n\nenum ClientDocumentNamespaceEnum {\n  DRIVERS_LICENSE_FRONT\n  DRIVERS_LICENSE_BACK\n  PHOTO_ID\n  BIRTH_CERTIFICATE\n  SOCIAL_SECURITY_CARD\n  OTHER_DOC_READY\n  CONSENT_FORM\n  HMIS_FORM\n  INCOME_FORM\n  OTHER_FORM\n  OTHER_CLIENT_DOCUMENT\n}\n\ntype ClientDocumentType implements AttachmentInterface {\n  id: ID!\n  file: DjangoFileType!\n  attachmentType: AttachmentType!\n  mimeType: String!\n  originalFilename: String\n  createdAt: DateTime!\n  updatedAt: DateTime!\n  namespace: ClientDocumentNamespaceEnum!\n}\n\ntype ClientDocumentTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ClientDocumentType!]!\n}\n\ninput ClientDocumentUploadsInputItem {\n  refId: String!\n  filename: String!\n  contentType: String!\n}\n\ntype ClientDocumentUploadsType {\n  documents: [ClientDocumentType!]!\n}\n\ninput ClientHouseholdMemberInput {\n  name: String\n  dateOfBirth: Date\n  gender: GenderEnum\n  genderOther: String\n  relationshipToClient: RelationshipTypeEnum\n  relationshipToClientOther: String\n  id: ID\n  clientProfile: ID\n}\n\ntype ClientHouseholdMemberType {\n  name: String\n  dateOfBirth: Date\n  gender: GenderEnum\n  genderOther: String\n  relationshipToClient: RelationshipTypeEnum\n  relationshipToClientOther: String\n  id: ID!\n  clientProfile: DjangoModelType!\n  displayGender: String\n}\n\ntype ClientHouseholdMemberTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ClientHouseholdMemberType!]!\n}\n\ntype ClientProfileDataImportType {\n  id: UUID!\n  importedAt: DateTime!\n  sourceFile: String!\n  notes: String!\n  importedBy: DjangoModelType!\n}\n\ninput ClientProfileFilter {\n  AND: ClientProfileFilter\n  OR: ClientProfileFilter\n  NOT: ClientProfileFilter\n  DISTINCT: Boolean\n  isActive: Boolean\n  search: String\n  searchClient: ClientSearchInput\n}\n\ntype ClientProfileImportRecordType {\n  id: ID!\n  sourceId: String!\n  sourceName: String!\n  success: Boolean!\n  errorMessage: String!\n  createdAt: DateTime!\n  clientProfile: ClientProfileType\n  rawData: JSON!\n}\n\ntype ClientProfileImportRecordTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ClientProfileImportRecordType!]!\n}\n\ninput ClientProfileImportRecordsBulkInput {\n  source: String!\n  sourceIds: [String!]!\n}\n\ninput ClientProfileOrder {\n  firstName: Ordering\n  lastName: Ordering\n  id: Ordering\n}\n\ninput ClientProfilePhotoInput {\n  clientProfile: ID!\n  photo: Upload\n}\n\ntype ClientProfileType {\n  adaAccommodation: [AdaAccommodationEnum!]\n  address: String\n  age: Int\n  californiaId: String\n  dateOfBirth: Date\n  email: NonBlankString\n  eyeColor: EyeColorEnum\n  firstName: NonBlankString\n  gender: GenderEnum\n  genderOther: String\n  hairColor: HairColorEnum\n  heightInInches: Float\n  importantNotes: String\n  lastName: NonBlankString\n  livingSituation: LivingSituationEnum\n  mailingAddress: String\n  maritalStatus: MaritalStatusEnum\n  middleName: NonBlankString\n  nickname: NonBlankString\n  phoneNumber: PhoneNumber\n  physicalDescription: String\n  placeOfBirth: String\n  preferredCommunication: [PreferredCommunicationEnum!]\n  preferredLanguage: LanguageEnum\n  profilePhoto: DjangoImageType\n  pronouns: PronounEnum\n  pronounsOther: String\n  race: RaceEnum\n  residenceAddress: String\n  residenceGeolocation: Point\n  spokenLanguages: [LanguageEnum!]\n  unhousedStartDate: Date\n  veteranStatus: VeteranStatusEnum\n  id: ID!\n  contacts: [ClientContactType!]\n  hmisProfiles: [HmisProfileType!]\n  householdMembers: [ClientHouseholdMemberType!]\n  phoneNumbers: [PhoneNumberType!]\n  socialMediaProfiles: [SocialMediaProfileType!]\n  displayGender: String\n  displayPronouns: String\n  docReadyDocuments: [ClientDocumentType!]\n  consentFormDocuments: [ClientDocumentType!]\n  otherDocuments: [ClientDocumentType!]\n  displayCaseManager: String!\n}\n\ntype ClientProfileTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ClientProfileType!]!\n}\n\ninput ClientSearchInput {\n  excludedClientProfileId: String = null\n  californiaId: String = null\n  firstName: String = null\n  lastName: String = null\n  middleName: String = null\n}\n\nunion CloneBedPayload = BedType | OperationInfo\n\nunion CloneRoomPayload = RoomType | OperationInfo\n\nenum ConditionChoices {\n  HEAT\n  FIRE\n  RAIN_SEVERE_WEATHER\n  WIND\n  AIR_QUALITY_SMOKE\n  PUBLIC_HEALTH_EMERGENCY\n  EMERGENCY_EVACUATION\n}\n\ntype ContactInfoType {\n  id: ID!\n  contactName: String!\n  contactNumber: PhoneNumber!\n}\n\ninput CreateBedInput {\n  shelterId: ID!\n  roomId: ID = null\n  accessibility: [AccessibilityChoices!] = null\n  b7: Boolean = null\n  demographics: [DemographicChoices!] = null\n  fees: Int = null\n  funders: [FunderChoices!] = null\n  lastCleanedInspected: DateTime = null\n  lastCleaned: DateTime = null\n  maintenanceFlag: Boolean = null\n  medicalNeeds: [MedicalNeedChoices!] = null\n  name: String = null\n  pets: [PetChoices!] = null\n  statusNotes: String = null\n  storage: Boolean = null\n  type: BedTypeChoices = null\n}\n\nunion CreateBedPayload = BedType | OperationInfo\n\nunion CreateClientContactPayload = ClientContactType | OperationInfo\n\ninput CreateClientDocumentInput {\n  clientProfile: ID!\n  file: Upload!\n  namespace: ClientDocumentNamespaceEnum!\n}\n\nunion CreateClientDocumentPayload = ClientDocumentType | OperationInfo\n\nunion CreateClientHouseholdMemberPayload = ClientHouseholdMemberType | OperationInfo\n\nunion CreateClientProfileDataImportPayload = ClientProfileDataImportType | OperationInfo\n\ninput CreateClientProfileInput {\n  adaAccommodation: [AdaAccommodationEnum!]\n  address: String\n  age: Int\n  californiaId: String\n  dateOfBirth: Date\n  email: NonBlankString\n  eyeColor: EyeColorEnum\n  firstName: NonBlankString\n  gender: GenderEnum\n  genderOther: String\n  hairColor: HairColorEnum\n  heightInInches: Float\n  importantNotes: String\n  lastName: NonBlankString\n  livingSituation: LivingSituationEnum\n  mailingAddress: String\n  maritalStatus: MaritalStatusEnum\n  middleName: NonBlankString\n  nickname: NonBlankString\n  phoneNumber: PhoneNumber\n  physicalDescription: String\n  placeOfBirth: String\n  preferredCommunication: [PreferredCommunicationEnum!]\n  preferredLanguage: LanguageEnum\n  profilePhoto: Upload\n  pronouns: PronounEnum\n  pronounsOther: String\n  race: RaceEnum\n  residenceAddress: String\n  residenceGeolocation: Point\n  spokenLanguages: [LanguageEnum!]\n  unhousedStartDate: Date\n  veteranStatus: VeteranStatusEnum\n  contacts: [ClientContactInput!]\n  hmisProfiles: [HmisProfileInput!]\n  householdMembers: [ClientHouseholdMemberInput!]\n  phoneNumbers: [PhoneNumberInput!]\n  socialMediaProfiles: [SocialMediaProfileInput!]\n}\n\nunion CreateClientProfilePayload = ClientProfileType | OperationInfo\n\ninput CreateHmisClientProfileInput {\n  alias: String\n  birthDate: Date\n  dobQuality: HmisDobQualityEnum\n  firstName: NonBlankString!\n  lastName: NonBlankString!\n  nameQuality: HmisNameQualityEnum!\n  ssn1: String\n  ssn2: String\n  ssn3: String\n  ssnQuality: HmisSsnQualityEnum\n  gender: [HmisGenderEnum!]\n  genderIdentityText: String\n  nameMiddle: NonBlankString\n  nameSuffix: HmisSuffixEnum\n  raceEthnicity: [HmisRaceEnum!]\n  additionalRaceEthnicityDetail: String\n  veteran: HmisVeteranStatusEnum\n  adaAccommodation: [AdaAccommodationEnum!]\n  address: String\n  californiaId: String\n  email: NonBlankString\n  eyeColor: EyeColorEnum\n  hairColor: HairColorEnum\n  heightInInches: Float\n  importantNotes: String\n  livingSituation: LivingSituationEnum\n  mailingAddress: String\n  maritalStatus: MaritalStatusEnum\n  physicalDescription: String\n  placeOfBirth: String\n  preferredCommunication: [PreferredCommunicationEnum!]\n  preferredLanguage: LanguageEnum\n  profilePhoto: Upload\n  pronouns: PronounEnum\n  pronounsOther: String\n  residenceAddress: String\n  residenceGeolocation: Point\n  spokenLanguages: [LanguageEnum!]\n  unhousedStartDate: Date\n}\n\nunion CreateHmisClientProfilePayload = HmisClientProfileType | OperationInfo\n\nunion CreateHmisClientProgramPayload = ProgramEnrollmentType | OperationInfo\n\ninput CreateHmisNoteInput {\n  hmisClientProfileId: String!\n  title: String\n  note: String\n  date: Date!\n  refClientProgram: String\n}\n\nunion CreateHmisNotePayload = HmisNoteType | OperationInfo\n\ninput CreateHmisNoteServiceRequestInput {\n  hmisNoteId: ID!\n  serviceId: ID\n  serviceOther: String\n  serviceRequestType: ServiceRequestTypeEnum!\n}\n\nunion CreateHmisNoteServiceRequestPayload = ServiceRequestType | OperationInfo\n\nunion CreateHmisProfilePayload = HmisProfileType | OperationInfo\n\ninput CreateNoteDataImportInput {\n  sourceFile: String!\n  notes: String!\n}\n\nunion CreateNoteDataImportPayload = NoteDataImportType | OperationInfo\n\ninput CreateNoteInput {\n  purpose: String = null\n  teamId: ID\n  publicDetails: String = \"\"\n  privateDetails: String = \"\"\n  clientProfile: ID = null\n  isSubmitted: Boolean = false\n  interactedAt: DateTime = null\n  location: LocationInput = null\n  providedServices: [CreateNoteServiceInput!] = null\n  requestedServices: [CreateNoteServiceInput!] = null\n  tasks: [CreateNoteTaskInput!] = null\n}\n\nunion CreateNotePayload = NoteType | OperationInfo\n\ninput CreateNoteServiceInput {\n  serviceId: ID = null\n  serviceOther: String = null\n}\n\ninput CreateNoteServiceRequestInput {\n  serviceId: ID\n  serviceOther: String\n  noteId: ID!\n  serviceRequestType: ServiceRequestTypeEnum!\n}\n\nunion CreateNoteServiceRequestPayload = ServiceRequestType | OperationInfo\n\ninput CreateNoteTaskInput {\n  summary: String!\n  description: String = null\n  status: Int = null\n  teamId: ID\n}\n\ninput CreateOrganizationInput {\n  organizationName: NonEmptyString!\n  orgType: NonEmptyString!\n}\n\ntype CreateOrganizationResponse {\n  user: UserType!\n  organization: OrganizationType!\n}\n\ninput CreateProfileDataImportInput {\n  sourceFile: String!\n  notes: String\n}\n\ninput CreateReferralInput {\n  clientProfile: ID!\n  shelter: ID!\n  notes: String\n}\n\nunion CreateReferralPayload = ReferralType | OperationInfo\n\ninput CreateReservationInput {\n  roomId: ID = null\n  bedId: ID = null\n  checkedInAt: DateTime = null\n  checkedOutAt: DateTime = null\n  clients: [ReservationClientInput!]!\n  duration: Int = null\n  notes: String = null\n  startDate: Date = null\n  status: ReservationStatusChoices = null\n}\n\nunion CreateReservationPayload = ReservationType | OperationInfo\n\ninput CreateRoomInput {\n  shelterId: ID!\n  accessibility: [AccessibilityChoices!] = null\n  amenities: String = null\n  demographics: [DemographicChoices!] = null\n  funders: [FunderChoices!] = null\n  lastCleanedInspected: DateTime = null\n  maintenanceFlag: Boolean = null\n  medicalRespite: Boolean = false\n  name: String!\n  notes: String = null\n  pets: [PetChoices!] = null\n  storage: Boolean = null\n  type: RoomStyleChoices = null\n  typeOther: String = null\n}\n\nunion CreateRoomPayload = RoomType | OperationInfo\n\ninput CreateShelterInput {\n  name: String!\n  description: String = null\n  accessibility: [AccessibilityChoices!] = null\n  demographics: [DemographicChoices!] = null\n  specialSituationRestrictions: [SpecialSituationRestrictionChoices!] = null\n  shelterTypes: [ShelterChoices!] = null\n  roomStyles: [RoomStyleChoices!] = null\n  storage: [StorageChoices!] = null\n  pets: [PetChoices!] = null\n  parking: [ParkingChoices!] = null\n  entryRequirements: [EntryRequirementChoices!] = null\n  referralRequirement: [ReferralRequirementChoices!] = null\n  vaccinationRequirement: [VaccinationRequirementChoices!] = null\n  exitPolicy: [ExitPolicyChoices!] = null\n  shelterPrograms: [ShelterProgramChoices!] = null\n  funders: [FunderChoices!] = null\n  location: ShelterLocationInput = null\n  schedules: [ScheduleInput!] = null\n  services: [ServiceInput!] = null\n  email: String = null\n  phone: PhoneNumber = null\n  website: String = null\n  instagram: String = null\n  status: StatusChoices = null\n  demographicsOther: String = null\n  shelterTypesOther: String = null\n  totalBeds: Int = null\n  roomStylesOther: String = null\n  addNotesSleepingDetails: String = null\n  addNotesShelterDetails: String = null\n  maxStay: Int = null\n  curfew: Time = null\n  onSiteSecurity: Boolean = null\n  visitorsAllowed: Boolean = null\n  exitPolicyOther: String = null\n  emergencySurge: Boolean = null\n  otherRules: String = null\n  otherServices: String = null\n  entryInfo: String = null\n  bedFees: String = null\n  programFees: String = null\n  shelterProgramsOther: String = null\n  fundersOther: String = null\n  subjectiveReview: String = null\n  cityCouncilDistrict: Int = null\n  supervisorialDistrict: Int = null\n  overallRating: Int = null\n  isPrivate: Boolean\n  cityId: ID\n  spaId: ID\n}\n\nunion CreateShelterPayload = ShelterType | OperationInfo\n\nunion CreateSocialMediaProfilePayload = SocialMediaProfileType | OperationInfo\n\ninput CreateTaskInput {\n  clientProfile: ID\n  hmisClientProfile: ID\n  description: String\n  note: ID\n  hmisNote: ID\n  summary: String!\n  teamId: ID\n  status: TaskStatusEnum\n}\n\nunion CreateTaskPayload = TaskType | OperationInfo\n\ninput CreateTeamInput {\n  name: String!\n}\n\nunion CreateTeamPayload = TeamType | OperationInfo\n\ntype CurrentUserOrganizationType {\n  id: ID!\n  name: String!\n  permissions: [String!]!\n}\n\ntype CurrentUserType {\n  firstName: NonBlankString\n  lastName: NonBlankString\n  middleName: NonBlankString\n  email: NonBlankString\n  id: ID!\n  organizationsOrganization(filters: OrganizationFilter, ordering: [OrganizationOrder!]! = [], pagination: OffsetPaginationInput): [CurrentUserOrganizationType!]\n  hasAcceptedTos: Boolean\n  hasAcceptedPrivacyPolicy: Boolean\n  username: String\n  isHmisUser: Boolean\n  isOutreachAuthorized: Boolean @deprecated(reason: \"Use userPermissions check instead.\")\n}\n\ntype DailyBedStatusMetricsType {\n  date: Date!\n  available: Int!\n  occupied: Int!\n  reserved: Int!\n  outOfService: Int!\n  inTurnaround: Int!\n}\n\ntype DailyOccupancyMetricsType {\n  date: Date!\n  occupiedCount: Int!\n  totalBeds: Int!\n  occupancyPct: Float!\n}\n\n\"\"\"Date (isoformat)\"\"\"\nscalar Date\n\ntype DateCountType {\n  date: String!\n  count: Int!\n}\n\n\"\"\"Date with time (isoformat)\"\"\"\nscalar DateTime\n\nenum DayOfWeekChoices {\n  MONDAY\n  TUESDAY\n  WEDNESDAY\n  THURSDAY\n  FRIDAY\n  SATURDAY\n  SUNDAY\n}\n\nunion DeleteBedsPayload = BulkDeleteResult | OperationInfo\n\nunion DeleteClientContactPayload = ClientContactType | OperationInfo\n\nunion DeleteClientDocumentPayload = ClientDocumentType | OperationInfo\n\nunion DeleteClientHouseholdMemberPayload = ClientHouseholdMemberType | OperationInfo\n\nunion DeleteClientProfilePayload = DeletedObjectType | OperationInfo\n\nunion DeleteClientProfilePhotoPayload = ClientProfileType | OperationInfo\n\nunion DeleteCurrentUserPayload = DeletedObjectType | OperationInfo\n\ninput DeleteDjangoObjectInput {\n  id: ID!\n}\n\nunion DeleteHmisNotePayload = DeletedObjectType | OperationInfo\n\nunion DeleteHmisProfilePayload = HmisProfileType | OperationInfo\n\nunion DeleteNotePayload = NoteType | OperationInfo\n\nunion DeleteReferralPayload = DeletedObjectType | OperationInfo\n\nunion DeleteReservationsPayload = BulkDeleteResult | OperationInfo\n\nunion DeleteRoomsPayload = BulkDeleteResult | OperationInfo\n\nunion DeleteServiceRequestPayload = DeletedObjectType | OperationInfo\n\nunion DeleteShelterPhotosPayload = BulkDeleteResult | OperationInfo\n\nunion DeleteSocialMediaProfilePayload = SocialMediaProfileType | OperationInfo\n\nunion DeleteTaskPayload = DeletedObjectType | OperationInfo\n\nunion DeleteTeamPayload = DeletedObjectType | OperationInfo\n\ntype DeletedObjectType {\n  id: Int!\n}\n\nenum DemographicChoices {\n  ALL\n  COUPLES\n  SINGLE_MEN\n  SINGLE_WOMEN\n  TAY_TEEN\n  SENIORS\n  FAMILIES\n  SINGLE_MOMS\n  SINGLE_DADS\n  LGBTQ_PLUS\n  OTHER\n}\n\ntype DemographicType {\n  name: DemographicChoices\n}\n\ntype DjangoFileType {\n  name: String!\n  path: String!\n  size: Int!\n  url: String!\n}\n\ntype DjangoImageType {\n  name: String!\n  path: String!\n  size: Int!\n  width: Int!\n  height: Int!\n  url(preset: ImagePresetEnum = null, processingOptions: String = null): String!\n}\n\ntype DjangoModelType {\n  pk: ID!\n}\n\nenum EntryRequirementChoices {\n  BACKGROUND\n  HOMELESS_VERIFICATION\n  MEDICAID_OR_MEDICARE\n  PHOTO_ID\n  REFERRAL\n  RESERVATION\n  VEHICLE_REGISTRATION\n  WALK_UPS\n  IN_SPA_ONLY\n}\n\ntype EntryRequirementType {\n  name: EntryRequirementChoices\n}\n\nenum ExitPolicyChoices {\n  MIA\n  VIOLENCE\n  MITIGATION\n  OTHER\n}\n\ntype ExitPolicyType {\n  name: ExitPolicyChoices\n}\n\nenum EyeColorEnum {\n  BLUE\n  BROWN\n  GREEN\n  GRAY\n  HAZEL\n  OTHER\n}\n\ntype FeatureControlData {\n  flags: [FlagType!]!\n  switches: [SwitchType!]!\n  samples: [SampleType!]!\n}\n\ntype FlagType {\n  name: String!\n  isActive: Boolean\n  lastModified: DateTime\n}\n\nenum FunderChoices {\n  CITY_OF_LOS_ANGELES\n  DHS\n  DMH\n  FEDERAL_FUNDING\n  HOPWA\n  LAHSA\n  PRIVATE\n  OTHER\n}\n\ntype FunderType {\n  name: FunderChoices\n}\n\nenum GenderEnum {\n  MALE\n  FEMALE\n  TRANS_MALE\n  TRANS_FEMALE\n  NON_BINARY\n  OTHER\n  PREFER_NOT_TO_SAY\n}\n\ninput GenerateClientDocumentUploadsInput {\n  clientProfileId: ID!\n  uploads: [ClientDocumentUploadsInputItem!]!\n}\n\nunion GenerateClientDocumentUploadsPayload = AuthorizedPresignedS3UploadsType | OperationInfo\n\ninput GenerateClientProfilePhotoUploadInput {\n  clientProfileId: ID!\n  refId: String!\n  filename: String!\n  contentType: String!\n}\n\nunion GenerateClientProfilePhotoUploadPayload = AuthorizedPresignedS3UploadType | OperationInfo\n\ninput GenerateNoteAttachmentUploadsInput {\n  noteId: ID!\n  uploads: [NoteAttachmentUploadItemInput!]!\n}\n\nunion GenerateNoteFileUploadsPayload = AuthorizedPresignedS3UploadsType | OperationInfo\n\ninput GenerateShelterPhotoUploadsInput {\n  shelterId: ID!\n  uploads: [ShelterPhotoUploadItemInput!]!\n}\n\nunion GenerateShelterPhotoUploadsPayload = AuthorizedPresignedS3UploadsType | OperationInfo\n\ninput GeolocationInput {\n  latitude: Float!\n  longitude: Float!\n  rangeInMiles: Int = null\n}\n\nenum HairColorEnum {\n  BLACK\n  BLONDE\n  BROWN\n  GRAY\n  RED\n  WHITE\n  BALD\n  OTHER\n}\n\nenum HmisAgencyEnum {\n  LAHSA\n  LONG_BEACH\n  PASADENA\n  CHAMP\n  VASH\n}\n\ninput HmisClientProfileFilter {\n  AND: HmisClientProfileFilter\n  OR: HmisClientProfileFilter\n  NOT: HmisClientProfileFilter\n  DISTINCT: Boolean\n  search: String\n}\n\ninput HmisClientProfileOrdering {\n  id: Ordering\n  firstName: Ordering\n  lastName: Ordering\n  addedDate: Ordering\n  lastUpdated: Ordering\n}\n\ntype HmisClientProfileType {\n  alias: String\n  birthDate: Date\n  dobQuality: HmisDobQualityEnum\n  firstName: NonBlankString\n  lastName: NonBlankString\n  nameQuality: HmisNameQualityEnum\n  ssn1: String\n  ssn2: String\n  ssn3: String\n  ssnQuality: HmisSsnQualityEnum\n  gender: [HmisGenderEnum!]\n  genderIdentityText: String\n  nameMiddle: NonBlankString\n  nameSuffix: HmisSuffixEnum\n  raceEthnicity: [HmisRaceEnum!]\n  additionalRaceEthnicityDetail: String\n  veteran: HmisVeteranStatusEnum\n  adaAccommodation: [AdaAccommodationEnum!]\n  address: String\n  californiaId: String\n  email: NonBlankString\n  eyeColor: EyeColorEnum\n  hairColor: HairColorEnum\n  heightInInches: Float\n  importantNotes: String\n  livingSituation: LivingSituationEnum\n  mailingAddress: String\n  maritalStatus: MaritalStatusEnum\n  physicalDescription: String\n  placeOfBirth: String\n  preferredCommunication: [PreferredCommunicationEnum!]\n  preferredLanguage: LanguageEnum\n  profilePhoto: DjangoImageType\n  pronouns: PronounEnum\n  pronounsOther: String\n  residenceAddress: String\n  residenceGeolocation: Point\n  spokenLanguages: [LanguageEnum!]\n  unhousedStartDate: Date\n  id: ID!\n  hmisId: String\n  personalId: String\n  uniqueIdentifier: String\n  addedDate: DateTime\n  lastUpdated: DateTime\n  age: Int\n  phoneNumbers: [PhoneNumberType!]\n  createdBy: UserType\n}\n\ntype HmisClientProfileTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [HmisClientProfileType!]!\n}\n\ntype HmisClientProgramType {\n  id: String!\n  program: HmisProgramType!\n}\n\nenum HmisDobQualityEnum {\n  FULL\n  PARTIAL\n  DONT_KNOW\n  NO_ANSWER\n  NOT_COLLECTED\n}\n\nenum HmisGenderEnum {\n  WOMAN_GIRL\n  MAN_BOY\n  SPECIFIC\n  TRANSGENDER\n  NON_BINARY\n  QUESTIONING\n  DIFFERENT\n  DONT_KNOW\n  NO_ANSWER\n  NOT_COLLECTED\n}\n\ntype HmisLoginError {\n  message: String!\n  field: String\n}\n\ntype HmisLoginSuccess {\n  user: CurrentUserType!\n}\n\nunion HmisLoginSuccessHmisLoginError = HmisLoginSuccess | HmisLoginError\n\nenum HmisNameQualityEnum {\n  FULL\n  PARTIAL\n  DONT_KNOW\n  NO_ANSWER\n  NOT_COLLECTED\n}\n\ninput HmisNoteFilter {\n  hmisClientProfile: ID\n  createdBy: ID\n  AND: HmisNoteFilter\n  OR: HmisNoteFilter\n  NOT: HmisNoteFilter\n  DISTINCT: Boolean\n  authors: [ID!]\n  search: String\n}\n\ninput HmisNoteOrdering {\n  id: Ordering\n  addedDate: Ordering\n  lastUpdated: Ordering\n  date: Ordering\n}\n\ntype HmisNoteType {\n  id: ID!\n  hmisId: String!\n  hmisClientProfile: HmisClientProfileType!\n  addedDate: DateTime\n  lastUpdated: DateTime\n  title: String\n  note: String!\n  date: Date\n  clientProgram: HmisClientProgramType\n  refClientProgram: String\n  tasks(filters: TaskFilter, ordering: [TaskOrder!]! = [], pagination: OffsetPaginationInput): [TaskType!]\n  createdBy: UserType\n  location: LocationType\n  requestedServices(pagination: OffsetPaginationInput): [ServiceRequestType!]\n  providedServices(pagination: OffsetPaginationInput): [ServiceRequestType!]\n}\n\ntype HmisNoteTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [HmisNoteType!]!\n}\n\ninput HmisProfileInput {\n  hmisId: NonBlankString\n  agency: HmisAgencyEnum!\n  id: ID\n  clientProfile: ID\n}\n\ntype HmisProfileType {\n  hmisId: NonBlankString\n  agency: HmisAgencyEnum!\n  id: ID!\n}\n\ntype HmisProfileTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [HmisProfileType!]!\n}\n\ntype HmisProgramType {\n  id: String!\n  name: String!\n  enableNotes: Int\n}\n\nenum HmisRaceEnum {\n  INDIGENOUS\n  ASIAN\n  BLACK\n  HISPANIC\n  MIDDLE_EASTERN\n  PACIFIC_ISLANDER\n  WHITE\n  DONT_KNOW\n  NO_ANSWER\n  NOT_COLLECTED\n}\n\nenum HmisSsnQualityEnum {\n  FULL\n  PARTIAL\n  DONT_KNOW\n  NO_ANSWER\n  NOT_COLLECTED\n}\n\nenum HmisSuffixEnum {\n  JR\n  SR\n  FIRST\n  SECOND\n  THIRD\n  FOURTH\n  FIFTH\n  SIXTH\n  DONT_KNOW\n  NO_ANSWER\n}\n\nenum HmisVeteranStatusEnum {\n  NO\n  YES\n  DONT_KNOW\n  NO_ANSWER\n  NOT_COLLECTED\n}\n\ninput IDFilterLookup {\n  \"\"\"Exact match. Filter will be skipped on `null` value\"\"\"\n  exact: ID\n\n  \"\"\"Assignment test. Filter will be skipped on `null` value\"\"\"\n  isNull: Boolean\n\n  \"\"\"\n  Exact match of items in a given list. Filter will be skipped on `null` value\n  \"\"\"\n  inList: [ID!]\n\n  \"\"\"Case-insensitive exact match. Filter will be skipped on `null` value\"\"\"\n  iExact: ID\n\n  \"\"\"\n  Case-sensitive containment test. Filter will be skipped on `null` value\n  \"\"\"\n  contains: ID\n\n  \"\"\"\n  Case-insensitive containment test. Filter will be skipped on `null` value\n  \"\"\"\n  iContains: ID\n\n  \"\"\"Case-sensitive starts-with. Filter will be skipped on `null` value\"\"\"\n  startsWith: ID\n\n  \"\"\"Case-insensitive starts-with. Filter will be skipped on `null` value\"\"\"\n  iStartsWith: ID\n\n  \"\"\"Case-sensitive ends-with. Filter will be skipped on `null` value\"\"\"\n  endsWith: ID\n\n  \"\"\"Case-insensitive ends-with. Filter will be skipped on `null` value\"\"\"\n  iEndsWith: ID\n\n  \"\"\"\n  Case-sensitive regular expression match. Filter will be skipped on `null` value\n  \"\"\"\n  regex: ID\n\n  \"\"\"\n  Case-insensitive regular expression match. Filter will be skipped on `null` value\n  \"\"\"\n  iRegex: ID\n}\n\nenum ImagePresetEnum {\n  ORIGINAL\n  SHELTER_HERO\n  SM\n  MD\n  LG\n}\n\ninput ImportClientProfileInput {\n  importJobId: UUID!\n  sourceId: String!\n  sourceName: String!\n  rawData: JSON!\n  clientProfile: CreateClientProfileInput!\n}\n\nunion ImportClientProfilePayload = ClientProfileImportRecordType | OperationInfo\n\ninput ImportNoteDataInput {\n  purpose: String\n  teamId: ID\n  publicDetails: String\n  privateDetails: String\n  clientProfile: ID\n  isSubmitted: Boolean\n  interactedAt: DateTime\n}\n\ninput ImportNoteInput {\n  importJobId: UUID!\n  sourceId: String!\n  sourceName: String!\n  rawData: JSON!\n  note: ImportNoteDataInput!\n}\n\nunion ImportNotePayload = NoteImportRecordType | OperationInfo\n\ninput InteractionAuthorFilter {\n  AND: InteractionAuthorFilter\n  OR: InteractionAuthorFilter\n  NOT: InteractionAuthorFilter\n  DISTINCT: Boolean\n  search: String\n}\n\ninput InteractionAuthorOrder {\n  firstName: Ordering\n  lastName: Ordering\n  id: Ordering\n}\n\ntype InteractionAuthorType {\n  id: ID!\n  firstName: String\n  lastName: String\n  middleName: String\n}\n\ntype InteractionAuthorTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [InteractionAuthorType!]!\n}\n\n\"\"\"\nThe `JSON` scalar type represents JSON values as specified by [ECMA-404](https://ecma-international.org/wp-content/uploads/ECMA-404_2nd_edition_december_2017.pdf).\n\"\"\"\nscalar JSON @specifiedBy(url: \"https://ecma-international.org/wp-content/uploads/ECMA-404_2nd_edition_december_2017.pdf\")\n\nenum LanguageEnum {\n  ASL\n  ARABIC\n  ARMENIAN\n  ENGLISH\n  FARSI\n  FRENCH\n  INDONESIAN\n  JAPANESE\n  KHMER\n  KOREAN\n  RUSSIAN\n  SIMPLIFIED_CHINESE\n  SPANISH\n  TAGALOG\n  TRADITIONAL_CHINESE\n  VIETNAMESE\n}\n\nscalar LatitudeScalar\n\nenum LivingSituationEnum {\n  HOUSING\n  OPEN_AIR\n  SHELTER\n  TENT\n  VEHICLE\n  OTHER\n}\n\ninput LocationInput {\n  address: AddressInput\n  point: Point!\n  pointOfInterest: String\n}\n\ntype LocationType {\n  id: ID\n  address: AddressType!\n  point: Point!\n  pointOfInterest: String\n}\n\ninput LoginInput {\n  username: String!\n  password: String!\n}\n\nscalar LongitudeScalar\n\ninput MapBoundsInput {\n  westLng: LongitudeScalar!\n  northLat: LatitudeScalar!\n  eastLng: LongitudeScalar!\n  southLat: LatitudeScalar!\n}\n\nenum MaritalStatusEnum {\n  DIVORCED\n  MARRIED\n  SEPARATED\n  SINGLE\n  WIDOWED\n}\n\ninput MaxStayInput {\n  days: Int!\n  includeNull: Boolean = false\n}\n\ntype MediaLinkType {\n  id: ID!\n  url: String!\n  title: String!\n  mediaType: MediaLinkTypeChoices!\n}\n\nenum MediaLinkTypeChoices {\n  YOUTUBE\n}\n\nenum MedicalNeedChoices {\n  ERC\n  DMH\n  OXYGEN\n  DIALYSIS\n}\n\ntype MedicalNeedType {\n  name: MedicalNeedChoices\n}\n\ntype Mutation {\n  logout: Boolean!\n  login(input: LoginInput!): AuthResponse!\n  updateCurrentUser(data: UpdateUserInput!): UpdateCurrentUserPayload!\n  updateUserProfile(data: UpdateUserProfileInput!): UpdateUserProfilePayload!\n  deleteCurrentUser: DeleteCurrentUserPayload!\n  addOrganizationMember(data: OrgInvitationInput!): AddOrganizationMemberPayload! @hasOrgPerm(permissions: [{app: \"organizations\", permission: \"add_org_member\"}], any: true)\n  removeOrganizationMember(data: RemoveOrganizationMemberInput!): RemoveOrganizationMemberPayload! @hasOrgPerm(permissions: [{app: \"organizations\", permission: \"remove_org_member\"}], any: true)\n  createOrganization(data: CreateOrganizationInput!): CreateOrganizationResponse!\n  changeOrganizationMemberRole(data: ChangeOrganizationMemberRoleInput!): ChangeOrganizationMemberRolePayload! @hasOrgPerm(permissions: [{app: \"organizations\", permission: \"change_org_member_role\"}], any: true)\n  createClientContact(data: ClientContactInput!): CreateClientContactPayload! @hasPerm(permissions: [{app: \"clients\", permission: \"add_clientcontact\"}], any: true)\n  updateClientContact(data: ClientContactInput!): UpdateClientContactPayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"change_clientcontact\"}], any: true)\n  deleteClientContact(data: DeleteDjangoObjectInput!): DeleteClientContactPayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"delete_clientcontact\"}], any: true)\n  createClientHouseholdMember(data: ClientHouseholdMemberInput!): CreateClientHouseholdMemberPayload! @hasPerm(permissions: [{app: \"clients\", permission: \"add_clienthouseholdmember\"}], any: true)\n  updateClientHouseholdMember(data: ClientHouseholdMemberInput!): UpdateClientHouseholdMemberPayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"change_clienthouseholdmember\"}], any: true)\n  deleteClientHouseholdMember(data: DeleteDjangoObjectInput!): DeleteClientHouseholdMemberPayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"delete_clienthouseholdmember\"}], any: true)\n  createHmisProfile(data: HmisProfileInput!): CreateHmisProfilePayload! @hasPerm(permissions: [{app: \"clients\", permission: \"add_hmisprofile\"}], any: true)\n  updateHmisProfile(data: HmisProfileInput!): UpdateHmisProfilePayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"change_hmisprofile\"}], any: true)\n  deleteHmisProfile(data: DeleteDjangoObjectInput!): DeleteHmisProfilePayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"delete_hmisprofile\"}], any: true)\n  createSocialMediaProfile(data: SocialMediaProfileInput!): CreateSocialMediaProfilePayload! @hasPerm(permissions: [{app: \"clients\", permission: \"add_socialmediaprofile\"}], any: true)\n  updateSocialMediaProfile(data: SocialMediaProfileInput!): UpdateSocialMediaProfilePayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"change_socialmediaprofile\"}], any: true)\n  deleteSocialMediaProfile(data: DeleteDjangoObjectInput!): DeleteSocialMediaProfilePayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"delete_socialmediaprofile\"}], any: true)\n  deleteClientDocument(data: DeleteDjangoObjectInput!): DeleteClientDocumentPayload! @hasRetvalPerm(permissions: [{app: \"common\", permission: \"delete_attachment\"}], any: true)\n  updateClientDocument(data: UpdateClientDocumentInput!): UpdateClientDocumentPayload! @hasRetvalPerm(permissions: [{app: \"common\", permission: \"change_attachment\"}], any: true)\n  createClientProfile(data: CreateClientProfileInput!): CreateClientProfilePayload! @hasPerm(permissions: [{app: \"clients\", permission: \"add_clientprofile\"}], any: true)\n  updateClientProfile(data: UpdateClientProfileInput!): UpdateClientProfilePayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"change_clientprofile\"}], any: true)\n  deleteClientProfile(data: DeleteDjangoObjectInput!): DeleteClientProfilePayload!\n  createClientDocument(data: CreateClientDocumentInput!): CreateClientDocumentPayload! @hasPerm(permissions: [{app: \"common\", permission: \"add_attachment\"}], any: true)\n  updateClientProfilePhoto(data: ClientProfilePhotoInput!): UpdateClientProfilePhotoPayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"change_clientprofile\"}], any: true) @deprecated(reason: \"Use generateClientProfilePhotoUpload/resolveClientProfilePhotoUpload for uploads and deleteClientProfilePhoto for removal.\")\n  deleteClientProfilePhoto(clientProfileId: ID!): DeleteClientProfilePhotoPayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"change_clientprofile\"}], any: true)\n  generateClientDocumentUploads(data: GenerateClientDocumentUploadsInput!): GenerateClientDocumentUploadsPayload! @hasPerm(permissions: [{app: \"common\", permission: \"add_attachment\"}], any: true)\n  resolveClientDocumentUploads(data: ResolveClientDocumentUploadsInput!): ResolveClientDocumentUploadsPayload! @hasPerm(permissions: [{app: \"common\", permission: \"add_attachment\"}], any: true)\n  generateClientProfilePhotoUpload(data: GenerateClientProfilePhotoUploadInput!): GenerateClientProfilePhotoUploadPayload! @hasPerm(permissions: [{app: \"clients\", permission: \"change_clientprofile\"}], any: true)\n  resolveClientProfilePhotoUpload(data: ResolveClientProfilePhotoUploadInput!): ResolveClientProfilePhotoUploadPayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"change_clientprofile\"}], any: true)\n  createClientProfileDataImport(data: CreateProfileDataImportInput!): CreateClientProfileDataImportPayload! @hasPerm(permissions: [{app: \"clients\", permission: \"add_clientprofileimportrecord\"}], any: true)\n  importClientProfile(data: ImportClientProfileInput!): ImportClientProfilePayload! @hasPerm(permissions: [{app: \"clients\", permission: \"add_clientprofileimportrecord\"}], any: true)\n  hmisLogin(email: String!, password: String!): HmisLoginSuccessHmisLoginError! @hmisDirective\n  createHmisClientProfile(data: CreateHmisClientProfileInput!): CreateHmisClientProfilePayload! @hmisDirective @isHmisAuthenticated\n  updateHmisClientProfile(data: UpdateHmisClientProfileInput!): UpdateHmisClientProfilePayload! @hmisDirective @isHmisAuthenticated\n  createHmisNote(data: CreateHmisNoteInput!): CreateHmisNotePayload! @hmisDirective @isHmisAuthenticated\n  updateHmisNote(data: UpdateHmisNoteInput!): UpdateHmisNotePayload! @hmisDirective @isHmisAuthenticated\n  deleteHmisNote(id: ID!): DeleteHmisNotePayload! @hmisDirective @isHmisAuthenticated\n  createHmisClientProgram(clientId: Int!, programHmisId: Int!): CreateHmisClientProgramPayload! @hmisDirective @isHmisAuthenticated\n  updateHmisNoteLocation(data: UpdateHmisNoteLocationInput!): UpdateHmisNoteLocationPayload! @hmisDirective @isHmisAuthenticated\n  createHmisNoteServiceRequest(data: CreateHmisNoteServiceRequestInput!): CreateHmisNoteServiceRequestPayload! @hmisDirective @isHmisAuthenticated\n  removeHmisNoteServiceRequest(data: RemoveHmisNoteServiceRequestInput!): RemoveHmisNoteServiceRequestPayload! @hmisDirective @isHmisAuthenticated\n  deleteNote(data: DeleteDjangoObjectInput!): DeleteNotePayload! @hasRetvalPerm(permissions: [{app: \"notes\", permission: \"delete_note\"}], any: true)\n  createNote(data: CreateNoteInput!): CreateNotePayload! @hasPerm(permissions: [{app: \"notes\", permission: \"add_note\"}], any: true)\n  updateNote(data: UpdateNoteInput!): UpdateNotePayload! @permissionedQuerySet(permissions: [{app: \"notes\", permission: \"change_note\"}], any: true)\n  updateNoteLocation(data: UpdateNoteLocationInput!): UpdateNoteLocationPayload! @permissionedQuerySet(permissions: [{app: \"notes\", permission: \"change_note\"}], any: true)\n  revertNote(data: RevertNoteInput!): RevertNotePayload! @permissionedQuerySet(permissions: [{app: \"notes\", permission: \"change_note\"}], any: true)\n  createNoteServiceRequest(data: CreateNoteServiceRequestInput!): CreateNoteServiceRequestPayload! @hasPerm(permissions: [{app: \"notes\", permission: \"add_servicerequest\"}], any: true) @permissionedQuerySet(permissions: [{app: \"notes\", permission: \"change_note\"}], any: true)\n  deleteServiceRequest(data: DeleteDjangoObjectInput!): DeleteServiceRequestPayload! @permissionedQuerySet(permissions: [{app: \"notes\", permission: \"delete_servicerequest\"}], any: true)\n  createNoteDataImport(data: CreateNoteDataImportInput!): CreateNoteDataImportPayload! @hasPerm(permissions: [{app: \"notes\", permission: \"add_noteimportrecord\"}], any: true)\n  importNote(data: ImportNoteInput!): ImportNotePayload! @hasPerm(permissions: [{app: \"notes\", permission: \"add_noteimportrecord\"}], any: true)\n  generateNoteFileUploads(data: GenerateNoteAttachmentUploadsInput!): GenerateNoteFileUploadsPayload! @hasPerm(permissions: [{app: \"common\", permission: \"add_attachment\"}], any: true) @permissionedQuerySet(permissions: [{app: \"notes\", permission: \"change_note\"}], any: true)\n  resolveNoteFileUploads(data: ResolveNoteAttachmentUploadsInput!): ResolveNoteFileUploadsPayload! @hasPerm(permissions: [{app: \"common\", permission: \"add_attachment\"}], any: true) @permissionedQuerySet(permissions: [{app: \"notes\", permission: \"change_note\"}], any: true)\n  createTask(data: CreateTaskInput!): CreateTaskPayload! @hasPerm(permissions: [{app: \"tasks\", permission: \"add_task\"}], any: true)\n  updateTask(data: UpdateTaskInput!): UpdateTaskPayload! @permissionedQuerySet(permissions: [{app: \"tasks\", permission: \"change_task\"}], any: true)\n  deleteTask(data: DeleteDjangoObjectInput!): DeleteTaskPayload!\n  createTeam(data: CreateTeamInput!): CreateTeamPayload! @hasOrgPerm(permissions: [{app: \"teams\", permission: \"add_team\"}], any: true)\n  updateTeam(data: UpdateTeamInput!): UpdateTeamPayload! @hasOrgPerm(permissions: [{app: \"teams\", permission: \"change_team\"}], any: true)\n  deleteTeam(data: DeleteDjangoObjectInput!): DeleteTeamPayload! @hasOrgPerm(permissions: [{app: \"teams\", permission: \"delete_team\"}], any: true)\n  createShelter(data: CreateShelterInput!): CreateShelterPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"add_shelter\"}], any: true)\n  updateShelter(data: UpdateShelterInput!): UpdateShelterPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"change_shelter\"}], any: true)\n  createRoom(data: CreateRoomInput!): CreateRoomPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"add_room\"}], any: true)\n  updateRoom(id: ID!, data: UpdateRoomInput!): UpdateRoomPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"change_room\"}], any: true)\n  cloneRoom(id: ID!): CloneRoomPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"add_room\"}], any: true)\n  deleteRooms(data: BulkDeleteInput!): DeleteRoomsPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"delete_room\"}], any: true)\n  createBed(data: CreateBedInput!): CreateBedPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"add_bed\"}], any: true)\n  updateBed(id: ID!, data: UpdateBedInput!): UpdateBedPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"change_bed\"}], any: true)\n  cloneBed(id: ID!): CloneBedPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"add_bed\"}], any: true)\n  deleteBeds(data: BulkDeleteInput!): DeleteBedsPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"delete_bed\"}], any: true)\n  createReservation(data: CreateReservationInput!): CreateReservationPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"add_reservation\"}], any: true)\n  updateReservation(id: ID!, data: UpdateReservationInput!): UpdateReservationPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"change_reservation\"}], any: true)\n  deleteReservations(data: BulkDeleteInput!): DeleteReservationsPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"delete_reservation\"}], any: true)\n  generateShelterPhotoUploads(data: GenerateShelterPhotoUploadsInput!): GenerateShelterPhotoUploadsPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"change_shelter\"}], any: true)\n  resolveShelterPhotoUploads(data: ResolveShelterPhotoUploadsInput!): ResolveShelterPhotoUploadsPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"change_shelter\"}], any: true)\n  updateShelterPhoto(data: UpdateShelterPhotoInput!): UpdateShelterPhotoPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"change_shelter\"}], any: true)\n  deleteShelterPhotos(data: BulkDeleteInput!): DeleteShelterPhotosPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"change_shelter\"}], any: true)\n  createReferral(data: CreateReferralInput!): CreateReferralPayload! @hasPerm(permissions: [{app: \"referrals\", permission: \"add_referral\"}], any: true)\n  updateReferral(data: UpdateReferralInput!): UpdateReferralPayload! @permissionedQuerySet(permissions: [{app: \"referrals\", permission: \"change_referral\"}], any: true)\n  deleteReferral(data: DeleteDjangoObjectInput!): DeleteReferralPayload!\n}\n\ntype NameCountType {\n  name: String!\n  count: Int!\n}\n\n\"\"\"\nCoerces blank input to None. Use for optional string fields where blank means 'no value'.\n\"\"\"\nscalar NonBlankString\n\n\"\"\"Rejects blank input. Use for required string fields.\"\"\"\nscalar NonEmptyString\n\ninput NoteAttachmentFromUploadInput {\n  presignedKey: String!\n  uploadToken: String!\n  filename: String!\n  contentType: String!\n}\n\ntype NoteAttachmentType implements AttachmentInterface {\n  id: ID!\n  file: DjangoFileType!\n  attachmentType: AttachmentType!\n  mimeType: String!\n  originalFilename: String\n  createdAt: DateTime!\n  updatedAt: DateTime!\n}\n\ninput NoteAttachmentUploadItemInput {\n  refId: String!\n  filename: String!\n  contentType: String!\n}\n\ntype NoteAttachmentUploadsType {\n  attachments: [NoteAttachmentType!]!\n}\n\ntype NoteDataImportType {\n  id: UUID!\n  importedAt: DateTime!\n  sourceFile: String!\n  notes: String!\n  importedBy: DjangoModelType!\n}\n\ninput NoteFilter {\n  clientProfile: ID\n  createdBy: ID\n  isSubmitted: Boolean\n  AND: NoteFilter\n  OR: NoteFilter\n  NOT: NoteFilter\n  DISTINCT: Boolean\n  authors: [ID!]\n  organizations: [ID!]\n  teamIds: [ID!]\n  search: String\n}\n\ntype NoteImportRecordType {\n  id: ID!\n  sourceId: String!\n  sourceName: String!\n  success: Boolean!\n  errorMessage: String!\n  createdAt: DateTime!\n  note: NoteType\n  rawData: JSON!\n}\n\ninput NoteOrder {\n  id: Ordering\n  interactedAt: Ordering\n}\n\ntype NoteType {\n  id: ID!\n  clientProfile: ClientProfileType\n  createdAt: DateTime!\n  createdBy: UserType\n  interactedAt: DateTime!\n  isSubmitted: Boolean!\n  location: LocationType\n  organization: OrganizationType!\n  providedServices(pagination: OffsetPaginationInput): [ServiceRequestType!]!\n  publicDetails: String!\n  purpose: String\n  requestedServices(pagination: OffsetPaginationInput): [ServiceRequestType!]!\n  tasks(filters: TaskFilter, ordering: [TaskOrder!]! = [], pagination: OffsetPaginationInput): [TaskType!]!\n  team: TeamType\n  currentTeam: TeamType @deprecated(reason: \"Use team instead\")\n  userCanEdit: Boolean!\n  privateDetails: String\n}\n\ntype NoteTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [NoteType!]!\n}\n\ntype OffsetPaginationInfo {\n  offset: Int!\n  limit: Int\n}\n\ninput OffsetPaginationInput {\n  offset: Int! = 0\n  limit: Int\n}\n\ninput OpenNowInput {\n  scheduleType: [ScheduleTypeChoices!] = null\n}\n\ntype OperationInfo {\n  \"\"\"List of messages returned by the operation.\"\"\"\n  messages: [OperationMessage!]!\n}\n\ntype OperationMessage {\n  \"\"\"The kind of this message.\"\"\"\n  kind: OperationMessageKind!\n\n  \"\"\"The error message.\"\"\"\n  message: String!\n\n  \"\"\"\n  The field that caused the error, or `null` if it isn't associated with any particular field.\n  \"\"\"\n  field: String\n\n  \"\"\"The error code, or `null` if no error code was set.\"\"\"\n  code: String\n}\n\nenum OperationMessageKind {\n  INFO\n  WARNING\n  ERROR\n  PERMISSION\n  VALIDATION\n}\n\ntype OperatorShelterType {\n  id: ID!\n  accessibility: [AccessibilityType!]!\n  additionalContacts: [ContactInfoType!]!\n  addNotesSleepingDetails: String\n  addNotesShelterDetails: String\n  bedFees: String\n  city: CityType\n  citiesServed: [CityType!]!\n  cityCouncilDistrict: Int\n  curfew: Time\n  demographics: [DemographicType!]!\n  demographicsOther: String\n  description: String!\n  email: String\n  entryInfo: String\n  entryRequirements: [EntryRequirementType!]!\n  exitPolicy: [ExitPolicyType!]!\n  exitPolicyOther: String\n  emergencySurge: Boolean\n  funders: [FunderType!]!\n  fundersOther: String\n  instagram: String\n  location: ShelterLocationType\n  maxStay: Int\n  name: String!\n  onSiteSecurity: Boolean\n  organization: OrganizationType\n  otherRules: String\n  otherServices: String\n  overallRating: Int\n  parking: [ParkingType!]!\n  pets: [PetType!]!\n  phone: PhoneNumber\n  programFees: String\n  referralRequirement: [ReferralRequirementType!]!\n  roomStyles: [RoomStyleType!]!\n  roomStylesOther: String\n  schedules: [ScheduleType!]!\n  services: [ServiceType!]!\n  shelterPrograms: [ShelterProgramType!]!\n  shelterProgramsOther: String\n  shelterTypes: [ShelterTypeType!]!\n  shelterTypesOther: String\n  spa: SPAType\n  spasServed: [SPAType!]!\n  specialSituationRestrictions: [SpecialSituationRestrictionType!]!\n  photos: [ShelterPhotoType!]!\n  isPrivate: Boolean!\n  status: StatusChoices!\n  storage: [StorageType!]!\n  subjectiveReview: String\n  supervisorialDistrict: Int\n  totalBeds: Int\n  updatedAt: DateTime!\n  vaccinationRequirement: [VaccinationRequirementType!]!\n  visitorsAllowed: Boolean\n  website: String\n  mediaLinks: [MediaLinkType!]!\n  availability: ShelterAvailabilityType\n  HeroPhotos: [ShelterPhotoType!]\n  heroImage(preset: ImagePresetEnum = null, processingOptions: String = null): ShelterHeroImageType\n  distanceInMiles: Float\n  bedCounts: BedCountType!\n  roomCounts: RoomCountType!\n}\n\ntype OperatorShelterTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [OperatorShelterType!]!\n}\n\nenum Ordering {\n  ASC\n  ASC_NULLS_FIRST\n  ASC_NULLS_LAST\n  DESC\n  DESC_NULLS_FIRST\n  DESC_NULLS_LAST\n}\n\ninput OrgInvitationInput {\n  email: String!\n  firstName: String!\n  middleName: String = null\n  lastName: String!\n  organizationId: ID!\n  permissionTemplate: PermissionTemplateEnum!\n}\n\nenum OrgRoleEnum {\n  MEMBER\n  ADMIN\n  SUPERUSER\n}\n\nenum OrgTypeEnum {\n  OUTREACH\n  SHELTER\n}\n\ninput OrganizationFilter {\n  AND: OrganizationFilter\n  OR: OrganizationFilter\n  NOT: OrganizationFilter\n  DISTINCT: Boolean\n  search: String\n}\n\ninput OrganizationMemberFilter {\n  AND: OrganizationMemberFilter\n  OR: OrganizationMemberFilter\n  NOT: OrganizationMemberFilter\n  DISTINCT: Boolean\n  search: String\n}\n\ninput OrganizationMemberOrdering {\n  id: Ordering\n  email: Ordering\n  firstName: Ordering\n  lastLogin: Ordering\n  lastName: Ordering\n  dateJoined: Ordering\n  memberRole: Ordering\n}\n\ntype OrganizationMemberType {\n  firstName: NonBlankString\n  lastName: NonBlankString\n  middleName: NonBlankString\n  email: NonBlankString\n  id: ID!\n  lastLogin: DateTime\n  dateJoined: DateTime!\n  memberRole: OrgRoleEnum!\n  isOrgOwner: Boolean!\n  permissionTemplates: [PermissionTemplateEnum!]!\n}\n\ntype OrganizationMemberTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [OrganizationMemberType!]!\n}\n\ninput OrganizationOrder {\n  name: Ordering\n  id: Ordering\n}\n\ninput OrganizationServiceCategoryOrdering {\n  id: Ordering\n  priority: Ordering\n}\n\ntype OrganizationServiceCategoryType {\n  id: ID!\n  name: String!\n  priority: Int\n  services(ordering: [OrganizationServiceOrdering!]! = [], pagination: OffsetPaginationInput): [OrganizationServiceType!]!\n}\n\ntype OrganizationServiceCategoryTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [OrganizationServiceCategoryType!]!\n}\n\ninput OrganizationServiceOrdering {\n  id: Ordering\n  priority: Ordering\n}\n\ntype OrganizationServiceType {\n  id: ID!\n  category: OrganizationServiceCategoryType\n  priority: Int\n  label: String!\n}\n\ntype OrganizationServiceTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [OrganizationServiceType!]!\n}\n\ntype OrganizationType {\n  id: ID!\n  name: String!\n}\n\ntype OrganizationTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [OrganizationType!]!\n}\n\nenum ParkingChoices {\n  BICYCLE\n  MOTORCYCLE\n  AUTOMOBILE\n  RV\n  STREET\n  NO_PARKING\n}\n\ntype ParkingType {\n  name: ParkingChoices\n}\n\nenum PermissionTemplateEnum {\n  CASEWORKER\n  SHELTER_OPERATOR\n}\n\nenum PetChoices {\n  CATS\n  DOGS_UNDER_25_LBS\n  DOGS_OVER_25_LBS\n  EXOTICS\n  SERVICE_ANIMALS\n  PET_AREA\n  NO_PETS_ALLOWED\n}\n\ntype PetType {\n  name: PetChoices\n}\n\nscalar PhoneNumber\n\ninput PhoneNumberInput {\n  id: ID\n  number: PhoneNumber\n  isPrimary: Boolean = false\n}\n\ntype PhoneNumberType {\n  id: ID!\n  number: PhoneNumber\n  isPrimary: Boolean\n}\n\n\"\"\"Represents a point as `(x, y, z)` or `(x, y)`.\"\"\"\nscalar Point\n\nenum PreferredCommunicationEnum {\n  CALL\n  EMAIL\n  FACEBOOK\n  INSTAGRAM\n  LINKEDIN\n  TEXT\n  WHATSAPP\n}\n\ntype ProgramEnrollmentType {\n  id: String!\n  clientId: String!\n  refClientProgram: String!\n}\n\nenum PronounEnum {\n  HE_HIM_HIS\n  SHE_HER_HERS\n  THEY_THEM_THEIRS\n  OTHER\n}\n\ntype Query {\n  currentUser: CurrentUserType!\n  organizationMember(organizationId: String!, userId: String!): OrganizationMemberType! @hasPerm(permissions: [{app: \"organizations\", permission: \"view_org_members\"}], any: true)\n  organizationMembers(organizationId: String!, ordering: [OrganizationMemberOrdering!] = null, filters: OrganizationMemberFilter = null, orgType: OrgTypeEnum = null, permissionTemplate: PermissionTemplateEnum = null, pagination: OffsetPaginationInput): OrganizationMemberTypeOffsetPaginated! @hasPerm(permissions: [{app: \"organizations\", permission: \"view_org_members\"}], any: true)\n  clientProfiles(pagination: OffsetPaginationInput, filters: ClientProfileFilter, ordering: [ClientProfileOrder!]! = []): ClientProfileTypeOffsetPaginated! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_clientprofile\"}], any: true)\n  clientDocument(pk: ID!): ClientDocumentType! @hasRetvalPerm(permissions: [{app: \"common\", permission: \"view_attachment\"}], any: true)\n  clientContact(pk: ID!): ClientContactType! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_clientcontact\"}], any: true)\n  clientContacts(pagination: OffsetPaginationInput): ClientContactTypeOffsetPaginated! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_clientcontact\"}], any: true)\n  clientHouseholdMember(pk: ID!): ClientHouseholdMemberType! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_clienthouseholdmember\"}], any: true)\n  clientHouseholdMembers(pagination: OffsetPaginationInput): ClientHouseholdMemberTypeOffsetPaginated! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_clienthouseholdmember\"}], any: true)\n  hmisProfile(pk: ID!): HmisProfileType! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_hmisprofile\"}], any: true)\n  hmisProfiles(pagination: OffsetPaginationInput): HmisProfileTypeOffsetPaginated! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_hmisprofile\"}], any: true)\n  socialMediaProfile(pk: ID!): SocialMediaProfileType! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_socialmediaprofile\"}], any: true)\n  socialMediaProfiles(pagination: OffsetPaginationInput): SocialMediaProfileTypeOffsetPaginated! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_socialmediaprofile\"}], any: true)\n  clientProfile(pk: ID!): ClientProfileType! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_clientprofile\"}], any: true)\n  clientDocuments(clientId: String!, filters: ClientDocumentFilter, pagination: OffsetPaginationInput): ClientDocumentTypeOffsetPaginated! @hasRetvalPerm(permissions: [{app: \"common\", permission: \"view_attachment\"}], any: true)\n  bulkClientProfileImportRecords(data: ClientProfileImportRecordsBulkInput!, pagination: OffsetPaginationInput): ClientProfileImportRecordTypeOffsetPaginated! @hasPerm(permissions: [{app: \"clients\", permission: \"view_clientprofileimportrecord\"}], any: true)\n  featureControls: FeatureControlData!\n  hmisClientProfiles(pagination: OffsetPaginationInput, filters: HmisClientProfileFilter, ordering: [HmisClientProfileOrdering!]! = []): HmisClientProfileTypeOffsetPaginated! @hmisDirective @isHmisAuthenticated\n  hmisNotes(pagination: OffsetPaginationInput, filters: HmisNoteFilter, ordering: [HmisNoteOrdering!]! = []): HmisNoteTypeOffsetPaginated! @hmisDirective @isHmisAuthenticated\n  hmisClientProfile(id: ID!): HmisClientProfileType! @hmisDirective @isHmisAuthenticated\n  hmisNote(id: ID!): HmisNoteType! @hmisDirective @isHmisAuthenticated\n  hmisClientPrograms(clientId: ID!): [HmisClientProgramType!]! @hmisDirective @isHmisAuthenticated\n  note(pk: ID!): NoteType! @hasRetvalPerm(permissions: [{app: \"notes\", permission: \"view_note\"}], any: true)\n  notes(pagination: OffsetPaginationInput, filters: NoteFilter, ordering: [NoteOrder!]! = []): NoteTypeOffsetPaginated! @hasRetvalPerm(permissions: [{app: \"notes\", permission: \"view_note\"}], any: true)\n  services(pagination: OffsetPaginationInput, ordering: [OrganizationServiceOrdering!]! = []): OrganizationServiceTypeOffsetPaginated! @hasPerm(permissions: [{app: \"notes\", permission: \"add_note\"}], any: true)\n  serviceCategories(pagination: OffsetPaginationInput, ordering: [OrganizationServiceCategoryOrdering!]! = []): OrganizationServiceCategoryTypeOffsetPaginated! @hasPerm(permissions: [{app: \"notes\", permission: \"add_note\"}], any: true)\n  interactionAuthors(pagination: OffsetPaginationInput, filters: InteractionAuthorFilter, ordering: [InteractionAuthorOrder!]! = []): InteractionAuthorTypeOffsetPaginated! @hasPerm(permissions: [{app: \"notes\", permission: \"add_note\"}], any: true)\n  caseworkerOrganizations(ordering: [OrganizationOrder!] = null, filters: OrganizationFilter = null, pagination: OffsetPaginationInput): OrganizationTypeOffsetPaginated!\n  reportSummary(startDate: Date = null, endDate: Date = null): ReportSummaryType! @hasOrgPerm(permissions: [{app: \"reports\", permission: \"view_reports\"}], any: true)\n  task(pk: ID!): TaskType! @hasRetvalPerm(permissions: [{app: \"tasks\", permission: \"view_task\"}], any: true)\n  tasks(ordering: [TaskOrder!] = null, filters: TaskFilter, pagination: OffsetPaginationInput): TaskTypeOffsetPaginated! @hasRetvalPerm(permissions: [{app: \"tasks\", permission: \"view_task\"}], any: true)\n  teams(filters: TeamFilter = null, pagination: OffsetPaginationInput): TeamTypeOffsetPaginated!\n  operatorShelter(pk: ID!): OperatorShelterType! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_shelter\"}], any: true)\n  operatorShelters(pagination: OffsetPaginationInput, filters: ShelterFilter, ordering: [ShelterOrder!]! = []): OperatorShelterTypeOffsetPaginated! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_shelter\"}], any: true)\n  shelter(pk: ID!): ShelterType!\n  shelters(pagination: OffsetPaginationInput, filters: ShelterFilter, ordering: [ShelterOrder!]! = []): ShelterTypeOffsetPaginated!\n  bed(pk: ID!): BedType! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_bed\"}], any: true)\n  beds(pagination: OffsetPaginationInput, filters: BedFilter, ordering: [BedOrder!]! = []): BedTypeOffsetPaginated! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_bed\"}], any: true)\n  reservation(pk: ID!): ReservationType! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_reservation\"}], any: true)\n  reservations(pagination: OffsetPaginationInput, filters: ReservationFilter, ordering: [ReservationOrder!]! = []): ReservationTypeOffsetPaginated! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_reservation\"}], any: true)\n  room(pk: ID!): RoomType! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_room\"}], any: true)\n  rooms(pagination: OffsetPaginationInput, filters: RoomFilter, ordering: [RoomOrder!]! = []): RoomTypeOffsetPaginated! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_room\"}], any: true)\n  shelterServiceCategories(pagination: OffsetPaginationInput): ServiceCategoryTypeOffsetPaginated!\n  shelterCities(pagination: OffsetPaginationInput): CityTypeOffsetPaginated!\n  shelterSpas(pagination: OffsetPaginationInput): SPATypeOffsetPaginated!\n  shelterMaxStay: Int\n  shelterOccupancyMetrics(shelterId: ID!, startDate: Date = null, endDate: Date = null): ShelterOccupancyMetricsType!\n  referral(pk: ID!): ReferralType! @hasRetvalPerm(permissions: [{app: \"referrals\", permission: \"view_referral\"}], any: true)\n  referrals(filters: ReferralFilter, ordering: [ReferralOrder!]! = [], pagination: OffsetPaginationInput): ReferralTypeOffsetPaginated! @hasRetvalPerm(permissions: [{app: \"referrals\", permission: \"view_referral\"}], any: true)\n}\n\nenum RaceEnum {\n  AMERICAN_INDIAN_ALASKA_NATIVE\n  ASIAN\n  BLACK_AFRICAN_AMERICAN\n  HISPANIC_LATINO\n  NATIVE_HAWAIIAN_PACIFIC_ISLANDER\n  WHITE_CAUCASIAN\n  OTHER\n}\n\ninput ReferralFilter {\n  clientProfile: ID\n  createdBy: ID\n  status: ReferralStatusEnum\n  AND: ReferralFilter\n  OR: ReferralFilter\n  NOT: ReferralFilter\n  DISTINCT: Boolean\n}\n\ninput ReferralOrder {\n  id: Ordering\n  createdAt: Ordering\n  updatedAt: Ordering\n  status: Ordering\n}\n\nenum ReferralRequirementChoices {\n  REFERRAL_MATCHED\n  REFERRAL_NONMATCHED\n  SERVICE_PROVIDER_SUBMISSION\n  SELF_REFERRAL\n  SAME_DAY_INTAKE\n}\n\ntype ReferralRequirementType {\n  name: ReferralRequirementChoices\n}\n\nenum ReferralStatusEnum {\n  PENDING\n  ACCEPTED\n  DECLINED\n}\n\ntype ReferralType {\n  id: ID!\n  clientProfile: ClientProfileType\n  shelter: ShelterType\n  createdAt: DateTime!\n  createdBy: UserType\n  status: ReferralStatusEnum\n  notes: String\n  updatedAt: DateTime!\n}\n\ntype ReferralTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ReferralType!]!\n}\n\nenum RelationshipTypeEnum {\n  CURRENT_CASE_MANAGER\n  PAST_CASE_MANAGER\n  ORGANIZATION\n  AUNT\n  CHILD\n  COUSIN\n  FATHER\n  FRIEND\n  GRANDPARENT\n  MOTHER\n  PET\n  SIBLING\n  UNCLE\n  OTHER\n}\n\ninput RemoveHmisNoteServiceRequestInput {\n  serviceRequestId: ID!\n  hmisNoteId: ID!\n  serviceRequestType: ServiceRequestTypeEnum!\n}\n\nunion RemoveHmisNoteServiceRequestPayload = HmisNoteType | OperationInfo\n\ninput RemoveOrganizationMemberInput {\n  id: ID!\n  organizationId: ID!\n}\n\nunion RemoveOrganizationMemberPayload = DeletedObjectType | OperationInfo\n\ntype ReportSummaryType {\n  totalNotes: Int!\n  uniqueClients: Int!\n  startDate: String!\n  endDate: String!\n  notesByDate: [DateCountType!]!\n  notesByTeam: [NameCountType!]!\n  notesByPurpose: [NameCountType!]!\n  uniqueClientsByDate: [DateCountType!]!\n  topProvidedServices: [NameCountType!]!\n  topRequestedServices: [NameCountType!]!\n}\n\ntype ReservationClientAssignmentType {\n  id: ID!\n  clientProfile: ClientProfileType!\n  isPrimary: Boolean!\n}\n\ninput ReservationClientInput {\n  clientProfileId: ID!\n  isPrimary: Boolean! = false\n}\n\ninput ReservationFilter {\n  id: ID\n  roomId: ID\n  bedId: ID\n  AND: ReservationFilter\n  OR: ReservationFilter\n  NOT: ReservationFilter\n  DISTINCT: Boolean\n  status: [ReservationStatusChoices!]\n  shelterId: ID\n}\n\ntype ReservationMetricsType {\n  checkInOverdue: Int!\n  cancelled: Int!\n  checkedIn: Int!\n  checkInOverdueToCheckedIn: Int!\n}\n\ninput ReservationOrder {\n  startDate: Ordering\n  checkedInAt: Ordering\n  checkedOutAt: Ordering\n  createdAt: Ordering\n  updatedAt: Ordering\n}\n\nenum ReservationStatusChoices {\n  CONFIRMED\n  CHECKED_IN\n  COMPLETED\n  CANCELLED\n  CHECK_IN_OVERDUE\n}\n\ntype ReservationType {\n  id: ID!\n  bed: BedType\n  checkedInAt: DateTime\n  checkedOutAt: DateTime\n  duration: Int\n  notes: String\n  room: RoomType\n  startDate: Date\n  status: ReservationStatusChoices!\n  clients: [ReservationClientAssignmentType!]!\n  shelter: OperatorShelterType!\n  createdById: ID\n}\n\ntype ReservationTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ReservationType!]!\n}\n\ninput ResolveClientDocumentUploadsInput {\n  clientProfileId: ID!\n  documents: [ClientDocumentFromUploadsInput!]!\n}\n\nunion ResolveClientDocumentUploadsPayload = ClientDocumentUploadsType | OperationInfo\n\ninput ResolveClientProfilePhotoUploadInput {\n  clientProfileId: ID!\n  presignedKey: String!\n  uploadToken: String!\n}\n\nunion ResolveClientProfilePhotoUploadPayload = ClientProfileType | OperationInfo\n\ninput ResolveNoteAttachmentUploadsInput {\n  noteId: ID!\n  attachments: [NoteAttachmentFromUploadInput!]!\n}\n\nunion ResolveNoteFileUploadsPayload = NoteAttachmentUploadsType | OperationInfo\n\ninput ResolveShelterPhotoUploadsInput {\n  shelterId: ID!\n  photos: [ShelterPhotoFromUploadInput!]!\n}\n\nunion ResolveShelterPhotoUploadsPayload = ShelterPhotoUploadsType | OperationInfo\n\ninput RevertNoteInput {\n  id: ID!\n  revertBeforeTimestamp: DateTime!\n}\n\nunion RevertNotePayload = NoteType | OperationInfo\n\ntype RoomCountType {\n  available: Int!\n  inTurnaround: Int!\n  occupied: Int!\n  outOfService: Int!\n  reserved: Int!\n  total: Int!\n}\n\ninput RoomFilter {\n  id: ID\n  medicalRespite: Boolean\n  shelterId: ID\n  AND: RoomFilter\n  OR: RoomFilter\n  NOT: RoomFilter\n  DISTINCT: Boolean\n  amenities: String\n  type: [RoomStyleChoices!]\n  numberOfBeds: Int\n  status: [RoomStatusChoices!]\n}\n\ninput RoomOrder {\n  name: Ordering\n  createdAt: Ordering\n  updatedAt: Ordering\n}\n\nenum RoomStatusChoices {\n  AVAILABLE\n  IN_TURNAROUND\n  OCCUPIED\n  OUT_OF_SERVICE\n  RESERVED\n}\n\nenum RoomStyleChoices {\n  CONGREGATE\n  CUBICLE_LOW_WALLS\n  CUBICLE_HIGH_WALLS\n  HIGH_BUNK\n  LOW_BUNK\n  SHARED_ROOMS\n  SINGLE_ROOM\n  MOTEL_ROOM\n  OTHER\n}\n\ntype RoomStyleType {\n  name: RoomStyleChoices\n}\n\ntype RoomType {\n  id: ID!\n  accessibility: [AccessibilityType!]!\n  amenities: String\n  beds(filters: BedFilter, ordering: [BedOrder!]! = []): [BedType!]!\n  demographics: [DemographicType!]!\n  funders: [FunderType!]!\n  lastCleaned: DateTime\n  lastCleanedInspected: DateTime\n  maintenanceFlag: Boolean!\n  medicalRespite: Boolean!\n  name: String!\n  notes: String\n  pets: [PetType!]!\n  shelter: OperatorShelterType!\n  storage: Boolean!\n  type: RoomStyleChoices\n  typeOther: String\n  status: RoomStatusChoices!\n}\n\ntype RoomTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [RoomType!]!\n}\n\ntype SPAType {\n  id: ID!\n  shortName: String\n  name: String!\n}\n\ntype SPATypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [SPAType!]!\n}\n\ntype SampleType {\n  name: String!\n  isActive: Boolean!\n  lastModified: DateTime\n}\n\ninput ScheduleInput {\n  scheduleType: ScheduleTypeChoices! = OPERATING\n  days: [DayOfWeekChoices!] = null\n  startTime: Time = null\n  endTime: Time = null\n  startDate: Date = null\n  endDate: Date = null\n  condition: ConditionChoices = null\n  isException: Boolean! = false\n}\n\ntype ScheduleType {\n  id: ID!\n  scheduleType: ScheduleTypeChoices!\n  day: DayOfWeekChoices\n  startTime: Time\n  endTime: Time\n  startDate: Date\n  endDate: Date\n  condition: ConditionChoices\n  demographic: DemographicType\n  isException: Boolean!\n}\n\nenum ScheduleTypeChoices {\n  OPERATING\n  INTAKE\n  MEAL_SERVICE\n  STAFF_AVAILABILITY\n}\n\ntype ServiceCategoryType {\n  id: ID!\n  name: String!\n  displayName: String!\n  priority: Int!\n  services: [ServiceType!]!\n}\n\ntype ServiceCategoryTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ServiceCategoryType!]!\n}\n\ninput ServiceInput {\n  id: ID = null\n  categoryId: ID = null\n  displayName: String = null\n}\n\nenum ServiceRequestStatusEnum {\n  COMPLETED\n  TO_DO\n}\n\ntype ServiceRequestType {\n  id: ID!\n  service: OrganizationServiceType\n  status: ServiceRequestStatusEnum!\n  dueBy: DateTime\n  completedOn: DateTime\n  clientProfile: ClientProfileType\n  createdBy: UserType!\n  createdAt: DateTime!\n}\n\nenum ServiceRequestTypeEnum {\n  PROVIDED\n  REQUESTED\n}\n\ntype ServiceType {\n  id: ID!\n  category: ServiceCategoryType!\n  name: String!\n  displayName: String!\n  isOther: Boolean!\n  priority: Int!\n}\n\ntype ShelterAvailabilityType {\n  id: ID!\n  nonRestrictedBeds: Int!\n  restrictedBeds: Int!\n  restrictionNotes: String!\n  updatedAt: DateTime!\n}\n\nenum ShelterChoices {\n  ACCESS_CENTER\n  BUILDING\n  CHURCH\n  HOTEL_MOTEL\n  SAFE_PARKING\n  SINGLE_FAMILY_HOUSE\n  TINY_HOMES\n  OTHER\n}\n\ninput ShelterFilter {\n  isPrivate: Boolean\n  AND: ShelterFilter\n  OR: ShelterFilter\n  NOT: ShelterFilter\n  DISTINCT: Boolean\n  isAccessCenter: Boolean\n  maxStay: MaxStayInput\n  name: String\n  organizations: [ID!]\n  properties: ShelterPropertyInput\n  openNowFor: [ScheduleTypeChoices!] @deprecated(reason: \"Use openNow instead\")\n  openNow: OpenNowInput\n  mapBounds: MapBoundsInput\n  geolocation: GeolocationInput\n  hasAvailableBeds: Boolean\n  spa: [ID!]\n}\n\ntype ShelterHeroImageType {\n  id: ID!\n  url: String!\n}\n\ninput ShelterLocationInput {\n  place: String!\n  latitude: Float = null\n  longitude: Float = null\n}\n\ntype ShelterLocationType {\n  place: String!\n  latitude: Float!\n  longitude: Float!\n}\n\ntype ShelterOccupancyMetricsType {\n  shelterId: ID!\n  startDate: Date!\n  endDate: Date!\n  dailyOccupancy: [DailyOccupancyMetricsType!]!\n  dailyBedStatus: [DailyBedStatusMetricsType!]!\n  reservationMetrics: ReservationMetricsType!\n  avgDaysToOccupancy: Float\n}\n\ninput ShelterOrder {\n  name: Ordering\n  createdAt: Ordering\n}\n\ninput ShelterPhotoFromUploadInput {\n  presignedKey: String!\n  uploadToken: String!\n  filename: String!\n  contentType: String!\n  photoType: ShelterPhotoTypeChoices!\n}\n\ntype ShelterPhotoType {\n  id: ID!\n  type: ShelterPhotoTypeChoices!\n  createdAt: DateTime!\n  file: DjangoImageType!\n}\n\nenum ShelterPhotoTypeChoices {\n  INTERIOR\n  EXTERIOR\n}\n\ninput ShelterPhotoUploadItemInput {\n  refId: String!\n  filename: String!\n  contentType: String!\n}\n\ntype ShelterPhotoUploadsType {\n  photos: [ShelterPhotoType!]!\n}\n\nenum ShelterProgramChoices {\n  BRIDGE_HOME\n  CRISIS_HOUSING\n  EMERGENCY_SHELTER\n  FAITH_BASED\n  INTERIM_HOUSING\n  PERMANENT_HOUSING\n  PROJECT_HOME_KEY\n  RAPID_REHOUSING\n  RECUPERATIVE_CARE\n  ROADMAP_HOME\n  SAFE_PARK_LA\n  SOBER_LIVING\n  TINY_HOME_VILLAGE\n  TRANSITIONAL_HOUSING\n  WINTER_SHELTER\n  OTHER\n}\n\ntype ShelterProgramType {\n  name: ShelterProgramChoices\n}\n\ninput ShelterPropertyInput {\n  pets: [PetChoices!] = null\n  petsIncludeNull: Boolean = false\n  demographics: [DemographicChoices!] = null\n  demographicsIncludeNull: Boolean = false\n  entryRequirements: [EntryRequirementChoices!] = null\n  entryRequirementsIncludeNull: Boolean = false\n  referralRequirement: [ReferralRequirementChoices!] = null\n  referralRequirementIncludeNull: Boolean = false\n  specialSituationRestrictions: [SpecialSituationRestrictionChoices!] = null\n  specialSituationRestrictionsIncludeNull: Boolean = false\n  shelterTypes: [ShelterChoices!] = null\n  shelterTypesIncludeNull: Boolean = false\n  roomStyles: [RoomStyleChoices!] = null\n  roomStylesIncludeNull: Boolean = false\n  parking: [ParkingChoices!] = null\n  parkingIncludeNull: Boolean = false\n}\n\ntype ShelterType {\n  id: ID!\n  accessibility: [AccessibilityType!]!\n  additionalContacts: [ContactInfoType!]!\n  addNotesSleepingDetails: String\n  addNotesShelterDetails: String\n  bedFees: String\n  city: CityType\n  citiesServed: [CityType!]!\n  cityCouncilDistrict: Int\n  curfew: Time\n  demographics: [DemographicType!]!\n  demographicsOther: String\n  description: String!\n  email: String\n  entryInfo: String\n  entryRequirements: [EntryRequirementType!]!\n  exitPolicy: [ExitPolicyType!]!\n  exitPolicyOther: String\n  emergencySurge: Boolean\n  funders: [FunderType!]!\n  fundersOther: String\n  instagram: String\n  location: ShelterLocationType\n  maxStay: Int\n  name: String!\n  onSiteSecurity: Boolean\n  organization: OrganizationType\n  otherRules: String\n  otherServices: String\n  overallRating: Int\n  parking: [ParkingType!]!\n  pets: [PetType!]!\n  phone: PhoneNumber\n  programFees: String\n  referralRequirement: [ReferralRequirementType!]!\n  roomStyles: [RoomStyleType!]!\n  roomStylesOther: String\n  schedules: [ScheduleType!]!\n  services: [ServiceType!]!\n  shelterPrograms: [ShelterProgramType!]!\n  shelterProgramsOther: String\n  shelterTypes: [ShelterTypeType!]!\n  shelterTypesOther: String\n  spa: SPAType\n  spasServed: [SPAType!]!\n  specialSituationRestrictions: [SpecialSituationRestrictionType!]!\n  photos: [ShelterPhotoType!]!\n  isPrivate: Boolean!\n  status: StatusChoices!\n  storage: [StorageType!]!\n  subjectiveReview: String\n  supervisorialDistrict: Int\n  totalBeds: Int\n  updatedAt: DateTime!\n  vaccinationRequirement: [VaccinationRequirementType!]!\n  visitorsAllowed: Boolean\n  website: String\n  mediaLinks: [MediaLinkType!]!\n  availability: ShelterAvailabilityType\n  HeroPhotos: [ShelterPhotoType!]\n  heroImage(preset: ImagePresetEnum = null, processingOptions: String = null): ShelterHeroImageType\n  distanceInMiles: Float\n  bedCounts: BedCountType!\n  roomCounts: RoomCountType!\n}\n\ntype ShelterTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ShelterType!]!\n}\n\ntype ShelterTypeType {\n  name: ShelterChoices\n}\n\nenum SocialMediaEnum {\n  FACEBOOK\n  INSTAGRAM\n  LINKEDIN\n  SNAPCHAT\n  TIKTOK\n  TWITTER\n  WHATSAPP\n}\n\ninput SocialMediaProfileInput {\n  id: ID\n  clientProfile: ID\n  platform: SocialMediaEnum\n  platformUserId: NonBlankString\n}\n\ntype SocialMediaProfileType {\n  id: ID\n  clientProfile: DjangoModelType!\n  platform: SocialMediaEnum!\n  platformUserId: NonBlankString!\n}\n\ntype SocialMediaProfileTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [SocialMediaProfileType!]!\n}\n\nenum SpecialSituationRestrictionChoices {\n  NONE\n  DOMESTIC_VIOLENCE\n  HIV_AIDS\n  HUMAN_TRAFFICKING\n  JUSTICE_SYSTEMS\n  VETERANS\n  HARM_REDUCTION\n}\n\ntype SpecialSituationRestrictionType {\n  name: SpecialSituationRestrictionChoices\n}\n\nenum StatusChoices {\n  DRAFT\n  PENDING\n  APPROVED\n  INACTIVE\n}\n\nenum StorageChoices {\n  UNIT_STORAGE\n  AMNESTY_LOCKERS\n  STANDARD_LOCKERS\n  SHARED_STORAGE\n  PERSONAL_BIN\n  NO_STORAGE\n}\n\ntype StorageType {\n  name: StorageChoices\n}\n\ntype SwitchType {\n  name: String!\n  isActive: Boolean!\n  lastModified: DateTime\n}\n\ninput TaskFilter {\n  clientProfile: ID\n  hmisClientProfile: ID\n  note: IDFilterLookup\n  hmisNote: IDFilterLookup\n  createdBy: ID\n  AND: TaskFilter\n  OR: TaskFilter\n  NOT: TaskFilter\n  DISTINCT: Boolean\n  clientProfiles: [ID!]\n  hmisClientProfiles: [ID!]\n  authors: [ID!]\n  organizations: [ID!]\n  status: [TaskStatusEnum!]\n  teamIds: [ID!]\n  search: String\n  clientProfileLookup: IDFilterLookup\n  hmisClientProfileLookup: IDFilterLookup\n}\n\ninput TaskOrder {\n  id: Ordering\n  createdAt: Ordering\n  updatedAt: Ordering\n  status: Ordering\n}\n\nenum TaskStatusEnum {\n  TO_DO\n  IN_PROGRESS\n  COMPLETED\n}\n\ntype TaskType {\n  id: ID!\n  hmisClientProfile: HmisClientProfileType\n  clientProfile: ClientProfileType\n  createdAt: DateTime!\n  createdBy: UserType!\n  description: String\n  note: DjangoModelType\n  hmisNote: DjangoModelType\n  organization: OrganizationType\n  status: TaskStatusEnum\n  summary: String\n  team: TeamType\n  currentTeam: TeamType @deprecated(reason: \"Use team instead\")\n  updatedAt: DateTime!\n}\n\ntype TaskTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [TaskType!]!\n}\n\ninput TeamFilter {\n  isActive: Boolean\n  AND: TeamFilter\n  OR: TeamFilter\n  NOT: TeamFilter\n  DISTINCT: Boolean\n}\n\ntype TeamType {\n  id: ID!\n  name: String!\n  isActive: Boolean\n  createdAt: DateTime!\n  slug: String @deprecated(reason: \"Always null. Team.name is the only identifier.\")\n}\n\ntype TeamTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [TeamType!]!\n}\n\n\"\"\"Time (isoformat)\"\"\"\nscalar Time\n\nscalar UUID\n\ninput UpdateBedInput {\n  roomId: ID\n  accessibility: [AccessibilityChoices!]\n  b7: Boolean\n  demographics: [DemographicChoices!]\n  fees: Int\n  funders: [FunderChoices!]\n  lastCleaned: DateTime\n  lastCleanedInspected: DateTime\n  maintenanceFlag: Boolean\n  medicalNeeds: [MedicalNeedChoices!]\n  name: String\n  pets: [PetChoices!]\n  statusNotes: String\n  storage: Boolean\n  type: BedTypeChoices\n}\n\nunion UpdateBedPayload = BedType | OperationInfo\n\nunion UpdateClientContactPayload = ClientContactType | OperationInfo\n\ninput UpdateClientDocumentInput {\n  id: ID!\n  originalFilename: String\n}\n\nunion UpdateClientDocumentPayload = ClientDocumentType | OperationInfo\n\nunion UpdateClientHouseholdMemberPayload = ClientHouseholdMemberType | OperationInfo\n\ninput UpdateClientProfileInput {\n  adaAccommodation: [AdaAccommodationEnum!]\n  address: String\n  age: Int\n  californiaId: String\n  dateOfBirth: Date\n  email: NonBlankString\n  eyeColor: EyeColorEnum\n  firstName: NonBlankString\n  gender: GenderEnum\n  genderOther: String\n  hairColor: HairColorEnum\n  heightInInches: Float\n  importantNotes: String\n  lastName: NonBlankString\n  livingSituation: LivingSituationEnum\n  mailingAddress: String\n  maritalStatus: MaritalStatusEnum\n  middleName: NonBlankString\n  nickname: NonBlankString\n  phoneNumber: PhoneNumber\n  physicalDescription: String\n  placeOfBirth: String\n  preferredCommunication: [PreferredCommunicationEnum!]\n  preferredLanguage: LanguageEnum\n  profilePhoto: Upload\n  pronouns: PronounEnum\n  pronounsOther: String\n  race: RaceEnum\n  residenceAddress: String\n  residenceGeolocation: Point\n  spokenLanguages: [LanguageEnum!]\n  unhousedStartDate: Date\n  veteranStatus: VeteranStatusEnum\n  id: ID!\n  contacts: [ClientContactInput!]\n  hmisProfiles: [HmisProfileInput!]\n  householdMembers: [ClientHouseholdMemberInput!]\n  phoneNumbers: [PhoneNumberInput!]\n  socialMediaProfiles: [SocialMediaProfileInput!]\n}\n\nunion UpdateClientProfilePayload = ClientProfileType | OperationInfo\n\nunion UpdateClientProfilePhotoPayload = ClientProfileType | OperationInfo\n\nunion UpdateCurrentUserPayload = UserType | CurrentUserType | OperationInfo\n\ninput UpdateHmisClientProfileInput {\n  alias: String\n  birthDate: Date\n  dobQuality: HmisDobQualityEnum\n  firstName: NonBlankString\n  lastName: NonBlankString\n  nameQuality: HmisNameQualityEnum\n  ssn1: String\n  ssn2: String\n  ssn3: String\n  ssnQuality: HmisSsnQualityEnum\n  gender: [HmisGenderEnum!]!\n  genderIdentityText: String\n  nameMiddle: NonBlankString\n  nameSuffix: HmisSuffixEnum\n  raceEthnicity: [HmisRaceEnum!]!\n  additionalRaceEthnicityDetail: String\n  veteran: HmisVeteranStatusEnum\n  adaAccommodation: [AdaAccommodationEnum!]\n  address: String\n  californiaId: String\n  email: NonBlankString\n  eyeColor: EyeColorEnum\n  hairColor: HairColorEnum\n  heightInInches: Float\n  importantNotes: String\n  livingSituation: LivingSituationEnum\n  mailingAddress: String\n  maritalStatus: MaritalStatusEnum\n  physicalDescription: String\n  placeOfBirth: String\n  preferredCommunication: [PreferredCommunicationEnum!]\n  preferredLanguage: LanguageEnum\n  profilePhoto: Upload\n  pronouns: PronounEnum\n  pronounsOther: String\n  residenceAddress: String\n  residenceGeolocation: Point\n  spokenLanguages: [LanguageEnum!]\n  unhousedStartDate: Date\n  id: ID!\n  phoneNumbers: [PhoneNumberInput!]\n}\n\nunion UpdateHmisClientProfilePayload = HmisClientProfileType | OperationInfo\n\ninput UpdateHmisNoteInput {\n  id: ID!\n  title: String\n  note: String\n  date: Date\n  refClientProgram: String\n}\n\ninput UpdateHmisNoteLocationInput {\n  id: ID!\n  location: LocationInput!\n}\n\nunion UpdateHmisNoteLocationPayload = HmisNoteType | OperationInfo\n\nunion UpdateHmisNotePayload = HmisNoteType | OperationInfo\n\nunion UpdateHmisProfilePayload = HmisProfileType | OperationInfo\n\ninput UpdateNoteInput {\n  id: ID!\n  purpose: NonBlankString\n  teamId: ID\n  publicDetails: String\n  privateDetails: String\n  isSubmitted: Boolean\n  interactedAt: DateTime\n  location: LocationInput\n  providedServices: [CreateNoteServiceInput!]\n  requestedServices: [CreateNoteServiceInput!]\n  tasks: [CreateNoteTaskInput!]\n}\n\ninput UpdateNoteLocationInput {\n  id: ID!\n  location: LocationInput!\n}\n\nunion UpdateNoteLocationPayload = NoteType | OperationInfo\n\nunion UpdateNotePayload = NoteType | OperationInfo\n\ninput UpdateReferralInput {\n  id: ID!\n  status: ReferralStatusEnum\n  notes: String\n}\n\nunion UpdateReferralPayload = ReferralType | OperationInfo\n\ninput UpdateReservationInput {\n  roomId: ID\n  bedId: ID\n  checkedInAt: DateTime\n  checkedOutAt: DateTime\n  clients: [ReservationClientInput!]\n  duration: Int\n  notes: String\n  startDate: Date\n  status: ReservationStatusChoices\n}\n\nunion UpdateReservationPayload = ReservationType | OperationInfo\n\ninput UpdateRoomInput {\n  accessibility: [AccessibilityChoices!]\n  amenities: String\n  demographics: [DemographicChoices!]\n  funders: [FunderChoices!]\n  lastCleaned: DateTime\n  lastCleanedInspected: DateTime\n  maintenanceFlag: Boolean\n  medicalRespite: Boolean\n  name: String\n  notes: String\n  pets: [PetChoices!]\n  storage: Boolean\n  type: RoomStyleChoices\n  typeOther: String\n}\n\nunion UpdateRoomPayload = RoomType | OperationInfo\n\ninput UpdateShelterInput {\n  id: ID!\n  name: String\n  status: StatusChoices\n  description: String\n  email: String\n  website: String\n  isPrivate: Boolean\n  heroImageId: ID\n  cityId: ID\n  spaId: ID\n  citiesServedIds: [ID!]\n  spasServedIds: [ID!]\n  phone: PhoneNumber\n  addNotesSleepingDetails: String\n  addNotesShelterDetails: String\n  maxStay: Int\n  onSiteSecurity: Boolean\n  visitorsAllowed: Boolean\n  exitPolicyOther: String\n  emergencySurge: Boolean\n  otherRules: String\n  otherServices: String\n  entryInfo: String\n  subjectiveReview: String\n  demographicsOther: String\n  shelterTypesOther: String\n  cityCouncilDistrict: Int\n  supervisorialDistrict: Int\n  fundersOther: String\n  accessibility: [AccessibilityChoices!]\n  demographics: [DemographicChoices!]\n  specialSituationRestrictions: [SpecialSituationRestrictionChoices!]\n  shelterTypes: [ShelterChoices!]\n  roomStyles: [RoomStyleChoices!]\n  storage: [StorageChoices!]\n  pets: [PetChoices!]\n  parking: [ParkingChoices!]\n  entryRequirements: [EntryRequirementChoices!]\n  referralRequirement: [ReferralRequirementChoices!]\n  vaccinationRequirement: [VaccinationRequirementChoices!]\n  exitPolicy: [ExitPolicyChoices!]\n  shelterPrograms: [ShelterProgramChoices!]\n  funders: [FunderChoices!]\n  location: ShelterLocationInput\n  schedules: [ScheduleInput!]\n  services: [ServiceInput!]\n}\n\nunion UpdateShelterPayload = ShelterType | OperationInfo\n\ninput UpdateShelterPhotoInput {\n  id: ID!\n  photoType: ShelterPhotoTypeChoices!\n}\n\nunion UpdateShelterPhotoPayload = ShelterPhotoType | OperationInfo\n\nunion UpdateSocialMediaProfilePayload = SocialMediaProfileType | OperationInfo\n\ninput UpdateTaskInput {\n  id: ID!\n  description: String\n  summary: String\n  teamId: ID\n  status: TaskStatusEnum\n}\n\nunion UpdateTaskPayload = TaskType | OperationInfo\n\ninput UpdateTeamInput {\n  id: ID!\n  name: String\n  isActive: Boolean\n}\n\nunion UpdateTeamPayload = TeamType | OperationInfo\n\ninput UpdateUserInput {\n  firstName: NonBlankString\n  lastName: NonBlankString\n  middleName: NonBlankString\n  email: NonBlankString\n  id: ID!\n  hasAcceptedTos: Boolean\n  hasAcceptedPrivacyPolicy: Boolean\n}\n\ninput UpdateUserProfileInput {\n  firstName: NonEmptyString\n  lastName: NonEmptyString\n}\n\nunion UpdateUserProfilePayload = CurrentUserType | OperationInfo\n\n\"\"\"Represents a file upload.\"\"\"\nscalar Upload\n\ntype UserType {\n  firstName: NonBlankString\n  lastName: NonBlankString\n  middleName: NonBlankString\n  email: NonBlankString\n  id: ID!\n  organizationsOrganization(filters: OrganizationFilter, ordering: [OrganizationOrder!]! = []): [OrganizationType!]\n  hasAcceptedTos: Boolean\n  hasAcceptedPrivacyPolicy: Boolean\n  username: String\n  isHmisUser: Boolean\n  isOutreachAuthorized: Boolean @deprecated(reason: \"Use userPermissions check instead.\")\n}\n\nenum VaccinationRequirementChoices {\n  TB\n  FLU\n  COVID_19\n}\n\ntype VaccinationRequirementType {\n  name: VaccinationRequirementChoices!\n}\n\nenum VeteranStatusEnum {\n  YES\n  NO\n  PREFER_NOT_TO_SAY\n  OTHER_THAN_HONORABLE\n}\n\n\"\"\"Permission definition for schema directives.\"\"\"\ninput PermDefinition {\n  \"\"\"\n  The app to which we are requiring permission. If this is empty that means that we are checking the permission directly.\n  \"\"\"\n  app: String\n\n  \"\"\"\n  The permission itself. If this is empty that means that we are checking for any permission for the given app.\n  \"\"\"\n  permission: String\n}\n";
\ No newline at end of file
+export const schema = "\"\"\"\nRequires the user to have the specified permission(s) in the organization set via X-Organization-ID header.\n\"\"\"\ndirective @hasOrgPerm(permissions: [PermDefinition!]!, any: Boolean! = true) repeatable on FIELD_DEFINITION\n\n\"\"\"\nWill check if the user has any/all permissions for the resolved value of this field before returning it.\n\nWhen the condition fails, the following can be returned (following this priority):\n1) `OperationInfo`/`OperationMessage` if those types are allowed at the return type\n2) `null` in case the field is not mandatory (e.g. `String` or `[String]`)\n3) An empty list in case the field is a list (e.g. `[String]!`)\n4) An empty `Connection` in case the return type is a relay connection\n2) Otherwise, an error will be raised\n\"\"\"\ndirective @hasRetvalPerm(permissions: [PermDefinition!]!, any: Boolean! = true) repeatable on FIELD_DEFINITION\n\n\"\"\"\nWill check if the user has any/all permissions for the resolved value of this field before returning it.\n\nWhen the condition fails, the following can be returned (following this priority):\n1) `OperationInfo`/`OperationMessage` if those types are allowed at the return type\n2) `null` in case the field is not mandatory (e.g. `String` or `[String]`)\n3) An empty list in case the field is a list (e.g. `[String]!`)\n4) An empty `Connection` in case the return type is a relay connection\n2) Otherwise, an error will be raised\n\"\"\"\ndirective @permissionedQuerySet(permissions: [PermDefinition!]!, any: Boolean! = true) repeatable on FIELD_DEFINITION\n\n\"\"\"\nWill check if the user has any/all permissions to resolve this.\n\nWhen the condition fails, the following can be returned (following this priority):\n1) `OperationInfo`/`OperationMessage` if those types are allowed at the return type\n2) `null` in case the field is not mandatory (e.g. `String` or `[String]`)\n3) An empty list in case the field is a list (e.g. `[String]!`)\n4) An empty `Connection` in case the return type is a relay connection\n2) Otherwise, an error will be raised\n\"\"\"\ndirective @hasPerm(permissions: [PermDefinition!]!, any: Boolean! = true) repeatable on FIELD_DEFINITION\n\ndirective @hmisDirective on FIELD_DEFINITION\n\ndirective @isHmisAuthenticated on FIELD_DEFINITION\n\nenum AccessibilityChoices {\n  MEDICAL_EQUIPMENT_PERMITTED\n  WHEELCHAIR_ACCESSIBLE\n  ADA_ROOMS\n}\n\ntype AccessibilityType {\n  name: AccessibilityChoices\n}\n\nenum AdaAccommodationEnum {\n  HEARING\n  MOBILITY\n  VISUAL\n  OTHER\n}\n\nunion AddOrganizationMemberPayload = OrganizationMemberType | OperationInfo\n\ninput AddressInput {\n  addressComponents: JSON = null\n  formattedAddress: String = null\n}\n\ntype AddressType {\n  id: ID!\n  street: String\n  city: String\n  state: String\n  zipCode: String\n}\n\ninterface AttachmentInterface {\n  id: ID!\n  file: DjangoFileType!\n  attachmentType: AttachmentType!\n  mimeType: String!\n  originalFilename: String\n  createdAt: DateTime!\n  updatedAt: DateTime!\n}\n\nenum AttachmentType {\n  IMAGE\n  DOCUMENT\n  AUDIO\n  VIDEO\n  UNKNOWN\n}\n\ntype AuthResponse {\n  status_code: String!\n}\n\ntype AuthorizedPresignedS3UploadType {\n  refId: String!\n  url: String!\n  fields: JSON!\n  presignedKey: String!\n  uploadToken: String!\n}\n\ntype AuthorizedPresignedS3UploadsType {\n  uploads: [AuthorizedPresignedS3UploadType!]!\n}\n\ntype BedCountType {\n  available: Int!\n  inTurnaround: Int!\n  occupied: Int!\n  outOfService: Int!\n  reserved: Int!\n  total: Int!\n}\n\ninput BedFilter {\n  id: ID\n  maintenanceFlag: Boolean\n  shelterId: ID\n  AND: BedFilter\n  OR: BedFilter\n  NOT: BedFilter\n  DISTINCT: Boolean\n  type: [BedTypeChoices!]\n  medicalNeeds: [MedicalNeedChoices!]\n  status: [BedStatusChoices!]\n}\n\ninput BedOrder {\n  name: Ordering\n  createdAt: Ordering\n  updatedAt: Ordering\n}\n\nenum BedStatusChoices {\n  AVAILABLE\n  IN_TURNAROUND\n  OCCUPIED\n  OUT_OF_SERVICE\n  RESERVED\n}\n\ntype BedType {\n  id: ID!\n  accessibility: [AccessibilityType!]!\n  b7: Boolean!\n  demographics: [DemographicType!]!\n  fees: Int\n  funders: [FunderType!]!\n  lastCleanedInspected: DateTime\n  lastCleaned: DateTime\n  maintenanceFlag: Boolean!\n  medicalNeeds: [MedicalNeedType!]!\n  name: String\n  pets: [PetType!]!\n  room: RoomType\n  shelter: OperatorShelterType!\n  statusNotes: String\n  storage: Boolean!\n  type: BedTypeChoices\n  status: BedStatusChoices!\n}\n\nenum BedTypeChoices {\n  TWIN\n  BUNK\n  ROLLAWAY\n  OTHER\n}\n\ntype BedTypeKeysetPaginated {\n  pageInfo: KeysetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [BedType!]!\n}\n\ntype BedTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [BedType!]!\n}\n\ninput BulkDeleteInput {\n  ids: [ID!]!\n}\n\ntype BulkDeleteResult {\n  ids: [ID!]!\n}\n\ninput BulkImportClientProfilesInput {\n  importJobId: UUID!\n  records: [ImportClientProfileRecordInput!]!\n}\n\nunion BulkImportClientProfilesPayload = ClientProfileImportRecordsType | OperationInfo\n\ninput BulkImportNoteDataInput {\n  purpose: String\n  teamId: ID\n  publicDetails: String\n  privateDetails: String\n  clientProfile: ID\n  isSubmitted: Boolean\n  interactedAt: DateTime\n  providedServices: [CreateNoteServiceInput!] = null\n  requestedServices: [CreateNoteServiceInput!] = null\n}\n\ninput BulkImportNotesInput {\n  importJobId: UUID!\n  records: [ImportNoteRecordInput!]!\n}\n\nunion BulkImportNotesPayload = NoteImportRecordsType | OperationInfo\n\ninput ChangeOrganizationMemberRoleInput {\n  userId: ID!\n  organizationId: ID!\n  permissionTemplate: PermissionTemplateEnum!\n}\n\nunion ChangeOrganizationMemberRolePayload = OrganizationMemberType | OperationInfo\n\ntype CityType {\n  id: ID!\n  name: String!\n}\n\ntype CityTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [CityType!]!\n}\n\ninput ClientContactInput {\n  name: String\n  email: String\n  mailingAddress: String\n  phoneNumber: PhoneNumber\n  relationshipToClient: RelationshipTypeEnum\n  relationshipToClientOther: String\n  id: ID\n  clientProfile: ID\n}\n\ntype ClientContactType {\n  name: String\n  email: String\n  mailingAddress: String\n  phoneNumber: PhoneNumber\n  relationshipToClient: RelationshipTypeEnum\n  relationshipToClientOther: String\n  id: ID!\n  clientProfile: DjangoModelType!\n  updatedAt: DateTime!\n}\n\ntype ClientContactTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ClientContactType!]!\n}\n\ninput ClientDocumentFilter {\n  AND: ClientDocumentFilter\n  OR: ClientDocumentFilter\n  NOT: ClientDocumentFilter\n  DISTINCT: Boolean\n  documentGroups: [ClientDocumentGroupEnum!]\n}\n\ninput ClientDocumentFromUploadsInput {\n  presignedKey: String!\n  uploadToken: String!\n  filename: String!\n  contentType: String!\n  namespace: ClientDocumentNamespaceEnum!\n}\n\nenum ClientDocumentGroupEnum {\n  DOC_READY\n  FORMS\n  OTHER\n}\n\nenum ClientDocumentNamespaceEnum {\n  DRIVERS_LICENSE_FRONT\n  DRIVERS_LICENSE_BACK\n  PHOTO_ID\n  BIRTH_CERTIFICATE\n  SOCIAL_SECURITY_CARD\n  OTHER_DOC_READY\n  CONSENT_FORM\n  HMIS_FORM\n  INCOME_FORM\n  OTHER_FORM\n  OTHER_CLIENT_DOCUMENT\n}\n\ntype ClientDocumentType implements AttachmentInterface {\n  id: ID!\n  file: DjangoFileType!\n  attachmentType: AttachmentType!\n  mimeType: String!\n  originalFilename: String\n  createdAt: DateTime!\n  updatedAt: DateTime!\n  namespace: ClientDocumentNamespaceEnum!\n}\n\ntype ClientDocumentTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ClientDocumentType!]!\n}\n\ninput ClientDocumentUploadsInputItem {\n  refId: String!\n  filename: String!\n  contentType: String!\n}\n\ntype ClientDocumentUploadsType {\n  documents: [ClientDocumentType!]!\n}\n\ninput ClientHouseholdMemberInput {\n  name: String\n  dateOfBirth: Date\n  gender: GenderEnum\n  genderOther: String\n  relationshipToClient: RelationshipTypeEnum\n  relationshipToClientOther: String\n  id: ID\n  clientProfile: ID\n}\n\ntype ClientHouseholdMemberType {\n  name: String\n  dateOfBirth: Date\n  gender: GenderEnum\n  genderOther: String\n  relationshipToClient: RelationshipTypeEnum\n  relationshipToClientOther: String\n  id: ID!\n  clientProfile: DjangoModelType!\n  displayGender: String\n}\n\ntype ClientHouseholdMemberTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ClientHouseholdMemberType!]!\n}\n\ntype ClientProfileDataImportType {\n  id: UUID!\n  importedAt: DateTime!\n  sourceFile: String!\n  notes: String!\n  importedBy: DjangoModelType!\n}\n\ninput ClientProfileFilter {\n  AND: ClientProfileFilter\n  OR: ClientProfileFilter\n  NOT: ClientProfileFilter\n  DISTINCT: Boolean\n  isActive: Boolean\n  search: String\n  searchClient: ClientSearchInput\n}\n\ntype ClientProfileImportRecordType {\n  id: ID!\n  sourceId: String!\n  sourceName: String!\n  success: Boolean!\n  errorMessage: String!\n  createdAt: DateTime!\n  clientProfile: ClientProfileType\n  rawData: JSON!\n}\n\ntype ClientProfileImportRecordTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ClientProfileImportRecordType!]!\n}\n\ninput ClientProfileImportRecordsBulkInput {\n  source: String!\n  sourceIds: [String!]!\n}\n\ntype ClientProfileImportRecordsType {\n  records: [ClientProfileImportRecordType!]!\n}\n\ninput ClientProfileOrder {\n  firstName: Ordering\n  lastName: Ordering\n  id: Ordering\n}\n\ninput ClientProfilePhotoInput {\n  clientProfile: ID!\n  photo: Upload\n}\n\ntype ClientProfileType {\n  adaAccommodation: [AdaAccommodationEnum!]\n  address: String\n  age: Int\n  californiaId: String\n  dateOfBirth: Date\n  email: NonBlankString\n  eyeColor: EyeColorEnum\n  firstName: NonBlankString\n  gender: GenderEnum\n  genderOther: String\n  hairColor: HairColorEnum\n  heightInInches: Float\n  importantNotes: String\n  lastName: NonBlankString\n  livingSituation: LivingSituationEnum\n  mailingAddress: String\n  maritalStatus: MaritalStatusEnum\n  middleName: NonBlankString\n  nickname: NonBlankString\n  phoneNumber: PhoneNumber\n  physicalDescription: String\n  placeOfBirth: String\n  preferredCommunication: [PreferredCommunicationEnum!]\n  preferredLanguage: LanguageEnum\n  profilePhoto: DjangoImageType\n  pronouns: PronounEnum\n  pronounsOther: String\n  race: RaceEnum\n  residenceAddress: String\n  residenceGeolocation: Point\n  spokenLanguages: [LanguageEnum!]\n  unhousedStartDate: Date\n  veteranStatus: VeteranStatusEnum\n  id: ID!\n  contacts: [ClientContactType!]\n  hmisProfiles: [HmisProfileType!]\n  householdMembers: [ClientHouseholdMemberType!]\n  phoneNumbers: [PhoneNumberType!]\n  socialMediaProfiles: [SocialMediaProfileType!]\n  displayGender: String\n  displayPronouns: String\n  docReadyDocuments: [ClientDocumentType!]\n  consentFormDocuments: [ClientDocumentType!]\n  otherDocuments: [ClientDocumentType!]\n  displayCaseManager: String!\n}\n\ntype ClientProfileTypeKeysetPaginated {\n  pageInfo: KeysetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ClientProfileType!]!\n}\n\ntype ClientProfileTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ClientProfileType!]!\n}\n\ninput ClientSearchInput {\n  excludedClientProfileId: String = null\n  californiaId: String = null\n  firstName: String = null\n  lastName: String = null\n  middleName: String = null\n}\n\nunion CloneBedPayload = BedType | OperationInfo\n\nunion CloneRoomPayload = RoomType | OperationInfo\n\nenum ConditionChoices {\n  HEAT\n  FIRE\n  RAIN_SEVERE_WEATHER\n  WIND\n  AIR_QUALITY_SMOKE\n  PUBLIC_HEALTH_EMERGENCY\n  EMERGENCY_EVACUATION\n}\n\ntype ContactInfoType {\n  id: ID!\n  contactName: String!\n  contactNumber: PhoneNumber!\n}\n\ninput CreateBedInput {\n  shelterId: ID!\n  roomId: ID = null\n  accessibility: [AccessibilityChoices!] = null\n  b7: Boolean = null\n  demographics: [DemographicChoices!] = null\n  fees: Int = null\n  funders: [FunderChoices!] = null\n  lastCleanedInspected: DateTime = null\n  lastCleaned: DateTime = null\n  maintenanceFlag: Boolean = null\n  medicalNeeds: [MedicalNeedChoices!] = null\n  name: String = null\n  pets: [PetChoices!] = null\n  statusNotes: String = null\n  storage: Boolean = null\n  type: BedTypeChoices = null\n}\n\nunion CreateBedPayload = BedType | OperationInfo\n\nunion CreateClientContactPayload = ClientContactType | OperationInfo\n\ninput CreateClientDocumentInput {\n  clientProfile: ID!\n  file: Upload!\n  namespace: ClientDocumentNamespaceEnum!\n}\n\nunion CreateClientDocumentPayload = ClientDocumentType | OperationInfo\n\nunion CreateClientHouseholdMemberPayload = ClientHouseholdMemberType | OperationInfo\n\nunion CreateClientProfileDataImportPayload = ClientProfileDataImportType | OperationInfo\n\ninput CreateClientProfileInput {\n  adaAccommodation: [AdaAccommodationEnum!]\n  address: String\n  age: Int\n  californiaId: String\n  dateOfBirth: Date\n  email: NonBlankString\n  eyeColor: EyeColorEnum\n  firstName: NonBlankString\n  gender: GenderEnum\n  genderOther: String\n  hairColor: HairColorEnum\n  heightInInches: Float\n  importantNotes: String\n  lastName: NonBlankString\n  livingSituation: LivingSituationEnum\n  mailingAddress: String\n  maritalStatus: MaritalStatusEnum\n  middleName: NonBlankString\n  nickname: NonBlankString\n  phoneNumber: PhoneNumber\n  physicalDescription: String\n  placeOfBirth: String\n  preferredCommunication: [PreferredCommunicationEnum!]\n  preferredLanguage: LanguageEnum\n  profilePhoto: Upload\n  pronouns: PronounEnum\n  pronounsOther: String\n  race: RaceEnum\n  residenceAddress: String\n  residenceGeolocation: Point\n  spokenLanguages: [LanguageEnum!]\n  unhousedStartDate: Date\n  veteranStatus: VeteranStatusEnum\n  contacts: [ClientContactInput!]\n  hmisProfiles: [HmisProfileInput!]\n  householdMembers: [ClientHouseholdMemberInput!]\n  phoneNumbers: [PhoneNumberInput!]\n  socialMediaProfiles: [SocialMediaProfileInput!]\n}\n\nunion CreateClientProfilePayload = ClientProfileType | OperationInfo\n\ninput CreateExportJobInput {\n  exportType: ExportJobTypeEnum!\n  startDate: Date!\n  endDate: Date!\n  shelterIds: [ID!] = null\n  metricOptions: [MetricsExportOptionsEnum!] = null\n}\n\nunion CreateExportJobPayload = ExportJobType | OperationInfo\n\ninput CreateHmisClientProfileInput {\n  alias: String\n  birthDate: Date\n  dobQuality: HmisDobQualityEnum\n  firstName: NonBlankString!\n  lastName: NonBlankString!\n  nameQuality: HmisNameQualityEnum!\n  ssn1: String\n  ssn2: String\n  ssn3: String\n  ssnQuality: HmisSsnQualityEnum\n  gender: [HmisGenderEnum!]\n  genderIdentityText: String\n  nameMiddle: NonBlankString\n  nameSuffix: HmisSuffixEnum\n  raceEthnicity: [HmisRaceEnum!]\n  additionalRaceEthnicityDetail: String\n  veteran: HmisVeteranStatusEnum\n  adaAccommodation: [AdaAccommodationEnum!]\n  address: String\n  californiaId: String\n  email: NonBlankString\n  eyeColor: EyeColorEnum\n  hairColor: HairColorEnum\n  heightInInches: Float\n  importantNotes: String\n  livingSituation: LivingSituationEnum\n  mailingAddress: String\n  maritalStatus: MaritalStatusEnum\n  physicalDescription: String\n  placeOfBirth: String\n  preferredCommunication: [PreferredCommunicationEnum!]\n  preferredLanguage: LanguageEnum\n  profilePhoto: Upload\n  pronouns: PronounEnum\n  pronounsOther: String\n  residenceAddress: String\n  residenceGeolocation: Point\n  spokenLanguages: [LanguageEnum!]\n  unhousedStartDate: Date\n}\n\nunion CreateHmisClientProfilePayload = HmisClientProfileType | OperationInfo\n\nunion CreateHmisClientProgramPayload = ProgramEnrollmentType | OperationInfo\n\ninput CreateHmisNoteInput {\n  hmisClientProfileId: String!\n  title: String\n  note: String\n  date: Date!\n  refClientProgram: String\n}\n\nunion CreateHmisNotePayload = HmisNoteType | OperationInfo\n\ninput CreateHmisNoteServiceRequestInput {\n  hmisNoteId: ID!\n  serviceId: ID\n  serviceOther: String\n  serviceRequestType: ServiceRequestTypeEnum!\n}\n\nunion CreateHmisNoteServiceRequestPayload = ServiceRequestType | OperationInfo\n\nunion CreateHmisProfilePayload = HmisProfileType | OperationInfo\n\ninput CreateNoteDataImportInput {\n  sourceFile: String!\n  notes: String!\n}\n\nunion CreateNoteDataImportPayload = NoteDataImportType | OperationInfo\n\ninput CreateNoteInput {\n  purpose: String = null\n  teamId: ID\n  publicDetails: String = \"\"\n  privateDetails: String = \"\"\n  clientProfile: ID = null\n  isSubmitted: Boolean = false\n  interactedAt: DateTime = null\n  location: LocationInput = null\n  providedServices: [CreateNoteServiceInput!] = null\n  requestedServices: [CreateNoteServiceInput!] = null\n  tasks: [CreateNoteTaskInput!] = null\n}\n\nunion CreateNotePayload = NoteType | OperationInfo\n\ninput CreateNoteServiceInput {\n  serviceId: ID = null\n  serviceOther: String = null\n}\n\ninput CreateNoteServiceRequestInput {\n  serviceId: ID\n  serviceOther: String\n  noteId: ID!\n  serviceRequestType: ServiceRequestTypeEnum!\n}\n\nunion CreateNoteServiceRequestPayload = ServiceRequestType | OperationInfo\n\ninput CreateNoteTaskInput {\n  summary: String!\n  description: String = null\n  status: Int = null\n  teamId: ID\n}\n\ninput CreateOrganizationInput {\n  organizationName: NonEmptyString!\n  orgType: NonEmptyString!\n}\n\ntype CreateOrganizationResponse {\n  user: UserType!\n  organization: OrganizationType!\n}\n\ninput CreateProfileDataImportInput {\n  sourceFile: String!\n  notes: String\n}\n\ninput CreateReferralInput {\n  clientProfile: ID!\n  shelter: ID!\n  notes: String\n}\n\nunion CreateReferralPayload = ReferralType | OperationInfo\n\ninput CreateReservationInput {\n  roomId: ID = null\n  bedId: ID = null\n  checkedInAt: DateTime = null\n  checkedOutAt: DateTime = null\n  clients: [ReservationClientInput!]!\n  duration: Int = null\n  notes: String = null\n  startDate: Date = null\n  status: ReservationStatusChoices = null\n}\n\nunion CreateReservationPayload = ReservationType | OperationInfo\n\ninput CreateRoomInput {\n  shelterId: ID!\n  accessibility: [AccessibilityChoices!] = null\n  amenities: String = null\n  demographics: [DemographicChoices!] = null\n  funders: [FunderChoices!] = null\n  lastCleanedInspected: DateTime = null\n  maintenanceFlag: Boolean = null\n  medicalRespite: Boolean = false\n  name: String!\n  notes: String = null\n  pets: [PetChoices!] = null\n  storage: Boolean = null\n  type: RoomStyleChoices = null\n  typeOther: String = null\n}\n\nunion CreateRoomPayload = RoomType | OperationInfo\n\ninput CreateShelterInput {\n  name: String!\n  description: String = null\n  accessibility: [AccessibilityChoices!] = null\n  demographics: [DemographicChoices!] = null\n  specialSituationRestrictions: [SpecialSituationRestrictionChoices!] = null\n  shelterTypes: [ShelterChoices!] = null\n  roomStyles: [RoomStyleChoices!] = null\n  storage: [StorageChoices!] = null\n  pets: [PetChoices!] = null\n  parking: [ParkingChoices!] = null\n  entryRequirements: [EntryRequirementChoices!] = null\n  referralRequirement: [ReferralRequirementChoices!] = null\n  vaccinationRequirement: [VaccinationRequirementChoices!] = null\n  exitPolicy: [ExitPolicyChoices!] = null\n  shelterPrograms: [ShelterProgramChoices!] = null\n  funders: [FunderChoices!] = null\n  location: ShelterLocationInput = null\n  schedules: [ScheduleInput!] = null\n  services: [ServiceInput!] = null\n  email: String = null\n  phone: PhoneNumber = null\n  website: String = null\n  instagram: String = null\n  status: StatusChoices = null\n  demographicsOther: String = null\n  shelterTypesOther: String = null\n  totalBeds: Int = null\n  roomStylesOther: String = null\n  addNotesSleepingDetails: String = null\n  addNotesShelterDetails: String = null\n  maxStay: Int = null\n  curfew: Time = null\n  onSiteSecurity: Boolean = null\n  visitorsAllowed: Boolean = null\n  exitPolicyOther: String = null\n  emergencySurge: Boolean = null\n  otherRules: String = null\n  otherServices: String = null\n  entryInfo: String = null\n  bedFees: String = null\n  programFees: String = null\n  shelterProgramsOther: String = null\n  fundersOther: String = null\n  subjectiveReview: String = null\n  cityCouncilDistrict: Int = null\n  supervisorialDistrict: Int = null\n  overallRating: Int = null\n  isPrivate: Boolean\n  cityId: ID\n  spaId: ID\n}\n\nunion CreateShelterPayload = ShelterType | OperationInfo\n\nunion CreateSocialMediaProfilePayload = SocialMediaProfileType | OperationInfo\n\ninput CreateTaskInput {\n  clientProfile: ID\n  hmisClientProfile: ID\n  description: String\n  note: ID\n  hmisNote: ID\n  summary: String!\n  teamId: ID\n  status: TaskStatusEnum\n}\n\nunion CreateTaskPayload = TaskType | OperationInfo\n\ninput CreateTeamInput {\n  name: String!\n}\n\nunion CreateTeamPayload = TeamType | OperationInfo\n\ntype CurrentUserOrganizationType {\n  id: ID!\n  name: String!\n  permissions: [String!]!\n}\n\ntype CurrentUserType {\n  firstName: NonBlankString\n  lastName: NonBlankString\n  middleName: NonBlankString\n  email: NonBlankString\n  id: ID!\n  organizationsOrganization(filters: OrganizationFilter, ordering: [OrganizationOrder!]! = [], pagination: OffsetPaginationInput): [CurrentUserOrganizationType!]\n  hasAcceptedTos: Boolean\n  hasAcceptedPrivacyPolicy: Boolean\n  username: String\n  isHmisUser: Boolean\n  isOutreachAuthorized: Boolean @deprecated(reason: \"Use userPermissions check instead.\")\n}\n\ntype DailyBedStatusMetricsType {\n  date: Date!\n  available: Int!\n  occupied: Int!\n  reserved: Int!\n  outOfService: Int!\n  inTurnaround: Int!\n}\n\ntype DailyOccupancyMetricsType {\n  date: Date!\n  occupiedCount: Int!\n  totalBeds: Int!\n  occupancyPct: Float!\n}\n\n\"\"\"Date (isoformat)\"\"\"\nscalar Date\n\ntype DateCountType {\n  date: String!\n  count: Int!\n}\n\n\"\"\"Date with time (isoformat)\"\"\"\nscalar DateTime\n\nenum DayOfWeekChoices {\n  MONDAY\n  TUESDAY\n  WEDNESDAY\n  THURSDAY\n  FRIDAY\n  SATURDAY\n  SUNDAY\n}\n\nunion DeleteBedsPayload = BulkDeleteResult | OperationInfo\n\nunion DeleteClientContactPayload = ClientContactType | OperationInfo\n\nunion DeleteClientDocumentPayload = ClientDocumentType | OperationInfo\n\nunion DeleteClientHouseholdMemberPayload = ClientHouseholdMemberType | OperationInfo\n\nunion DeleteClientProfilePayload = DeletedObjectType | OperationInfo\n\nunion DeleteClientProfilePhotoPayload = ClientProfileType | OperationInfo\n\nunion DeleteCurrentUserPayload = DeletedObjectType | OperationInfo\n\ninput DeleteDjangoObjectInput {\n  id: ID!\n}\n\nunion DeleteHmisNotePayload = DeletedObjectType | OperationInfo\n\nunion DeleteHmisProfilePayload = HmisProfileType | OperationInfo\n\nunion DeleteNotePayload = NoteType | OperationInfo\n\nunion DeleteReferralPayload = DeletedObjectType | OperationInfo\n\nunion DeleteReservationsPayload = BulkDeleteResult | OperationInfo\n\nunion DeleteRoomsPayload = BulkDeleteResult | OperationInfo\n\nunion DeleteServiceRequestPayload = DeletedObjectType | OperationInfo\n\nunion DeleteShelterPhotosPayload = BulkDeleteResult | OperationInfo\n\nunion DeleteSocialMediaProfilePayload = SocialMediaProfileType | OperationInfo\n\nunion DeleteTaskPayload = DeletedObjectType | OperationInfo\n\nunion DeleteTeamPayload = DeletedObjectType | OperationInfo\n\ntype DeletedObjectType {\n  id: Int!\n}\n\nenum DemographicChoices {\n  ALL\n  COUPLES\n  SINGLE_MEN\n  SINGLE_WOMEN\n  TAY_TEEN\n  SENIORS\n  FAMILIES\n  SINGLE_MOMS\n  SINGLE_DADS\n  LGBTQ_PLUS\n  OTHER\n}\n\ntype DemographicType {\n  name: DemographicChoices\n}\n\ntype DjangoFileType {\n  name: String!\n  path: String!\n  size: Int!\n  url: String!\n}\n\ntype DjangoImageType {\n  name: String!\n  path: String!\n  size: Int!\n  width: Int!\n  height: Int!\n  url(preset: ImagePresetEnum = null, processingOptions: String = null): String!\n}\n\ntype DjangoModelType {\n  pk: ID!\n}\n\nenum EntryRequirementChoices {\n  BACKGROUND\n  HOMELESS_VERIFICATION\n  MEDICAID_OR_MEDICARE\n  PHOTO_ID\n  REFERRAL\n  RESERVATION\n  VEHICLE_REGISTRATION\n  WALK_UPS\n  IN_SPA_ONLY\n}\n\ntype EntryRequirementType {\n  name: EntryRequirementChoices\n}\n\nenum ExitPolicyChoices {\n  MIA\n  VIOLENCE\n  MITIGATION\n  OTHER\n}\n\ntype ExitPolicyType {\n  name: ExitPolicyChoices\n}\n\nenum ExportJobStatusEnum {\n  PENDING\n  RUNNING\n  SUCCEEDED\n  FAILED\n}\n\ntype ExportJobType {\n  id: ID!\n  exportType: ExportJobTypeEnum!\n  status: ExportJobStatusEnum!\n  progress: Int!\n  errorMessage: String!\n  createdAt: DateTime!\n  startedAt: DateTime\n  finishedAt: DateTime\n  filename: String\n  downloadUrl: String\n}\n\nenum ExportJobTypeEnum {\n  INTERACTION_DATA_CSV\n  SHELTER_METRICS_XLSX\n  SHELTER_METRICS_ZIP\n}\n\nenum EyeColorEnum {\n  BLUE\n  BROWN\n  GREEN\n  GRAY\n  HAZEL\n  OTHER\n}\n\ntype FeatureControlData {\n  flags: [FlagType!]!\n  switches: [SwitchType!]!\n  samples: [SampleType!]!\n}\n\ntype FlagType {\n  name: String!\n  isActive: Boolean\n  lastModified: DateTime\n}\n\nenum FunderChoices {\n  CITY_OF_LOS_ANGELES\n  DHS\n  DMH\n  FEDERAL_FUNDING\n  HOPWA\n  LAHSA\n  PRIVATE\n  OTHER\n}\n\ntype FunderType {\n  name: FunderChoices\n}\n\nenum GenderEnum {\n  MALE\n  FEMALE\n  TRANS_MALE\n  TRANS_FEMALE\n  NON_BINARY\n  OTHER\n  PREFER_NOT_TO_SAY\n}\n\ninput GenerateClientDocumentUploadsInput {\n  clientProfileId: ID!\n  uploads: [ClientDocumentUploadsInputItem!]!\n}\n\nunion GenerateClientDocumentUploadsPayload = AuthorizedPresignedS3UploadsType | OperationInfo\n\ninput GenerateClientProfilePhotoUploadInput {\n  clientProfileId: ID!\n  refId: String!\n  filename: String!\n  contentType: String!\n}\n\nunion GenerateClientProfilePhotoUploadPayload = AuthorizedPresignedS3UploadType | OperationInfo\n\ninput GenerateNoteAttachmentUploadsInput {\n  noteId: ID!\n  uploads: [NoteAttachmentUploadItemInput!]!\n}\n\nunion GenerateNoteFileUploadsPayload = AuthorizedPresignedS3UploadsType | OperationInfo\n\ninput GenerateShelterPhotoUploadsInput {\n  shelterId: ID!\n  uploads: [ShelterPhotoUploadItemInput!]!\n}\n\nunion GenerateShelterPhotoUploadsPayload = AuthorizedPresignedS3UploadsType | OperationInfo\n\ninput GeolocationInput {\n  latitude: Float!\n  longitude: Float!\n  rangeInMiles: Int = null\n  nearestFirst: Boolean = false\n}\n\nenum HairColorEnum {\n  BLACK\n  BLONDE\n  BROWN\n  GRAY\n  RED\n  WHITE\n  BALD\n  OTHER\n}\n\nenum HmisAgencyEnum {\n  LAHSA\n  LONG_BEACH\n  PASADENA\n  CHAMP\n  VASH\n}\n\ninput HmisClientProfileFilter {\n  AND: HmisClientProfileFilter\n  OR: HmisClientProfileFilter\n  NOT: HmisClientProfileFilter\n  DISTINCT: Boolean\n  search: String\n}\n\ninput HmisClientProfileOrdering {\n  id: Ordering\n  firstName: Ordering\n  lastName: Ordering\n  addedDate: Ordering\n  lastUpdated: Ordering\n}\n\ntype HmisClientProfileType {\n  alias: String\n  birthDate: Date\n  dobQuality: HmisDobQualityEnum\n  firstName: NonBlankString\n  lastName: NonBlankString\n  nameQuality: HmisNameQualityEnum\n  ssn1: String\n  ssn2: String\n  ssn3: String\n  ssnQuality: HmisSsnQualityEnum\n  gender: [HmisGenderEnum!]\n  genderIdentityText: String\n  nameMiddle: NonBlankString\n  nameSuffix: HmisSuffixEnum\n  raceEthnicity: [HmisRaceEnum!]\n  additionalRaceEthnicityDetail: String\n  veteran: HmisVeteranStatusEnum\n  adaAccommodation: [AdaAccommodationEnum!]\n  address: String\n  californiaId: String\n  email: NonBlankString\n  eyeColor: EyeColorEnum\n  hairColor: HairColorEnum\n  heightInInches: Float\n  importantNotes: String\n  livingSituation: LivingSituationEnum\n  mailingAddress: String\n  maritalStatus: MaritalStatusEnum\n  physicalDescription: String\n  placeOfBirth: String\n  preferredCommunication: [PreferredCommunicationEnum!]\n  preferredLanguage: LanguageEnum\n  profilePhoto: DjangoImageType\n  pronouns: PronounEnum\n  pronounsOther: String\n  residenceAddress: String\n  residenceGeolocation: Point\n  spokenLanguages: [LanguageEnum!]\n  unhousedStartDate: Date\n  id: ID!\n  hmisId: String\n  personalId: String\n  uniqueIdentifier: String\n  addedDate: DateTime\n  lastUpdated: DateTime\n  age: Int\n  phoneNumbers: [PhoneNumberType!]\n  createdBy: UserType\n}\n\ntype HmisClientProfileTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [HmisClientProfileType!]!\n}\n\ntype HmisClientProgramType {\n  id: String!\n  program: HmisProgramType!\n}\n\nenum HmisDobQualityEnum {\n  FULL\n  PARTIAL\n  DONT_KNOW\n  NO_ANSWER\n  NOT_COLLECTED\n}\n\nenum HmisGenderEnum {\n  WOMAN_GIRL\n  MAN_BOY\n  SPECIFIC\n  TRANSGENDER\n  NON_BINARY\n  QUESTIONING\n  DIFFERENT\n  DONT_KNOW\n  NO_ANSWER\n  NOT_COLLECTED\n}\n\ntype HmisLoginError {\n  message: String!\n  field: String\n}\n\ntype HmisLoginSuccess {\n  user: CurrentUserType!\n}\n\nunion HmisLoginSuccessHmisLoginError = HmisLoginSuccess | HmisLoginError\n\nenum HmisNameQualityEnum {\n  FULL\n  PARTIAL\n  DONT_KNOW\n  NO_ANSWER\n  NOT_COLLECTED\n}\n\ninput HmisNoteFilter {\n  hmisClientProfile: ID\n  createdBy: ID\n  AND: HmisNoteFilter\n  OR: HmisNoteFilter\n  NOT: HmisNoteFilter\n  DISTINCT: Boolean\n  authors: [ID!]\n  search: String\n}\n\ninput HmisNoteOrdering {\n  id: Ordering\n  addedDate: Ordering\n  lastUpdated: Ordering\n  date: Ordering\n}\n\ntype HmisNoteType {\n  id: ID!\n  hmisId: String!\n  hmisClientProfile: HmisClientProfileType!\n  addedDate: DateTime\n  lastUpdated: DateTime\n  title: String\n  note: String!\n  date: Date\n  clientProgram: HmisClientProgramType\n  refClientProgram: String\n  tasks(filters: TaskFilter, ordering: [TaskOrder!]! = [], pagination: OffsetPaginationInput): [TaskType!]\n  createdBy: UserType\n  location: LocationType\n  requestedServices(pagination: OffsetPaginationInput): [ServiceRequestType!]\n  providedServices(pagination: OffsetPaginationInput): [ServiceRequestType!]\n}\n\ntype HmisNoteTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [HmisNoteType!]!\n}\n\ninput HmisProfileInput {\n  hmisId: NonBlankString\n  agency: HmisAgencyEnum!\n  id: ID\n  clientProfile: ID\n}\n\ntype HmisProfileType {\n  hmisId: NonBlankString\n  agency: HmisAgencyEnum!\n  id: ID!\n}\n\ntype HmisProfileTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [HmisProfileType!]!\n}\n\ntype HmisProgramType {\n  id: String!\n  name: String!\n  enableNotes: Int\n}\n\nenum HmisRaceEnum {\n  INDIGENOUS\n  ASIAN\n  BLACK\n  HISPANIC\n  MIDDLE_EASTERN\n  PACIFIC_ISLANDER\n  WHITE\n  DONT_KNOW\n  NO_ANSWER\n  NOT_COLLECTED\n}\n\nenum HmisSsnQualityEnum {\n  FULL\n  PARTIAL\n  DONT_KNOW\n  NO_ANSWER\n  NOT_COLLECTED\n}\n\nenum HmisSuffixEnum {\n  JR\n  SR\n  FIRST\n  SECOND\n  THIRD\n  FOURTH\n  FIFTH\n  SIXTH\n  DONT_KNOW\n  NO_ANSWER\n}\n\nenum HmisVeteranStatusEnum {\n  NO\n  YES\n  DONT_KNOW\n  NO_ANSWER\n  NOT_COLLECTED\n}\n\ninput IDFilterLookup {\n  \"\"\"Exact match. Filter will be skipped on `null` value\"\"\"\n  exact: ID\n\n  \"\"\"Assignment test. Filter will be skipped on `null` value\"\"\"\n  isNull: Boolean\n\n  \"\"\"\n  Exact match of items in a given list. Filter will be skipped on `null` value\n  \"\"\"\n  inList: [ID!]\n\n  \"\"\"Case-insensitive exact match. Filter will be skipped on `null` value\"\"\"\n  iExact: ID\n\n  \"\"\"\n  Case-sensitive containment test. Filter will be skipped on `null` value\n  \"\"\"\n  contains: ID\n\n  \"\"\"\n  Case-insensitive containment test. Filter will be skipped on `null` value\n  \"\"\"\n  iContains: ID\n\n  \"\"\"Case-sensitive starts-with. Filter will be skipped on `null` value\"\"\"\n  startsWith: ID\n\n  \"\"\"Case-insensitive starts-with. Filter will be skipped on `null` value\"\"\"\n  iStartsWith: ID\n\n  \"\"\"Case-sensitive ends-with. Filter will be skipped on `null` value\"\"\"\n  endsWith: ID\n\n  \"\"\"Case-insensitive ends-with. Filter will be skipped on `null` value\"\"\"\n  iEndsWith: ID\n\n  \"\"\"\n  Case-sensitive regular expression match. Filter will be skipped on `null` value\n  \"\"\"\n  regex: ID\n\n  \"\"\"\n  Case-insensitive regular expression match. Filter will be skipped on `null` value\n  \"\"\"\n  iRegex: ID\n}\n\nenum ImagePresetEnum {\n  ORIGINAL\n  SHELTER_HERO\n  SM\n  MD\n  LG\n}\n\ninput ImportClientProfileInput {\n  importJobId: UUID!\n  sourceId: String!\n  sourceName: String!\n  rawData: JSON!\n  clientProfile: CreateClientProfileInput!\n}\n\nunion ImportClientProfilePayload = ClientProfileImportRecordType | OperationInfo\n\ninput ImportClientProfileRecordInput {\n  sourceId: String!\n  sourceName: String!\n  rawData: JSON!\n  clientProfile: CreateClientProfileInput!\n}\n\ninput ImportNoteDataInput {\n  purpose: String\n  teamId: ID\n  publicDetails: String\n  privateDetails: String\n  clientProfile: ID\n  isSubmitted: Boolean\n  interactedAt: DateTime\n}\n\ninput ImportNoteInput {\n  importJobId: UUID!\n  sourceId: String!\n  sourceName: String!\n  rawData: JSON!\n  note: ImportNoteDataInput!\n}\n\nunion ImportNotePayload = NoteImportRecordType | OperationInfo\n\ninput ImportNoteRecordInput {\n  sourceId: String!\n  sourceName: String!\n  rawData: JSON!\n  note: BulkImportNoteDataInput!\n}\n\ninput InteractionAuthorFilter {\n  AND: InteractionAuthorFilter\n  OR: InteractionAuthorFilter\n  NOT: InteractionAuthorFilter\n  DISTINCT: Boolean\n  search: String\n}\n\ninput InteractionAuthorOrder {\n  firstName: Ordering\n  lastName: Ordering\n  id: Ordering\n}\n\ntype InteractionAuthorType {\n  id: ID!\n  firstName: String\n  lastName: String\n  middleName: String\n}\n\ntype InteractionAuthorTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [InteractionAuthorType!]!\n}\n\n\"\"\"\nThe `JSON` scalar type represents JSON values as specified by [ECMA-404](https://ecma-international.org/wp-content/uploads/ECMA-404_2nd_edition_december_2017.pdf).\n\"\"\"\nscalar JSON @specifiedBy(url: \"https://ecma-international.org/wp-content/uploads/ECMA-404_2nd_edition_december_2017.pdf\")\n\ntype KeysetPaginationInfo {\n  limit: Int\n  endCursor: String\n  hasNextPage: Boolean!\n}\n\ninput KeysetPaginationInput {\n  after: String = null\n  limit: Int\n}\n\nenum LanguageEnum {\n  ASL\n  ARABIC\n  ARMENIAN\n  ENGLISH\n  FARSI\n  FRENCH\n  INDONESIAN\n  JAPANESE\n  KHMER\n  KOREAN\n  RUSSIAN\n  SIMPLIFIED_CHINESE\n  SPANISH\n  TAGALOG\n  TRADITIONAL_CHINESE\n  VIETNAMESE\n}\n\nscalar LatitudeScalar\n\nenum LivingSituationEnum {\n  HOUSING\n  OPEN_AIR\n  SHELTER\n  TENT\n  VEHICLE\n  OTHER\n}\n\ninput LocationInput {\n  address: AddressInput\n  point: Point!\n  pointOfInterest: String\n}\n\ntype LocationType {\n  id: ID\n  address: AddressType!\n  point: Point!\n  pointOfInterest: String\n}\n\ninput LoginInput {\n  username: String!\n  password: String!\n}\n\nscalar LongitudeScalar\n\ninput MapBoundsInput {\n  westLng: LongitudeScalar!\n  northLat: LatitudeScalar!\n  eastLng: LongitudeScalar!\n  southLat: LatitudeScalar!\n}\n\nenum MaritalStatusEnum {\n  DIVORCED\n  MARRIED\n  SEPARATED\n  SINGLE\n  WIDOWED\n}\n\ninput MaxStayInput {\n  days: Int!\n  includeNull: Boolean = false\n}\n\ntype MediaLinkType {\n  id: ID!\n  url: String!\n  title: String!\n  mediaType: MediaLinkTypeChoices!\n}\n\nenum MediaLinkTypeChoices {\n  YOUTUBE\n}\n\nenum MedicalNeedChoices {\n  ERC\n  DMH\n  OXYGEN\n  DIALYSIS\n}\n\ntype MedicalNeedType {\n  name: MedicalNeedChoices\n}\n\nenum MetricsExportOptionsEnum {\n  DAILY_OCCUPANCY_METRICS\n  DAILY_BED_STATUS_METRICS\n  RESERVATION_METRICS\n  AVG_DAYS_TO_OCCUPANCY\n}\n\ntype Mutation {\n  logout: Boolean!\n  login(input: LoginInput!): AuthResponse!\n  updateCurrentUser(data: UpdateUserInput!): UpdateCurrentUserPayload!\n  updateUserProfile(data: UpdateUserProfileInput!): UpdateUserProfilePayload!\n  deleteCurrentUser: DeleteCurrentUserPayload!\n  addOrganizationMember(data: OrgInvitationInput!): AddOrganizationMemberPayload! @hasOrgPerm(permissions: [{app: \"organizations\", permission: \"add_org_member\"}], any: true)\n  removeOrganizationMember(data: RemoveOrganizationMemberInput!): RemoveOrganizationMemberPayload! @hasOrgPerm(permissions: [{app: \"organizations\", permission: \"remove_org_member\"}], any: true)\n  createOrganization(data: CreateOrganizationInput!): CreateOrganizationResponse!\n  changeOrganizationMemberRole(data: ChangeOrganizationMemberRoleInput!): ChangeOrganizationMemberRolePayload! @hasOrgPerm(permissions: [{app: \"organizations\", permission: \"change_org_member_role\"}], any: true)\n  createClientContact(data: ClientContactInput!): CreateClientContactPayload! @hasPerm(permissions: [{app: \"clients\", permission: \"add_clientcontact\"}], any: true)\n  updateClientContact(data: ClientContactInput!): UpdateClientContactPayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"change_clientcontact\"}], any: true)\n  deleteClientContact(data: DeleteDjangoObjectInput!): DeleteClientContactPayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"delete_clientcontact\"}], any: true)\n  createClientHouseholdMember(data: ClientHouseholdMemberInput!): CreateClientHouseholdMemberPayload! @hasPerm(permissions: [{app: \"clients\", permission: \"add_clienthouseholdmember\"}], any: true)\n  updateClientHouseholdMember(data: ClientHouseholdMemberInput!): UpdateClientHouseholdMemberPayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"change_clienthouseholdmember\"}], any: true)\n  deleteClientHouseholdMember(data: DeleteDjangoObjectInput!): DeleteClientHouseholdMemberPayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"delete_clienthouseholdmember\"}], any: true)\n  createHmisProfile(data: HmisProfileInput!): CreateHmisProfilePayload! @hasPerm(permissions: [{app: \"clients\", permission: \"add_hmisprofile\"}], any: true)\n  updateHmisProfile(data: HmisProfileInput!): UpdateHmisProfilePayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"change_hmisprofile\"}], any: true)\n  deleteHmisProfile(data: DeleteDjangoObjectInput!): DeleteHmisProfilePayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"delete_hmisprofile\"}], any: true)\n  createSocialMediaProfile(data: SocialMediaProfileInput!): CreateSocialMediaProfilePayload! @hasPerm(permissions: [{app: \"clients\", permission: \"add_socialmediaprofile\"}], any: true)\n  updateSocialMediaProfile(data: SocialMediaProfileInput!): UpdateSocialMediaProfilePayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"change_socialmediaprofile\"}], any: true)\n  deleteSocialMediaProfile(data: DeleteDjangoObjectInput!): DeleteSocialMediaProfilePayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"delete_socialmediaprofile\"}], any: true)\n  deleteClientDocument(data: DeleteDjangoObjectInput!): DeleteClientDocumentPayload! @hasRetvalPerm(permissions: [{app: \"common\", permission: \"delete_attachment\"}], any: true)\n  updateClientDocument(data: UpdateClientDocumentInput!): UpdateClientDocumentPayload! @hasRetvalPerm(permissions: [{app: \"common\", permission: \"change_attachment\"}], any: true)\n  createClientProfile(data: CreateClientProfileInput!): CreateClientProfilePayload! @hasPerm(permissions: [{app: \"clients\", permission: \"add_clientprofile\"}], any: true)\n  updateClientProfile(data: UpdateClientProfileInput!): UpdateClientProfilePayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"change_clientprofile\"}], any: true)\n  deleteClientProfile(data: DeleteDjangoObjectInput!): DeleteClientProfilePayload!\n  createClientDocument(data: CreateClientDocumentInput!): CreateClientDocumentPayload! @hasPerm(permissions: [{app: \"common\", permission: \"add_attachment\"}], any: true)\n  updateClientProfilePhoto(data: ClientProfilePhotoInput!): UpdateClientProfilePhotoPayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"change_clientprofile\"}], any: true) @deprecated(reason: \"Use generateClientProfilePhotoUpload/resolveClientProfilePhotoUpload for uploads and deleteClientProfilePhoto for removal.\")\n  deleteClientProfilePhoto(clientProfileId: ID!): DeleteClientProfilePhotoPayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"change_clientprofile\"}], any: true)\n  generateClientDocumentUploads(data: GenerateClientDocumentUploadsInput!): GenerateClientDocumentUploadsPayload! @hasPerm(permissions: [{app: \"common\", permission: \"add_attachment\"}], any: true)\n  resolveClientDocumentUploads(data: ResolveClientDocumentUploadsInput!): ResolveClientDocumentUploadsPayload! @hasPerm(permissions: [{app: \"common\", permission: \"add_attachment\"}], any: true)\n  generateClientProfilePhotoUpload(data: GenerateClientProfilePhotoUploadInput!): GenerateClientProfilePhotoUploadPayload! @hasPerm(permissions: [{app: \"clients\", permission: \"change_clientprofile\"}], any: true)\n  resolveClientProfilePhotoUpload(data: ResolveClientProfilePhotoUploadInput!): ResolveClientProfilePhotoUploadPayload! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"change_clientprofile\"}], any: true)\n  createClientProfileDataImport(data: CreateProfileDataImportInput!): CreateClientProfileDataImportPayload! @hasPerm(permissions: [{app: \"clients\", permission: \"add_clientprofileimportrecord\"}], any: true)\n  importClientProfile(data: ImportClientProfileInput!): ImportClientProfilePayload! @hasPerm(permissions: [{app: \"clients\", permission: \"add_clientprofileimportrecord\"}], any: true)\n  bulkImportClientProfiles(data: BulkImportClientProfilesInput!): BulkImportClientProfilesPayload! @hasPerm(permissions: [{app: \"clients\", permission: \"add_clientprofileimportrecord\"}], any: true)\n  hmisLogin(email: String!, password: String!): HmisLoginSuccessHmisLoginError! @hmisDirective\n  createHmisClientProfile(data: CreateHmisClientProfileInput!): CreateHmisClientProfilePayload! @hmisDirective @isHmisAuthenticated\n  updateHmisClientProfile(data: UpdateHmisClientProfileInput!): UpdateHmisClientProfilePayload! @hmisDirective @isHmisAuthenticated\n  createHmisNote(data: CreateHmisNoteInput!): CreateHmisNotePayload! @hmisDirective @isHmisAuthenticated\n  updateHmisNote(data: UpdateHmisNoteInput!): UpdateHmisNotePayload! @hmisDirective @isHmisAuthenticated\n  deleteHmisNote(id: ID!): DeleteHmisNotePayload! @hmisDirective @isHmisAuthenticated\n  createHmisClientProgram(clientId: Int!, programHmisId: Int!): CreateHmisClientProgramPayload! @hmisDirective @isHmisAuthenticated\n  updateHmisNoteLocation(data: UpdateHmisNoteLocationInput!): UpdateHmisNoteLocationPayload! @hmisDirective @isHmisAuthenticated\n  createHmisNoteServiceRequest(data: CreateHmisNoteServiceRequestInput!): CreateHmisNoteServiceRequestPayload! @hmisDirective @isHmisAuthenticated\n  removeHmisNoteServiceRequest(data: RemoveHmisNoteServiceRequestInput!): RemoveHmisNoteServiceRequestPayload! @hmisDirective @isHmisAuthenticated\n  deleteNote(data: DeleteDjangoObjectInput!): DeleteNotePayload! @hasRetvalPerm(permissions: [{app: \"notes\", permission: \"delete_note\"}], any: true)\n  createNote(data: CreateNoteInput!): CreateNotePayload! @hasPerm(permissions: [{app: \"notes\", permission: \"add_note\"}], any: true)\n  updateNote(data: UpdateNoteInput!): UpdateNotePayload! @permissionedQuerySet(permissions: [{app: \"notes\", permission: \"change_note\"}], any: true)\n  updateNoteLocation(data: UpdateNoteLocationInput!): UpdateNoteLocationPayload! @permissionedQuerySet(permissions: [{app: \"notes\", permission: \"change_note\"}], any: true)\n  revertNote(data: RevertNoteInput!): RevertNotePayload! @permissionedQuerySet(permissions: [{app: \"notes\", permission: \"change_note\"}], any: true)\n  createNoteServiceRequest(data: CreateNoteServiceRequestInput!): CreateNoteServiceRequestPayload! @hasPerm(permissions: [{app: \"notes\", permission: \"add_servicerequest\"}], any: true) @permissionedQuerySet(permissions: [{app: \"notes\", permission: \"change_note\"}], any: true)\n  deleteServiceRequest(data: DeleteDjangoObjectInput!): DeleteServiceRequestPayload! @permissionedQuerySet(permissions: [{app: \"notes\", permission: \"delete_servicerequest\"}], any: true)\n  createNoteDataImport(data: CreateNoteDataImportInput!): CreateNoteDataImportPayload! @hasPerm(permissions: [{app: \"notes\", permission: \"add_noteimportrecord\"}], any: true)\n  importNote(data: ImportNoteInput!): ImportNotePayload! @hasPerm(permissions: [{app: \"notes\", permission: \"add_noteimportrecord\"}], any: true)\n  bulkImportNotes(data: BulkImportNotesInput!): BulkImportNotesPayload! @hasPerm(permissions: [{app: \"notes\", permission: \"add_noteimportrecord\"}], any: true)\n  generateNoteFileUploads(data: GenerateNoteAttachmentUploadsInput!): GenerateNoteFileUploadsPayload! @hasPerm(permissions: [{app: \"common\", permission: \"add_attachment\"}], any: true) @permissionedQuerySet(permissions: [{app: \"notes\", permission: \"change_note\"}], any: true)\n  resolveNoteFileUploads(data: ResolveNoteAttachmentUploadsInput!): ResolveNoteFileUploadsPayload! @hasPerm(permissions: [{app: \"common\", permission: \"add_attachment\"}], any: true) @permissionedQuerySet(permissions: [{app: \"notes\", permission: \"change_note\"}], any: true)\n  createExportJob(data: CreateExportJobInput!): CreateExportJobPayload! @hasOrgPerm(permissions: [{app: \"reports\", permission: \"view_reports\"}], any: true)\n  createTask(data: CreateTaskInput!): CreateTaskPayload! @hasPerm(permissions: [{app: \"tasks\", permission: \"add_task\"}], any: true)\n  updateTask(data: UpdateTaskInput!): UpdateTaskPayload! @permissionedQuerySet(permissions: [{app: \"tasks\", permission: \"change_task\"}], any: true)\n  deleteTask(data: DeleteDjangoObjectInput!): DeleteTaskPayload!\n  createTeam(data: CreateTeamInput!): CreateTeamPayload! @hasOrgPerm(permissions: [{app: \"teams\", permission: \"add_team\"}], any: true)\n  updateTeam(data: UpdateTeamInput!): UpdateTeamPayload! @hasOrgPerm(permissions: [{app: \"teams\", permission: \"change_team\"}], any: true)\n  deleteTeam(data: DeleteDjangoObjectInput!): DeleteTeamPayload! @hasOrgPerm(permissions: [{app: \"teams\", permission: \"delete_team\"}], any: true)\n  createShelter(data: CreateShelterInput!): CreateShelterPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"add_shelter\"}], any: true)\n  updateShelter(data: UpdateShelterInput!): UpdateShelterPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"change_shelter\"}], any: true)\n  createRoom(data: CreateRoomInput!): CreateRoomPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"add_room\"}], any: true)\n  updateRoom(id: ID!, data: UpdateRoomInput!): UpdateRoomPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"change_room\"}], any: true)\n  cloneRoom(id: ID!): CloneRoomPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"add_room\"}], any: true)\n  deleteRooms(data: BulkDeleteInput!): DeleteRoomsPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"delete_room\"}], any: true)\n  createBed(data: CreateBedInput!): CreateBedPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"add_bed\"}], any: true)\n  updateBed(id: ID!, data: UpdateBedInput!): UpdateBedPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"change_bed\"}], any: true)\n  cloneBed(id: ID!): CloneBedPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"add_bed\"}], any: true)\n  deleteBeds(data: BulkDeleteInput!): DeleteBedsPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"delete_bed\"}], any: true)\n  createReservation(data: CreateReservationInput!): CreateReservationPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"add_reservation\"}], any: true)\n  updateReservation(id: ID!, data: UpdateReservationInput!): UpdateReservationPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"change_reservation\"}], any: true)\n  deleteReservations(data: BulkDeleteInput!): DeleteReservationsPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"delete_reservation\"}], any: true)\n  generateShelterPhotoUploads(data: GenerateShelterPhotoUploadsInput!): GenerateShelterPhotoUploadsPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"change_shelter\"}], any: true)\n  resolveShelterPhotoUploads(data: ResolveShelterPhotoUploadsInput!): ResolveShelterPhotoUploadsPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"change_shelter\"}], any: true)\n  updateShelterPhoto(data: UpdateShelterPhotoInput!): UpdateShelterPhotoPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"change_shelter\"}], any: true)\n  deleteShelterPhotos(data: BulkDeleteInput!): DeleteShelterPhotosPayload! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"change_shelter\"}], any: true)\n  createReferral(data: CreateReferralInput!): CreateReferralPayload! @hasPerm(permissions: [{app: \"referrals\", permission: \"add_referral\"}], any: true)\n  updateReferral(data: UpdateReferralInput!): UpdateReferralPayload! @permissionedQuerySet(permissions: [{app: \"referrals\", permission: \"change_referral\"}], any: true)\n  deleteReferral(data: DeleteDjangoObjectInput!): DeleteReferralPayload!\n}\n\ntype NameCountType {\n  name: String!\n  count: Int!\n}\n\n\"\"\"\nCoerces blank input to None. Use for optional string fields where blank means 'no value'.\n\"\"\"\nscalar NonBlankString\n\n\"\"\"Rejects blank input. Use for required string fields.\"\"\"\nscalar NonEmptyString\n\ninput NoteAttachmentFromUploadInput {\n  presignedKey: String!\n  uploadToken: String!\n  filename: String!\n  contentType: String!\n}\n\ntype NoteAttachmentType implements AttachmentInterface {\n  id: ID!\n  file: DjangoFileType!\n  attachmentType: AttachmentType!\n  mimeType: String!\n  originalFilename: String\n  createdAt: DateTime!\n  updatedAt: DateTime!\n}\n\ninput NoteAttachmentUploadItemInput {\n  refId: String!\n  filename: String!\n  contentType: String!\n}\n\ntype NoteAttachmentUploadsType {\n  attachments: [NoteAttachmentType!]!\n}\n\ntype NoteDataImportType {\n  id: UUID!\n  importedAt: DateTime!\n  sourceFile: String!\n  notes: String!\n  importedBy: DjangoModelType!\n}\n\ninput NoteFilter {\n  clientProfile: ID\n  createdBy: ID\n  isSubmitted: Boolean\n  AND: NoteFilter\n  OR: NoteFilter\n  NOT: NoteFilter\n  DISTINCT: Boolean\n  authors: [ID!]\n  organizations: [ID!]\n  teamIds: [ID!]\n  search: String\n}\n\ntype NoteImportRecordType {\n  id: ID!\n  sourceId: String!\n  sourceName: String!\n  success: Boolean!\n  errorMessage: String!\n  createdAt: DateTime!\n  note: NoteType\n  rawData: JSON!\n}\n\ntype NoteImportRecordsType {\n  records: [NoteImportRecordType!]!\n}\n\ninput NoteOrder {\n  id: Ordering\n  interactedAt: Ordering\n}\n\ntype NoteType {\n  id: ID!\n  clientProfile: ClientProfileType\n  createdAt: DateTime!\n  createdBy: UserType\n  interactedAt: DateTime!\n  isSubmitted: Boolean!\n  location: LocationType\n  organization: OrganizationType!\n  providedServices(pagination: OffsetPaginationInput): [ServiceRequestType!]!\n  publicDetails: String!\n  purpose: String\n  requestedServices(pagination: OffsetPaginationInput): [ServiceRequestType!]!\n  tasks(filters: TaskFilter, ordering: [TaskOrder!]! = [], pagination: OffsetPaginationInput): [TaskType!]!\n  team: TeamType\n  currentTeam: TeamType @deprecated(reason: \"Use team instead\")\n  userCanEdit: Boolean!\n  privateDetails: String\n}\n\ntype NoteTypeKeysetPaginated {\n  pageInfo: KeysetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [NoteType!]!\n}\n\ntype NoteTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [NoteType!]!\n}\n\ntype OffsetPaginationInfo {\n  offset: Int!\n  limit: Int\n}\n\ninput OffsetPaginationInput {\n  offset: Int! = 0\n  limit: Int\n}\n\ninput OpenNowInput {\n  scheduleType: [ScheduleTypeChoices!] = null\n}\n\ntype OperationInfo {\n  \"\"\"List of messages returned by the operation.\"\"\"\n  messages: [OperationMessage!]!\n}\n\ntype OperationMessage {\n  \"\"\"The kind of this message.\"\"\"\n  kind: OperationMessageKind!\n\n  \"\"\"The error message.\"\"\"\n  message: String!\n\n  \"\"\"\n  The field that caused the error, or `null` if it isn't associated with any particular field.\n  \"\"\"\n  field: String\n\n  \"\"\"The error code, or `null` if no error code was set.\"\"\"\n  code: String\n}\n\nenum OperationMessageKind {\n  INFO\n  WARNING\n  ERROR\n  PERMISSION\n  VALIDATION\n}\n\ntype OperatorShelterType {\n  id: ID!\n  accessibility: [AccessibilityType!]!\n  additionalContacts: [ContactInfoType!]!\n  addNotesSleepingDetails: String\n  addNotesShelterDetails: String\n  bedFees: String\n  city: CityType\n  citiesServed: [CityType!]!\n  cityCouncilDistrict: Int\n  curfew: Time\n  demographics: [DemographicType!]!\n  demographicsOther: String\n  description: String!\n  email: String\n  entryInfo: String\n  entryRequirements: [EntryRequirementType!]!\n  exitPolicy: [ExitPolicyType!]!\n  exitPolicyOther: String\n  emergencySurge: Boolean\n  funders: [FunderType!]!\n  fundersOther: String\n  instagram: String\n  location: ShelterLocationType\n  maxStay: Int\n  name: String!\n  onSiteSecurity: Boolean\n  organization: OrganizationType\n  otherRules: String\n  otherServices: String\n  overallRating: Int\n  parking: [ParkingType!]!\n  pets: [PetType!]!\n  phone: PhoneNumber\n  programFees: String\n  referralRequirement: [ReferralRequirementType!]!\n  roomStyles: [RoomStyleType!]!\n  roomStylesOther: String\n  schedules: [ScheduleType!]!\n  services: [ServiceType!]!\n  shelterPrograms: [ShelterProgramType!]!\n  shelterProgramsOther: String\n  shelterTypes: [ShelterTypeType!]!\n  shelterTypesOther: String\n  spa: SPAType\n  spasServed: [SPAType!]!\n  specialSituationRestrictions: [SpecialSituationRestrictionType!]!\n  photos: [ShelterPhotoType!]!\n  isPrivate: Boolean!\n  status: StatusChoices!\n  storage: [StorageType!]!\n  subjectiveReview: String\n  supervisorialDistrict: Int\n  totalBeds: Int\n  updatedAt: DateTime!\n  vaccinationRequirement: [VaccinationRequirementType!]!\n  visitorsAllowed: Boolean\n  website: String\n  mediaLinks: [MediaLinkType!]!\n  availability: ShelterAvailabilityType\n  HeroPhotos: [ShelterPhotoType!]\n  heroImage(preset: ImagePresetEnum = null, processingOptions: String = null): ShelterHeroImageType\n  distanceInMiles: Float\n  bedCounts: BedCountType!\n  roomCounts: RoomCountType!\n}\n\ntype OperatorShelterTypeKeysetPaginated {\n  pageInfo: KeysetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [OperatorShelterType!]!\n}\n\ntype OperatorShelterTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [OperatorShelterType!]!\n}\n\nenum Ordering {\n  ASC\n  ASC_NULLS_FIRST\n  ASC_NULLS_LAST\n  DESC\n  DESC_NULLS_FIRST\n  DESC_NULLS_LAST\n}\n\ninput OrgInvitationInput {\n  email: String!\n  firstName: String!\n  middleName: String = null\n  lastName: String!\n  organizationId: ID!\n  permissionTemplate: PermissionTemplateEnum!\n}\n\nenum OrgRoleEnum {\n  MEMBER\n  ADMIN\n  SUPERUSER\n}\n\nenum OrgTypeEnum {\n  OUTREACH\n  SHELTER\n}\n\ninput OrganizationFilter {\n  AND: OrganizationFilter\n  OR: OrganizationFilter\n  NOT: OrganizationFilter\n  DISTINCT: Boolean\n  search: String\n}\n\ninput OrganizationMemberFilter {\n  AND: OrganizationMemberFilter\n  OR: OrganizationMemberFilter\n  NOT: OrganizationMemberFilter\n  DISTINCT: Boolean\n  search: String\n}\n\ninput OrganizationMemberOrdering {\n  id: Ordering\n  email: Ordering\n  firstName: Ordering\n  lastLogin: Ordering\n  lastName: Ordering\n  dateJoined: Ordering\n  memberRole: Ordering\n}\n\ntype OrganizationMemberType {\n  firstName: NonBlankString\n  lastName: NonBlankString\n  middleName: NonBlankString\n  email: NonBlankString\n  id: ID!\n  lastLogin: DateTime\n  dateJoined: DateTime!\n  memberRole: OrgRoleEnum!\n  isOrgOwner: Boolean!\n  permissionTemplates: [PermissionTemplateEnum!]!\n}\n\ntype OrganizationMemberTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [OrganizationMemberType!]!\n}\n\ninput OrganizationOrder {\n  name: Ordering\n  id: Ordering\n}\n\ninput OrganizationServiceCategoryOrdering {\n  id: Ordering\n  priority: Ordering\n}\n\ntype OrganizationServiceCategoryType {\n  id: ID!\n  name: String!\n  priority: Int\n  services(ordering: [OrganizationServiceOrdering!]! = [], pagination: OffsetPaginationInput): [OrganizationServiceType!]!\n}\n\ntype OrganizationServiceCategoryTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [OrganizationServiceCategoryType!]!\n}\n\ninput OrganizationServiceOrdering {\n  id: Ordering\n  priority: Ordering\n}\n\ntype OrganizationServiceType {\n  id: ID!\n  category: OrganizationServiceCategoryType\n  priority: Int\n  label: String!\n}\n\ntype OrganizationServiceTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [OrganizationServiceType!]!\n}\n\ntype OrganizationType {\n  id: ID!\n  name: String!\n}\n\ntype OrganizationTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [OrganizationType!]!\n}\n\nenum ParkingChoices {\n  BICYCLE\n  MOTORCYCLE\n  AUTOMOBILE\n  RV\n  STREET\n  NO_PARKING\n}\n\ntype ParkingType {\n  name: ParkingChoices\n}\n\nenum PermissionTemplateEnum {\n  CASEWORKER\n  SHELTER_OPERATOR\n}\n\nenum PetChoices {\n  CATS\n  DOGS_UNDER_25_LBS\n  DOGS_OVER_25_LBS\n  EXOTICS\n  SERVICE_ANIMALS\n  PET_AREA\n  NO_PETS_ALLOWED\n}\n\ntype PetType {\n  name: PetChoices\n}\n\nscalar PhoneNumber\n\ninput PhoneNumberInput {\n  id: ID\n  number: PhoneNumber\n  isPrimary: Boolean = false\n}\n\ntype PhoneNumberType {\n  id: ID!\n  number: PhoneNumber\n  isPrimary: Boolean\n}\n\n\"\"\"Represents a point as `(x, y, z)` or `(x, y)`.\"\"\"\nscalar Point\n\nenum PreferredCommunicationEnum {\n  CALL\n  EMAIL\n  FACEBOOK\n  INSTAGRAM\n  LINKEDIN\n  TEXT\n  WHATSAPP\n}\n\ntype ProgramEnrollmentType {\n  id: String!\n  clientId: String!\n  refClientProgram: String!\n}\n\nenum PronounEnum {\n  HE_HIM_HIS\n  SHE_HER_HERS\n  THEY_THEM_THEIRS\n  OTHER\n}\n\ntype Query {\n  currentUser: CurrentUserType!\n  organizationMember(organizationId: String!, userId: String!): OrganizationMemberType! @hasPerm(permissions: [{app: \"organizations\", permission: \"view_org_members\"}], any: true)\n  organizationMembers(organizationId: String!, ordering: [OrganizationMemberOrdering!] = null, filters: OrganizationMemberFilter = null, orgType: OrgTypeEnum = null, permissionTemplate: PermissionTemplateEnum = null, pagination: OffsetPaginationInput): OrganizationMemberTypeOffsetPaginated! @hasPerm(permissions: [{app: \"organizations\", permission: \"view_org_members\"}], any: true)\n  clientProfiles(pagination: OffsetPaginationInput, filters: ClientProfileFilter, ordering: [ClientProfileOrder!]! = []): ClientProfileTypeOffsetPaginated! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_clientprofile\"}], any: true)\n  clientProfilesKeyset(pagination: KeysetPaginationInput, filters: ClientProfileFilter): ClientProfileTypeKeysetPaginated! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_clientprofile\"}], any: true)\n  clientDocument(pk: ID!): ClientDocumentType! @hasRetvalPerm(permissions: [{app: \"common\", permission: \"view_attachment\"}], any: true)\n  clientContact(pk: ID!): ClientContactType! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_clientcontact\"}], any: true)\n  clientContacts(pagination: OffsetPaginationInput): ClientContactTypeOffsetPaginated! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_clientcontact\"}], any: true)\n  clientHouseholdMember(pk: ID!): ClientHouseholdMemberType! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_clienthouseholdmember\"}], any: true)\n  clientHouseholdMembers(pagination: OffsetPaginationInput): ClientHouseholdMemberTypeOffsetPaginated! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_clienthouseholdmember\"}], any: true)\n  hmisProfile(pk: ID!): HmisProfileType! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_hmisprofile\"}], any: true)\n  hmisProfiles(pagination: OffsetPaginationInput): HmisProfileTypeOffsetPaginated! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_hmisprofile\"}], any: true)\n  socialMediaProfile(pk: ID!): SocialMediaProfileType! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_socialmediaprofile\"}], any: true)\n  socialMediaProfiles(pagination: OffsetPaginationInput): SocialMediaProfileTypeOffsetPaginated! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_socialmediaprofile\"}], any: true)\n  clientProfile(pk: ID!): ClientProfileType! @hasRetvalPerm(permissions: [{app: \"clients\", permission: \"view_clientprofile\"}], any: true)\n  clientProfileSearch(text: String!, limit: Int! = 20): [ClientProfileType!]!\n  clientDocuments(clientId: String!, filters: ClientDocumentFilter, pagination: OffsetPaginationInput): ClientDocumentTypeOffsetPaginated! @hasRetvalPerm(permissions: [{app: \"common\", permission: \"view_attachment\"}], any: true)\n  bulkClientProfileImportRecords(data: ClientProfileImportRecordsBulkInput!, pagination: OffsetPaginationInput): ClientProfileImportRecordTypeOffsetPaginated! @hasPerm(permissions: [{app: \"clients\", permission: \"view_clientprofileimportrecord\"}], any: true)\n  featureControls: FeatureControlData!\n  hmisClientProfiles(pagination: OffsetPaginationInput, filters: HmisClientProfileFilter, ordering: [HmisClientProfileOrdering!]! = []): HmisClientProfileTypeOffsetPaginated! @hmisDirective @isHmisAuthenticated\n  hmisNotes(pagination: OffsetPaginationInput, filters: HmisNoteFilter, ordering: [HmisNoteOrdering!]! = []): HmisNoteTypeOffsetPaginated! @hmisDirective @isHmisAuthenticated\n  hmisClientProfile(id: ID!): HmisClientProfileType! @hmisDirective @isHmisAuthenticated\n  hmisNote(id: ID!): HmisNoteType! @hmisDirective @isHmisAuthenticated\n  hmisClientPrograms(clientId: ID!): [HmisClientProgramType!]! @hmisDirective @isHmisAuthenticated\n  note(pk: ID!): NoteType! @hasRetvalPerm(permissions: [{app: \"notes\", permission: \"view_note\"}], any: true)\n  notes(pagination: OffsetPaginationInput, filters: NoteFilter, ordering: [NoteOrder!]! = []): NoteTypeOffsetPaginated! @hasRetvalPerm(permissions: [{app: \"notes\", permission: \"view_note\"}], any: true)\n  notesKeyset(pagination: KeysetPaginationInput, filters: NoteFilter): NoteTypeKeysetPaginated! @hasRetvalPerm(permissions: [{app: \"notes\", permission: \"view_note\"}], any: true)\n  services(pagination: OffsetPaginationInput, ordering: [OrganizationServiceOrdering!]! = []): OrganizationServiceTypeOffsetPaginated! @hasPerm(permissions: [{app: \"notes\", permission: \"add_note\"}], any: true)\n  serviceCategories(pagination: OffsetPaginationInput, ordering: [OrganizationServiceCategoryOrdering!]! = []): OrganizationServiceCategoryTypeOffsetPaginated! @hasPerm(permissions: [{app: \"notes\", permission: \"add_note\"}], any: true)\n  interactionAuthors(pagination: OffsetPaginationInput, filters: InteractionAuthorFilter, ordering: [InteractionAuthorOrder!]! = []): InteractionAuthorTypeOffsetPaginated! @hasPerm(permissions: [{app: \"notes\", permission: \"add_note\"}], any: true)\n  caseworkerOrganizations(ordering: [OrganizationOrder!] = null, filters: OrganizationFilter = null, pagination: OffsetPaginationInput): OrganizationTypeOffsetPaginated!\n  exportJob(pk: ID!): ExportJobType! @hasOrgPerm(permissions: [{app: \"reports\", permission: \"view_reports\"}], any: true)\n  reportSummary(startDate: Date = null, endDate: Date = null): ReportSummaryType! @hasOrgPerm(permissions: [{app: \"reports\", permission: \"view_reports\"}], any: true)\n  task(pk: ID!): TaskType! @hasRetvalPerm(permissions: [{app: \"tasks\", permission: \"view_task\"}], any: true)\n  tasks(ordering: [TaskOrder!] = null, filters: TaskFilter, pagination: OffsetPaginationInput): TaskTypeOffsetPaginated! @hasRetvalPerm(permissions: [{app: \"tasks\", permission: \"view_task\"}], any: true)\n  tasksKeyset(filters: TaskFilter, pagination: KeysetPaginationInput): TaskTypeKeysetPaginated! @hasRetvalPerm(permissions: [{app: \"tasks\", permission: \"view_task\"}], any: true)\n  teams(filters: TeamFilter = null, pagination: OffsetPaginationInput): TeamTypeOffsetPaginated!\n  operatorShelter(pk: ID!): OperatorShelterType! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_shelter\"}], any: true)\n  operatorShelters(pagination: OffsetPaginationInput, filters: ShelterFilter, ordering: [ShelterOrder!]! = []): OperatorShelterTypeOffsetPaginated! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_shelter\"}], any: true)\n  operatorSheltersKeyset(pagination: KeysetPaginationInput, filters: ShelterFilter): OperatorShelterTypeKeysetPaginated! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_shelter\"}], any: true)\n  shelter(pk: ID!): ShelterType!\n  shelters(pagination: OffsetPaginationInput, filters: ShelterFilter, ordering: [ShelterOrder!]! = []): ShelterTypeOffsetPaginated!\n  sheltersKeyset(pagination: KeysetPaginationInput, filters: ShelterFilter): ShelterTypeKeysetPaginated!\n  bed(pk: ID!): BedType! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_bed\"}], any: true)\n  beds(pagination: OffsetPaginationInput, filters: BedFilter, ordering: [BedOrder!]! = []): BedTypeOffsetPaginated! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_bed\"}], any: true)\n  bedsKeyset(pagination: KeysetPaginationInput, filters: BedFilter): BedTypeKeysetPaginated! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_bed\"}], any: true)\n  reservation(pk: ID!): ReservationType! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_reservation\"}], any: true)\n  reservations(pagination: OffsetPaginationInput, filters: ReservationFilter, ordering: [ReservationOrder!]! = []): ReservationTypeOffsetPaginated! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_reservation\"}], any: true)\n  reservationsKeyset(pagination: KeysetPaginationInput, filters: ReservationFilter): ReservationTypeKeysetPaginated! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_reservation\"}], any: true)\n  room(pk: ID!): RoomType! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_room\"}], any: true)\n  rooms(pagination: OffsetPaginationInput, filters: RoomFilter, ordering: [RoomOrder!]! = []): RoomTypeOffsetPaginated! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_room\"}], any: true)\n  roomsKeyset(pagination: KeysetPaginationInput, filters: RoomFilter): RoomTypeKeysetPaginated! @hasOrgPerm(permissions: [{app: \"shelters\", permission: \"view_room\"}], any: true)\n  shelterServiceCategories(pagination: OffsetPaginationInput): ServiceCategoryTypeOffsetPaginated!\n  shelterCities(pagination: OffsetPaginationInput): CityTypeOffsetPaginated!\n  shelterSpas(pagination: OffsetPaginationInput): SPATypeOffsetPaginated!\n  shelterMapClusters(zoom: Int!, x: Int!, y: Int!, filters: ShelterFilter = null): [ShelterMapClusterType!]!\n  shelterMaxStay: Int\n  shelterOccupancyMetrics(shelterId: ID!, startDate: Date = null, endDate: Date = null): ShelterOccupancyMetricsType!\n  referral(pk: ID!): ReferralType! @hasRetvalPerm(permissions: [{app: \"referrals\", permission: \"view_referral\"}], any: true)\n  referrals(filters: ReferralFilter, ordering: [ReferralOrder!]! = [], pagination: OffsetPaginationInput): ReferralTypeOffsetPaginated! @hasRetvalPerm(permissions: [{app: \"referrals\", permission: \"view_referral\"}], any: true)\n}\n\nenum RaceEnum {\n  AMERICAN_INDIAN_ALASKA_NATIVE\n  ASIAN\n  BLACK_AFRICAN_AMERICAN\n  HISPANIC_LATINO\n  NATIVE_HAWAIIAN_PACIFIC_ISLANDER\n  WHITE_CAUCASIAN\n  OTHER\n}\n\ninput ReferralFilter {\n  clientProfile: ID\n  createdBy: ID\n  status: ReferralStatusEnum\n  AND: ReferralFilter\n  OR: ReferralFilter\n  NOT: ReferralFilter\n  DISTINCT: Boolean\n}\n\ninput ReferralOrder {\n  id: Ordering\n  createdAt: Ordering\n  updatedAt: Ordering\n  status: Ordering\n}\n\nenum ReferralRequirementChoices {\n  REFERRAL_MATCHED\n  REFERRAL_NONMATCHED\n  SERVICE_PROVIDER_SUBMISSION\n  SELF_REFERRAL\n  SAME_DAY_INTAKE\n}\n\ntype ReferralRequirementType {\n  name: ReferralRequirementChoices\n}\n\nenum ReferralStatusEnum {\n  PENDING\n  ACCEPTED\n  DECLINED\n}\n\ntype ReferralType {\n  id: ID!\n  clientProfile: ClientProfileType\n  shelter: ShelterType\n  createdAt: DateTime!\n  createdBy: UserType\n  status: ReferralStatusEnum\n  notes: String\n  updatedAt: DateTime!\n}\n\ntype ReferralTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ReferralType!]!\n}\n\nenum RelationshipTypeEnum {\n  CURRENT_CASE_MANAGER\n  PAST_CASE_MANAGER\n  ORGANIZATION\n  AUNT\n  CHILD\n  COUSIN\n  FATHER\n  FRIEND\n  GRANDPARENT\n  MOTHER\n  PET\n  SIBLING\n  UNCLE\n  OTHER\n}\n\ninput RemoveHmisNoteServiceRequestInput {\n  serviceRequestId: ID!\n  hmisNoteId: ID!\n  serviceRequestType: ServiceRequestTypeEnum!\n}\n\nunion RemoveHmisNoteServiceRequestPayload = HmisNoteType | OperationInfo\n\ninput RemoveOrganizationMemberInput {\n  id: ID!\n  organizationId: ID!\n}\n\nunion RemoveOrganizationMemberPayload = DeletedObjectType | OperationInfo\n\ntype ReportSummaryType {\n  totalNotes: Int!\n  uniqueClients: Int!\n  startDate: String!\n  endDate: String!\n  notesByDate: [DateCountType!]!\n  notesByTeam: [NameCountType!]!\n  notesByPurpose: [NameCountType!]!\n  uniqueClientsByDate: [DateCountType!]!\n  topProvidedServices: [NameCountType!]!\n  topRequestedServices: [NameCountType!]!\n}\n\ntype ReservationClientAssignmentType {\n  id: ID!\n  clientProfile: ClientProfileType!\n  isPrimary: Boolean!\n}\n\ninput ReservationClientInput {\n  clientProfileId: ID!\n  isPrimary: Boolean! = false\n}\n\ninput ReservationFilter {\n  id: ID\n  roomId: ID\n  bedId: ID\n  AND: ReservationFilter\n  OR: ReservationFilter\n  NOT: ReservationFilter\n  DISTINCT: Boolean\n  status: [ReservationStatusChoices!]\n  shelterId: ID\n}\n\ntype ReservationMetricsType {\n  checkInOverdue: Int!\n  cancelled: Int!\n  checkedIn: Int!\n  checkInOverdueToCheckedIn: Int!\n}\n\ninput ReservationOrder {\n  startDate: Ordering\n  checkedInAt: Ordering\n  checkedOutAt: Ordering\n  createdAt: Ordering\n  updatedAt: Ordering\n}\n\nenum ReservationStatusChoices {\n  CONFIRMED\n  CHECKED_IN\n  COMPLETED\n  CANCELLED\n  CHECK_IN_OVERDUE\n}\n\ntype ReservationType {\n  id: ID!\n  bed: BedType\n  checkedInAt: DateTime\n  checkedOutAt: DateTime\n  duration: Int\n  notes: String\n  room: RoomType\n  startDate: Date\n  status: ReservationStatusChoices!\n  clients: [ReservationClientAssignmentType!]!\n  shelter: OperatorShelterType!\n  createdById: ID\n}\n\ntype ReservationTypeKeysetPaginated {\n  pageInfo: KeysetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ReservationType!]!\n}\n\ntype ReservationTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ReservationType!]!\n}\n\ninput ResolveClientDocumentUploadsInput {\n  clientProfileId: ID!\n  documents: [ClientDocumentFromUploadsInput!]!\n}\n\nunion ResolveClientDocumentUploadsPayload = ClientDocumentUploadsType | OperationInfo\n\ninput ResolveClientProfilePhotoUploadInput {\n  clientProfileId: ID!\n  presignedKey: String!\n  uploadToken: String!\n}\n\nunion ResolveClientProfilePhotoUploadPayload = ClientProfileType | OperationInfo\n\ninput ResolveNoteAttachmentUploadsInput {\n  noteId: ID!\n  attachments: [NoteAttachmentFromUploadInput!]!\n}\n\nunion ResolveNoteFileUploadsPayload = NoteAttachmentUploadsType | OperationInfo\n\ninput ResolveShelterPhotoUploadsInput {\n  shelterId: ID!\n  photos: [ShelterPhotoFromUploadInput!]!\n}\n\nunion ResolveShelterPhotoUploadsPayload = ShelterPhotoUploadsType | OperationInfo\n\ninput RevertNoteInput {\n  id: ID!\n  revertBeforeTimestamp: DateTime!\n}\n\nunion RevertNotePayload = NoteType | OperationInfo\n\ntype RoomCountType {\n  available: Int!\n  inTurnaround: Int!\n  occupied: Int!\n  outOfService: Int!\n  reserved: Int!\n  total: Int!\n}\n\ninput RoomFilter {\n  id: ID\n  medicalRespite: Boolean\n  shelterId: ID\n  AND: RoomFilter\n  OR: RoomFilter\n  NOT: RoomFilter\n  DISTINCT: Boolean\n  amenities: String\n  type: [RoomStyleChoices!]\n  numberOfBeds: Int\n  status: [RoomStatusChoices!]\n}\n\ninput RoomOrder {\n  name: Ordering\n  createdAt: Ordering\n  updatedAt: Ordering\n}\n\nenum RoomStatusChoices {\n  AVAILABLE\n  IN_TURNAROUND\n  OCCUPIED\n  OUT_OF_SERVICE\n  RESERVED\n}\n\nenum RoomStyleChoices {\n  CONGREGATE\n  CUBICLE_LOW_WALLS\n  CUBICLE_HIGH_WALLS\n  HIGH_BUNK\n  LOW_BUNK\n  SHARED_ROOMS\n  SINGLE_ROOM\n  MOTEL_ROOM\n  OTHER\n}\n\ntype RoomStyleType {\n  name: RoomStyleChoices\n}\n\ntype RoomType {\n  id: ID!\n  accessibility: [AccessibilityType!]!\n  amenities: String\n  beds(filters: BedFilter, ordering: [BedOrder!]! = []): [BedType!]!\n  demographics: [DemographicType!]!\n  funders: [FunderType!]!\n  lastCleaned: DateTime\n  lastCleanedInspected: DateTime\n  maintenanceFlag: Boolean!\n  medicalRespite: Boolean!\n  name: String!\n  notes: String\n  pets: [PetType!]!\n  shelter: OperatorShelterType!\n  storage: Boolean!\n  type: RoomStyleChoices\n  typeOther: String\n  status: RoomStatusChoices!\n}\n\ntype RoomTypeKeysetPaginated {\n  pageInfo: KeysetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [RoomType!]!\n}\n\ntype RoomTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [RoomType!]!\n}\n\ntype SPAType {\n  id: ID!\n  shortName: String\n  name: String!\n}\n\ntype SPATypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [SPAType!]!\n}\n\ntype SampleType {\n  name: String!\n  isActive: Boolean!\n  lastModified: DateTime\n}\n\ninput ScheduleInput {\n  scheduleType: ScheduleTypeChoices! = OPERATING\n  days: [DayOfWeekChoices!] = null\n  startTime: Time = null\n  endTime: Time = null\n  startDate: Date = null\n  endDate: Date = null\n  condition: ConditionChoices = null\n  isException: Boolean! = false\n}\n\ntype ScheduleType {\n  id: ID!\n  scheduleType: ScheduleTypeChoices!\n  day: DayOfWeekChoices\n  startTime: Time\n  endTime: Time\n  startDate: Date\n  endDate: Date\n  condition: ConditionChoices\n  demographic: DemographicType\n  isException: Boolean!\n}\n\nenum ScheduleTypeChoices {\n  OPERATING\n  INTAKE\n  MEAL_SERVICE\n  STAFF_AVAILABILITY\n}\n\ntype ServiceCategoryType {\n  id: ID!\n  name: String!\n  displayName: String!\n  priority: Int!\n  services: [ServiceType!]!\n}\n\ntype ServiceCategoryTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ServiceCategoryType!]!\n}\n\ninput ServiceInput {\n  id: ID = null\n  categoryId: ID = null\n  displayName: String = null\n}\n\nenum ServiceRequestStatusEnum {\n  COMPLETED\n  TO_DO\n}\n\ntype ServiceRequestType {\n  id: ID!\n  service: OrganizationServiceType\n  status: ServiceRequestStatusEnum!\n  dueBy: DateTime\n  completedOn: DateTime\n  clientProfile: ClientProfileType\n  createdBy: UserType!\n  createdAt: DateTime!\n}\n\nenum ServiceRequestTypeEnum {\n  PROVIDED\n  REQUESTED\n}\n\ntype ServiceType {\n  id: ID!\n  category: ServiceCategoryType!\n  name: String!\n  displayName: String!\n  isOther: Boolean!\n  priority: Int!\n}\n\ntype ShelterAvailabilityType {\n  id: ID!\n  nonRestrictedBeds: Int!\n  restrictedBeds: Int!\n  restrictionNotes: String!\n  updatedAt: DateTime!\n}\n\nenum ShelterChoices {\n  ACCESS_CENTER\n  BUILDING\n  CHURCH\n  HOTEL_MOTEL\n  SAFE_PARKING\n  SINGLE_FAMILY_HOUSE\n  TINY_HOMES\n  OTHER\n}\n\ninput ShelterFilter {\n  isPrivate: Boolean\n  AND: ShelterFilter\n  OR: ShelterFilter\n  NOT: ShelterFilter\n  DISTINCT: Boolean\n  isAccessCenter: Boolean\n  maxStay: MaxStayInput\n  name: String\n  organizations: [ID!]\n  properties: ShelterPropertyInput\n  openNowFor: [ScheduleTypeChoices!] @deprecated(reason: \"Use openNow instead\")\n  openNow: OpenNowInput\n  mapBounds: MapBoundsInput\n  geolocation: GeolocationInput\n  hasAvailableBeds: Boolean\n  spa: [ID!]\n}\n\ntype ShelterHeroImageType {\n  id: ID!\n  url: String!\n}\n\ninput ShelterLocationInput {\n  place: String!\n  latitude: Float = null\n  longitude: Float = null\n}\n\ntype ShelterLocationType {\n  place: String!\n  latitude: Float!\n  longitude: Float!\n}\n\ntype ShelterMapClusterType {\n  latitude: Float!\n  longitude: Float!\n  count: Int!\n  availableBeds: Int!\n  shelterId: ID\n}\n\ntype ShelterOccupancyMetricsType {\n  shelterId: ID!\n  startDate: Date!\n  endDate: Date!\n  dailyOccupancy: [DailyOccupancyMetricsType!]!\n  dailyBedStatus: [DailyBedStatusMetricsType!]!\n  reservationMetrics: ReservationMetricsType!\n  avgDaysToOccupancy: Float\n}\n\ninput ShelterOrder {\n  name: Ordering\n  createdAt: Ordering\n}\n\ninput ShelterPhotoFromUploadInput {\n  presignedKey: String!\n  uploadToken: String!\n  filename: String!\n  contentType: String!\n  photoType: ShelterPhotoTypeChoices!\n}\n\ntype ShelterPhotoType {\n  id: ID!\n  type: ShelterPhotoTypeChoices!\n  createdAt: DateTime!\n  file: DjangoImageType!\n}\n\nenum ShelterPhotoTypeChoices {\n  INTERIOR\n  EXTERIOR\n}\n\ninput ShelterPhotoUploadItemInput {\n  refId: String!\n  filename: String!\n  contentType: String!\n}\n\ntype ShelterPhotoUploadsType {\n  photos: [ShelterPhotoType!]!\n}\n\nenum ShelterProgramChoices {\n  BRIDGE_HOME\n  CRISIS_HOUSING\n  EMERGENCY_SHELTER\n  FAITH_BASED\n  INTERIM_HOUSING\n  PERMANENT_HOUSING\n  PROJECT_HOME_KEY\n  RAPID_REHOUSING\n  RECUPERATIVE_CARE\n  ROADMAP_HOME\n  SAFE_PARK_LA\n  SOBER_LIVING\n  TINY_HOME_VILLAGE\n  TRANSITIONAL_HOUSING\n  WINTER_SHELTER\n  OTHER\n}\n\ntype ShelterProgramType {\n  name: ShelterProgramChoices\n}\n\ninput ShelterPropertyInput {\n  pets: [PetChoices!] = null\n  petsIncludeNull: Boolean = false\n  demographics: [DemographicChoices!] = null\n  demographicsIncludeNull: Boolean = false\n  entryRequirements: [EntryRequirementChoices!] = null\n  entryRequirementsIncludeNull: Boolean = false\n  referralRequirement: [ReferralRequirementChoices!] = null\n  referralRequirementIncludeNull: Boolean = false\n  specialSituationRestrictions: [SpecialSituationRestrictionChoices!] = null\n  specialSituationRestrictionsIncludeNull: Boolean = false\n  shelterTypes: [ShelterChoices!] = null\n  shelterTypesIncludeNull: Boolean = false\n  roomStyles: [RoomStyleChoices!] = null\n  roomStylesIncludeNull: Boolean = false\n  parking: [ParkingChoices!] = null\n  parkingIncludeNull: Boolean = false\n}\n\ntype ShelterType {\n  id: ID!\n  accessibility: [AccessibilityType!]!\n  additionalContacts: [ContactInfoType!]!\n  addNotesSleepingDetails: String\n  addNotesShelterDetails: String\n  bedFees: String\n  city: CityType\n  citiesServed: [CityType!]!\n  cityCouncilDistrict: Int\n  curfew: Time\n  demographics: [DemographicType!]!\n  demographicsOther: String\n  description: String!\n  email: String\n  entryInfo: String\n  entryRequirements: [EntryRequirementType!]!\n  exitPolicy: [ExitPolicyType!]!\n  exitPolicyOther: String\n  emergencySurge: Boolean\n  funders: [FunderType!]!\n  fundersOther: String\n  instagram: String\n  location: ShelterLocationType\n  maxStay: Int\n  name: String!\n  onSiteSecurity: Boolean\n  organization: OrganizationType\n  otherRules: String\n  otherServices: String\n  overallRating: Int\n  parking: [ParkingType!]!\n  pets: [PetType!]!\n  phone: PhoneNumber\n  programFees: String\n  referralRequirement: [ReferralRequirementType!]!\n  roomStyles: [RoomStyleType!]!\n  roomStylesOther: String\n  schedules: [ScheduleType!]!\n  services: [ServiceType!]!\n  shelterPrograms: [ShelterProgramType!]!\n  shelterProgramsOther: String\n  shelterTypes: [ShelterTypeType!]!\n  shelterTypesOther: String\n  spa: SPAType\n  spasServed: [SPAType!]!\n  specialSituationRestrictions: [SpecialSituationRestrictionType!]!\n  photos: [ShelterPhotoType!]!\n  isPrivate: Boolean!\n  status: StatusChoices!\n  storage: [StorageType!]!\n  subjectiveReview: String\n  supervisorialDistrict: Int\n  totalBeds: Int\n  updatedAt: DateTime!\n  vaccinationRequirement: [VaccinationRequirementType!]!\n  visitorsAllowed: Boolean\n  website: String\n  mediaLinks: [MediaLinkType!]!\n  availability: ShelterAvailabilityType\n  HeroPhotos: [ShelterPhotoType!]\n  heroImage(preset: ImagePresetEnum = null, processingOptions: String = null): ShelterHeroImageType\n  distanceInMiles: Float\n  bedCounts: BedCountType!\n  roomCounts: RoomCountType!\n}\n\ntype ShelterTypeKeysetPaginated {\n  pageInfo: KeysetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ShelterType!]!\n}\n\ntype ShelterTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [ShelterType!]!\n}\n\ntype ShelterTypeType {\n  name: ShelterChoices\n}\n\nenum SocialMediaEnum {\n  FACEBOOK\n  INSTAGRAM\n  LINKEDIN\n  SNAPCHAT\n  TIKTOK\n  TWITTER\n  WHATSAPP\n}\n\ninput SocialMediaProfileInput {\n  id: ID\n  clientProfile: ID\n  platform: SocialMediaEnum\n  platformUserId: NonBlankString\n}\n\ntype SocialMediaProfileType {\n  id: ID\n  clientProfile: DjangoModelType!\n  platform: SocialMediaEnum!\n  platformUserId: NonBlankString!\n}\n\ntype SocialMediaProfileTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [SocialMediaProfileType!]!\n}\n\nenum SpecialSituationRestrictionChoices {\n  NONE\n  DOMESTIC_VIOLENCE\n  HIV_AIDS\n  HUMAN_TRAFFICKING\n  JUSTICE_SYSTEMS\n  VETERANS\n  HARM_REDUCTION\n}\n\ntype SpecialSituationRestrictionType {\n  name: SpecialSituationRestrictionChoices\n}\n\nenum StatusChoices {\n  DRAFT\n  PENDING\n  APPROVED\n  INACTIVE\n}\n\nenum StorageChoices {\n  UNIT_STORAGE\n  AMNESTY_LOCKERS\n  STANDARD_LOCKERS\n  SHARED_STORAGE\n  PERSONAL_BIN\n  NO_STORAGE\n}\n\ntype StorageType {\n  name: StorageChoices\n}\n\ntype SwitchType {\n  name: String!\n  isActive: Boolean!\n  lastModified: DateTime\n}\n\ninput TaskFilter {\n  clientProfile: ID\n  hmisClientProfile: ID\n  note: IDFilterLookup\n  hmisNote: IDFilterLookup\n  createdBy: ID\n  AND: TaskFilter\n  OR: TaskFilter\n  NOT: TaskFilter\n  DISTINCT: Boolean\n  clientProfiles: [ID!]\n  hmisClientProfiles: [ID!]\n  authors: [ID!]\n  organizations: [ID!]\n  status: [TaskStatusEnum!]\n  teamIds: [ID!]\n  search: String\n  clientProfileLookup: IDFilterLookup\n  hmisClientProfileLookup: IDFilterLookup\n}\n\ninput TaskOrder {\n  id: Ordering\n  createdAt: Ordering\n  updatedAt: Ordering\n  status: Ordering\n}\n\nenum TaskStatusEnum {\n  TO_DO\n  IN_PROGRESS\n  COMPLETED\n}\n\ntype TaskType {\n  id: ID!\n  hmisClientProfile: HmisClientProfileType\n  clientProfile: ClientProfileType\n  createdAt: DateTime!\n  createdBy: UserType!\n  description: String\n  note: DjangoModelType\n  hmisNote: DjangoModelType\n  organization: OrganizationType\n  status: TaskStatusEnum\n  summary: String\n  team: TeamType\n  currentTeam: TeamType @deprecated(reason: \"Use team instead\")\n  updatedAt: DateTime!\n}\n\ntype TaskTypeKeysetPaginated {\n  pageInfo: KeysetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [TaskType!]!\n}\n\ntype TaskTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [TaskType!]!\n}\n\ninput TeamFilter {\n  isActive: Boolean\n  AND: TeamFilter\n  OR: TeamFilter\n  NOT: TeamFilter\n  DISTINCT: Boolean\n}\n\ntype TeamType {\n  id: ID!\n  name: String!\n  isActive: Boolean\n  createdAt: DateTime!\n  slug: String @deprecated(reason: \"Always null. Team.name is the only identifier.\")\n}\n\ntype TeamTypeOffsetPaginated {\n  pageInfo: OffsetPaginationInfo!\n\n  \"\"\"Total count of existing results.\"\"\"\n  totalCount: Int!\n\n  \"\"\"List of paginated results.\"\"\"\n  results: [TeamType!]!\n}\n\n\"\"\"Time (isoformat)\"\"\"\nscalar Time\n\nscalar UUID\n\ninput UpdateBedInput {\n  roomId: ID\n  accessibility: [AccessibilityChoices!]\n  b7: Boolean\n  demographics: [DemographicChoices!]\n  fees: Int\n  funders: [FunderChoices!]\n  lastCleaned: DateTime\n  lastCleanedInspected: DateTime\n  maintenanceFlag: Boolean\n  medicalNeeds: [MedicalNeedChoices!]\n  name: String\n  pets: [PetChoices!]\n  statusNotes: String\n  storage: Boolean\n  type: BedTypeChoices\n}\n\nunion UpdateBedPayload = BedType | OperationInfo\n\nunion UpdateClientContactPayload = ClientContactType | OperationInfo\n\ninput UpdateClientDocumentInput {\n  id: ID!\n  originalFilename: String\n}\n\nunion UpdateClientDocumentPayload = ClientDocumentType | OperationInfo\n\nunion UpdateClientHouseholdMemberPayload = ClientHouseholdMemberType | OperationInfo\n\ninput UpdateClientProfileInput {\n  adaAccommodation: [AdaAccommodationEnum!]\n  address: String\n  age: Int\n  californiaId: String\n  dateOfBirth: Date\n  email: NonBlankString\n  eyeColor: EyeColorEnum\n  firstName: NonBlankString\n  gender: GenderEnum\n  genderOther: String\n  hairColor: HairColorEnum\n  heightInInches: Float\n  importantNotes: String\n  lastName: NonBlankString\n  livingSituation: LivingSituationEnum\n  mailingAddress: String\n  maritalStatus: MaritalStatusEnum\n  middleName: NonBlankString\n  nickname: NonBlankString\n  phoneNumber: PhoneNumber\n  physicalDescription: String\n  placeOfBirth: String\n  preferredCommunication: [PreferredCommunicationEnum!]\n  preferredLanguage: LanguageEnum\n  profilePhoto: Upload\n  pronouns: PronounEnum\n  pronounsOther: String\n  race: RaceEnum\n  residenceAddress: String\n  residenceGeolocation: Point\n  spokenLanguages: [LanguageEnum!]\n  unhousedStartDate: Date\n  veteranStatus: VeteranStatusEnum\n  id: ID!\n  contacts: [ClientContactInput!]\n  hmisProfiles: [HmisProfileInput!]\n  householdMembers: [ClientHouseholdMemberInput!]\n  phoneNumbers: [PhoneNumberInput!]\n  socialMediaProfiles: [SocialMediaProfileInput!]\n}\n\nunion UpdateClientProfilePayload = ClientProfileType | OperationInfo\n\nunion UpdateClientProfilePhotoPayload = ClientProfileType | OperationInfo\n\nunion UpdateCurrentUserPayload = UserType | CurrentUserType | OperationInfo\n\ninput UpdateHmisClientProfileInput {\n  alias: String\n  birthDate: Date\n  dobQuality: HmisDobQualityEnum\n  firstName: NonBlankString\n  lastName: NonBlankString\n  nameQuality: HmisNameQualityEnum\n  ssn1: String\n  ssn2: String\n  ssn3: String\n  ssnQuality: HmisSsnQualityEnum\n  gender: [HmisGenderEnum!]!\n  genderIdentityText: String\n  nameMiddle: NonBlankString\n  nameSuffix: HmisSuffixEnum\n  raceEthnicity: [HmisRaceEnum!]!\n  additionalRaceEthnicityDetail: String\n  veteran: HmisVeteranStatusEnum\n  adaAccommodation: [AdaAccommodationEnum!]\n  address: String\n  californiaId: String\n  email: NonBlankString\n  eyeColor: EyeColorEnum\n  hairColor: HairColorEnum\n  heightInInches: Float\n  importantNotes: String\n  livingSituation: LivingSituationEnum\n  mailingAddress: String\n  maritalStatus: MaritalStatusEnum\n  physicalDescription: String\n  placeOfBirth: String\n  preferredCommunication: [PreferredCommunicationEnum!]\n  preferredLanguage: LanguageEnum\n  profilePhoto: Upload\n  pronouns: PronounEnum\n  pronounsOther: String\n  residenceAddress: String\n  residenceGeolocation: Point\n  spokenLanguages: [LanguageEnum!]\n  unhousedStartDate: Date\n  id: ID!\n  phoneNumbers: [PhoneNumberInput!]\n}\n\nunion UpdateHmisClientProfilePayload = HmisClientProfileType | OperationInfo\n\ninput UpdateHmisNoteInput {\n  id: ID!\n  title: String\n  note: String\n  date: Date\n  refClientProgram: String\n}\n\ninput UpdateHmisNoteLocationInput {\n  id: ID!\n  location: LocationInput!\n}\n\nunion UpdateHmisNoteLocationPayload = HmisNoteType | OperationInfo\n\nunion UpdateHmisNotePayload = HmisNoteType | OperationInfo\n\nunion UpdateHmisProfilePayload = HmisProfileType | OperationInfo\n\ninput UpdateNoteInput {\n  id: ID!\n  purpose: NonBlankString\n  teamId: ID\n  publicDetails: String\n  privateDetails: String\n  isSubmitted: Boolean\n  interactedAt: DateTime\n  location: LocationInput\n  providedServices: [CreateNoteServiceInput!]\n  requestedServices: [CreateNoteServiceInput!]\n  tasks: [CreateNoteTaskInput!]\n}\n\ninput UpdateNoteLocationInput {\n  id: ID!\n  location: LocationInput!\n}\n\nunion UpdateNoteLocationPayload = NoteType | OperationInfo\n\nunion UpdateNotePayload = NoteType | OperationInfo\n\ninput UpdateReferralInput {\n  id: ID!\n  status: ReferralStatusEnum\n  notes: String\n}\n\nunion UpdateReferralPayload = ReferralType | OperationInfo\n\ninput UpdateReservationInput {\n  roomId: ID\n  bedId: ID\n  checkedInAt: DateTime\n  checkedOutAt: DateTime\n  clients: [ReservationClientInput!]\n  duration: Int\n  notes: String\n  startDate: Date\n  status: ReservationStatusChoices\n}\n\nunion UpdateReservationPayload = ReservationType | OperationInfo\n\ninput UpdateRoomInput {\n  accessibility: [AccessibilityChoices!]\n  amenities: String\n  demographics: [DemographicChoices!]\n  funders: [FunderChoices!]\n  lastCleaned: DateTime\n  lastCleanedInspected: DateTime\n  maintenanceFlag: Boolean\n  medicalRespite: Boolean\n  name: String\n  notes: String\n  pets: [PetChoices!]\n  storage: Boolean\n  type: RoomStyleChoices\n  typeOther: String\n}\n\nunion UpdateRoomPayload = RoomType | OperationInfo\n\ninput UpdateShelterInput {\n  id: ID!\n  name: String\n  status: StatusChoices\n  description: String\n  email: String\n  website: String\n  isPrivate: Boolean\n  heroImageId: ID\n  cityId: ID\n  spaId: ID\n  citiesServedIds: [ID!]\n  spasServedIds: [ID!]\n  phone: PhoneNumber\n  addNotesSleepingDetails: String\n  addNotesShelterDetails: String\n  maxStay: Int\n  onSiteSecurity: Boolean\n  visitorsAllowed: Boolean\n  exitPolicyOther: String\n  emergencySurge: Boolean\n  otherRules: String\n  otherServices: String\n  entryInfo: String\n  subjectiveReview: String\n  demographicsOther: String\n  shelterTypesOther: String\n  cityCouncilDistrict: Int\n  supervisorialDistrict: Int\n  fundersOther: String\n  accessibility: [AccessibilityChoices!]\n  demographics: [DemographicChoices!]\n  specialSituationRestrictions: [SpecialSituationRestrictionChoices!]\n  shelterTypes: [ShelterChoices!]\n  roomStyles: [RoomStyleChoices!]\n  storage: [StorageChoices!]\n  pets: [PetChoices!]\n  parking: [ParkingChoices!]\n  entryRequirements: [EntryRequirementChoices!]\n  referralRequirement: [ReferralRequirementChoices!]\n  vaccinationRequirement: [VaccinationRequirementChoices!]\n  exitPolicy: [ExitPolicyChoices!]\n  shelterPrograms: [ShelterProgramChoices!]\n  funders: [FunderChoices!]\n  location: ShelterLocationInput\n  schedules: [ScheduleInput!]\n  services: [ServiceInput!]\n}\n\nunion UpdateShelterPayload = ShelterType | OperationInfo\n\ninput UpdateShelterPhotoInput {\n  id: ID!\n  photoType: ShelterPhotoTypeChoices!\n}\n\nunion UpdateShelterPhotoPayload = ShelterPhotoType | OperationInfo\n\nunion UpdateSocialMediaProfilePayload = SocialMediaProfileType | OperationInfo\n\ninput UpdateTaskInput {\n  id: ID!\n  description: String\n  summary: String\n  teamId: ID\n  status: TaskStatusEnum\n}\n\nunion UpdateTaskPayload = TaskType | OperationInfo\n\ninput UpdateTeamInput {\n  id: ID!\n  name: String\n  isActive: Boolean\n}\n\nunion UpdateTeamPayload = TeamType | OperationInfo\n\ninput UpdateUserInput {\n  firstName: NonBlankString\n  lastName: NonBlankString\n  middleName: NonBlankString\n  email: NonBlankString\n  id: ID!\n  hasAcceptedTos: Boolean\n  hasAcceptedPrivacyPolicy: Boolean\n}\n\ninput UpdateUserProfileInput {\n  firstName: NonEmptyString\n  lastName: NonEmptyString\n}\n\nunion UpdateUserProfilePayload = CurrentUserType | OperationInfo\n\n\"\"\"Represents a file upload.\"\"\"\nscalar Upload\n\ntype UserType {\n  firstName: NonBlankString\n  lastName: NonBlankString\n  middleName: NonBlankString\n  email: NonBlankString\n  id: ID!\n  organizationsOrganization(filters: OrganizationFilter, ordering: [OrganizationOrder!]! = []): [OrganizationType!]\n  hasAcceptedTos: Boolean\n  hasAcceptedPrivacyPolicy: Boolean\n  username: String\n  isHmisUser: Boolean\n  isOutreachAuthorized: Boolean @deprecated(reason: \"Use userPermissions check instead.\")\n}\n\nenum VaccinationRequirementChoices {\n  TB\n  FLU\n  COVID_19\n}\n\ntype VaccinationRequirementType {\n  name: VaccinationRequirementChoices!\n}\n\nenum VeteranStatusEnum {\n  YES\n  NO\n  PREFER_NOT_TO_SAY\n  OTHER_THAN_HONORABLE\n}\n\n\"\"\"Permission definition for schema directives.\"\"\"\ninput PermDefinition {\n  \"\"\"\n  The app to which we are requiring permission. If this is empty that means that we are checking the permission directly.\n  \"\"\"\n  app: String\n\n  \"\"\"\n  The permission itself. If this is empty that means that we are checking for any permission for the given app.\n  \"\"\"\n  permission: String\n}\n";
\ No newline at end of file